@@ -1,38 +1,167 @@
 """Functions for API preparation."""
+import time
+
+from flask import current_app, g, make_response, request
 from flask_restful import Api
+from werkzeug.exceptions import UnprocessableEntity
 
+from cache import CircuitOpenError
+from controllers import POST_BODY_CACHE
+from controllers.base import (
+    ENDPOINT_COMMAND_STATS, SLOW_QUERY_LISTENER, reset_query_endpoint, set_query_endpoint, start_command_stats,
+    stop_command_stats,
+)
+from controllers.base.config import MONGO_COMMAND_STATS, SERVER_TIMING_HEADER
 from endpoints import (
-    EPAnalysisPostGet, EPAnalysisPostIDCheck, EPAnalysisPostList, EPCharaAnalysisPostEdit,
-    EPCharacterAnalysisPostPublish, EPDragonAnalysisPostEdit, EPDragonAnalysisPostPublish, EPQuestPostEdit,
-    EPQuestPostGet, EPQuestPostIDCheck, EPQuestPostList, EPQuestPostPublish,
-    EPRootTest,
-    EPUserLogin, EPUserShowAds,
+    EPAnalysisPostGet, EPAnalysisPostGetMany, EPAnalysisPostHistory, EPAnalysisPostIDCheck, EPAnalysisPostList,
+    EPCharaAnalysisPostEdit, EPCharaAnalysisPostEditBundle, EPCharaAnalysisPostPublishBundle,
+    EPCharacterAnalysisPostPublish, EPDragonAnalysisPostEdit, EPDragonAnalysisPostEditBundle,
+    EPDragonAnalysisPostPublish, EPDragonAnalysisPostPublishBundle, EPMetrics, EPQuestPostEdit, EPQuestPostEditBundle,
+    EPQuestPostGet, EPQuestPostGetMany, EPQuestPostHistory, EPQuestPostIDCheck, EPQuestPostList, EPQuestPostPublish,
+    EPQuestPostPublishBundle, EPRootTest, EPUserLogin, EPUserShowAds,
+)
+from endpoints.metrics import RequestMetrics, get_response_code, record_request_metrics
+from env_var import get_metrics_token
+from responses import (
+    Error422Response, Error500Response, Error503Response, Response, ResponseBodyEncodeFunction,
+    encode_with_post_body_cache, get_response_body_encoder,
 )
-from responses import Error500Response
 
-__all__ = ("attach_api",)
+__all__ = ("attach_api", "attach_command_stats", "attach_metrics", "attach_slow_query_log", "to_error_response")
+
+
+def to_error_response(e: Exception) -> tuple[Response, int]:
+    """
+    Get the error response body and the status code of the error ``e`` in the conventionalized format.
+
+    Returns 422 if the request arguments fail the validation,
+    503 if the database is considered unavailable by the circuit breaker, and 500 otherwise.
+    """
+    if isinstance(e, UnprocessableEntity):
+        return Error422Response(e), 422
+
+    if isinstance(e, CircuitOpenError):
+        return Error503Response(f"{e.__class__.__name__}: {e}"), 503
+
+    return Error500Response(f"{e.__class__.__name__}: {e}"), 500
 
 
 class CustomApi(Api):
     """Customized Flask API wrapper to enforce the error returned to be the conventionalized format."""
 
     def handle_error(self, e: Exception):  # pylint: disable=no-self-use
-        """Force the error to send in the conventionalized json format."""
-        return Error500Response(f"{e.__class__.__name__}: {e}").serialize(), 500
+        """Force the error to send in the conventionalized json format. See ``to_error_response()``."""
+        response, status_code = to_error_response(e)
+
+        return response.serialize(), status_code
+
+
+def make_json_representation(encoder: ResponseBodyEncodeFunction):
+    """Make the JSON representation of the API encoding the response body using ``encoder``."""
+    def output_json(data, code, headers=None):
+        # Code in the response body for the metrics
+        g.response_code = get_response_code(data)
+
+        # Indent the response body in debug mode, as what `flask-restful` does
+        resp = make_response(encoder(data, current_app.debug) + b"\n", code)
+        resp.headers.extend(headers or {})
+
+        return resp
+
+    return output_json
 
 
 def attach_api(app):
     """Attach api to Flask application."""
     api = CustomApi(app)
+    api.representations["application/json"] = make_json_representation(
+        encode_with_post_body_cache(get_response_body_encoder(app.config["RESPONSE_BODY_ENCODER"]), POST_BODY_CACHE)
+    )
 
     attach_endpoints(api)
 
 
+def attach_command_stats(app):
+    """
+    Record the database commands issued by each request to ``app`` if enabled, attributed to its endpoint.
+
+    The statistics are returned in the ``Server-Timing`` header if enabled.
+    """
+    if not MONGO_COMMAND_STATS:
+        return
+
+    # pylint: disable=unused-variable
+    @app.before_request
+    def start_recording():
+        g.command_stats, g.command_stats_token = start_command_stats()
+
+    @app.after_request
+    def record(response):
+        if "command_stats" not in g:
+            return response
+
+        ENDPOINT_COMMAND_STATS.record(request.endpoint or "", g.command_stats)
+
+        if SERVER_TIMING_HEADER:
+            response.headers.add("Server-Timing", g.command_stats.to_server_timing())
+
+        return response
+
+    @app.teardown_request
+    def stop_recording(_):
+        if "command_stats_token" in g:
+            stop_command_stats(g.command_stats_token)
+
+
+def attach_metrics(app):
+    """
+    Record the metrics of each request to ``app``, attributed to its endpoint, if ``METRICS_TOKEN`` is set.
+
+    The metrics are returned by the ``/metrics`` endpoint to the requests with the token.
+    """
+    # pylint: disable=unused-variable
+    @app.before_request
+    def start_timer():
+        if get_metrics_token():
+            g.request_start = time.perf_counter()
+
+    @app.after_request
+    def record(response):
+        if "request_start" not in g:
+            return response
+
+        record_request_metrics(RequestMetrics(
+            request.endpoint or "", request.method, response.status_code, time.perf_counter() - g.request_start,
+            size=response.content_length, response_code=g.get("response_code"), command_stats=g.get("command_stats")
+        ))
+
+        return response
+
+
+def attach_slow_query_log(app):
+    """Attribute the slow database commands logged, if enabled, to the endpoint of the request to ``app``."""
+    if not SLOW_QUERY_LISTENER.enabled:
+        return
+
+    # pylint: disable=unused-variable
+    @app.before_request
+    def set_endpoint():
+        g.query_endpoint_token = set_query_endpoint(request.endpoint or "")
+
+    @app.teardown_request
+    def reset_endpoint(_):
+        if "query_endpoint_token" in g:
+            reset_query_endpoint(g.query_endpoint_token)
+
+
 def attach_endpoints(api_app):
     """Attach API endpoints to Flask app."""
     api_app.add_resource(
         EPRootTest, "/",
         endpoint="misc.root")
+    api_app.add_resource(
+        EPMetrics, "/metrics",
+        endpoint="misc.metrics")
     api_app.add_resource(
         EPUserLogin, "/user/login",
         endpoint="user.login")
@@ -45,15 +174,27 @@ def attach_endpoints(api_app):
     api_app.add_resource(
         EPQuestPostPublish, "/posts/quest/publish",
         endpoint="posts.quest.publish")
+    api_app.add_resource(
+        EPQuestPostPublishBundle, "/posts/quest/publish-bundle",
+        endpoint="posts.quest.publish_bundle")
     api_app.add_resource(
         EPQuestPostList, "/posts/quest",
         endpoint="posts.quest.list")
     api_app.add_resource(
         EPQuestPostGet, "/posts/quest/get",
         endpoint="posts.quest.get")
+    api_app.add_resource(
+        EPQuestPostGetMany, "/posts/quest/get-many",
+        endpoint="posts.quest.get_many")
+    api_app.add_resource(
+        EPQuestPostHistory, "/posts/quest/history",
+        endpoint="posts.quest.history")
     api_app.add_resource(
         EPQuestPostEdit, "/posts/quest/edit",
         endpoint="posts.quest.edit")
+    api_app.add_resource(
+        EPQuestPostEditBundle, "/posts/quest/edit-bundle",
+        endpoint="posts.quest.edit_bundle")
     api_app.add_resource(
         EPQuestPostIDCheck, "/posts/quest/id-check",
         endpoint="posts.quest.id_check")
@@ -66,18 +207,36 @@ def attach_endpoints(api_app):
     api_app.add_resource(
         EPDragonAnalysisPostPublish, "/posts/analysis/publish/dragon",
         endpoint="posts.analysis.publish.dragon")
+    api_app.add_resource(
+        EPCharaAnalysisPostPublishBundle, "/posts/analysis/publish-bundle/chara",
+        endpoint="posts.analysis.publish_bundle.chara")
+    api_app.add_resource(
+        EPDragonAnalysisPostPublishBundle, "/posts/analysis/publish-bundle/dragon",
+        endpoint="posts.analysis.publish_bundle.dragon")
     api_app.add_resource(
         EPAnalysisPostList, "/posts/analysis",
         endpoint="posts.analysis.list")
     api_app.add_resource(
         EPAnalysisPostGet, "/posts/analysis/get",
         endpoint="posts.analysis.get")
+    api_app.add_resource(
+        EPAnalysisPostGetMany, "/posts/analysis/get-many",
+        endpoint="posts.analysis.get_many")
+    api_app.add_resource(
+        EPAnalysisPostHistory, "/posts/analysis/history",
+        endpoint="posts.analysis.history")
     api_app.add_resource(
         EPCharaAnalysisPostEdit, "/posts/analysis/edit/chara",
         endpoint="posts.analysis.edit.chara")
     api_app.add_resource(
         EPDragonAnalysisPostEdit, "/posts/analysis/edit/dragon",
         endpoint="posts.analysis.edit.dragon")
+    api_app.add_resource(
+        EPCharaAnalysisPostEditBundle, "/posts/analysis/edit-bundle/chara",
+        endpoint="posts.analysis.edit_bundle.chara")
+    api_app.add_resource(
+        EPDragonAnalysisPostEditBundle, "/posts/analysis/edit-bundle/dragon",
+        endpoint="posts.analysis.edit_bundle.dragon")
     api_app.add_resource(
         EPAnalysisPostIDCheck, "/posts/analysis/id-check",
         endpoint="posts.analysis.id_check")
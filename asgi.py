@@ -0,0 +1,252 @@
+"""
+Native asyncio (ASGI) application.
+
+The hot read endpoints are served natively on asyncio using the async MongoDB driver,
+running the independent queries of a request concurrently.
+All the other endpoints are served by the WSGI application in ``main``.
+
+Run this by ``gunicorn asgi:app -k uvicorn.workers.UvicornWorker``. Requires the packages in ``requirements-asgi.txt``.
+"""
+import asyncio
+from datetime import datetime
+from typing import Any, Callable, Optional, Type
+
+from a2wsgi import WSGIMiddleware
+from starlette.applications import Starlette
+from starlette.middleware import Middleware
+from starlette.middleware.cors import CORSMiddleware
+from starlette.requests import Request
+from starlette.responses import Response as HttpResponse
+from starlette.routing import Mount, Route
+from webargs.core import Parser
+from webargs.multidictproxy import MultiDictProxy
+from werkzeug.exceptions import UnprocessableEntity
+
+from api import to_error_response
+from controllers import POST_BODY_CACHE
+from controllers.aio import AsyncGoogleUserReader, AsyncPostReader, AsyncQuestPostReader, AsyncUnitAnalysisPostReader
+from controllers.base.cursor import is_post_list_cursor_valid
+from endpoints.conditional import get_validator_headers, is_not_modified, make_etag
+from endpoints.post_analysis import (
+    EPAnalysisPostGetParam, EPAnalysisPostListParam, analysis_post_get_args, analysis_post_list_args,
+)
+from endpoints.post_quest import EPQuestPostGetParam, EPQuestPostListParam, quest_post_get_args, quest_post_list_args
+from endpoints.user import EPUserShowAdsParam, user_show_ads_args
+from main import AppConfig, app as wsgi_app
+from responses import (
+    AnalysisPostGetFailedResponse, AnalysisPostGetSuccessResponse, AnalysisPostListFailedResponse,
+    AnalysisPostListResponse, QuestPostGetFailedResponse, QuestPostGetSuccessResponse,
+    QuestPostListFailedResponse, QuestPostListResponse, Response, ResponseCodeCollection, UserShowAdsResponse,
+    encode_with_post_body_cache, get_response_body_encoder,
+)
+
+__all__ = ("app",)
+
+
+class StarletteParser(Parser):
+    """Request argument parser for Starlette, behaving the same as the one for Flask."""
+
+    def load_querystring(self, req: Request, schema):
+        """Return query params from the request as a MultiDictProxy."""
+        return MultiDictProxy(req.query_params, schema)
+
+    def handle_error(self, error, req, schema, *, error_status_code, error_headers):
+        """Raise the same error as the Flask parser does."""
+        raise UnprocessableEntity()
+
+
+parser = StarletteParser()
+
+encode_response_body = encode_with_post_body_cache(
+    get_response_body_encoder(AppConfig.RESPONSE_BODY_ENCODER), POST_BODY_CACHE
+)
+
+
+def to_http_response(
+        response: Response, status_code: int, headers: Optional[dict[str, str]] = None
+) -> HttpResponse:
+    """Convert ``response`` to the HTTP response, encoded the same as the WSGI application does."""
+    return HttpResponse(
+        encode_response_body(response, wsgi_app.debug) + b"\n",
+        status_code=status_code,
+        headers=headers,
+        media_type="application/json"
+    )
+
+
+def is_conditional_request(request: Request) -> bool:
+    """Check if ``request`` has any conditional headers."""
+    return "If-None-Match" in request.headers or "If-Modified-Since" in request.headers
+
+
+def is_request_not_modified(request: Request, etag: str, last_modified: Optional[datetime]) -> bool:
+    """Check if the response of ``request`` is not modified according to its conditional headers."""
+    return is_not_modified(
+        etag, last_modified, request.headers.get("If-None-Match"), request.headers.get("If-Modified-Since")
+    )
+
+
+def make_not_modified_response(etag: str, last_modified: Optional[datetime]) -> HttpResponse:
+    """Make the ``304 Not Modified`` response without body."""
+    return HttpResponse(status_code=304, headers=get_validator_headers(etag, last_modified))
+
+
+def handle_error(_: Request, ex: Exception) -> HttpResponse:
+    """
+    Force the error to send in the conventionalized json format, encoded the same as the WSGI application does.
+
+    The status code is the same as the WSGI application returns. See ``api.to_error_response()``.
+    """
+    response, status_code = to_error_response(ex)
+
+    with wsgi_app.app_context():
+        body = wsgi_app.json.response(response.serialize()).get_data()
+
+    return HttpResponse(body, status_code=status_code, media_type="application/json")
+
+
+# region Post / List
+
+def post_list_endpoint(
+        reader: AsyncPostReader, list_args: dict[str, Any], param: Type[EPQuestPostListParam],
+        success_response: Callable[..., Response], failed_response: Callable[..., Response]
+):
+    """
+    Make the endpoint to get a post list using ``reader``.
+
+    The cursor is validated first. The user lookup runs concurrently with the list version lookup.
+    The post list is not loaded if not modified.
+    """
+    async def endpoint(request: Request) -> HttpResponse:
+        args = parser.parse(list_args, request, location="query")
+        start_idx = args[param.START]
+        uid = args[param.GOOGLE_UID]
+        lang_code = args[param.LANG_CODE]
+        limit = args[param.LIMIT]
+        cursor = args[param.CURSOR]
+        with_count = args[param.WITH_COUNT]
+
+        if not is_post_list_cursor_valid(cursor):
+            return to_http_response(failed_response(ResponseCodeCollection.FAILED_INVALID_CURSOR), 400)
+
+        user_context, validator = await asyncio.gather(
+            AsyncGoogleUserReader.get_user_context(uid),
+            reader.get_list_validator(lang_code)
+        )
+
+        etag = make_etag(validator, user_context)
+        if is_request_not_modified(request, etag, validator.last_modified):
+            return make_not_modified_response(etag, validator.last_modified)
+
+        list_result = await reader.get_posts(
+            lang_code, start=start_idx, limit=limit, cursor=cursor, with_count=with_count
+        )
+
+        return to_http_response(
+            success_response(user_context.is_admin, user_context.show_ads, start_idx, list_result), 200,
+            get_validator_headers(etag, validator.last_modified)
+        )
+
+    return endpoint
+
+
+# endregion
+
+
+# region Post / Get
+
+def post_get_endpoint(
+        reader: AsyncPostReader, get_args: dict[str, Any], param: Type[EPQuestPostGetParam],
+        success_response: Callable[..., Response], failed_response: Callable[..., Response]
+):
+    """
+    Make the endpoint to get a post using ``reader``. The user lookup runs concurrently.
+
+    For the conditional requests, the post is not loaded if not modified. The view is still counted.
+    """
+    async def endpoint(request: Request) -> HttpResponse:
+        args = parser.parse(get_args, request, location="query")
+        uid = args[param.GOOGLE_UID]
+        seq_id = args[param.SEQ_ID]
+        lang_code = args[param.LANG_CODE]
+        increase_count = args[param.INCREASE_COUNT]
+
+        if is_conditional_request(request):
+            user_context, validator = await asyncio.gather(
+                AsyncGoogleUserReader.get_user_context(uid),
+                reader.get_post_validator(seq_id, lang_code)
+            )
+
+            etag = make_etag(validator, user_context) if validator else None
+            if etag and is_request_not_modified(request, etag, validator.last_modified):
+                if increase_count:
+                    await reader.count_post_view(seq_id, validator.lang_code)
+
+                return make_not_modified_response(etag, validator.last_modified)
+
+            result = await reader.get_post(seq_id, lang_code, increase_count)
+        else:
+            user_context, result = await asyncio.gather(
+                AsyncGoogleUserReader.get_user_context(uid),
+                reader.get_post(seq_id, lang_code, increase_count)
+            )
+
+        if not result.data:
+            return to_http_response(failed_response(ResponseCodeCollection.FAILED_POST_NOT_EXISTS), 404)
+
+        validator = reader.to_post_validator(result)
+
+        return to_http_response(
+            success_response(user_context.is_admin, user_context.show_ads, result), 200,
+            get_validator_headers(make_etag(validator, user_context), validator.last_modified)
+        )
+
+    return endpoint
+
+
+# endregion
+
+
+# region User Show Ads
+
+async def user_show_ads(request: Request) -> HttpResponse:
+    """Endpoint to send a user ads disable check request."""
+    args = parser.parse(user_show_ads_args, request, location="query")
+
+    user_context = await AsyncGoogleUserReader.get_user_context(args[EPUserShowAdsParam.GOOGLE_UID])
+
+    return to_http_response(UserShowAdsResponse(user_context.show_ads), 200)
+
+
+# endregion
+
+
+app = Starlette(
+    routes=[
+        Route("/user/show-ads", user_show_ads),
+        Route("/posts/quest", post_list_endpoint(
+            AsyncQuestPostReader, quest_post_list_args, EPQuestPostListParam,
+            QuestPostListResponse, QuestPostListFailedResponse
+        )),
+        Route("/posts/quest/get", post_get_endpoint(
+            AsyncQuestPostReader, quest_post_get_args, EPQuestPostGetParam,
+            QuestPostGetSuccessResponse, QuestPostGetFailedResponse
+        )),
+        Route("/posts/analysis", post_list_endpoint(
+            AsyncUnitAnalysisPostReader, analysis_post_list_args, EPAnalysisPostListParam,
+            AnalysisPostListResponse, AnalysisPostListFailedResponse
+        )),
+        Route("/posts/analysis/get", post_get_endpoint(
+            AsyncUnitAnalysisPostReader, analysis_post_get_args, EPAnalysisPostGetParam,
+            AnalysisPostGetSuccessResponse, AnalysisPostGetFailedResponse
+        )),
+        # Everything else is served by the WSGI application
+        Mount("/", app=WSGIMiddleware(wsgi_app)),
+    ],
+    middleware=[
+        Middleware(CORSMiddleware, allow_origins=["*"], allow_methods=["*"], allow_headers=["*"]),
+    ],
+    exception_handlers={
+        Exception: handle_error,
+    },
+)
@@ -0,0 +1,6 @@
+"""In-process caches."""
+from .byte_lru import ByteLRUCache
+from .circuit import CircuitBreaker, CircuitOpenError
+from .single_flight import SingleFlight
+from .swr import CacheStatus, StaleWhileRevalidateCache, StaleWhileRevalidateConfig, StaleWhileRevalidateStats
+from .ttl_lru import TTLLRUCache
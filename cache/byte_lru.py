@@ -0,0 +1,91 @@
+"""In-process LRU cache bounded by the total size of the values in bytes."""
+import threading
+from collections import OrderedDict
+from typing import Generic, Hashable, Optional, TypeVar
+
+__all__ = ("ByteLRUCache",)
+
+T = TypeVar("T")
+
+
+class ByteLRUCache(Generic[T]):
+    """
+    Thread-safe LRU cache holding the values up to ``max_bytes`` in total.
+
+    The size of each value is given on caching. Values larger than ``max_bytes`` are not cached.
+    The cache is disabled if ``max_bytes`` is not positive.
+    """
+
+    def __init__(self, max_bytes: int):
+        self._max_bytes = max_bytes
+
+        self._lock = threading.Lock()
+        # Key -> (value, size in bytes)
+        self._entries: OrderedDict[Hashable, tuple[T, int]] = OrderedDict()
+        self._size = 0
+
+        self.hits = 0
+        self.misses = 0
+
+    def lookup(self, key: Hashable) -> tuple[bool, Optional[T]]:
+        """Get a tuple of if ``key`` is found and the value of ``key``. Value is ``None`` if not found."""
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if not entry:
+                self.misses += 1
+                return False, None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return True, entry[0]
+
+    def set(self, key: Hashable, value: T, size: int):
+        """Cache ``value`` of ``size`` bytes as ``key``, evicting the least recently used entries to fit it in."""
+        if size > self._max_bytes:
+            return
+
+        with self._lock:
+            self._pop(key)
+
+            self._entries[key] = (value, size)
+            self._size += size
+
+            while self._size > self._max_bytes:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self._size -= evicted_size
+
+    def _pop(self, key: Hashable):
+        if entry := self._entries.pop(key, None):
+            self._size -= entry[1]
+
+    def invalidate(self, key: Hashable):
+        """Drop the cached value of ``key``, if any."""
+        with self._lock:
+            self._pop(key)
+
+    def clear(self):
+        """Drop all cached values."""
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    @property
+    def max_bytes(self) -> int:
+        """Maximum total size of the cached values in bytes."""
+        return self._max_bytes
+
+    @property
+    def size(self) -> int:
+        """Total size of the cached values in bytes."""
+        return self._size
+
+    @property
+    def hit_ratio(self) -> float:
+        """Ratio of the cache hits to all lookups. Returns ``0`` if there were no lookups."""
+        total = self.hits + self.misses
+
+        return self.hits / total if total else 0
@@ -0,0 +1,62 @@
+"""Circuit breaker to stop calling a failing dependency for a while."""
+import threading
+import time
+
+__all__ = ("CircuitBreaker", "CircuitOpenError")
+
+
+class CircuitOpenError(Exception):
+    """Raised if the call is rejected because the circuit is open."""
+
+
+class CircuitBreaker:
+    """
+    Thread-safe circuit breaker.
+
+    The circuit opens after ``failure_threshold`` consecutive failures, rejecting the calls.
+    After ``reset_timeout`` seconds, a single trial call is allowed. The circuit closes if it succeeds,
+    or stays open for another ``reset_timeout`` seconds otherwise.
+
+    The circuit never opens if ``failure_threshold`` is not positive.
+    """
+
+    def __init__(self, failure_threshold: int, reset_timeout: float):
+        self._failure_threshold = failure_threshold
+        self._reset_timeout = reset_timeout
+
+        self._lock = threading.Lock()
+        self._failures = 0
+        # Monotonic timestamp until which the calls are rejected, if the circuit is open
+        self._open_until = 0.0
+
+    @property
+    def is_open(self) -> bool:
+        """If the circuit is open, including waiting for the trial call."""
+        return 0 < self._failure_threshold <= self._failures
+
+    def allow_call(self) -> bool:
+        """Check if a call is allowed. The trial call is allowed once for each ``reset_timeout`` when open."""
+        with self._lock:
+            if not self.is_open:
+                return True
+
+            now = time.monotonic()
+            if now < self._open_until:
+                return False
+
+            # Reject the other calls until the trial call completes, or the timeout is reached again
+            self._open_until = now + self._reset_timeout
+            return True
+
+    def record_success(self):
+        """Record a successful call, closing the circuit."""
+        with self._lock:
+            self._failures = 0
+
+    def record_failure(self):
+        """Record a failed call, opening the circuit if the failures reach the threshold."""
+        with self._lock:
+            self._failures += 1
+
+            if self.is_open:
+                self._open_until = time.monotonic() + self._reset_timeout
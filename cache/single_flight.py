@@ -0,0 +1,101 @@
+"""Coalescing of the concurrent identical calls into a single call."""
+import os
+import threading
+from typing import Any, Callable, Generic, Hashable, Optional, TypeVar
+
+__all__ = ("SingleFlight",)
+
+T = TypeVar("T")
+
+
+class _Flight:
+    """Call in flight and its outcome."""
+
+    __slots__ = ("done", "result", "error", "weight")
+
+    def __init__(self, weight: int):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+        self.weight = weight
+
+
+class SingleFlight(Generic[T]):
+    """
+    Thread-safe coalescing of the concurrent calls of the same key.
+
+    The first caller of a key makes the call, and the callers of the same key arriving before the call completes
+    wait for it and share its result or error, instead of making their own calls.
+
+    The result is shared by the callers, so it should not be modified.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._flights: dict[Hashable, _Flight] = {}
+
+        self.calls = 0
+        self.shared_calls = 0
+
+        # The lock may be held by the other threads of the parent process when forking
+        os.register_at_fork(after_in_child=self._reset)
+
+    def _reset(self):
+        self._lock = threading.Lock()
+        self._flights = {}
+
+    def do(self, key: Hashable, func: Callable[[], T], /, weight: int = 1) -> tuple[T, int]:
+        """
+        Call ``func``, or wait for the call of ``key`` in flight and share its result.
+
+        ``weight`` of each caller sharing the call is summed up,
+        for example, to aggregate the view counts of the callers into a single write.
+
+        :return: tuple of the result and the total weight of the callers if this caller made the call, 0 otherwise
+        """
+        with self._lock:
+            self.calls += 1
+
+            if flight := self._flights.get(key):
+                flight.weight += weight
+                self.shared_calls += 1
+                is_caller = False
+            else:
+                flight = self._flights[key] = _Flight(weight)
+                is_caller = True
+
+        if not is_caller:
+            flight.done.wait()
+
+            if flight.error:
+                raise flight.error
+
+            return flight.result, 0
+
+        try:
+            flight.result = func()
+        except BaseException as ex:
+            flight.error = ex
+            raise
+        finally:
+            with self._lock:
+                if self._flights.get(key) is flight:
+                    del self._flights[key]
+                total_weight = flight.weight
+
+            flight.done.set()
+
+        return flight.result, total_weight
+
+    def forget_if(self, predicate: Callable[[Hashable], bool]):
+        """
+        Stop sharing the calls in flight of the keys matching ``predicate`` with the callers arriving later.
+
+        This should be called if the data to be returned by these calls has changed.
+        """
+        with self._lock:
+            for key in [key for key in self._flights if predicate(key)]:
+                del self._flights[key]
+
+    def __len__(self):
+        return len(self._flights)
@@ -0,0 +1,168 @@
+"""In-process read-through cache serving the stale values while revalidating them."""
+import logging
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Generic, Hashable, TypeVar
+
+from .circuit import CircuitBreaker, CircuitOpenError
+
+__all__ = ("CacheStatus", "StaleWhileRevalidateCache", "StaleWhileRevalidateConfig", "StaleWhileRevalidateStats")
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class CacheStatus:
+    """Status of a value returned by ``StaleWhileRevalidateCache``."""
+
+    FRESH = "fresh"  # Cached, not older than the soft TTL
+    STALE = "stale"  # Cached, older than the soft TTL
+    REVALIDATED = "revalidated"  # Loaded for the call
+
+
+@dataclass(frozen=True)
+class StaleWhileRevalidateConfig:
+    """Configuration of ``StaleWhileRevalidateCache``."""
+
+    max_size: int
+    soft_ttl: float
+    hard_ttl: float
+    # Types of the load failures recorded to the circuit breaker
+    failure_types: tuple[type[Exception], ...]
+
+
+@dataclass
+class StaleWhileRevalidateStats:
+    """Lookup statistics of ``StaleWhileRevalidateCache``."""
+
+    hits: int = 0
+    stale_hits: int = 0
+    misses: int = 0
+
+
+class StaleWhileRevalidateCache(Generic[T]):
+    """
+    Thread-safe read-through LRU cache with at most ``max_size`` entries.
+
+    Cached values older than ``soft_ttl`` seconds are returned as-is, and reloaded in the background.
+    Values are reloaded on call if they are older than ``hard_ttl`` seconds or not cached.
+    Therefore, if the reload keeps failing, the stale values are still returned until ``hard_ttl``.
+
+    Loads failing with ``failure_types`` are recorded to ``circuit_breaker``.
+    Loads are skipped while the circuit is open.
+
+    The cache is disabled if ``soft_ttl`` is not positive.
+    """
+
+    def __init__(
+            self, max_size: int, soft_ttl: float, hard_ttl: float, circuit_breaker: CircuitBreaker,
+            failure_types: tuple[type[Exception], ...] = (Exception,)
+    ):
+        self._config = StaleWhileRevalidateConfig(max_size, soft_ttl, max(soft_ttl, hard_ttl), failure_types)
+        self._circuit_breaker = circuit_breaker
+
+        self._lock = threading.Lock()
+        # Key -> (value, monotonic timestamp of the load)
+        self._entries: OrderedDict[Hashable, tuple[T, float]] = OrderedDict()
+        # Keys being reloaded in the background
+        self._revalidating: set[Hashable] = set()
+        # Incremented on invalidation, so the values loaded before it are not cached
+        self._generation = 0
+
+        self.stats = StaleWhileRevalidateStats()
+
+    @property
+    def enabled(self) -> bool:
+        """If the cache is enabled."""
+        return self._config.soft_ttl > 0 and self._config.max_size > 0
+
+    def get(self, key: Hashable, loader: Callable[[], T]) -> tuple[T, str]:
+        """
+        Get a tuple of the value of ``key`` and its ``CacheStatus``, loading it by ``loader`` if needed.
+
+        :raises CircuitOpenError: if the value has to be loaded but the circuit is open
+        """
+        if not self.enabled:
+            return loader(), CacheStatus.REVALIDATED
+
+        with self._lock:
+            entry = self._entries.get(key)
+            age = time.monotonic() - entry[1] if entry else None
+
+            if entry and age < self._config.soft_ttl:
+                self._entries.move_to_end(key)
+                self.stats.hits += 1
+                return entry[0], CacheStatus.FRESH
+
+            stale = bool(entry and age < self._config.hard_ttl)
+            if stale:
+                self._entries.move_to_end(key)
+                self.stats.stale_hits += 1
+                revalidate = key not in self._revalidating and self._circuit_breaker.allow_call()
+                if revalidate:
+                    self._revalidating.add(key)
+            else:
+                self.stats.misses += 1
+
+        if stale:
+            if revalidate:
+                threading.Thread(
+                    target=self._revalidate, args=(key, loader), name="cache-revalidate", daemon=True
+                ).start()
+
+            return entry[0], CacheStatus.STALE
+
+        if not self._circuit_breaker.allow_call():
+            raise CircuitOpenError(f"Circuit is open, skipped loading `{key}`")
+
+        return self._load(key, loader), CacheStatus.REVALIDATED
+
+    def _load(self, key: Hashable, loader: Callable[[], T]) -> T:
+        generation = self._generation
+
+        try:
+            value = loader()
+        except Exception as ex:
+            if isinstance(ex, self._config.failure_types):
+                self._circuit_breaker.record_failure()
+
+            raise
+
+        self._circuit_breaker.record_success()
+
+        with self._lock:
+            if generation == self._generation:
+                self._entries[key] = (value, time.monotonic())
+                self._entries.move_to_end(key)
+
+                while len(self._entries) > self._config.max_size:
+                    self._entries.popitem(last=False)
+
+        return value
+
+    def _revalidate(self, key: Hashable, loader: Callable[[], T]):
+        try:
+            self._load(key, loader)
+        except Exception:  # pylint: disable=broad-except
+            logger.warning("Failed to revalidate `%s`, serving the stale value", key, exc_info=True)
+        finally:
+            with self._lock:
+                self._revalidating.discard(key)
+
+    def invalidate_if(self, predicate: Callable[[Hashable], bool]):
+        """Drop the cached values of the keys matching ``predicate``."""
+        with self._lock:
+            self._generation += 1
+
+            for key in [key for key in self._entries if predicate(key)]:
+                del self._entries[key]
+
+    def clear(self):
+        """Drop all cached values."""
+        self.invalidate_if(lambda _: True)
+
+    def __len__(self):
+        return len(self._entries)
@@ -0,0 +1,83 @@
+"""Bounded in-process LRU cache with per-entry TTL."""
+import threading
+import time
+from collections import OrderedDict
+from typing import Generic, Hashable, Optional, TypeVar
+
+__all__ = ("TTLLRUCache",)
+
+T = TypeVar("T")
+
+
+class TTLLRUCache(Generic[T]):
+    """
+    Thread-safe LRU cache with at most ``max_size`` entries, each expires after its TTL.
+
+    ``None`` is a valid value to cache, so a lookup returns if the key is found alongside the value.
+    """
+
+    def __init__(self, max_size: int, ttl: float):
+        self._max_size = max_size
+        self._ttl = ttl
+
+        self._lock = threading.Lock()
+        # Key -> (value, monotonic timestamp of the expiry)
+        self._entries: OrderedDict[Hashable, tuple[T, float]] = OrderedDict()
+
+        self.hits = 0
+        self.misses = 0
+
+    def lookup(self, key: Hashable) -> tuple[bool, Optional[T]]:
+        """Get a tuple of if ``key`` is found and the value of ``key``. Value is ``None`` if not found."""
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry and entry[1] > time.monotonic():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return True, entry[0]
+
+            if entry:
+                del self._entries[key]
+
+            self.misses += 1
+            return False, None
+
+    def set(self, key: Hashable, value: T, /, ttl: Optional[float] = None):
+        """
+        Cache ``value`` as ``key``, evicting the least recently used entry if the cache is full.
+
+        ``ttl`` overrides the default TTL of the cache. The value will not be cached if ``ttl`` is not positive.
+        """
+        if ttl is None:
+            ttl = self._ttl
+
+        if ttl <= 0 or self._max_size <= 0:
+            return
+
+        with self._lock:
+            self._entries[key] = (value, time.monotonic() + ttl)
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, key: Hashable):
+        """Drop the cached value of ``key``, if any."""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self):
+        """Drop all cached values."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+    @property
+    def hit_ratio(self) -> float:
+        """Ratio of the cache hits to all lookups. Returns ``0`` if there were no lookups."""
+        total = self.hits + self.misses
+
+        return self.hits / total if total else 0
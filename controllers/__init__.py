@@ -1,6 +1,14 @@
 """Data controllers."""
-from .base import ModifiableDataKey, MultilingualGetOneResult, MultilingualPostKey
+from .base import (
+    POST_BODY_CACHE, IndexSyncReport, ModifiableDataKey, MultilingualGetOneResult, MultilingualPostKey,
+    MultilingualPostListResult, PostIDUnavailableError, PostValidator,
+)
+from .change_watch import CHANGE_WATCHER, start_change_watcher
+from .indexes import INDEXED_CONTROLLERS, sync_all_indexes, sync_all_indexes_in_background
 from .post import (
-    QuestPostController, QuestPostKey, UnitAnalysisPostController, UnitAnalysisPostKey, UnitAnalysisPostType,
+    PostCounterController, QuestPostController, QuestPostHistoryController, QuestPostKey, QuestPostListController,
+    UnitAnalysisPostController, UnitAnalysisPostHistoryController, UnitAnalysisPostKey, UnitAnalysisPostListController,
+    UnitAnalysisPostType,
 )
-from .user import GoogleLoginType, GoogleUserDataController, GoogleUserDataKeys
+from .user import GoogleLoginType, GoogleUserContext, GoogleUserDataController, GoogleUserDataKeys
+from .warm_up import warm_up_controllers
@@ -0,0 +1,210 @@
+"""
+Async readers of the controllers for the native asyncio serving mode.
+
+The readers share the query building, the caches and the view count buffer of the sync controllers,
+but run the queries using the async MongoDB driver. Requires ``pymongo>=4.13``.
+"""
+import asyncio
+import os
+import weakref
+from typing import Any, Optional
+
+from pymongo import AsyncMongoClient
+from pymongo.asynchronous.collection import AsyncCollection
+
+from .base import MultilingualGetOneResult, MultilingualPostController, MultilingualPostListResult, PostValidator
+from .base.command_stats import COMMAND_STATS_LISTENER
+from .base.config import MONGO_CLIENT_OPTIONS, MONGO_URL
+from .base.pool_stats import POOL_STATS
+from .base.slow_query import SLOW_QUERY_LISTENER
+from .base.ctrl import BaseCollection
+from .base.post_version import LIST_VERSION_COUNTER
+from .post import QuestPostController, UnitAnalysisPostController
+from .user import GoogleUserContext, GoogleUserDataController, GoogleUserDataKeys
+
+__all__ = ("get_async_mongo_client", "AsyncPostReader", "AsyncUserReader",
+           "AsyncQuestPostReader", "AsyncUnitAnalysisPostReader", "AsyncGoogleUserReader")
+
+# Event loop -> client. An async client can only be used in the event loop where it is first used.
+_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncMongoClient]" = weakref.WeakKeyDictionary()
+
+
+def _discard_clients():
+    _clients.clear()
+
+
+# Clients created before forking must not be used in the forked process
+os.register_at_fork(after_in_child=_discard_clients)
+
+
+def get_async_mongo_client() -> AsyncMongoClient:
+    """
+    Get the async MongoDB client of the running event loop, creating it on the first call in the event loop.
+
+    :raises ValueError: if the connection string `MONGO_URL` is not specified
+    """
+    loop = asyncio.get_running_loop()
+
+    if client := _clients.get(loop):
+        return client
+
+    if not MONGO_URL:
+        raise ValueError("Specify connection string to MongoDB instance "
+                         "as `MONGO_URL` in environment variable.")
+
+    client = _clients[loop] = AsyncMongoClient(
+        MONGO_URL, event_listeners=[COMMAND_STATS_LISTENER, POOL_STATS, SLOW_QUERY_LISTENER], **MONGO_CLIENT_OPTIONS
+    )
+
+    return client
+
+
+def _get_async_collection(controller: BaseCollection) -> AsyncCollection:
+    return get_async_mongo_client().get_database(controller.database.name).get_collection(controller.name)
+
+
+class AsyncPostReader:
+    """Async reader of the posts in the collection of a multilingual post controller."""
+
+    def __init__(self, controller: MultilingualPostController):
+        self._controller = controller
+
+    async def get_post(self, seq_id: int, lang_code: str = "cht", inc_count: bool = True, /,
+                       fallback_langs: Optional[list[str]] = None) -> MultilingualGetOneResult:
+        """Get a post asynchronously. Same as ``MultilingualPostController.get_post``."""
+        if not seq_id:
+            return MultilingualGetOneResult(None, False, [])
+
+        collection = _get_async_collection(self._controller)
+
+        cursor = await collection.aggregate(
+            self._controller.get_post_pipeline(seq_id, lang_code, fallback_langs=fallback_langs)
+        )
+        result = self._controller.to_get_one_result(await cursor.next(), lang_code)
+
+        if result.data and self._controller.views.count_view(result.data, inc_count):
+            await self._increase_view_count(result.data)
+
+        return result
+
+    async def _increase_view_count(self, post: dict[str, Any]):
+        await _get_async_collection(self._controller.views.counters).update_one(
+            *self._controller.views.get_view_count_update(post), upsert=True
+        )
+
+    async def get_post_validator(
+            self, seq_id: int, lang_code: str, /, fallback_langs: Optional[list[str]] = None
+    ) -> Optional[PostValidator]:  # pylint: disable=unsubscriptable-object
+        """Get the post validator asynchronously. Same as ``MultilingualPostController.get_post_validator``."""
+        if not seq_id:
+            return None
+
+        post_filter, projection = self._controller.versions.get_post_validator_query(seq_id)
+        timestamps = await _get_async_collection(self._controller).find(post_filter, projection=projection).to_list()
+
+        return self._controller.versions.to_post_validator_from_timestamps(
+            seq_id, lang_code, timestamps, fallback_langs=fallback_langs
+        )
+
+    async def count_post_view(self, seq_id: int, lang_code: str):
+        """Count the post view asynchronously. Same as ``MultilingualPostController.count_post_view``."""
+        post = self._controller.get_post_key(seq_id, lang_code)
+
+        if self._controller.views.count_view(post, True):
+            await self._increase_view_count(post)
+
+    def to_post_validator(self, result: MultilingualGetOneResult) -> PostValidator:
+        """Get the validator of the post in ``result``. Same as ``MultilingualPostController.to_post_validator``."""
+        return self._controller.to_post_validator(result)
+
+    async def get_list_validator(self, lang_code: Optional[str]) -> PostValidator:
+        """Get the validator of the post list in ``lang_code`` asynchronously."""
+        version_tracker = self._controller.versions.list_version
+
+        version_doc = await get_async_mongo_client() \
+            .get_database(self._controller.database.name) \
+            .get_collection(LIST_VERSION_COUNTER) \
+            .find_one(version_tracker.get_version_filter(lang_code))
+
+        return version_tracker.to_validator(version_doc)
+
+    async def _get_post_count(self, lang_code: Optional[str]) -> int:
+        if (count := self._controller.post_count_cache.lookup(lang_code)) is not None:
+            return count
+
+        collection = _get_async_collection(self._controller.list_entries)
+
+        if (count_filter := self._controller.get_count_filter(lang_code)) is None:
+            count = await collection.estimated_document_count()
+        else:
+            count = await collection.count_documents(count_filter)
+
+        self._controller.post_count_cache.set(lang_code, count)
+
+        return count
+
+    async def get_posts(
+            self, lang_code: Optional[str], /, start: int = 0, limit: int = 0, cursor: Optional[str] = None,
+            with_count: bool = True
+    ) -> MultilingualPostListResult:
+        """
+        Get the post list asynchronously. Same as ``get_posts`` of the post controllers.
+
+        The posts and the post count are fetched concurrently, then the view counts of the posts are fetched at once.
+
+        :raises ValueError: if `cursor` is malformed
+        """
+        list_filter, sort, start = self._controller.get_post_list_query(lang_code, start=start, cursor=cursor)
+
+        posts_cursor = _get_async_collection(self._controller.list_entries) \
+            .find(list_filter, projection=self._controller.post_list_projection, sort=sort) \
+            .skip(start) \
+            .limit(limit)
+
+        if with_count:
+            posts, post_count = await asyncio.gather(posts_cursor.to_list(), self._get_post_count(lang_code))
+        else:
+            posts, post_count = await posts_cursor.to_list(), None
+
+        if post_ids := self._controller.views.get_post_ids(posts):
+            counters = self._controller.views.counters
+            counters_cursor = _get_async_collection(counters).find(
+                counters.get_view_counts_filter(self._controller.collection_name, post_ids)
+            )
+            self._controller.views.attach_view_counts(posts, counters.to_view_counts(await counters_cursor.to_list()))
+
+        return self._controller.to_post_list_result(posts, limit, post_count)
+
+
+class AsyncUserReader:
+    """Async reader of the Google user data sharing the user data cache of the controller."""
+
+    def __init__(self, controller):
+        self._controller = controller
+
+    async def get_user_data(self, uid: Optional[str]) -> Optional[dict[str, Any]]:
+        """Get the user data asynchronously. Same as ``GoogleUserDataController.get_user_data``."""
+        if not uid:
+            return None
+
+        # Prevent number being accidentally passed in
+        uid = str(uid)
+
+        found, user_data = self._controller.user_cache.lookup(uid)
+        if found:
+            return user_data
+
+        user_data = await _get_async_collection(self._controller).find_one({GoogleUserDataKeys.GOOGLE_UID: uid})
+
+        self._controller.cache_user_data(uid, user_data)
+
+        return user_data
+
+    async def get_user_context(self, uid: Optional[str]) -> GoogleUserContext:
+        """Get the user context asynchronously. Same as ``GoogleUserDataController.get_user_context``."""
+        return GoogleUserContext(await self.get_user_data(uid))
+
+
+AsyncQuestPostReader = AsyncPostReader(QuestPostController)
+AsyncUnitAnalysisPostReader = AsyncPostReader(UnitAnalysisPostController)
+AsyncGoogleUserReader = AsyncUserReader(GoogleUserDataController)
@@ -1,6 +1,22 @@
 """Base classes for the data controllers."""
-from .config import MONGO_CLIENT
+from .change_watch import ChangeEvent, ChangeOperation, ChangeSubscription, ChangeWatcher, ChangeWatchMode
+from .command_stats import (
+    ENDPOINT_COMMAND_STATS, CommandStats, record_command_stats, start_command_stats, stop_command_stats,
+)
+from .client import get_mongo_client, warm_up_mongo_client
+from .config import CHANGE_WATCH_MODE, CHANGE_WATCH_POLL_SEC, INDEX_SYNC_ON_STARTUP, MONGO_WARM_UP_CONNECTIONS
 from .ctrl import BaseCollection
 from .ctrl_lang import MultilingualDataController, MultilingualGetOneResult
-from .ctrl_lang_post import MultilingualPostController, MultilingualPostKey
+from .ctrl_lang_post import (
+    POST_BODY_CACHE, MultilingualPostController, MultilingualPostKey, MultilingualPostListResult,
+    PostIDUnavailableError,
+)
+from .ctrl_lang_post_history import MultilingualPostHistoryController
+from .ctrl_lang_post_list import MultilingualPostListController
+from .ctrl_post_counter import MultilingualPostCounterController, PostCounterKey
+from .index import IndexSyncReport
+from .lazy import LazyController
+from .pool_stats import POOL_STATS
 from .post_mod import ModifiableDataKey
+from .post_version import PostValidator
+from .slow_query import SLOW_QUERY_LISTENER, reset_query_endpoint, set_query_endpoint
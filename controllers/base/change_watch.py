@@ -0,0 +1,361 @@
+"""Watcher of the database changes, invalidating the in-process caches of the changed documents."""
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Callable, Iterable, Optional
+
+from pymongo.collection import Collection
+from pymongo.database import Database
+from pymongo.errors import OperationFailure, PyMongoError
+
+__all__ = ("ChangeWatchMode", "ChangeOperation", "ChangeEvent", "ChangeSubscription", "ChangeWatchConfig",
+           "ChangeWatchStats", "ChangeWatcher")
+
+logger = logging.getLogger(__name__)
+
+# Error code of resuming a change stream from a point no longer in the oplog
+CHANGE_STREAM_HISTORY_LOST = 286
+# Error code of a change stream unable to be resumed
+CHANGE_STREAM_FATAL_ERROR = 280
+# Error code of opening a change stream on a standalone server
+CHANGE_STREAM_NOT_SUPPORTED = 40573
+
+# Maximum seconds to wait before reopening a failed change stream or retrying a failed poll
+MAX_RETRY_BACKOFF_SEC = 30
+
+
+class ChangeWatchMode:
+    """Mode of ``ChangeWatcher``."""
+
+    OFF = ""
+    STREAM = "stream"
+    POLL = "poll"
+    AUTO = "auto"  # Change streams, falling back to polling if the server does not support them
+
+    ALL = (OFF, STREAM, POLL, AUTO)
+
+
+class ChangeOperation:
+    """Operation types of the changes."""
+
+    INSERT = "insert"
+    UPDATE = "update"
+    REPLACE = "replace"
+    DELETE = "delete"
+    # Documents modified since the last poll. Polling cannot tell the insertions from the updates.
+    POLLED = "polled"
+
+
+@dataclass(frozen=True)
+class ChangeEvent:
+    """
+    Change of a document in a watched collection.
+
+    ``document`` contains only the fields subscribed. It's ``None`` if the document is unavailable,
+    for example, the document has been deleted.
+    """
+
+    operation: str
+    document: Optional[dict[str, Any]]  # pylint: disable=unsubscriptable-object
+
+
+@dataclass(frozen=True)
+class ChangeSubscription:
+    """
+    Subscription of the changes in ``collection``.
+
+    ``on_change`` is called on each change of the documents in ``collection``.
+    ``on_reset`` is called if some changes may have been missed, so everything cached should be dropped.
+
+    ``fields`` are the fields of the changed documents to be included in the events.
+
+    Updates not setting ``modified_key`` are not watched, if ``modified_key`` is given.
+    ``modified_key`` is also used to find the changed documents on polling.
+    Collections without ``modified_key`` are not watched on polling.
+    """
+
+    collection: Collection
+    on_change: Callable[[ChangeEvent], None]
+    on_reset: Callable[[], None]
+    fields: tuple[str, ...] = ()
+    modified_key: Optional[str] = None  # pylint: disable=unsubscriptable-object
+
+
+@dataclass(frozen=True)
+class ChangeWatchConfig:
+    """Configuration of ``ChangeWatcher``."""
+
+    # One of ``ChangeWatchMode``
+    mode: str
+    # Seconds between the polls in ``ChangeWatchMode.POLL``
+    poll_interval: float
+
+
+@dataclass
+class ChangeWatchStats:
+    """Statistics of ``ChangeWatcher``."""
+
+    # Changes published to the subscriptions
+    events: int = 0
+    # Failures of the change streams and the polls
+    errors: int = 0
+    # Times the subscriptions were notified that some changes may have been missed
+    resets: int = 0
+
+
+class ChangeWatcher:
+    """
+    Watcher of the changes in the subscribed collections, running a daemon thread per database in each process.
+
+    The changes are followed by the change streams of the databases in ``ChangeWatchMode.STREAM``,
+    and the streams are resumed from the last change handled on error.
+    The collections are polled every ``poll_interval`` seconds for the documents modified in ``ChangeWatchMode.POLL``.
+
+    ``lag`` is the seconds since the changes of all databases were last known to be handled.
+    """
+
+    def __init__(self, mode: str, poll_interval: float):
+        if mode not in ChangeWatchMode.ALL:
+            raise ValueError(f"Unknown change watch mode: `{mode}`")
+
+        self._config = ChangeWatchConfig(mode, poll_interval)
+
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._watcher_pid: Optional[int] = None
+        # Database name -> epoch timestamp until which the changes are handled
+        self._caught_up_at: dict[str, float] = {}
+        self._database_count = 0
+
+        self.stats = ChangeWatchStats()
+
+    @property
+    def enabled(self) -> bool:
+        """If the watcher is enabled."""
+        return self._config.mode != ChangeWatchMode.OFF
+
+    @property
+    def lag(self) -> Optional[float]:
+        """Seconds since the changes of all databases were last known to be handled. ``None`` if not caught up yet."""
+        with self._lock:
+            if not self._database_count or len(self._caught_up_at) < self._database_count:
+                return None
+
+            return max(time.time() - min(self._caught_up_at.values()), 0)
+
+    def _mark_caught_up(self, db_name: str, timestamp: float):
+        with self._lock:
+            self._caught_up_at[db_name] = timestamp
+
+    def start(self, subscriptions: Iterable[ChangeSubscription]) -> bool:
+        """
+        Start watching ``subscriptions`` in the current process, if not started yet (threads do not survive fork).
+
+        :return: if the watcher is started by this call
+        """
+        if not self.enabled:
+            return False
+
+        with self._lock:
+            if self._watcher_pid == os.getpid():
+                return False
+
+            self._watcher_pid = os.getpid()
+            self._stop.clear()
+            self._caught_up_at = {}
+
+            by_database: dict[str, list[ChangeSubscription]] = {}
+            databases: dict[str, Database] = {}
+            for subscription in subscriptions:
+                database = subscription.collection.database
+                databases[database.name] = database
+                by_database.setdefault(database.name, []).append(subscription)
+
+            self._database_count = len(databases)
+
+        for db_name, db_subscriptions in by_database.items():
+            threading.Thread(
+                target=self._watch_database, args=(databases[db_name], db_subscriptions),
+                name=f"change-watch-{db_name}", daemon=True
+            ).start()
+
+        return True
+
+    def stop(self):
+        """Stop the watching threads of the current process after their current wait."""
+        self._stop.set()
+
+        with self._lock:
+            self._watcher_pid = None
+
+    def _watch_database(self, database: Database, subscriptions: list[ChangeSubscription]):
+        if self._config.mode == ChangeWatchMode.POLL:
+            self._poll_database(database.name, subscriptions)
+            return
+
+        try:
+            self._stream_database(database, subscriptions)
+        except OperationFailure as ex:
+            if ex.code != CHANGE_STREAM_NOT_SUPPORTED or self._config.mode != ChangeWatchMode.AUTO:
+                logger.exception("Stopped watching the changes of `%s`", database.name)
+                return
+
+            logger.warning("Change streams are not supported on `%s`, polling instead", database.name)
+            self._poll_database(database.name, subscriptions)
+
+    # region Change streams
+
+    @staticmethod
+    def get_stream_pipeline(subscriptions: list[ChangeSubscription]) -> list[dict[str, Any]]:
+        """Get the change stream pipeline of a database to watch the changes of ``subscriptions`` only."""
+        collection_matches = []
+        projection = {"operationType": 1, "ns": 1, "clusterTime": 1}
+
+        for subscription in subscriptions:
+            match: dict[str, Any] = {"ns.coll": subscription.collection.name}
+
+            if subscription.modified_key:
+                # Skip the updates not modifying the document, such as counting the views
+                match["$or"] = [
+                    {"operationType": {"$ne": ChangeOperation.UPDATE}},
+                    {f"updateDescription.updatedFields.{subscription.modified_key}": {"$exists": True}}
+                ]
+
+            collection_matches.append(match)
+            projection.update({f"fullDocument.{field}": 1 for field in subscription.fields})
+
+        return [
+            # Dropping or renaming the database invalidates the stream
+            {"$match": {"$or": collection_matches + [{"operationType": {"$in": ["dropDatabase", "invalidate"]}}]}},
+            {"$project": projection}
+        ]
+
+    def _stream_database(self, database: Database, subscriptions: list[ChangeSubscription]):
+        pipeline = self.get_stream_pipeline(subscriptions)
+        resume_token = None
+        retry_count = 0
+
+        while not self._stop.is_set():
+            try:
+                with database.watch(
+                        pipeline, full_document="updateLookup", resume_after=resume_token, max_await_time_ms=1000
+                ) as stream:
+                    retry_count = 0
+
+                    while stream.alive and not self._stop.is_set():
+                        if change := stream.try_next():
+                            if not self.handle_stream_change(change, subscriptions):
+                                # Stream invalidated, cannot be resumed
+                                resume_token = None
+                                break
+
+                            self._mark_caught_up(database.name, change["clusterTime"].time)
+                        else:
+                            # No more changes for now
+                            self._mark_caught_up(database.name, time.time())
+
+                        resume_token = stream.resume_token
+            except OperationFailure as ex:
+                if ex.code == CHANGE_STREAM_NOT_SUPPORTED:
+                    raise
+
+                self.stats.errors += 1
+
+                if ex.code in (CHANGE_STREAM_HISTORY_LOST, CHANGE_STREAM_FATAL_ERROR):
+                    logger.warning("Changes of `%s` may be missed, restarting the change stream", database.name)
+                    self.reset(subscriptions)
+                    resume_token = None
+                    continue
+
+                logger.exception("Change stream of `%s` failed", database.name)
+                retry_count += 1
+            except PyMongoError:
+                self.stats.errors += 1
+                logger.exception("Change stream of `%s` failed", database.name)
+                retry_count += 1
+
+            self._stop.wait(min(2 ** retry_count, MAX_RETRY_BACKOFF_SEC) if retry_count else 0)
+
+    def handle_stream_change(self, change: dict[str, Any], subscriptions: list[ChangeSubscription]) -> bool:
+        """
+        Publish ``change`` from the change stream to the matching ``subscriptions``.
+
+        :return: if the change stream is still valid
+        """
+        operation = change["operationType"]
+
+        if operation in ("dropDatabase", "invalidate"):
+            self.reset(subscriptions)
+            return operation != "invalidate"
+
+        col_name = change.get("ns", {}).get("coll")
+
+        for subscription in subscriptions:
+            if subscription.collection.name != col_name:
+                continue
+
+            self.stats.events += 1
+
+            if operation in (ChangeOperation.INSERT, ChangeOperation.UPDATE,
+                             ChangeOperation.REPLACE, ChangeOperation.DELETE):
+                subscription.on_change(ChangeEvent(operation, change.get("fullDocument")))
+            else:
+                # Collection dropped or renamed
+                subscription.on_reset()
+
+        return True
+
+    # endregion
+
+    # region Polling
+
+    def _poll_database(self, db_name: str, subscriptions: list[ChangeSubscription]):
+        subscriptions = [subscription for subscription in subscriptions if subscription.modified_key]
+        # Collection name -> last modified timestamp of the documents seen
+        since = {subscription.collection.name: datetime.utcnow() for subscription in subscriptions}
+        retry_count = 0
+
+        while not self._stop.wait(min(self._config.poll_interval * 2 ** retry_count, MAX_RETRY_BACKOFF_SEC)):
+            polled_at = time.time()
+
+            try:
+                for subscription in subscriptions:
+                    since[subscription.collection.name] = self.poll_collection(
+                        subscription, since[subscription.collection.name]
+                    )
+            except PyMongoError:
+                self.stats.errors += 1
+                logger.exception("Failed to poll the changes of `%s`", db_name)
+                retry_count += 1
+                continue
+
+            retry_count = 0
+            self._mark_caught_up(db_name, polled_at)
+
+    def poll_collection(self, subscription: ChangeSubscription, since: datetime) -> datetime:
+        """
+        Publish the documents modified after ``since`` in the collection of ``subscription``.
+
+        :return: last modified timestamp of the documents published, or ``since`` if none
+        """
+        projection = {field: 1 for field in subscription.fields} | {subscription.modified_key: 1, "_id": 0}
+
+        for document in subscription.collection.find({subscription.modified_key: {"$gt": since}}, projection):
+            self.stats.events += 1
+            since = max(since, document[subscription.modified_key])
+
+            subscription.on_change(ChangeEvent(ChangeOperation.POLLED, document))
+
+        return since
+
+    # endregion
+
+    def reset(self, subscriptions: list[ChangeSubscription]):
+        """Notify ``subscriptions`` that some changes may have been missed."""
+        self.stats.resets += 1
+
+        for subscription in subscriptions:
+            subscription.on_reset()
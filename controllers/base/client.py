@@ -0,0 +1,74 @@
+"""Lazily created, per-process MongoDB client."""
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
+from pymongo import MongoClient
+
+from .command_stats import COMMAND_STATS_LISTENER
+from .config import MONGO_CLIENT_OPTIONS, MONGO_URL
+from .pool_stats import POOL_STATS
+from .slow_query import SLOW_QUERY_LISTENER
+
+__all__ = ("get_mongo_client", "warm_up_mongo_client")
+
+
+class _ProcessClient:
+    """Holder of the client of the current process and the lock to create it."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        # (PID of the process creating the client, client)
+        self.client: Optional[tuple[int, MongoClient]] = None  # pylint: disable=unsubscriptable-object
+
+
+_PROCESS_CLIENT = _ProcessClient()
+
+
+def _reset_client_lock():
+    _PROCESS_CLIENT.lock = threading.Lock()
+
+
+# The lock may be held by the other threads of the parent process when forking
+os.register_at_fork(after_in_child=_reset_client_lock)
+
+
+def get_mongo_client() -> MongoClient:
+    """
+    Get the MongoDB client of the current process, creating it on the first call in the process.
+
+    ``MongoClient`` is not fork-safe, so the client created before forking (for example, by ``gunicorn --preload``)
+    is never used in the forked process.
+
+    :raises ValueError: if the connection string `MONGO_URL` is not specified
+    """
+    pid = os.getpid()
+
+    if (client := _PROCESS_CLIENT.client) and client[0] == pid:
+        return client[1]
+
+    with _PROCESS_CLIENT.lock:
+        if not _PROCESS_CLIENT.client or _PROCESS_CLIENT.client[0] != pid:
+            if not MONGO_URL:
+                raise ValueError("Specify connection string to MongoDB instance "
+                                 "as `MONGO_URL` in environment variable.")
+
+            _PROCESS_CLIENT.client = (pid, MongoClient(
+                MONGO_URL, event_listeners=[COMMAND_STATS_LISTENER, POOL_STATS, SLOW_QUERY_LISTENER],
+                **MONGO_CLIENT_OPTIONS
+            ))
+
+        return _PROCESS_CLIENT.client[1]
+
+
+def warm_up_mongo_client(connection_count: int):
+    """Open ``connection_count`` connections of the client in the current process by pinging concurrently."""
+    client = get_mongo_client()
+
+    if connection_count <= 0:
+        return
+
+    with ThreadPoolExecutor(max_workers=connection_count) as executor:
+        for _ in range(connection_count):
+            executor.submit(client.admin.command, "ping")
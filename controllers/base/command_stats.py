@@ -0,0 +1,156 @@
+"""Statistics of the database commands issued by each request."""
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from dataclasses import dataclass, field
+from typing import Iterator, Optional
+
+import bson
+from pymongo import monitoring
+
+__all__ = ("CommandStats", "EndpointStats", "EndpointCommandStats", "CommandStatsListener",
+           "COMMAND_STATS_LISTENER", "ENDPOINT_COMMAND_STATS",
+           "start_command_stats", "stop_command_stats", "record_command_stats")
+
+
+@dataclass
+class CommandStats:
+    """
+    Statistics of the database commands issued while recording.
+
+    Commands recorded are also recorded to ``parent``, if any.
+    """
+
+    count: int = 0
+    failed_count: int = 0
+    # Total seconds spent on the commands
+    duration: float = 0
+    request_bytes: int = 0
+    reply_bytes: int = 0
+
+    parent: Optional["CommandStats"] = field(default=None, repr=False, compare=False)
+
+    def to_server_timing(self) -> str:
+        """Get the value of the ``Server-Timing`` header reporting the statistics."""
+        return (
+            f'db;dur={self.duration * 1000:.3f};'
+            f'desc="{self.count} commands, {self.request_bytes + self.reply_bytes} bytes"'
+        )
+
+
+_current_stats: ContextVar[Optional[CommandStats]] = ContextVar("command_stats", default=None)
+
+
+def start_command_stats() -> tuple[CommandStats, Token]:
+    """
+    Start recording the database commands issued in the current context.
+
+    The recording started earlier in the same context, if any, still records the commands.
+
+    :return: statistics being recorded, and the token to stop recording by ``stop_command_stats()``
+    """
+    stats = CommandStats(parent=_current_stats.get())
+
+    return stats, _current_stats.set(stats)
+
+
+def stop_command_stats(token: Token):
+    """Stop the recording started by ``start_command_stats()`` which returned ``token``."""
+    _current_stats.reset(token)
+
+
+@contextmanager
+def record_command_stats() -> Iterator[CommandStats]:
+    """Record the database commands issued in the current context within the ``with`` block."""
+    stats, token = start_command_stats()
+
+    try:
+        yield stats
+    finally:
+        stop_command_stats(token)
+
+
+class CommandStatsListener(monitoring.CommandListener):
+    """
+    Listener recording the database commands to the statistics being recorded in the current context.
+
+    The listener does nothing if no statistics are being recorded, so it can be always registered.
+
+    Commands issued by the other threads, such as flushing the buffered view counts, are not recorded.
+    """
+
+    def started(self, event: monitoring.CommandStartedEvent):
+        if not (stats := _current_stats.get()):
+            return
+
+        size = len(bson.encode(event.command))
+
+        while stats:
+            stats.request_bytes += size
+            stats = stats.parent
+
+    def succeeded(self, event: monitoring.CommandSucceededEvent):
+        if not (stats := _current_stats.get()):
+            return
+
+        size = len(bson.encode(event.reply))
+
+        while stats:
+            stats.count += 1
+            stats.duration += event.duration_micros / 1E6
+            stats.reply_bytes += size
+            stats = stats.parent
+
+    def failed(self, event: monitoring.CommandFailedEvent):
+        if not (stats := _current_stats.get()):
+            return
+
+        while stats:
+            stats.count += 1
+            stats.failed_count += 1
+            stats.duration += event.duration_micros / 1E6
+            stats = stats.parent
+
+
+@dataclass
+class EndpointStats:
+    """Total statistics of the database commands issued by the requests of an endpoint."""
+
+    request_count: int = 0
+    commands: CommandStats = field(default_factory=CommandStats)
+
+
+class EndpointCommandStats:
+    """Thread-safe totals of the database commands issued by the requests of each endpoint."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stats: dict[str, EndpointStats] = {}
+
+    def record(self, endpoint: str, stats: CommandStats):
+        """Add ``stats`` of a request of ``endpoint`` to the totals."""
+        with self._lock:
+            totals = self._stats.setdefault(endpoint, EndpointStats())
+
+            totals.request_count += 1
+            totals.commands.count += stats.count
+            totals.commands.failed_count += stats.failed_count
+            totals.commands.duration += stats.duration
+            totals.commands.request_bytes += stats.request_bytes
+            totals.commands.reply_bytes += stats.reply_bytes
+
+    def snapshot(self) -> dict[str, EndpointStats]:
+        """Get a copy of the totals keyed by the endpoint name."""
+        with self._lock:
+            return {
+                endpoint: EndpointStats(totals.request_count, CommandStats(
+                    totals.commands.count, totals.commands.failed_count, totals.commands.duration,
+                    totals.commands.request_bytes, totals.commands.reply_bytes
+                ))
+                for endpoint, totals in self._stats.items()
+            }
+
+
+COMMAND_STATS_LISTENER = CommandStatsListener()
+
+ENDPOINT_COMMAND_STATS = EndpointCommandStats()
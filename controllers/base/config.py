@@ -1,20 +1,50 @@
 """Various configs related to the database and the connection to it."""
 import os
-import sys
 import time
-
-from pymongo import MongoClient
+from typing import Any
 
 from env_var import is_testing
 
-__all__ = ("MONGO_URL", "MONGO_CLIENT", "get_single_db_name", "SINGLE_DB_NAME", "is_test_db",)
+__all__ = ("MONGO_URL", "MONGO_CLIENT_OPTIONS", "MONGO_WARM_UP_CONNECTIONS",
+           "get_single_db_name", "SINGLE_DB_NAME", "is_test_db",
+           "VIEW_COUNT_FLUSH_SEC", "VIEW_COUNT_FLUSH_SIZE", "POST_FALLBACK_LANGS",
+           "POST_COUNT_RECONCILE_SEC", "USER_CACHE_SIZE", "USER_CACHE_TTL_SEC",
+           "SEQ_ID_BLOCK_SIZE", "INDEX_SYNC_ON_STARTUP", "POST_BODY_CACHE_BYTES",
+           "CHANGE_WATCH_MODE", "CHANGE_WATCH_POLL_SEC", "POST_READ_SOFT_TTL_SEC", "POST_READ_HARD_TTL_SEC",
+           "POST_READ_CACHE_SIZE", "DB_CIRCUIT_FAILURE_THRESHOLD", "DB_CIRCUIT_RESET_SEC",
+           "POST_READ_COALESCING", "MONGO_COMMAND_STATS", "SERVER_TIMING_HEADER",
+           "SLOW_QUERY_MS", "SLOW_QUERY_EXPLAIN_INTERVAL_SEC", "POST_MODIFY_NOTES_EMBEDDED",
+           "POST_GET_MANY_LIMIT", "POST_PUBLISH_TRANSACTION")
 
 MONGO_URL = os.environ.get("MONGO_URL")
-if not MONGO_URL:
-    print("Specify connection string to MongoDB instance as `MONGO_URL` in environment variable.")
-    sys.exit(1)
 
-MONGO_CLIENT = MongoClient(MONGO_URL)
+# Environment variable name -> `MongoClient` option. Options not set use the ones in `MONGO_URL` or the defaults.
+_MONGO_CLIENT_OPTION_ENV = {
+    "MONGO_MAX_POOL_SIZE": "maxPoolSize",
+    "MONGO_MIN_POOL_SIZE": "minPoolSize",
+    "MONGO_CONNECT_TIMEOUT_MS": "connectTimeoutMS",
+    "MONGO_SOCKET_TIMEOUT_MS": "socketTimeoutMS",
+    "MONGO_SERVER_SELECTION_TIMEOUT_MS": "serverSelectionTimeoutMS",
+    "MONGO_WAIT_QUEUE_TIMEOUT_MS": "waitQueueTimeoutMS",
+}
+
+MONGO_CLIENT_OPTIONS: dict[str, Any] = {
+    option: int(os.environ[env_name]) for env_name, option in _MONGO_CLIENT_OPTION_ENV.items()
+    if os.environ.get(env_name)
+}
+
+# Count of the connections to be opened when a worker starts. Warm-up is disabled if this is `0`.
+MONGO_WARM_UP_CONNECTIONS = int(os.environ.get("MONGO_WARM_UP_CONNECTIONS", 0))
+
+# Return the statistics of the database commands issued by each request in the `Server-Timing` header if this is `1`.
+SERVER_TIMING_HEADER = bool(int(os.environ.get("SERVER_TIMING_HEADER", 0)))
+# Record the database commands issued by the requests of each endpoint if this is `1` or `SERVER_TIMING_HEADER` is set.
+MONGO_COMMAND_STATS = bool(int(os.environ.get("MONGO_COMMAND_STATS", 0))) or SERVER_TIMING_HEADER
+
+# Milliseconds of a database command to be logged as slow. Slow commands are not logged if this is `0`.
+SLOW_QUERY_MS = float(os.environ.get("SLOW_QUERY_MS", 0))
+# Minimum seconds between the explains of the slow queries of the same shape. Explain is disabled if this is `0`.
+SLOW_QUERY_EXPLAIN_INTERVAL_SEC = float(os.environ.get("SLOW_QUERY_EXPLAIN_INTERVAL_SEC", 600))
 
 
 def get_single_db_name():
@@ -49,3 +79,58 @@ def is_test_db(db_name: str):
         return "Test" in prefix and int(epoch) < time.time_ns() // 1000000 - 600000
 
     return False
+
+
+# Seconds between the flushes of the buffered view counts. View count buffering is disabled if this is `0`.
+VIEW_COUNT_FLUSH_SEC = float(os.environ.get("VIEW_COUNT_FLUSH_SEC", 0))
+# Count of the pending posts to trigger an immediate flush of the buffered view counts.
+VIEW_COUNT_FLUSH_SIZE = int(os.environ.get("VIEW_COUNT_FLUSH_SIZE", 500))
+
+# Language codes in priority order to fall back to if a post is unavailable in the requested language.
+POST_FALLBACK_LANGS = [lang for lang in os.environ.get("POST_FALLBACK_LANGS", "").split(",") if lang]
+
+# Count of the latest modification notes embedded in each post. All notes are kept in the history collection.
+POST_MODIFY_NOTES_EMBEDDED = max(int(os.environ.get("POST_MODIFY_NOTES_EMBEDDED", 10)), 1)
+
+# Maximum count of the posts to get in a single batch get request.
+POST_GET_MANY_LIMIT = int(os.environ.get("POST_GET_MANY_LIMIT", 50))
+
+# Insert the new posts and their list entries in a transaction if this is `1`. Requires a replica set.
+POST_PUBLISH_TRANSACTION = bool(int(os.environ.get("POST_PUBLISH_TRANSACTION", 0)))
+
+# Seconds until the cached post counts are reconciled with the database.
+POST_COUNT_RECONCILE_SEC = float(os.environ.get("POST_COUNT_RECONCILE_SEC", 300))
+
+# Maximum total bytes of the encoded post bodies to be cached. Post body caching is disabled if this is `0`.
+POST_BODY_CACHE_BYTES = int(os.environ.get("POST_BODY_CACHE_BYTES", 32 * 1024 * 1024))
+
+# Seconds until the cached post reads are stale and reloaded in the background. Post read caching is disabled if `0`.
+POST_READ_SOFT_TTL_SEC = float(os.environ.get("POST_READ_SOFT_TTL_SEC", 0))
+# Seconds until the stale post reads are no longer served, even if they cannot be reloaded.
+POST_READ_HARD_TTL_SEC = float(os.environ.get("POST_READ_HARD_TTL_SEC", 300))
+# Maximum count of the post reads to be cached by each controller.
+POST_READ_CACHE_SIZE = int(os.environ.get("POST_READ_CACHE_SIZE", 1000))
+# Share a single database call between the concurrent identical post reads of a process unless this is `0`.
+POST_READ_COALESCING = bool(int(os.environ.get("POST_READ_COALESCING", 1)))
+
+# Count of the consecutive failed post reloads to stop reloading for `DB_CIRCUIT_RESET_SEC`.
+DB_CIRCUIT_FAILURE_THRESHOLD = int(os.environ.get("DB_CIRCUIT_FAILURE_THRESHOLD", 5))
+# Seconds to stop reloading the posts after the reloads keep failing.
+DB_CIRCUIT_RESET_SEC = float(os.environ.get("DB_CIRCUIT_RESET_SEC", 10))
+
+# Maximum count of the user data to be cached.
+USER_CACHE_SIZE = int(os.environ.get("USER_CACHE_SIZE", 10000))
+# Seconds until the cached user data expires. User data caching is disabled if this is `0`.
+USER_CACHE_TTL_SEC = float(os.environ.get("USER_CACHE_TTL_SEC", 60))
+
+# Count of the sequential IDs to be reserved at once by a process. IDs reserved but not used are skipped.
+SEQ_ID_BLOCK_SIZE = int(os.environ.get("SEQ_ID_BLOCK_SIZE", 1))
+
+# Synchronize the indexes declared by the controllers in the background on startup if this is `1`.
+INDEX_SYNC_ON_STARTUP = bool(int(os.environ.get("INDEX_SYNC_ON_STARTUP", 0)))
+
+# Mode of watching the changes in the database to invalidate the caches of each worker
+# (`stream`, `poll` or `auto`). Watching is disabled if this is empty.
+CHANGE_WATCH_MODE = os.environ.get("CHANGE_WATCH_MODE", "")
+# Seconds between the polls of the changes if the changes are watched by polling.
+CHANGE_WATCH_POLL_SEC = float(os.environ.get("CHANGE_WATCH_POLL_SEC", 5))
@@ -1,52 +1,80 @@
 """Base data controller (a mongodb collection instance)."""
 from abc import ABC
+from typing import Optional
 
-from pymongo.collection import Collection, ReturnDocument
+from pymongo import IndexModel
+from pymongo.collection import Collection
 
-from .config import MONGO_CLIENT
+from .change_watch import ChangeSubscription
+from .client import get_mongo_client
+from .config import SEQ_ID_BLOCK_SIZE
 from .ctrl_prop import CollectionPropertiesMixin
+from .index import IndexSyncReport, sync_collection_indexes
+from .seq_alloc import SequentialIdAllocator
 
 SEQ_COUNTER = "_seq_counter"
-SEQ_NAME = "_col"
-SEQ_COUNT = "_seq"
 
 
 class BaseCollection(CollectionPropertiesMixin, Collection, ABC):
     """Base class for a collection instance."""
 
     def __init__(self, sequential: bool = False):
-        self._db = MONGO_CLIENT.get_database(self.get_db_name())
+        self._db = get_mongo_client().get_database(self.get_db_name())
 
         super().__init__(self._db, self.get_col_name())
 
-        # self.build_indexes()
-
         self._seq = None
         if sequential:
-            self._seq = MONGO_CLIENT \
-                .get_database(self.get_db_name()) \
-                .get_collection(SEQ_COUNTER)
-
-            self._seq_num = self._seq.find_one_and_update(
-                {SEQ_NAME: self.get_col_name()},
-                {"$inc": {SEQ_COUNT: 0}},
-                upsert=True,
-                return_document=ReturnDocument.AFTER,
-            )[SEQ_COUNT]
+            self._seq = SequentialIdAllocator(
+                self._db.get_collection(SEQ_COUNTER),
+                self.get_col_name(),
+                SEQ_ID_BLOCK_SIZE
+            )
 
     def __eq__(self, other):  # Conflict with LGTM alert: pylint: disable=useless-super-delegation
         return super().__eq__(other)
 
     def get_next_seq_id(self, /, increase: bool = True) -> int:
-        """Get the next sequential number. If ``increase`` is ``1``, increase the sequential ID."""
+        """
+        Get the next sequential number. If ``increase`` is ``1``, increase the sequential ID.
+
+        If ``increase`` is ``False``, returns the highest sequential ID allocated known by this process instead.
+        """
         if self._seq is None:
             raise ValueError("This collection is not sequential.")
 
         if increase:
-            self._seq_num += 1
-            self._seq.update_one({SEQ_NAME: self.get_col_name()}, {"$set": {SEQ_COUNT: self._seq_num}})
+            return self._seq.next_id()
+
+        return self._seq.highest_allocated
+
+    def is_seq_id_allocated(self, seq_id: int) -> bool:
+        """
+        Check if ``seq_id`` has been allocated in any process.
+
+        Only fetches the highest allocated ID from the database if ``seq_id`` is higher than the known one.
+        """
+        if self._seq is None:
+            raise ValueError("This collection is not sequential.")
+
+        return seq_id <= self._seq.highest_allocated or seq_id <= self._seq.refresh_highest_allocated()
+
+    def get_index_models(self) -> list[IndexModel]:
+        """
+        Get the indexes to be maintained on this collection.
+
+        Every query issued by the controller should be supported by one of these.
+        """
+        return []
+
+    def get_change_subscription(self) -> Optional[ChangeSubscription]:
+        """
+        Get the subscription of the changes in this collection, invalidating the data cached by the controller.
 
-        return self._seq_num
+        ``None`` if the controller does not cache any data.
+        """
+        return None
 
-    def build_indexes(self):
-        """Method to be called when building the indexes of this collection."""
+    def sync_indexes(self, /, dry_run: bool = False) -> IndexSyncReport:
+        """Create the declared indexes missing in this collection, and report the unused and redundant indexes."""
+        return sync_collection_indexes(self, self.get_index_models(), dry_run=dry_run)
@@ -1,14 +1,28 @@
 """Multilingual data controller base and its related data structure."""
 from abc import ABC
 from dataclasses import dataclass
-from typing import Any, Optional, Type, Union
+from typing import Any, Hashable, Optional, Sequence, Type, Union
 
 import pymongo
+from pymongo import IndexModel
 
+from .config import POST_FALLBACK_LANGS
 from .ctrl import BaseCollection
 from .post_mod import ModifiableDataKey
 
-__all__ = ("MultilingualDataController", "MultilingualGetOneResult", "MultilingualDataKey")
+__all__ = ("MultilingualDataController", "MultilingualGetOneResult", "MultilingualDataKey", "get_lang_priority")
+
+
+def get_lang_priority(lang_code: str, fallback_langs: Optional[Sequence[str]]) -> list[str]:
+    """
+    Get the language codes in the priority order to get the data in ``lang_code``.
+
+    ``lang_code`` comes first, then ``fallback_langs``. ``POST_FALLBACK_LANGS`` will be used if it is ``None``.
+    """
+    if fallback_langs is None:
+        fallback_langs = POST_FALLBACK_LANGS
+
+    return [lang_code] + [lang for lang in fallback_langs if lang != lang_code]
 
 
 class MultilingualDataKey(ABC):
@@ -20,11 +34,19 @@ class MultilingualDataKey(ABC):
 
 @dataclass
 class MultilingualGetOneResult:
-    """Result object of getting a single multilingual data."""
+    """
+    Result object of getting a single multilingual data.
+
+    ``cache_key`` is the key of ``data`` to cache the data derived from it, if ``data`` is cacheable.
+
+    ``cache_status`` is the ``CacheStatus`` of the result if the result is read through a cache.
+    """
 
     data: Optional[dict[str, Any]]  # pylint: disable=unsubscriptable-object
     is_alt_lang: bool
     other_langs: list[str]
+    cache_key: Optional[Hashable] = None  # pylint: disable=unsubscriptable-object
+    cache_status: Optional[str] = None  # pylint: disable=unsubscriptable-object
 
 
 class MultilingualDataController(BaseCollection, ABC):  # lgtm [py/missing-equals]
@@ -42,14 +64,18 @@ class MultilingualDataController(BaseCollection, ABC):  # lgtm [py/missing-equal
 
         super().__init__(True)
 
-    def build_indexes(self):
-        self.create_index(
-            [
-                (self._seq_id_key, pymongo.DESCENDING),
-                (self._lang_code_key, pymongo.ASCENDING)
-            ],
-            unique=True
-        )
+    def get_index_models(self) -> list[IndexModel]:
+        return super().get_index_models() + [
+            # For getting a single data, or all languages of it (by the prefix `seq_id`)
+            IndexModel(
+                [
+                    (self._seq_id_key, pymongo.DESCENDING),
+                    (self._lang_code_key, pymongo.ASCENDING)
+                ],
+                unique=True,
+                background=True
+            )
+        ]
 
     def is_id_lang_available(self, seq_id: Optional[int], lang_code: str) -> bool:
         """
@@ -62,7 +88,26 @@ class MultilingualDataController(BaseCollection, ABC):  # lgtm [py/missing-equal
         if not seq_id:
             return True
 
-        if seq_id > self.get_next_seq_id(increase=False):
+        if not self.is_seq_id_allocated(seq_id):
             return False
 
         return self.find_one({self._seq_id_key: seq_id, self._lang_code_key: lang_code}) is None
+
+    def is_id_langs_available(self, seq_id: Optional[int], lang_codes: Sequence[str]) -> bool:
+        """
+        Check if the given ID is available in all of the given language codes in a single query.
+
+        :param seq_id: sequential ID to be checked
+        :param lang_codes: language codes to be checked
+        :return: if the combinations are all available, ``False`` if any language code is duplicated
+        """
+        if len(set(lang_codes)) != len(lang_codes):
+            return False
+
+        if not seq_id:
+            return True
+
+        if not self.is_seq_id_allocated(seq_id):
+            return False
+
+        return self.find_one({self._seq_id_key: seq_id, self._lang_code_key: {"$in": list(lang_codes)}}) is None
@@ -1,14 +1,49 @@
 """Multilingual post controller base and its related data structure."""
+import logging
 from abc import ABC
+from collections import defaultdict
+from dataclasses import dataclass, replace
 from datetime import datetime
-from typing import Any, Optional, Type
+from typing import Any, Hashable, Optional, Sequence, Type
 
 import pymongo
+from pymongo import IndexModel, UpdateOne
+from pymongo.client_session import ClientSession
+from pymongo.errors import BulkWriteError, DuplicateKeyError, PyMongoError
 
+from cache import ByteLRUCache
 from controllers.results import UpdateResult
-from .ctrl_lang import MultilingualDataController, MultilingualDataKey, MultilingualGetOneResult
+from .change_watch import ChangeEvent, ChangeOperation, ChangeSubscription
+from .config import (
+    POST_BODY_CACHE_BYTES, POST_COUNT_RECONCILE_SEC, POST_MODIFY_NOTES_EMBEDDED, POST_PUBLISH_TRANSACTION,
+)
+from .ctrl_lang import MultilingualDataController, MultilingualDataKey, MultilingualGetOneResult, get_lang_priority
+from .ctrl_lang_post_history import MultilingualPostHistoryController
+from .ctrl_lang_post_list import MultilingualPostListController
+from .ctrl_post_counter import MultilingualPostCounterController
+from .cursor import decode_post_list_cursor, encode_post_list_cursor
+from .post_count import PostCountCache
+from .post_read import READ_LIST, READ_LIST_VALIDATOR, READ_POST, READ_POST_VALIDATOR, PostReadCache
+from .post_version import LIST_VERSION_COUNTER, PostListVersionTracker, PostValidator, PostVersioning
+from .view_count import VIEW_COUNT_BUFFER, PostViewCounter
 
-__all__ = ("MultilingualPostController", "MultilingualPostKey")
+__all__ = ("MultilingualPostController", "MultilingualPostKey", "MultilingualPostListResult", "POST_BODY_CACHE",
+           "PostIDUnavailableError")
+
+logger = logging.getLogger(__name__)
+
+LANG_RANK_KEY = "_lang_rank"
+
+# Code of the errors caused by violating an unique index
+DUPLICATE_KEY_ERROR_CODE = 11000
+
+# Cache of the encoded post bodies keyed by the post cache key of the controllers.
+# The values are maintained by the response encoding, and invalidated by the controllers on post changes.
+POST_BODY_CACHE: ByteLRUCache = ByteLRUCache(POST_BODY_CACHE_BYTES)
+
+
+class PostIDUnavailableError(Exception):
+    """Raised if any post to publish already exists, which could be published concurrently."""
 
 
 class MultilingualPostKey(MultilingualDataKey, ABC):
@@ -17,72 +52,471 @@ class MultilingualPostKey(MultilingualDataKey, ABC):
     VIEW_COUNT: str = "_vc"
 
 
+@dataclass
+class MultilingualPostListResult:
+    """
+    Result object of getting a list of multilingual posts.
+
+    ``cache_status`` is the ``CacheStatus`` of the result if the post reads are cached.
+    """
+
+    posts: list[dict[str, Any]]
+    post_count: Optional[int]  # pylint: disable=unsubscriptable-object
+    next_cursor: Optional[str]  # pylint: disable=unsubscriptable-object
+    cache_status: Optional[str] = None  # pylint: disable=unsubscriptable-object
+
+
 class MultilingualPostController(MultilingualDataController):
-    """Multilingual post controller."""
+    """
+    Multilingual post controller.
+
+    The post lists are served from the list entries in ``list_entries``, which are maintained along with the posts.
+
+    The modification notes are added to ``history``.
+    Only the latest ``POST_MODIFY_NOTES_EMBEDDED`` notes are embedded in the posts and returned by ``get_post()``.
+
+    The views are counted by ``views``, which keeps the view counts in the counters instead of the posts.
+    The view counts are joined to the posts and the post lists at read time.
 
-    def __init__(self, key_class: Type[MultilingualPostKey]):
-        self._view_count_key = key_class.VIEW_COUNT
+    The posts, the post lists and their validators are read through ``reads``.
+
+    The validators of the posts and the post lists are made by ``versions``.
+    """
+
+    # Fields of the posts to be stored in the list entries and returned in the post list
+    post_list_projection: dict[str, int] = {}
+
+    def __init__(
+            self, key_class: Type[MultilingualPostKey], list_entries: MultilingualPostListController,
+            history: MultilingualPostHistoryController, counters: MultilingualPostCounterController
+    ):
+        self.list_entries = list_entries
+        self.history = history
+
+        self.post_count_cache = PostCountCache(POST_COUNT_RECONCILE_SEC)
+        self.reads = PostReadCache()
 
         super().__init__(key_class)
 
+        self.views = PostViewCounter(self, counters, key_class, key_class.VIEW_COUNT)
+        self.versions = PostVersioning(
+            key_class, PostListVersionTracker(self._db.get_collection(LIST_VERSION_COUNTER), self.get_col_name())
+        )
+
+    def get_count_filter(self, lang_code: Optional[str]) -> Optional[dict[str, Any]]:
+        """Get the filter to count the posts in ``lang_code``. ``None`` means to use the estimated count of all."""
+        return {self._lang_code_key: lang_code} if lang_code else None
+
+    def _count_posts(self, lang_code: Optional[str]) -> int:
+        """Count the posts in ``lang_code``. Use the estimated count of all posts if ``lang_code`` is ``None``."""
+        if (count_filter := self.get_count_filter(lang_code)) is None:
+            return self.list_entries.estimated_document_count()
+
+        return self.list_entries.count_documents(count_filter)
+
+    def get_post_list_query(
+            self, lang_code: Optional[str], /, start: int = 0, cursor: Optional[str] = None
+    ) -> tuple[dict[str, Any], list[tuple[str, int]], int]:
+        """
+        Get the filter, the sort and the count of the posts to skip for getting the post list.
+
+        :raises ValueError: if `cursor` is malformed
+        """
+        list_filter = {self._lang_code_key: lang_code} if lang_code else {}
+
+        if cursor:
+            last_modified, seq_id = decode_post_list_cursor(cursor)
+            list_filter["$or"] = [
+                {self._last_mod_key: {"$lt": last_modified}},
+                {self._last_mod_key: last_modified, self._seq_id_key: {"$lt": seq_id}}
+            ]
+            start = 0
+
+        return list_filter, [(self._last_mod_key, pymongo.DESCENDING), (self._seq_id_key, pymongo.DESCENDING)], start
+
+    def to_post_list_result(
+            self, posts: list[dict[str, Any]], limit: int, post_count: Optional[int]
+    ) -> MultilingualPostListResult:
+        """Make the post list result of ``posts`` fetched with ``limit``, attaching the cursor of the next page."""
+        next_cursor = None
+        if limit and len(posts) == limit:
+            last_post = posts[-1]
+            next_cursor = encode_post_list_cursor(last_post[self._last_mod_key], last_post[self._seq_id_key])
+
+        return MultilingualPostListResult(posts, post_count, next_cursor)
+
     def _get_post_list(
-            self, lang_code: str, projection: dict[str, int], /,
-            start: int = 0, limit: int = 0
-    ) -> tuple[list[dict[str, Any]], int]:
-        """Get the post list of the controller."""
-        return (
-            sorted(
-                self.find({self._lang_code_key: lang_code},
-                          projection=projection,
-                          sort=[(self._last_mod_key, pymongo.DESCENDING)])
-                    .skip(start)
-                    .limit(limit),
-                key=lambda item: item[self._last_mod_key],
-                reverse=True
-            ),
-            self.count_documents({self._lang_code_key: lang_code})
+            self, lang_code: Optional[str], /,
+            start: int = 0, limit: int = 0, cursor: Optional[str] = None, with_count: bool = True
+    ) -> MultilingualPostListResult:
+        """
+        Get the post list of the controller sorted by the last modified timestamp DESC.
+
+        Only the fields in ``post_list_projection`` are returned, which are read from the list entries.
+        The view counts are attached from the counters.
+
+        If ``cursor`` is given, the list starts right after the position encoded in the cursor and ``start`` is
+        ignored. Otherwise, ``start`` posts are skipped.
+
+        Posts in all languages will be listed if ``lang_code`` is ``None``.
+
+        The returned next cursor is ``None`` if there are no more posts.
+        The returned post count is ``None`` if ``with_count`` is ``False``.
+        Otherwise, it is served from ``post_count_cache``.
+
+        :raises ValueError: if `cursor` is malformed
+        :raises CircuitOpenError: if the list is not cached and the database is considered unavailable
+        """
+        result, cache_status, _ = self.reads.read(
+            (READ_LIST, lang_code, start, limit, cursor, with_count),
+            lambda: self._load_post_list(lang_code, start=start, limit=limit, cursor=cursor, with_count=with_count)
+        )
+
+        return replace(result, cache_status=cache_status) if cache_status else result
+
+    def _load_post_list(
+            self, lang_code: Optional[str], /,
+            start: int = 0, limit: int = 0, cursor: Optional[str] = None, with_count: bool = True
+    ) -> MultilingualPostListResult:
+        list_filter, sort, start = self.get_post_list_query(lang_code, start=start, cursor=cursor)
+
+        posts = list(
+            self.list_entries.find(list_filter, projection=self.post_list_projection, sort=sort)
+                .skip(start)
+                .limit(limit)
         )
+        self.views.load_view_counts(posts)
 
-    def get_post(self, seq_id: int, lang_code: str = "cht", inc_count: bool = True) -> MultilingualGetOneResult:
+        post_count = None
+        if with_count:
+            post_count = self.post_count_cache.get(lang_code, lambda: self._count_posts(lang_code))
+
+        return self.to_post_list_result(posts, limit, post_count)
+
+    def get_post_pipeline(
+            self, seq_id: int, lang_code: str, /, fallback_langs: Optional[Sequence[str]] = None
+    ) -> list[dict[str, Any]]:
+        """
+        Get the aggregation pipeline which gets a post, its view count and its available languages in a single query.
+
+        Only the latest ``POST_MODIFY_NOTES_EMBEDDED`` modification notes of the post are returned.
+
+        The post returned is in ``lang_code``, or the first available language of ``fallback_langs`` if not available.
+        ``POST_FALLBACK_LANGS`` will be used if ``fallback_langs`` is ``None``.
+        If none of these is available, any available language will be returned.
+        """
+        lang_priority = get_lang_priority(lang_code, fallback_langs)
+
+        return [
+            {"$match": {self._seq_id_key: seq_id}},
+            {"$facet": {
+                "langs": [
+                    {"$project": {"_id": 0, self._lang_code_key: 1}}
+                ],
+                "post": [
+                    {"$addFields": {
+                        LANG_RANK_KEY: {"$let": {
+                            "vars": {"rank": {"$indexOfArray": [lang_priority, f"${self._lang_code_key}"]}},
+                            "in": {"$cond": [{"$lt": ["$$rank", 0]}, len(lang_priority), "$$rank"]}
+                        }}
+                    }},
+                    {"$sort": {LANG_RANK_KEY: pymongo.ASCENDING, self._lang_code_key: pymongo.ASCENDING}},
+                    {"$limit": 1},
+                    {"$project": {LANG_RANK_KEY: 0}},
+                    *self.views.get_view_count_join(),
+                    # The posts updated before the notes are capped may embed the full history
+                    {"$set": {self._mod_notes_key: {
+                        "$slice": [{"$ifNull": [f"${self._mod_notes_key}", []]}, -POST_MODIFY_NOTES_EMBEDDED]
+                    }}}
+                ]
+            }}
+        ]
+
+    def get_post(self, seq_id: int, lang_code: str = "cht", inc_count: bool = True, /,
+                 fallback_langs: Optional[Sequence[str]] = None) -> MultilingualGetOneResult:
         """
         Get a post by its ``seq_id`` and ``lang_code`` with available languages and if it's in an alt language.
 
+        The post, its other available languages and if it's in an alt language are fetched in a single query.
+
+        If the post is not available in ``lang_code``, the post in the first available language of
+        ``fallback_langs`` will be returned. ``POST_FALLBACK_LANGS`` will be used if ``fallback_langs`` is ``None``.
+        If the post is not available in any of these, the post in any available language will be returned.
+
         Increases the post view count if ``inc_count`` is ``True``.
 
-        Will not check for the other available languages if the count will not be increased,
-        because such condition only happens when fetching the post for edit.
+        If the view count buffer is enabled, the post is fetched without any write.
+        The view is buffered instead, and the returned view count includes the views not yet flushed.
+
+        If the post is served from the read cache, failing to count the view does not fail the call.
+
+        If the read is shared with the other concurrent calls, their views are counted in a single write.
+
+        :raises CircuitOpenError: if the post is not cached and the database is considered unavailable
         """
         # Early termination on no sequential ID
         if not seq_id:
             return MultilingualGetOneResult(None, False, [])
 
-        other_langs = []
-        if inc_count:
-            other_langs = [
-                data[self._lang_code_key]
-                for data in self.find(
-                    {self._seq_id_key: seq_id, self._lang_code_key: {"$ne": lang_code}},
-                    projection={self._lang_code_key: 1}
-                )
-            ]
+        result, cache_status, view_count = self.reads.read(
+            (READ_POST, seq_id, lang_code, tuple(fallback_langs) if fallback_langs is not None else None),
+            lambda: self.to_get_one_result(
+                next(self.aggregate(self.get_post_pipeline(seq_id, lang_code, fallback_langs=fallback_langs))),
+                lang_code
+            ),
+            weight=int(inc_count)
+        )
+
+        # The post may be shared with the other calls, so copy it before `count_view()` updates its view count
+        result = replace(result, data=dict(result.data) if result.data else None, cache_status=cache_status)
+
+        if not result.data:
+            return result
+
+        # With the view count buffer, each call buffers its own view.
+        # Otherwise, only the call making the read writes the views of all calls sharing it.
+        if VIEW_COUNT_BUFFER:
+            self.views.count_view(result.data, inc_count)
+        elif view_count:
+            try:
+                self.views.increase_view_count(result.data, view_count)
+            except PyMongoError:
+                if not result.cache_status:
+                    raise
+
+                logger.warning("Failed to count the view of a cached post", exc_info=True)
+
+        return result
+
+    def to_get_one_result(self, pipeline_result: dict[str, Any], lang_code: str) -> MultilingualGetOneResult:
+        """Make the get one result from the result of the pipeline by ``get_post_pipeline()``."""
+        if not pipeline_result["post"]:
+            return MultilingualGetOneResult(None, False, [])
+
+        post = pipeline_result["post"][0]
+        other_langs = [
+            data[self._lang_code_key] for data in pipeline_result["langs"] if data[self._lang_code_key] != lang_code
+        ]
+
+        return MultilingualGetOneResult(
+            post, post[self._lang_code_key] != lang_code, other_langs,
+            cache_key=self.get_post_cache_key(post[self._seq_id_key], post[self._lang_code_key])
+        )
+
+    def get_posts_by_ids(
+            self, post_ids: Sequence[tuple[int, str]], inc_count: bool = False, /,
+            fallback_langs: Optional[Sequence[str]] = None
+    ) -> list[MultilingualGetOneResult]:
+        """
+        Get the posts by their ``(seq_id, lang_code)`` in ``post_ids`` in the order of ``post_ids``.
+
+        All languages of the posts are fetched in a single query, and their view counts in another single query.
+        Each post falls back to the other languages as ``get_post()`` does.
+        The data of the results of the posts not found is ``None``.
 
-        post = self.find_one_and_update(
-            {self._seq_id_key: seq_id, self._lang_code_key: lang_code},
-            {"$inc": {self._view_count_key: 1 if inc_count else 0}}
+        The posts are not read through the read cache.
+
+        Increases the view counts of the posts found if ``inc_count`` is ``True``.
+        """
+        posts_of_seq: dict[int, dict[str, dict[str, Any]]] = defaultdict(dict)
+
+        if seq_ids := list({seq_id for seq_id, _ in post_ids if seq_id}):
+            posts = self.find(
+                {self._seq_id_key: {"$in": seq_ids}},
+                projection={self._mod_notes_key: {"$slice": -POST_MODIFY_NOTES_EMBEDDED}}
+            )
+            for post in posts:
+                posts_of_seq[post[self._seq_id_key]][post[self._lang_code_key]] = post
+
+        results = [
+            self._select_post(posts_of_seq.get(seq_id, {}), lang_code, fallback_langs)
+            for seq_id, lang_code in post_ids
+        ]
+        found_posts = [result.data for result in results if result.data]
+
+        self.views.load_view_counts(found_posts)
+        self.views.count_views(found_posts, inc_count)
+
+        return results
+
+    def _select_post(
+            self, posts_of_lang: dict[str, dict[str, Any]], lang_code: str,
+            fallback_langs: Optional[Sequence[str]]
+    ) -> MultilingualGetOneResult:
+        """Get the result of the post in ``lang_code`` from ``posts_of_lang`` in the same way as ``get_post()``."""
+        if not posts_of_lang:
+            return MultilingualGetOneResult(None, False, [])
+
+        post_lang = next(
+            (lang for lang in get_lang_priority(lang_code, fallback_langs) if lang in posts_of_lang),
+            min(posts_of_lang)
+        )
+        # The same post may be requested multiple times, so each result holds its own copy
+        post = dict(posts_of_lang[post_lang])
+
+        return MultilingualGetOneResult(
+            post, post_lang != lang_code, sorted(lang for lang in posts_of_lang if lang != lang_code),
+            cache_key=self.get_post_cache_key(post[self._seq_id_key], post_lang)
+        )
+
+    def get_post_validator(
+            self, seq_id: int, lang_code: str, /, fallback_langs: Optional[Sequence[str]] = None
+    ) -> Optional[PostValidator]:  # pylint: disable=unsubscriptable-object
+        """
+        Get the validator of the post returned by ``get_post()`` with the same arguments without loading the post.
+
+        Returns ``None`` if the post does not exist.
+
+        :raises CircuitOpenError: if the validator is not cached and the database is considered unavailable
+        """
+        if not seq_id:
+            return None
+
+        post_filter, projection = self.versions.get_post_validator_query(seq_id)
+
+        validator, _, _ = self.reads.read(
+            (READ_POST_VALIDATOR, seq_id, lang_code, tuple(fallback_langs) if fallback_langs is not None else None),
+            lambda: self.versions.to_post_validator_from_timestamps(
+                seq_id, lang_code, self.find(post_filter, projection=projection), fallback_langs=fallback_langs
+            )
         )
-        in_alt_lang = False
 
-        if not post:
-            post = self.find_one_and_update({self._seq_id_key: seq_id}, {"$inc": {self._view_count_key: 1}})
-            in_alt_lang = True
+        return validator
+
+    def get_post_list_validator(self, lang_code: Optional[str]) -> PostValidator:
+        """
+        Get the validator of the post list in ``lang_code``.
 
-        return MultilingualGetOneResult(post, in_alt_lang, other_langs)
+        :raises CircuitOpenError: if the validator is not cached and the database is considered unavailable
+        """
+        validator, _, _ = self.reads.read(
+            (READ_LIST_VALIDATOR, lang_code), lambda: self.versions.list_version.get_validator(lang_code)
+        )
+
+        return validator
+
+    def to_post_validator(self, result: MultilingualGetOneResult) -> PostValidator:
+        """Get the validator of the post in ``result``, which must contain a post."""
+        return self.versions.to_post_validator(result)
+
+    def get_post_key(self, seq_id: int, lang_code: str) -> dict[str, Any]:
+        """Get the key of the post ``(seq_id, lang_code)`` as a document, which can be used as a filter."""
+        return {self._seq_id_key: seq_id, self._lang_code_key: lang_code}
+
+    def get_post_cache_key(self, seq_id: int, lang_code: str) -> Hashable:
+        """
+        Get the key to cache the data derived from the post ``(seq_id, lang_code)``, such as its encoded body.
+
+        The key does not change on post updates.
+        Therefore, the cached data should be validated against the last modified timestamp of the post.
+        """
+        return self.collection_name, seq_id, lang_code
+
+    def get_index_models(self) -> list[IndexModel]:
+        return super().get_index_models() + [
+            # For polling the posts modified since the last poll
+            IndexModel([(self._last_mod_key, pymongo.DESCENDING)], background=True)
+        ]
+
+    def get_change_subscription(self) -> Optional[ChangeSubscription]:
+        return ChangeSubscription(
+            self, self._on_post_changed, self._on_post_changes_missed,
+            fields=(self._seq_id_key, self._lang_code_key), modified_key=self._last_mod_key
+        )
+
+    def _on_post_changed(self, event: ChangeEvent):
+        """Invalidate the cached data of the post changed in ``event``, which may be changed by the other workers."""
+        if not event.document:
+            # Deleted post, which key is unknown
+            self.post_count_cache.invalidate()
+            self.reads.clear()
+            return
+
+        seq_id, lang_code = event.document[self._seq_id_key], event.document[self._lang_code_key]
+
+        POST_BODY_CACHE.invalidate(self.get_post_cache_key(seq_id, lang_code))
+        self.reads.invalidate(seq_id)
+
+        if event.operation not in (ChangeOperation.UPDATE, ChangeOperation.REPLACE):
+            self.post_count_cache.invalidate(lang_code)
+
+    def _on_post_changes_missed(self):
+        self.post_count_cache.invalidate()
+        self.reads.clear()
+        POST_BODY_CACHE.clear()
+
+    def count_post_view(self, seq_id: int, lang_code: str):
+        """Increase the view count of the post ``(seq_id, lang_code)`` without loading it."""
+        post = self.get_post_key(seq_id, lang_code)
+
+        if self.views.count_view(post, True):
+            self.views.increase_view_count(post)
+
+    def _insert_post(self, post: dict[str, Any]):
+        """Insert a new ``post`` and its list entry, update the cached post counts and the post list versions."""
+        self._insert_posts([post])
+
+    def _insert_posts(self, posts: list[dict[str, Any]]):
+        """
+        Insert new ``posts`` and their list entries, update the cached post counts and the post list versions.
+
+        The posts are inserted in a single write, and so are their list entries.
+
+        If ``POST_PUBLISH_TRANSACTION`` is set, these are written in a transaction,
+        so either all or none of the posts are inserted.
+
+        :raises PostIDUnavailableError: if any of the posts already exists, in which case none of them are inserted
+        """
+        try:
+            if POST_PUBLISH_TRANSACTION:
+                with self.database.client.start_session() as session:
+                    session.with_transaction(lambda txn_session: self._write_posts(posts, txn_session))
+            else:
+                self._write_posts(posts)
+        except DuplicateKeyError as ex:
+            raise PostIDUnavailableError() from ex
+        except BulkWriteError as ex:
+            if all(error["code"] == DUPLICATE_KEY_ERROR_CODE for error in ex.details["writeErrors"]):
+                raise PostIDUnavailableError() from ex
+
+            raise
+
+        for post in posts:
+            self.post_count_cache.increment(post[self._lang_code_key])
+            POST_BODY_CACHE.invalidate(self.get_post_cache_key(post[self._seq_id_key], post[self._lang_code_key]))
+
+        self.versions.list_version.bump(*{post[self._lang_code_key] for post in posts})
+
+        for seq_id in {post[self._seq_id_key] for post in posts}:
+            self.reads.invalidate(seq_id)
+
+    def _write_posts(self, posts: list[dict[str, Any]], session: Optional[ClientSession] = None):
+        """
+        Insert ``posts`` in order, then insert or replace their list entries.
+
+        If ``session`` is not given, the posts inserted before the failed one are deleted on failure,
+        so their list entries are never written.
+        Otherwise, the transaction of ``session`` should be aborted on failure instead.
+
+        :raises BulkWriteError: if any of the posts fails to be inserted, such as it already exists
+        """
+        try:
+            self.insert_many(posts, session=session)
+        except BulkWriteError as ex:
+            if session is None and (inserted := posts[:ex.details["nInserted"]]):
+                self.delete_many({"_id": {"$in": [post["_id"] for post in inserted]}})
+
+            raise
+
+        self.list_entries.upsert_entries(posts, self.post_list_projection, session=session)
 
     def update_post(self, seq_id: Optional[int], lang_code: str, update_data: dict[str, Any], modify_note: str, /,
                     addl_update_cond: dict[str, Any] = None) -> UpdateResult:
         """
         Update a multilingual post with the key ``(seq_id, lang_code)``.
 
+        ``modify_note`` is added to the history, and embedded in the post with the latest notes only.
+
         Returns ``UpdateResult.NOT_FOUND`` if ``seq_id`` is ``None``.
         This occurs when the sequential was not being passed in via the API endpoints.
 
@@ -98,6 +532,129 @@ class MultilingualPostController(MultilingualDataController):
 
         now = datetime.utcnow()
 
+        update_data |= {self._last_mod_key: now}
+
+        update_result = self.update_one(
+            self._get_update_cond(seq_id, lang_code, addl_update_cond),
+            self._get_post_update(update_data, modify_note, now)
+        )
+
+        if update_result.matched_count == 0:
+            return UpdateResult.NOT_FOUND
+
+        self.history.add_note(seq_id, lang_code, now, modify_note)
+        self.list_entries.update_entry(seq_id, lang_code, update_data, self.post_list_projection)
+        self.versions.list_version.bump(lang_code)
+        POST_BODY_CACHE.invalidate(self.get_post_cache_key(seq_id, lang_code))
+        self.reads.invalidate(seq_id)
+
+        # `NO_CHANGE` is impossible for now since each time a modification note will be pushed
+        return UpdateResult.UPDATED if update_result.modified_count > 0 else UpdateResult.NO_CHANGE
+
+    def update_posts(
+            self, seq_id: Optional[int], updates: Sequence[tuple[str, dict[str, Any], str]], /,
+            addl_update_cond: dict[str, Any] = None
+    ) -> dict[str, UpdateResult]:
+        """
+        Update a multilingual post in multiple languages in a single bulk write.
+
+        Each language is updated as ``update_post()`` does, pushing its own modification note.
+        The notes of all languages are added to the history in a single write, and so are their list entries updated.
+
+        All languages are ``UpdateResult.NOT_FOUND`` if ``seq_id`` is ``None``.
+
+        The bulk write is unordered and not in a transaction.
+        If any language fails to be written, the languages updated are still added to the history,
+        updated in the list entries and invalidated in the caches before the error is re-raised.
+
+        :param seq_id: sequential ID of the post
+        :param updates: language code, the update data and the modification note of each language to update
+        :param addl_update_cond: additional update condition
+        :return: result of the update of each language keyed by the language code
+        :raises BulkWriteError: if any language fails to be written
+        """
+        if not seq_id:
+            return {lang_code: UpdateResult.NOT_FOUND for lang_code, _, _ in updates}
+
+        now = datetime.utcnow()
+
+        updates = [
+            (lang_code, update_data | {self._last_mod_key: now}, modify_note)
+            for lang_code, update_data, modify_note in updates
+        ]
+
+        try:
+            bulk_result = self.bulk_write(
+                [
+                    UpdateOne(
+                        self._get_update_cond(seq_id, lang_code, addl_update_cond),
+                        self._get_post_update(update_data, modify_note, now)
+                    )
+                    for lang_code, update_data, modify_note in updates
+                ],
+                ordered=False
+            )
+        except BulkWriteError as ex:
+            # The other languages are still written since the bulk write is unordered
+            failed_indices = {error["index"] for error in ex.details.get("writeErrors", [])}
+            written = [update for idx, update in enumerate(updates) if idx not in failed_indices]
+
+            if written:
+                self._complete_updates(
+                    seq_id, now, written, self._get_existing_langs(seq_id, written, addl_update_cond)
+                )
+
+            raise
+
+        lang_codes = {lang_code for lang_code, _, _ in updates}
+        if bulk_result.matched_count < len(updates):
+            # Only check which languages exist if some of them are not updated
+            lang_codes = self._get_existing_langs(seq_id, updates, addl_update_cond)
+
+        self._complete_updates(seq_id, now, updates, lang_codes)
+
+        # `NO_CHANGE` is impossible for now since each time a modification note will be pushed
+        return {
+            lang_code: UpdateResult.UPDATED if lang_code in lang_codes else UpdateResult.NOT_FOUND
+            for lang_code, _, _ in updates
+        }
+
+    def _get_existing_langs(
+            self, seq_id: int, updates: Sequence[tuple[str, dict[str, Any], str]],
+            addl_update_cond: Optional[dict[str, Any]]
+    ) -> set[str]:
+        """Get the languages of ``updates`` which exist in the post ``seq_id``, that is, which are updated."""
+        return set(self.distinct(
+            self._lang_code_key,
+            self._get_update_cond(seq_id, {"$in": [lang_code for lang_code, _, _ in updates]}, addl_update_cond)
+        ))
+
+    def _complete_updates(
+            self, seq_id: int, now: datetime, updates: Sequence[tuple[str, dict[str, Any], str]], lang_codes: set[str]
+    ):
+        """
+        Complete ``updates`` of the post ``seq_id`` in ``lang_codes`` written to the posts at ``now``.
+
+        The modification notes are added to the history, the list entries are updated,
+        the post list versions are bumped and the cached post bodies and reads are invalidated.
+        """
+        if not lang_codes:
+            return
+
+        updated = [update for update in updates if update[0] in lang_codes]
+
+        self.history.add_notes(seq_id, now, [(lang_code, modify_note) for lang_code, _, modify_note in updated])
+        self.list_entries.update_entries(
+            seq_id, [(lang_code, update_data) for lang_code, update_data, _ in updated], self.post_list_projection
+        )
+        self.versions.list_version.bump(*lang_codes)
+        for lang_code in lang_codes:
+            POST_BODY_CACHE.invalidate(self.get_post_cache_key(seq_id, lang_code))
+        self.reads.invalidate(seq_id)
+
+    def _get_update_cond(
+            self, seq_id: int, lang_code: Any, addl_update_cond: Optional[dict[str, Any]]
+    ) -> dict[str, Any]:
         update_cond = {
             self._seq_id_key: seq_id,
             self._lang_code_key: lang_code
@@ -105,23 +662,44 @@ class MultilingualPostController(MultilingualDataController):
         if addl_update_cond:
             update_cond |= addl_update_cond
 
-        update_data |= {self._last_mod_key: now}
+        return update_cond
 
-        update_result = self.update_one(
-            update_cond,
-            {
-                "$set": update_data,
-                "$push": {
-                    self._mod_notes_key: {
+    def _get_post_update(self, update_data: dict[str, Any], modify_note: str, now: datetime) -> dict[str, Any]:
+        return {
+            "$set": update_data,
+            "$push": {
+                self._mod_notes_key: {
+                    "$each": [{
                         self._mod_dt_key: now,
                         self._mod_note_key: modify_note
-                    }
+                    }],
+                    "$slice": -POST_MODIFY_NOTES_EMBEDDED
                 }
             }
-        )
+        }
 
-        if update_result.matched_count == 0:
-            return UpdateResult.NOT_FOUND
+    def get_modify_notes(
+            self, seq_id: int, lang_code: str, /, start: int = 0, limit: int = 0
+    ) -> tuple[list[dict[str, Any]], bool]:
+        """
+        Get the modification notes of the post ``(seq_id, lang_code)`` from the history, latest first.
 
-        # `NO_CHANGE` is impossible for now since each time a modification note will be pushed
-        return UpdateResult.UPDATED if update_result.modified_count > 0 else UpdateResult.NO_CHANGE
+        :return: tuple of the notes and if there are more notes after them
+        """
+        if not seq_id:
+            return [], False
+
+        return self.history.get_notes(seq_id, lang_code, start=start, limit=limit)
+
+    def rebuild_list_entries(self) -> int:
+        """
+        Rebuild all list entries from the posts, then reset the cached post counts and post lists.
+
+        :return: count of the list entries rebuilt
+        """
+        entry_count = self.list_entries.rebuild(self, self.post_list_projection)
+
+        self.post_count_cache.invalidate()
+        self.reads.invalidate(None)
+
+        return entry_count
@@ -0,0 +1,115 @@
+"""Controller base of the modification history of the multilingual posts."""
+from abc import ABC
+from datetime import datetime
+from typing import Any, Iterable, Type, Union
+
+import pymongo
+from pymongo import IndexModel
+
+from .ctrl import BaseCollection
+from .ctrl_lang import MultilingualDataKey
+from .post_mod import ModifiableDataKey
+
+__all__ = ("MultilingualPostHistoryController",)
+
+
+class MultilingualPostHistoryController(BaseCollection, ABC):
+    """
+    Controller of the append-only modification history of a multilingual post collection.
+
+    Each document is a modification note of a post, holding the key of the post, the timestamp and the note.
+    The post itself only embeds the latest modification notes.
+
+    The notes are added along with the post updates by ``MultilingualPostController``.
+    """
+
+    def __init__(self, key_class: Type[Union[MultilingualDataKey, ModifiableDataKey]]):
+        self._seq_id_key = key_class.SEQ_ID
+        self._lang_code_key = key_class.LANG_CODE
+        self._mod_dt_key = key_class.MODIFY_DT
+        self._mod_note_key = key_class.MODIFY_NOTE
+
+        super().__init__()
+
+    def get_index_models(self) -> list[IndexModel]:
+        return [
+            IndexModel(
+                [
+                    (self._seq_id_key, pymongo.DESCENDING),
+                    (self._lang_code_key, pymongo.ASCENDING),
+                    (self._mod_dt_key, pymongo.DESCENDING)
+                ],
+                background=True
+            )
+        ]
+
+    def make_note(self, seq_id: int, lang_code: str, timestamp: datetime, note: str) -> dict[str, Any]:
+        """Make the history document of the modification note of the post ``(seq_id, lang_code)``."""
+        return {
+            self._seq_id_key: seq_id,
+            self._lang_code_key: lang_code,
+            self._mod_dt_key: timestamp,
+            self._mod_note_key: note
+        }
+
+    def add_note(self, seq_id: int, lang_code: str, timestamp: datetime, note: str):
+        """Add a modification note of the post ``(seq_id, lang_code)``."""
+        self.insert_one(self.make_note(seq_id, lang_code, timestamp, note))
+
+    def add_notes(self, seq_id: int, timestamp: datetime, notes: Iterable[tuple[str, str]]):
+        """
+        Add the modification notes of the post ``seq_id`` in multiple languages in a single write.
+
+        :param seq_id: sequential ID of the post
+        :param timestamp: timestamp of the modification
+        :param notes: language code and the modification note of each note to add
+        """
+        if note_docs := [self.make_note(seq_id, lang_code, timestamp, note) for lang_code, note in notes]:
+            self.insert_many(note_docs)
+
+    def add_embedded_notes(self, seq_id: int, lang_code: str, notes: Iterable[dict[str, Any]]) -> int:
+        """
+        Add the modification ``notes`` embedded in the post ``(seq_id, lang_code)`` which are not in the history yet.
+
+        :return: count of the notes added
+        """
+        existing = {
+            note[self._mod_dt_key] for note
+            in self.find({self._seq_id_key: seq_id, self._lang_code_key: lang_code}, projection={self._mod_dt_key: 1})
+        }
+        new_notes = [
+            self.make_note(seq_id, lang_code, note[self._mod_dt_key], note[self._mod_note_key])
+            for note in notes if note[self._mod_dt_key] not in existing
+        ]
+
+        if new_notes:
+            self.insert_many(new_notes)
+
+        return len(new_notes)
+
+    def get_notes(
+            self, seq_id: int, lang_code: str, /, start: int = 0, limit: int = 0
+    ) -> tuple[list[dict[str, Any]], bool]:
+        """
+        Get the modification notes of the post ``(seq_id, lang_code)`` sorted by the timestamp DESC.
+
+        :param seq_id: sequential ID of the post
+        :param lang_code: language code of the post
+        :param start: count of the latest notes to skip
+        :param limit: maximum count of the notes to be returned, no limit if ``0``
+        :return: tuple of the notes and if there are more notes after them
+        :raises ValueError: if `start` or `limit` is negative
+        """
+        if start < 0 or limit < 0:
+            raise ValueError("Negative start or limit of the modification notes")
+
+        notes = list(self.find(
+            {self._seq_id_key: seq_id, self._lang_code_key: lang_code},
+            projection={"_id": 0, self._mod_dt_key: 1, self._mod_note_key: 1},
+            sort=[(self._mod_dt_key, pymongo.DESCENDING)], skip=start, limit=limit + 1 if limit else 0
+        ))
+
+        if limit and len(notes) > limit:
+            return notes[:limit], True
+
+        return notes, False
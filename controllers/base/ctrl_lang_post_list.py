@@ -0,0 +1,115 @@
+"""Controller base of the post list entries of the multilingual posts."""
+from abc import ABC
+from typing import Any, Iterable, Optional, Type, Union
+
+import pymongo
+from pymongo import IndexModel, ReplaceOne, UpdateOne
+from pymongo.client_session import ClientSession
+from pymongo.collection import Collection
+
+from .ctrl import BaseCollection
+from .ctrl_lang import MultilingualDataKey
+from .post_mod import ModifiableDataKey
+
+__all__ = ("MultilingualPostListController",)
+
+
+class MultilingualPostListController(BaseCollection, ABC):
+    """
+    Controller of the post list entries of a multilingual post collection.
+
+    Each entry holds only the fields of a post to be shown in the post list,
+    so the post lists are served without loading the full post documents.
+
+    The entries are maintained along with the posts by ``MultilingualPostController``.
+    Use ``rebuild()`` to rebuild all entries from the posts if they drift.
+    """
+
+    def __init__(self, key_class: Type[Union[MultilingualDataKey, ModifiableDataKey]]):
+        self._seq_id_key = key_class.SEQ_ID
+        self._lang_code_key = key_class.LANG_CODE
+        self._last_mod_key = key_class.DT_LAST_MODIFIED
+
+        super().__init__()
+
+    def get_index_models(self) -> list[IndexModel]:
+        return [
+            IndexModel(
+                [(self._seq_id_key, pymongo.DESCENDING), (self._lang_code_key, pymongo.ASCENDING)],
+                unique=True, background=True
+            ),
+            # For the post list sorted by the last modified timestamp (and the keyset pagination),
+            # and the post count of a language (by the prefix `lang_code`)
+            IndexModel(
+                [
+                    (self._lang_code_key, pymongo.ASCENDING),
+                    (self._last_mod_key, pymongo.DESCENDING),
+                    (self._seq_id_key, pymongo.DESCENDING)
+                ],
+                background=True
+            )
+        ]
+
+    def get_entry_filter(self, seq_id: int, lang_code: str) -> dict[str, Any]:
+        """Get the filter of the entry of the post ``(seq_id, lang_code)``."""
+        return {self._seq_id_key: seq_id, self._lang_code_key: lang_code}
+
+    def upsert_entries(
+            self, posts: Iterable[dict[str, Any]], projection: dict[str, int], /,
+            session: Optional[ClientSession] = None
+    ):
+        """
+        Insert or replace the entries of ``posts`` in a single bulk write.
+
+        The entries contain the fields in ``projection`` only.
+        """
+        self.bulk_write(
+            [
+                ReplaceOne(
+                    self.get_entry_filter(post[self._seq_id_key], post[self._lang_code_key]),
+                    {key: value for key, value in post.items() if key in projection},
+                    upsert=True
+                )
+                for post in posts
+            ],
+            session=session
+        )
+
+    def update_entry(self, seq_id: int, lang_code: str, update_data: dict[str, Any], projection: dict[str, int]):
+        """Set the fields in ``update_data`` which are also in ``projection`` to the entry of the post."""
+        if entry_update := {key: value for key, value in update_data.items() if key in projection}:
+            self.update_one(self.get_entry_filter(seq_id, lang_code), {"$set": entry_update})
+
+    def update_entries(
+            self, seq_id: int, updates: Iterable[tuple[str, dict[str, Any]]], projection: dict[str, int]
+    ):
+        """
+        Set the fields in the update data which are also in ``projection`` to the entries of a post in a single write.
+
+        :param seq_id: sequential ID of the post
+        :param updates: language code and the update data of each entry to update
+        :param projection: fields of the entries
+        """
+        requests = [
+            UpdateOne(self.get_entry_filter(seq_id, lang_code), {"$set": entry_update})
+            for lang_code, update_data in updates
+            if (entry_update := {key: value for key, value in update_data.items() if key in projection})
+        ]
+
+        if requests:
+            self.bulk_write(requests)
+
+    def rebuild(self, posts: Collection, projection: dict[str, int]) -> int:
+        """
+        Replace all entries by the ones made from ``posts`` with the fields in ``projection``.
+
+        The entries are replaced atomically, and the indexes of this collection are kept.
+
+        :return: count of the entries rebuilt
+        """
+        posts.aggregate([
+            {"$project": projection | {"_id": 0}},
+            {"$out": self.name}
+        ])
+
+        return self.estimated_document_count()
@@ -0,0 +1,149 @@
+"""Controller base of the counters of the multilingual posts."""
+from abc import ABC
+from typing import Any, Iterable
+
+import pymongo
+from pymongo import IndexModel, UpdateOne
+
+from .ctrl import BaseCollection
+
+__all__ = ("MultilingualPostCounterController", "PostCounterKey")
+
+PostCounterId = tuple[int, str]
+
+COUNTER_JOIN_KEY = "_counter"
+
+
+class PostCounterKey:
+    """Keys of the post counters."""
+
+    COLLECTION = "_col"
+    SEQ_ID = "_seq"
+    LANG_CODE = "_lang"
+
+    VIEW_COUNT = "_vc"
+
+
+class MultilingualPostCounterController(BaseCollection, ABC):
+    """
+    Controller of the counters of the multilingual posts, keyed by ``(collection, seq_id, lang_code)``.
+
+    The counters are kept in small documents shared by all post collections,
+    so incrementing them does not rewrite the large post documents.
+
+    The counters are created on the first increment. Counters not created yet are ``0``.
+    """
+
+    def get_index_models(self) -> list[IndexModel]:
+        return [
+            IndexModel(
+                [
+                    (PostCounterKey.COLLECTION, pymongo.ASCENDING),
+                    (PostCounterKey.SEQ_ID, pymongo.DESCENDING),
+                    (PostCounterKey.LANG_CODE, pymongo.ASCENDING)
+                ],
+                unique=True, background=True
+            )
+        ]
+
+    @staticmethod
+    def get_counter_filter(col_name: str, seq_id: int, lang_code: str) -> dict[str, Any]:
+        """Get the filter of the counters of the post ``(seq_id, lang_code)`` in the collection ``col_name``."""
+        return {
+            PostCounterKey.COLLECTION: col_name,
+            PostCounterKey.SEQ_ID: seq_id,
+            PostCounterKey.LANG_CODE: lang_code
+        }
+
+    def get_view_count_update(
+            self, col_name: str, seq_id: int, lang_code: str, count: int = 1
+    ) -> tuple[dict[str, Any], dict[str, Any]]:
+        """
+        Get the filter and the update to increase the view count of the post by ``count``.
+
+        The update must be applied with ``upsert=True``.
+        """
+        return self.get_counter_filter(col_name, seq_id, lang_code), {"$inc": {PostCounterKey.VIEW_COUNT: count}}
+
+    def increase_view_count(self, col_name: str, seq_id: int, lang_code: str, count: int = 1):
+        """Increase the view count of the post ``(seq_id, lang_code)`` in the collection ``col_name`` by ``count``."""
+        self.update_one(*self.get_view_count_update(col_name, seq_id, lang_code, count), upsert=True)
+
+    def increase_view_counts(self, col_name: str, increments: dict[PostCounterId, int]):
+        """
+        Increase the view counts of the posts in the collection ``col_name`` in a single bulk write.
+
+        :param col_name: name of the post collection
+        :param increments: view count increments keyed by ``(seq_id, lang_code)``
+        """
+        self.bulk_write(
+            [
+                UpdateOne(*self.get_view_count_update(col_name, seq_id, lang_code, count), upsert=True)
+                for (seq_id, lang_code), count in increments.items()
+            ],
+            ordered=False
+        )
+
+    @staticmethod
+    def get_view_counts_filter(col_name: str, post_ids: Iterable[PostCounterId]) -> dict[str, Any]:
+        """Get the filter of the counters of the posts ``(seq_id, lang_code)`` in the collection ``col_name``."""
+        return {
+            PostCounterKey.COLLECTION: col_name,
+            "$or": [
+                {PostCounterKey.SEQ_ID: seq_id, PostCounterKey.LANG_CODE: lang_code} for seq_id, lang_code in post_ids
+            ]
+        }
+
+    @staticmethod
+    def to_view_counts(counters: Iterable[dict[str, Any]]) -> dict[PostCounterId, int]:
+        """Get the view counts keyed by ``(seq_id, lang_code)`` from the counters found."""
+        return {
+            (counter[PostCounterKey.SEQ_ID], counter[PostCounterKey.LANG_CODE]):
+                counter.get(PostCounterKey.VIEW_COUNT, 0)
+            for counter in counters
+        }
+
+    def get_view_counts(self, col_name: str, post_ids: Iterable[PostCounterId]) -> dict[PostCounterId, int]:
+        """
+        Get the view counts of the posts ``(seq_id, lang_code)`` in the collection ``col_name`` in a single query.
+
+        The posts without the counters are not included.
+        """
+        if not (post_ids := list(post_ids)):
+            return {}
+
+        return self.to_view_counts(self.find(
+            self.get_view_counts_filter(col_name, post_ids), projection={"_id": 0, PostCounterKey.COLLECTION: 0}
+        ))
+
+    def get_view_count_join(
+            self, col_name: str, seq_id_key: str, lang_code_key: str, view_count_key: str
+    ) -> list[dict[str, Any]]:
+        """
+        Get the aggregation stages joining the view count of the posts in the collection ``col_name``.
+
+        The view count is set to ``view_count_key`` of the posts.
+
+        The view count of the posts without the counters is ``0``.
+        """
+        return [
+            {"$lookup": {
+                "from": self.name,
+                "let": {"seq": f"${seq_id_key}", "lang": f"${lang_code_key}"},
+                "pipeline": [
+                    {"$match": {
+                        PostCounterKey.COLLECTION: col_name,
+                        "$expr": {"$and": [
+                            {"$eq": [f"${PostCounterKey.SEQ_ID}", "$$seq"]},
+                            {"$eq": [f"${PostCounterKey.LANG_CODE}", "$$lang"]}
+                        ]}
+                    }},
+                    {"$project": {"_id": 0, PostCounterKey.VIEW_COUNT: 1}}
+                ],
+                "as": COUNTER_JOIN_KEY
+            }},
+            {"$set": {view_count_key: {
+                "$ifNull": [{"$arrayElemAt": [f"${COUNTER_JOIN_KEY}.{PostCounterKey.VIEW_COUNT}", 0]}, 0]
+            }}},
+            {"$project": {COUNTER_JOIN_KEY: 0}}
+        ]
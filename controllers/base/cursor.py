@@ -0,0 +1,55 @@
+"""Opaque cursor for the keyset pagination of the post lists."""
+import base64
+import json
+from calendar import timegm
+from datetime import datetime, timedelta
+from typing import Optional
+
+__all__ = ("encode_post_list_cursor", "decode_post_list_cursor", "is_post_list_cursor_valid")
+
+EPOCH = datetime(1970, 1, 1)
+
+
+def encode_post_list_cursor(last_modified: datetime, seq_id: int) -> str:
+    """
+    Encode the position right after the post ``(last_modified, seq_id)`` to an opaque cursor.
+
+    ``last_modified`` is encoded in milliseconds, which is the precision of the datetime stored in MongoDB.
+    """
+    epoch_ms = timegm(last_modified.utctimetuple()) * 1000 + last_modified.microsecond // 1000
+
+    return base64.urlsafe_b64encode(json.dumps([epoch_ms, seq_id]).encode()).decode()
+
+
+def decode_post_list_cursor(cursor: str) -> tuple[datetime, int]:
+    """
+    Decode ``cursor`` to the ``(last_modified, seq_id)`` of the post right before the position.
+
+    :raises ValueError: if `cursor` is malformed
+    """
+    try:
+        epoch_ms, seq_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except (TypeError, ValueError) as ex:
+        raise ValueError(f"Malformed post list cursor: {cursor}") from ex
+
+    # `bool` is a subclass of `int`
+    if any(not isinstance(value, int) or isinstance(value, bool) for value in (epoch_ms, seq_id)):
+        raise ValueError(f"Malformed post list cursor: {cursor}")
+
+    try:
+        return EPOCH + timedelta(milliseconds=epoch_ms), seq_id
+    except OverflowError as ex:
+        raise ValueError(f"Malformed post list cursor: {cursor}") from ex
+
+
+def is_post_list_cursor_valid(cursor: Optional[str]) -> bool:  # pylint: disable=unsubscriptable-object
+    """Check if ``cursor`` could be decoded. No cursor (``None`` or empty) is valid."""
+    if not cursor:
+        return True
+
+    try:
+        decode_post_list_cursor(cursor)
+    except ValueError:
+        return False
+
+    return True
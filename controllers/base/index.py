@@ -0,0 +1,114 @@
+"""Synchronization of the declared indexes of a collection and its related data structure."""
+from dataclasses import dataclass, field
+from typing import Any
+
+from pymongo import IndexModel
+from pymongo.collection import Collection
+from pymongo.errors import OperationFailure
+
+__all__ = ("IndexSyncReport", "sync_collection_indexes")
+
+# Options which change the behavior of an index, so indexes having different ones are not interchangeable
+BEHAVIORAL_OPTIONS = ("unique", "sparse", "expireAfterSeconds", "partialFilterExpression")
+
+ID_INDEX_NAME = "_id_"
+
+
+@dataclass
+class IndexSyncReport:
+    """Report of synchronizing the declared indexes of a collection."""
+
+    collection_name: str
+
+    created: list[str] = field(default_factory=list)
+    conflicting: list[str] = field(default_factory=list)
+    unused: list[str] = field(default_factory=list)
+    redundant: list[str] = field(default_factory=list)
+
+    def __str__(self):
+        return (
+            f"`{self.collection_name}` - "
+            f"Created: {self.created or '-'} / "
+            f"Conflicting: {self.conflicting or '-'} / "
+            f"Unused: {self.unused or '-'} / "
+            f"Redundant: {self.redundant or '-'}"
+        )
+
+
+def _get_index_key(index_info: dict[str, Any]) -> tuple[tuple[str, Any], ...]:
+    """Get the key of ``index_info``, which is either from ``index_information()`` or ``IndexModel.document``."""
+    key = index_info["key"]
+
+    # Index direction may be returned as float by the server
+    return tuple(
+        (name, int(direction) if isinstance(direction, float) else direction)
+        for name, direction in (key.items() if isinstance(key, dict) else key)
+    )
+
+
+def _is_options_matched(declared: dict[str, Any], existing: dict[str, Any]) -> bool:
+    return all(declared.get(option) == existing.get(option) for option in BEHAVIORAL_OPTIONS)
+
+
+def _get_unused_index_names(collection: Collection) -> list[str]:
+    """Get the names of the indexes not being used since the server started. Empty if the stats are unavailable."""
+    try:
+        return [
+            stats["name"] for stats in collection.aggregate([{"$indexStats": {}}])
+            if stats["name"] != ID_INDEX_NAME and not stats["accesses"]["ops"]
+        ]
+    except OperationFailure:
+        # `$indexStats` is not permitted for the user
+        return []
+
+
+def _get_redundant_index_names(existing: dict[str, dict[str, Any]]) -> list[str]:
+    """Get the names of the indexes whose key is a prefix of another index and have no behavioral options."""
+    keys = {name: _get_index_key(info) for name, info in existing.items()}
+
+    return [
+        name for name, key in keys.items()
+        if name != ID_INDEX_NAME
+        and not any(existing[name].get(option) for option in BEHAVIORAL_OPTIONS)
+        and any(other_name != name and len(other_key) > len(key) and other_key[:len(key)] == key
+                for other_name, other_key in keys.items())
+    ]
+
+
+def sync_collection_indexes(
+        collection: Collection, index_models: list[IndexModel], /, dry_run: bool = False
+) -> IndexSyncReport:
+    """
+    Create the indexes in ``index_models`` missing in ``collection``, and report the unused and redundant indexes.
+
+    Indexes are compared by their keys, so an existing index having the same key but a different name
+    is considered as present. If its behavioral options (for example, ``unique``) are different,
+    it will be reported as conflicting and not be touched.
+
+    Indexes are not created if ``dry_run`` is ``True``. The names to be created will still be reported.
+    """
+    report = IndexSyncReport(collection.full_name)
+
+    existing = collection.index_information()
+    existing_by_key = {_get_index_key(info): info for info in existing.values()}
+
+    missing = []
+    for index_model in index_models:
+        declared = index_model.document
+
+        if existing_info := existing_by_key.get(_get_index_key(declared)):
+            if not _is_options_matched(declared, existing_info):
+                report.conflicting.append(declared["name"])
+            continue
+
+        missing.append(index_model)
+        report.created.append(declared["name"])
+
+    if missing and not dry_run:
+        collection.create_indexes(missing)
+        existing = collection.index_information()
+
+    report.unused = _get_unused_index_names(collection)
+    report.redundant = _get_redundant_index_names(existing)
+
+    return report
@@ -0,0 +1,55 @@
+"""Proxy of the controller created on its first use in each process."""
+import os
+import threading
+from typing import Any, Callable, Generic, Optional, TypeVar
+
+__all__ = ("LazyController",)
+
+T = TypeVar("T")
+
+
+class LazyController(Generic[T]):
+    """
+    Proxy of the controller created by ``factory`` on its first use in each process.
+
+    Attributes are forwarded to the controller, so the proxy can be used as the controller itself.
+
+    This avoids connecting to the database on import, and the controller created before forking
+    (which holds the connection pool of the parent process) being used in the forked process.
+    """
+
+    def __init__(self, factory: Callable[[], T]):
+        self._factory = factory
+
+        self._lock = threading.Lock()
+        # (PID of the process creating the controller, controller)
+        self._instance: Optional[tuple[int, T]] = None  # pylint: disable=unsubscriptable-object
+
+        # The lock may be held by the other threads of the parent process when forking
+        os.register_at_fork(after_in_child=self._reset_lock)
+
+    def _reset_lock(self):
+        self._lock = threading.Lock()
+
+    def get_instance(self) -> T:
+        """Get the controller of the current process, creating it on the first call in the process."""
+        pid = os.getpid()
+
+        if (instance := self._instance) and instance[0] == pid:
+            return instance[1]
+
+        with self._lock:
+            if not self._instance or self._instance[0] != pid:
+                self._instance = (pid, self._factory())
+
+            return self._instance[1]
+
+    def get_created_instance(self) -> Optional[T]:  # pylint: disable=unsubscriptable-object
+        """Get the controller of the current process if it has been created, without creating it."""
+        if (instance := self._instance) and instance[0] == os.getpid():
+            return instance[1]
+
+        return None
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.get_instance(), name)
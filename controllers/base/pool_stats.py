@@ -0,0 +1,68 @@
+"""Statistics of the database connection pools of the current process."""
+import threading
+
+from pymongo import monitoring
+
+__all__ = ("ConnectionPoolStats", "POOL_STATS")
+
+
+class ConnectionPoolStats(monitoring.ConnectionPoolListener):
+    """
+    Listener keeping the thread-safe statistics of the connection pools of the clients registering it.
+
+    ``checkout_wait`` is the total seconds waited to check out the connections.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+
+        self.open_count = 0
+        self.in_use_count = 0
+        self.checkout_count = 0
+        self.checkout_failed_count = 0
+        self.checkout_wait = 0.0
+        self.cleared_count = 0
+
+    def pool_created(self, event: monitoring.PoolCreatedEvent):
+        pass
+
+    def pool_ready(self, event: monitoring.PoolReadyEvent):
+        pass
+
+    def pool_cleared(self, event: monitoring.PoolClearedEvent):
+        with self._lock:
+            self.cleared_count += 1
+
+    def pool_closed(self, event: monitoring.PoolClosedEvent):
+        pass
+
+    def connection_created(self, event: monitoring.ConnectionCreatedEvent):
+        with self._lock:
+            self.open_count += 1
+
+    def connection_ready(self, event: monitoring.ConnectionReadyEvent):
+        pass
+
+    def connection_closed(self, event: monitoring.ConnectionClosedEvent):
+        with self._lock:
+            self.open_count -= 1
+
+    def connection_check_out_started(self, event: monitoring.ConnectionCheckOutStartedEvent):
+        pass
+
+    def connection_check_out_failed(self, event: monitoring.ConnectionCheckOutFailedEvent):
+        with self._lock:
+            self.checkout_failed_count += 1
+
+    def connection_checked_out(self, event: monitoring.ConnectionCheckedOutEvent):
+        with self._lock:
+            self.in_use_count += 1
+            self.checkout_count += 1
+            self.checkout_wait += event.duration or 0
+
+    def connection_checked_in(self, event: monitoring.ConnectionCheckedInEvent):
+        with self._lock:
+            self.in_use_count -= 1
+
+
+POOL_STATS = ConnectionPoolStats()
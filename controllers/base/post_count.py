@@ -0,0 +1,79 @@
+"""Cache of the post counts of a collection."""
+import threading
+import time
+from typing import Callable, Optional
+
+__all__ = ("PostCountCache",)
+
+
+class PostCountCache:
+    """
+    Cache of the post counts of a collection keyed by the language code.
+
+    Counts are updated on write by ``increment()``, and reconciled with the database
+    on the first access after ``reconcile_interval`` seconds since the last reconciliation.
+
+    ``None`` as the language code means the count of the posts in all languages.
+    """
+
+    def __init__(self, reconcile_interval: float):
+        self._reconcile_interval = reconcile_interval
+
+        self._lock = threading.Lock()
+        # Language code -> (post count, monotonic timestamp of the last reconciliation)
+        self._counts: dict[Optional[str], tuple[int, float]] = {}
+
+        self.hits = 0
+        self.misses = 0
+
+    def lookup(self, lang_code: Optional[str]) -> Optional[int]:
+        """Get the cached post count of ``lang_code``. ``None`` if it's not cached or is due for reconciliation."""
+        with self._lock:
+            cached = self._counts.get(lang_code)
+
+            if cached and time.monotonic() - cached[1] < self._reconcile_interval:
+                self.hits += 1
+                return cached[0]
+
+            self.misses += 1
+            return None
+
+    def set(self, lang_code: Optional[str], count: int):
+        """Cache ``count`` as the post count of ``lang_code`` reconciled with the database just now."""
+        with self._lock:
+            self._counts[lang_code] = (count, time.monotonic())
+
+    def get(self, lang_code: Optional[str], counter: Callable[[], int]) -> int:
+        """Get the post count of ``lang_code``. If it's not cached or is due for reconciliation, call ``counter``."""
+        if (count := self.lookup(lang_code)) is not None:
+            return count
+
+        count = counter()
+        self.set(lang_code, count)
+
+        return count
+
+    def increment(self, lang_code: str, delta: int = 1):
+        """Apply the change of the post count of ``lang_code`` to the cached counts (if any)."""
+        with self._lock:
+            for key in (lang_code, None):
+                if key in self._counts:
+                    count, reconciled_at = self._counts[key]
+                    self._counts[key] = (count + delta, reconciled_at)
+
+    def invalidate(self, lang_code: Optional[str] = None):
+        """Drop the cached counts of ``lang_code`` and all languages. Drop all if ``lang_code`` is ``None``."""
+        with self._lock:
+            if lang_code is None:
+                self._counts.clear()
+                return
+
+            self._counts.pop(lang_code, None)
+            self._counts.pop(None, None)
+
+    @property
+    def hit_ratio(self) -> float:
+        """Ratio of the cache hits to all count requests. Returns ``0`` if there were no requests."""
+        total = self.hits + self.misses
+
+        return self.hits / total if total else 0
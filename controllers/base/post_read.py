@@ -0,0 +1,81 @@
+"""Cache of the post reads, which serves the stale reads while reloading them."""
+from typing import Callable, Optional, TypeVar
+
+from pymongo.errors import PyMongoError
+
+from cache import CircuitBreaker, SingleFlight, StaleWhileRevalidateCache
+from .config import (
+    DB_CIRCUIT_FAILURE_THRESHOLD, DB_CIRCUIT_RESET_SEC, POST_READ_CACHE_SIZE, POST_READ_COALESCING,
+    POST_READ_HARD_TTL_SEC, POST_READ_SOFT_TTL_SEC,
+)
+
+__all__ = ("PostReadCache", "DB_CIRCUIT_BREAKER",
+           "READ_POST", "READ_POST_VALIDATOR", "READ_LIST", "READ_LIST_VALIDATOR")
+
+T = TypeVar("T")
+
+# Kinds of the post reads cached, which are the first element of the read cache keys
+READ_POST = "post"
+READ_POST_VALIDATOR = "post_validator"
+READ_LIST = "list"
+READ_LIST_VALIDATOR = "list_validator"
+
+# Circuit breaker of reloading the cached post reads, shared by the controllers as they share the database
+DB_CIRCUIT_BREAKER = CircuitBreaker(DB_CIRCUIT_FAILURE_THRESHOLD, DB_CIRCUIT_RESET_SEC)
+
+
+class PostReadCache:
+    """
+    Cache of the posts, the post lists and their validators read by a multilingual post controller.
+
+    If enabled, the reads are cached in ``cache``.
+    The cached reads are served immediately, and reloaded in the background once they are stale.
+    If the database is unavailable, the stale reads are served until they expire.
+
+    Concurrent identical reads share a single database call by ``flights``, if enabled.
+
+    The key of each read is a tuple, which first element is the kind of the read (``READ_POST``, etc.),
+    and the second element is the sequential ID of the post for the post reads.
+    """
+
+    def __init__(self):
+        self.cache: StaleWhileRevalidateCache = StaleWhileRevalidateCache(
+            POST_READ_CACHE_SIZE, POST_READ_SOFT_TTL_SEC, POST_READ_HARD_TTL_SEC, DB_CIRCUIT_BREAKER, (PyMongoError,)
+        )
+        self.flights: SingleFlight = SingleFlight()
+
+    def read(self, key: tuple, loader: Callable[[], T], /, weight: int = 1) -> tuple[T, Optional[str], int]:
+        """
+        Read the data of ``key`` by ``loader`` through ``cache`` and ``flights`` if enabled.
+
+        :return: tuple of the data, its cache status (``None`` if not cached),
+            and the total ``weight`` of the calls sharing the read if this call made the read (0 otherwise)
+        :raises CircuitOpenError: if the data is not cached and the database is considered unavailable
+        """
+        def read():
+            return self.cache.get(key, loader)
+
+        if POST_READ_COALESCING:
+            (data, cache_status), total_weight = self.flights.do(key, read, weight=weight)
+        else:
+            (data, cache_status), total_weight = read(), weight
+
+        return data, cache_status if self.cache.enabled else None, total_weight
+
+    def invalidate(self, seq_id: Optional[int]):
+        """
+        Drop the cached reads of the post ``seq_id`` in all languages, and all cached post lists.
+
+        Only the post lists are dropped if ``seq_id`` is ``None``.
+
+        The reads in flight of these are not shared with the later calls either.
+        """
+        def is_changed(key: tuple) -> bool:
+            return key[0] in (READ_LIST, READ_LIST_VALIDATOR) or (seq_id is not None and key[1] == seq_id)
+
+        self.cache.invalidate_if(is_changed)
+        self.flights.forget_if(is_changed)
+
+    def clear(self):
+        """Drop all cached reads."""
+        self.cache.clear()
@@ -0,0 +1,138 @@
+"""Versions of the posts and the post lists for the conditional requests."""
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Iterable, Optional, Sequence, Type, Union
+
+from pymongo import UpdateOne
+from pymongo.collection import Collection
+
+from .ctrl_lang import MultilingualDataKey, MultilingualGetOneResult, get_lang_priority
+from .post_mod import ModifiableDataKey
+
+__all__ = ("PostValidator", "PostListVersionTracker", "PostVersioning", "LIST_VERSION_COUNTER")
+
+LIST_VERSION_COUNTER = "_list_version"
+
+VER_COL = "_col"
+VER_LANG = "_lang"
+VER_COUNT = "_ver"
+VER_DT_MOD = "_dt_mod"
+
+
+@dataclass
+class PostValidator:
+    """
+    Validators of a post or a post list.
+
+    ``version`` changes whenever the data changes, except the view counts.
+
+    ``lang_code`` is the language of the post. This is ``None`` for the post lists.
+    """
+
+    version: str
+    last_modified: Optional[datetime]  # pylint: disable=unsubscriptable-object
+    lang_code: Optional[str] = None  # pylint: disable=unsubscriptable-object
+
+
+class PostListVersionTracker:
+    """
+    Tracker of the versions of the post lists of a collection for each language.
+
+    ``None`` as the language code means the list of the posts in all languages.
+    """
+
+    def __init__(self, counter: Collection, col_name: str):
+        self._counter = counter
+        self._col_name = col_name
+
+    def bump(self, *lang_codes: str):
+        """Increase the list versions of each of ``lang_codes`` and all languages in a single write."""
+        self._counter.bulk_write(
+            [
+                UpdateOne(
+                    self.get_version_filter(key),
+                    {"$inc": {VER_COUNT: 1}, "$currentDate": {VER_DT_MOD: True}},
+                    upsert=True
+                )
+                for key in (*lang_codes, None)
+            ],
+            ordered=False
+        )
+
+    def get_version_filter(self, lang_code: Optional[str]) -> dict[str, Any]:
+        """Get the filter of the version document of the list in ``lang_code``."""
+        return {VER_COL: self._col_name, VER_LANG: lang_code}
+
+    @staticmethod
+    def to_validator(version_doc: Optional[dict[str, Any]]) -> PostValidator:
+        """Get the validator from ``version_doc``. The list has never changed if it's ``None``."""
+        if not version_doc:
+            return PostValidator("0", None)
+
+        return PostValidator(str(version_doc[VER_COUNT]), version_doc[VER_DT_MOD])
+
+    def get_validator(self, lang_code: Optional[str]) -> PostValidator:
+        """Get the validator of the list in ``lang_code``."""
+        return self.to_validator(self._counter.find_one(self.get_version_filter(lang_code)))
+
+
+class PostVersioning:
+    """
+    Versioning of the posts and the post lists of a multilingual post collection.
+
+    The validators of the posts are made from the last modified timestamps of the posts in all languages,
+    and the validators of the post lists from the versions tracked by ``list_version``.
+    """
+
+    def __init__(
+            self, key_class: Type[Union[MultilingualDataKey, ModifiableDataKey]], list_version: PostListVersionTracker
+    ):
+        self._seq_id_key = key_class.SEQ_ID
+        self._lang_code_key = key_class.LANG_CODE
+        self._last_mod_key = key_class.DT_LAST_MODIFIED
+
+        self.list_version = list_version
+
+    @staticmethod
+    def _make_post_validator(
+            seq_id: int, post_lang: str, last_modified: datetime, other_langs: list[str]
+    ) -> PostValidator:
+        return PostValidator(
+            f"{seq_id}:{post_lang}:{last_modified.isoformat()}:{','.join(sorted(other_langs))}",
+            last_modified,
+            post_lang
+        )
+
+    def to_post_validator(self, result: MultilingualGetOneResult) -> PostValidator:
+        """Get the validator of the post in ``result``, which must contain a post."""
+        return self._make_post_validator(
+            result.data[self._seq_id_key], result.data[self._lang_code_key], result.data[self._last_mod_key],
+            result.other_langs
+        )
+
+    def get_post_validator_query(self, seq_id: int) -> tuple[dict[str, Any], dict[str, int]]:
+        """Get the filter and the projection to get the last modified timestamps of all languages of a post."""
+        return {self._seq_id_key: seq_id}, {self._lang_code_key: 1, self._last_mod_key: 1}
+
+    def to_post_validator_from_timestamps(
+            self, seq_id: int, lang_code: str, timestamps: Iterable[dict[str, Any]], /,
+            fallback_langs: Optional[Sequence[str]] = None
+    ) -> Optional[PostValidator]:  # pylint: disable=unsubscriptable-object
+        """
+        Get the validator of the post returned by ``get_post()`` of the controller with the same arguments.
+
+        ``timestamps`` is the result of the query by ``get_post_validator_query()``.
+        Returns ``None`` if the post does not exist.
+        """
+        last_modified = {data[self._lang_code_key]: data[self._last_mod_key] for data in timestamps}
+
+        if not last_modified:
+            return None
+
+        post_lang = next(
+            (lang for lang in get_lang_priority(lang_code, fallback_langs) if lang in last_modified),
+            min(last_modified)
+        )
+        other_langs = [lang for lang in last_modified if lang != lang_code]
+
+        return self._make_post_validator(seq_id, post_lang, last_modified[post_lang], other_langs)
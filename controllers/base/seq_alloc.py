@@ -0,0 +1,88 @@
+"""Allocator of the sequential IDs reserving the IDs in blocks."""
+import itertools
+import os
+import threading
+from typing import Iterator, Optional
+
+from pymongo.collection import Collection, ReturnDocument
+
+__all__ = ("SequentialIdAllocator", "SEQ_NAME", "SEQ_COUNT")
+
+SEQ_NAME = "_col"
+SEQ_COUNT = "_seq"
+
+
+class SequentialIdAllocator:
+    """
+    Hi/lo allocator of the sequential IDs of a collection.
+
+    IDs are reserved in blocks of ``block_size`` by atomically increasing the counter document,
+    so the IDs handed out are unique across threads and processes.
+    IDs in the reserved block are then handed out without any lock or database round trip.
+
+    IDs reserved but not handed out (for example, when the process exits) are skipped.
+    """
+
+    def __init__(self, counter: Collection, col_name: str, block_size: int):
+        self._counter = counter
+        self._col_name = col_name
+        self._block_size = max(block_size, 1)
+
+        self._lock = threading.Lock()
+        # (Iterator of the IDs in the block, last ID of the block)
+        self._block: Optional[tuple[Iterator[int], int]] = None  # pylint: disable=unsubscriptable-object
+        self._highest_allocated: Optional[int] = None  # pylint: disable=unsubscriptable-object
+
+        # Block reserved by the parent process must not be used by the child process
+        os.register_at_fork(after_in_child=self._discard_block)
+
+    def _discard_block(self):
+        self._lock = threading.Lock()
+        self._block = None
+
+    def _reserve_block(self) -> tuple[Iterator[int], int]:
+        last_id = self._counter.find_one_and_update(
+            {SEQ_NAME: self._col_name},
+            {"$inc": {SEQ_COUNT: self._block_size}},
+            upsert=True,
+            return_document=ReturnDocument.AFTER,
+        )[SEQ_COUNT]
+
+        self._highest_allocated = max(self._highest_allocated or 0, last_id)
+
+        return itertools.count(last_id - self._block_size + 1), last_id
+
+    def next_id(self) -> int:
+        """Get the next sequential ID."""
+        while True:
+            block = self._block
+
+            # `next()` of `itertools.count` is atomic, so no lock is needed for handing out the IDs in the block
+            if block and (seq_id := next(block[0])) <= block[1]:
+                return seq_id
+
+            with self._lock:
+                # Only reserve a new block if the block has not been replaced by the other threads
+                if self._block is block:
+                    self._block = self._reserve_block()
+
+    def refresh_highest_allocated(self) -> int:
+        """Get the highest allocated ID from the database and return it."""
+        counter = self._counter.find_one({SEQ_NAME: self._col_name})
+
+        self._highest_allocated = max(self._highest_allocated or 0, counter[SEQ_COUNT] if counter else 0)
+
+        return self._highest_allocated
+
+    @property
+    def highest_allocated(self) -> int:
+        """
+        Get the highest ID allocated in any process known by this process.
+
+        Only fetches from the database if it is unknown yet.
+        Call ``refresh_highest_allocated()`` to get the value allocated by the other processes since then.
+        """
+        if self._highest_allocated is None:
+            return self.refresh_highest_allocated()
+
+        return self._highest_allocated
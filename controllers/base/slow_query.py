@@ -0,0 +1,264 @@
+"""Logging of the slow database commands with the execution statistics of their queries."""
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import ContextVar, Token
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from pymongo import monitoring
+from pymongo.errors import PyMongoError
+
+from .config import SLOW_QUERY_EXPLAIN_INTERVAL_SEC, SLOW_QUERY_MS
+
+__all__ = ("SlowQueryListener", "SlowQueryStats", "SLOW_QUERY_LISTENER",
+           "get_query_shape", "redact_query", "summarize_explain", "set_query_endpoint", "reset_query_endpoint")
+
+logger = logging.getLogger(__name__)
+
+# Commands whose queries can be explained without side effects
+EXPLAINABLE_COMMANDS = frozenset({"find", "aggregate", "count", "distinct"})
+
+# Fields of the commands describing the query
+QUERY_FIELDS = ("filter", "query", "key", "sort", "projection", "pipeline", "skip", "limit", "hint")
+
+# Fields of the commands whose values may contain user data, such as the Google UIDs, which are redacted on log
+REDACTED_FIELDS = frozenset({"filter", "query", "pipeline"})
+
+# Fields of the commands not accepted by `explain`, in addition to the fields starting with `$`
+_NON_EXPLAIN_FIELDS = frozenset({"lsid", "txnNumber", "autocommit", "startTransaction", "readConcern", "writeConcern"})
+
+_current_endpoint: ContextVar[str] = ContextVar("query_endpoint", default="")
+
+
+def set_query_endpoint(endpoint: str) -> Token:
+    """
+    Set the endpoint issuing the database commands in the current context, which is logged with the slow commands.
+
+    :return: token to restore the endpoint by ``reset_query_endpoint()``
+    """
+    return _current_endpoint.set(endpoint)
+
+
+def reset_query_endpoint(token: Token):
+    """Restore the endpoint changed by ``set_query_endpoint()`` which returned ``token``."""
+    _current_endpoint.reset(token)
+
+
+def get_query_shape(value: Any) -> Any:
+    """
+    Get the hashable shape of the query ``value``, which only keeps the field names and the operators.
+
+    Arrays are collapsed into their distinct shapes, so ``{"$in": [1, 2]}`` and ``{"$in": [3]}`` have the same shape.
+    """
+    if isinstance(value, dict):
+        return tuple((key, get_query_shape(item)) for key, item in value.items())
+
+    if isinstance(value, (list, tuple)):
+        return tuple(dict.fromkeys(get_query_shape(item) for item in value))
+
+    return "?"
+
+
+def redact_query(value: Any) -> Any:
+    """
+    Get ``value`` with all the values replaced by ``?``, which only keeps the field names and the operators.
+
+    Unlike ``get_query_shape()``, the structure is kept as-is, so ``{"$in": [1, 2]}`` becomes ``{"$in": ["?", "?"]}``.
+    """
+    if isinstance(value, dict):
+        return {key: redact_query(item) for key, item in value.items()}
+
+    if isinstance(value, (list, tuple)):
+        return [redact_query(item) for item in value]
+
+    return "?"
+
+
+def _find_key(value: Any, key: str) -> Optional[Any]:
+    """Get the value of the first ``key`` found in ``value`` recursively, if any."""
+    if isinstance(value, dict):
+        if key in value:
+            return value[key]
+
+        value = value.values()
+    elif not isinstance(value, list):
+        return None
+
+    for item in value:
+        if (found := _find_key(item, key)) is not None:
+            return found
+
+    return None
+
+
+def _get_stages(execution_stages: dict) -> list[str]:
+    """Get the names of the stages in ``execution_stages`` from the root to the leaves."""
+    stages = [execution_stages["stage"]] if "stage" in execution_stages else []
+
+    children = execution_stages.get("inputStages", [])
+    if "inputStage" in execution_stages:
+        children = [execution_stages["inputStage"], *children]
+
+    for child in children:
+        stages.extend(stage for stage in _get_stages(child) if stage not in stages)
+
+    return stages
+
+
+def summarize_explain(result: dict) -> dict[str, Any]:
+    """
+    Get the summary of the execution statistics in the ``explain`` ``result``.
+
+    The stages include ``COLLSCAN`` if the collection is scanned.
+    """
+    stats = _find_key(result, "executionStats") or {}
+
+    returned = stats.get("nReturned", 0)
+    docs_examined = stats.get("totalDocsExamined", 0)
+
+    return {
+        "nReturned": returned,
+        "totalDocsExamined": docs_examined,
+        "totalKeysExamined": stats.get("totalKeysExamined", 0),
+        "docsExaminedPerReturned": round(docs_examined / returned, 2) if returned else None,
+        "executionTimeMillis": stats.get("executionTimeMillis", 0),
+        "stages": _get_stages(stats.get("executionStages", {})),
+    }
+
+
+@dataclass
+class SlowQueryStats:
+    """Statistics of ``SlowQueryListener``."""
+
+    # Slow commands logged
+    slow_count: int = 0
+    # Queries of the slow commands explained
+    explain_count: int = 0
+
+
+class SlowQueryListener(monitoring.CommandListener):
+    """
+    Listener logging the database commands taking more than ``threshold_ms`` with their queries and endpoints.
+
+    The queries of the slow commands are explained in the background, and their execution statistics are logged.
+    Each query shape is explained at most once per ``explain_interval`` seconds.
+
+    Slow commands are not logged if ``threshold_ms`` is not positive,
+    and their queries are not explained if ``explain_interval`` is not positive.
+
+    The values of the filters and the pipelines are redacted on log.
+    """
+
+    def __init__(self, threshold_ms: float, explain_interval: float):
+        self._threshold_micros = threshold_ms * 1000
+        self._explain_interval = explain_interval
+
+        self._lock = threading.Lock()
+        # (connection ID, request ID) -> command
+        self._commands: dict[tuple[Any, int], dict[str, Any]] = {}
+        # Query shape -> monotonic timestamp of the last explain
+        self._explained_at: dict[Any, float] = {}
+        # (PID of the process creating the executor, executor)
+        self._executor: Optional[tuple[int, ThreadPoolExecutor]] = None  # pylint: disable=unsubscriptable-object
+
+        self.stats = SlowQueryStats()
+
+    @property
+    def enabled(self) -> bool:
+        """If the slow commands are logged."""
+        return self._threshold_micros > 0
+
+    def started(self, event: monitoring.CommandStartedEvent):
+        # Explains issued by this listener are not recorded
+        if self.enabled and event.command_name != "explain":
+            self._commands[(event.connection_id, event.request_id)] = event.command
+
+    def succeeded(self, event: monitoring.CommandSucceededEvent):
+        command = self._commands.pop((event.connection_id, event.request_id), None)
+
+        if command is not None and event.duration_micros >= self._threshold_micros:
+            self.record_slow(event.database_name, event.command_name, command, event.duration_micros / 1000)
+
+    def failed(self, event: monitoring.CommandFailedEvent):
+        self._commands.pop((event.connection_id, event.request_id), None)
+
+    def record_slow(self, database_name: str, command_name: str, command: dict[str, Any], duration_ms: float):
+        """Log the slow ``command``, and explain its query in the background if needed."""
+        self.stats.slow_count += 1
+
+        endpoint = _current_endpoint.get()
+        target = f"{database_name}.{command.get(command_name)}"
+        query = {
+            field: redact_query(command[field]) if field in REDACTED_FIELDS else command[field]
+            for field in QUERY_FIELDS if field in command
+        }
+
+        logger.warning(
+            "Slow database command `%s` on `%s` (%.1f ms) of endpoint `%s`: %s",
+            command_name, target, duration_ms, endpoint, query
+        )
+
+        if self.should_explain(database_name, command_name, command):
+            self._get_executor().submit(self._explain, database_name, command_name, command, endpoint)
+
+    def should_explain(self, database_name: str, command_name: str, command: dict[str, Any]) -> bool:
+        """Check if the query of ``command`` should be explained, marking its shape as explained if so."""
+        if self._explain_interval <= 0 or command_name not in EXPLAINABLE_COMMANDS:
+            return False
+
+        if any("$out" in stage or "$merge" in stage for stage in command.get("pipeline", ())):
+            return False
+
+        shape = (
+            database_name, command_name, command.get(command_name),
+            get_query_shape({field: command[field] for field in QUERY_FIELDS if field in command})
+        )
+        now = time.monotonic()
+
+        with self._lock:
+            if shape in self._explained_at and now - self._explained_at[shape] < self._explain_interval:
+                return False
+
+            self._explained_at[shape] = now
+
+        return True
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        pid = os.getpid()
+
+        with self._lock:
+            # The thread of the executor created before forking does not exist in the forked process
+            if not self._executor or self._executor[0] != pid:
+                self._executor = (pid, ThreadPoolExecutor(max_workers=1, thread_name_prefix="slow-query-explain"))
+
+            return self._executor[1]
+
+    def _explain(self, database_name: str, command_name: str, command: dict[str, Any], endpoint: str):
+        # Imported on call because the client registers this listener
+        from .client import get_mongo_client  # pylint: disable=import-outside-toplevel, cyclic-import
+
+        explain_command = {
+            key: value for key, value in command.items()
+            if not key.startswith("$") and key not in _NON_EXPLAIN_FIELDS
+        }
+
+        try:
+            result = get_mongo_client()[database_name].command(
+                {"explain": explain_command, "verbosity": "executionStats"}
+            )
+        except PyMongoError:
+            logger.warning("Failed to explain the slow database command `%s`", command_name, exc_info=True)
+            return
+
+        self.stats.explain_count += 1
+
+        logger.warning(
+            "Execution stats of the slow database command `%s` on `%s.%s` of endpoint `%s`: %s",
+            command_name, database_name, command.get(command_name), endpoint, summarize_explain(result)
+        )
+
+
+SLOW_QUERY_LISTENER = SlowQueryListener(SLOW_QUERY_MS, SLOW_QUERY_EXPLAIN_INTERVAL_SEC)
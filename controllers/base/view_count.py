@@ -0,0 +1,234 @@
+"""Write-behind buffer of the post view counts."""
+import atexit
+import logging
+import os
+import threading
+from collections import Counter
+from dataclasses import dataclass
+from typing import Any, Iterable, Optional, Protocol, Type
+
+from .config import VIEW_COUNT_FLUSH_SEC, VIEW_COUNT_FLUSH_SIZE
+from .ctrl import BaseCollection
+from .ctrl_lang import MultilingualDataKey
+from .ctrl_post_counter import MultilingualPostCounterController
+
+__all__ = ("ViewCountBuffer", "ViewCountFlushConfig", "ViewCountFlushable", "PostViewCounter", "VIEW_COUNT_BUFFER")
+
+logger = logging.getLogger(__name__)
+
+ViewCountKey = tuple[int, str]
+
+
+class ViewCountFlushable(Protocol):
+    """Controller which is able to persist the buffered view count increments."""
+
+    full_name: str
+
+    def flush_view_counts(self, increments: dict[ViewCountKey, int]):
+        """Persist ``increments`` which is keyed by ``(seq_id, lang_code)``."""
+
+
+@dataclass(frozen=True)
+class ViewCountFlushConfig:
+    """Conditions of flushing the view count increments buffered by ``ViewCountBuffer``."""
+
+    # Seconds between the flushes
+    interval: float
+    # Count of the pending keys triggering a flush
+    size: int
+
+
+class ViewCountBuffer:
+    """
+    In-memory aggregator of the view count increments.
+
+    Increments are collected per ``(collection, seq_id, lang_code)``, and flushed as one unordered bulk write
+    per collection when ``flush_interval`` seconds passed, when there are ``flush_size`` pending keys,
+    or when the worker process exits.
+    """
+
+    def __init__(self, flush_interval: float, flush_size: int):
+        self._config = ViewCountFlushConfig(flush_interval, flush_size)
+
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._pending: dict[str, dict[ViewCountKey, int]] = {}
+        self._in_flight: dict[str, dict[ViewCountKey, int]] = {}
+        self._controllers: dict[str, ViewCountFlushable] = {}
+        # (PID of the process running the flushing thread, event waking up the thread)
+        self._flusher: Optional[tuple[int, threading.Event]] = None  # pylint: disable=unsubscriptable-object
+
+        atexit.register(self.flush)
+
+    def _ensure_flusher(self) -> threading.Event:
+        """
+        Start the flushing thread if it is not running in the current process (threads do not survive fork).
+
+        :return: event waking up the flushing thread
+        """
+        pid = os.getpid()
+
+        if self._flusher and self._flusher[0] == pid:
+            return self._flusher[1]
+
+        with self._lock:
+            if not self._flusher or self._flusher[0] != pid:
+                self._flusher = (pid, threading.Event())
+                threading.Thread(
+                    target=self._flush_loop, args=(self._flusher[1],), name="view-count-flusher", daemon=True
+                ).start()
+
+            return self._flusher[1]
+
+    def _flush_loop(self, wake: threading.Event):
+        while True:
+            wake.wait(self._config.interval)
+            wake.clear()
+            self.flush()
+
+    def add(self, controller: ViewCountFlushable, seq_id: int, lang_code: str, count: int = 1):
+        """Buffer ``count`` views of the post ``(seq_id, lang_code)`` in ``controller``."""
+        wake = self._ensure_flusher()
+
+        with self._lock:
+            self._merge(controller, {(seq_id, lang_code): count})
+
+            # Only a few collections are buffered, so counting the pending keys is cheap
+            if sum(len(pending) for pending in self._pending.values()) >= self._config.size:
+                wake.set()
+
+    def _merge(self, controller: ViewCountFlushable, increments: dict[ViewCountKey, int]):
+        """Merge ``increments`` into the pending increments. Lock must be acquired before calling this."""
+        self._controllers[controller.full_name] = controller
+
+        pending = self._pending.setdefault(controller.full_name, {})
+        for key, count in increments.items():
+            pending[key] = pending.get(key, 0) + count
+
+    def get_pending(self, controller: ViewCountFlushable, seq_id: int, lang_code: str) -> int:
+        """Get the count of the views of the post ``(seq_id, lang_code)`` in ``controller`` not yet flushed."""
+        key = (seq_id, lang_code)
+
+        with self._lock:
+            return (
+                self._pending.get(controller.full_name, {}).get(key, 0)
+                + self._in_flight.get(controller.full_name, {}).get(key, 0)
+            )
+
+    def flush(self):
+        """Persist all pending increments. Increments failed to be persisted will be kept for the next flush."""
+        with self._flush_lock:
+            with self._lock:
+                pending = self._pending
+                self._pending = {}
+                # Flushing increments are still counted as pending until they are persisted
+                self._in_flight = dict(pending)
+
+            for col_name, increments in pending.items():
+                try:
+                    self._controllers[col_name].flush_view_counts(increments)
+                except Exception:  # pylint: disable=broad-except
+                    logger.exception("Failed to flush %d view count increments of `%s`", len(increments), col_name)
+
+                    with self._lock:
+                        self._merge(self._controllers[col_name], increments)
+                finally:
+                    with self._lock:
+                        self._in_flight.pop(col_name, None)
+
+
+VIEW_COUNT_BUFFER: Optional[ViewCountBuffer] = (
+    ViewCountBuffer(VIEW_COUNT_FLUSH_SEC, VIEW_COUNT_FLUSH_SIZE) if VIEW_COUNT_FLUSH_SEC else None
+)
+
+
+class PostViewCounter:
+    """
+    Counter of the views of the posts in ``collection``, which keeps the view counts in ``counters``.
+
+    If the view count buffer is enabled, the views are buffered and flushed in the background.
+    Otherwise, the views are written on count.
+
+    ``view_count_key`` is the field of the posts to which the view counts are set.
+    """
+
+    def __init__(
+            self, collection: BaseCollection, counters: MultilingualPostCounterController,
+            key_class: Type[MultilingualDataKey], view_count_key: str
+    ):
+        self._col_name = collection.collection_name
+        self._seq_id_key = key_class.SEQ_ID
+        self._lang_code_key = key_class.LANG_CODE
+        self._view_count_key = view_count_key
+
+        # Key of the buffered views
+        self.full_name = collection.full_name
+        self.counters = counters
+
+    def get_post_ids(self, posts: Iterable[dict[str, Any]]) -> list[tuple[int, str]]:
+        """Get the keys ``(seq_id, lang_code)`` of ``posts``."""
+        return [(post[self._seq_id_key], post[self._lang_code_key]) for post in posts]
+
+    def get_view_count_join(self) -> list[dict[str, Any]]:
+        """Get the aggregation stages joining the view count of the posts."""
+        return self.counters.get_view_count_join(
+            self._col_name, self._seq_id_key, self._lang_code_key, self._view_count_key
+        )
+
+    def attach_view_counts(self, posts: Iterable[dict[str, Any]], view_counts: dict[tuple[int, str], int]):
+        """Set the view counts of ``posts`` from ``view_counts`` keyed by ``(seq_id, lang_code)``."""
+        for post in posts:
+            post[self._view_count_key] = view_counts.get((post[self._seq_id_key], post[self._lang_code_key]), 0)
+
+    def load_view_counts(self, posts: list[dict[str, Any]]):
+        """Get the view counts of ``posts`` from the counters in a single query, and set them to ``posts``."""
+        self.attach_view_counts(posts, self.counters.get_view_counts(self._col_name, set(self.get_post_ids(posts))))
+
+    def count_view(self, post: dict[str, Any], inc_count: bool) -> bool:
+        """
+        Count a view of ``post`` if ``inc_count`` is ``True``, and return if it has to be written to the database.
+
+        If the view count buffer is enabled, the view is buffered without any write,
+        and the view count of ``post`` is updated to include the views not yet flushed.
+        """
+        if not VIEW_COUNT_BUFFER:
+            return inc_count
+
+        seq_id = post[self._seq_id_key]
+        post_lang = post[self._lang_code_key]
+
+        post[self._view_count_key] = \
+            post.get(self._view_count_key, 0) + VIEW_COUNT_BUFFER.get_pending(self, seq_id, post_lang)
+
+        if inc_count:
+            VIEW_COUNT_BUFFER.add(self, seq_id, post_lang)
+
+        return False
+
+    def count_views(self, posts: list[dict[str, Any]], inc_count: bool):
+        """Count a view of each post in ``posts`` if ``inc_count`` is ``True``, writing all views at once if needed."""
+        if VIEW_COUNT_BUFFER:
+            for post in posts:
+                self.count_view(post, inc_count)
+        elif inc_count and posts:
+            self.counters.increase_view_counts(self._col_name, Counter(self.get_post_ids(posts)))
+
+    def get_view_count_update(
+            self, post: dict[str, Any], count: int = 1
+    ) -> tuple[dict[str, Any], dict[str, Any]]:
+        """
+        Get the filter and the update to increase the view count of ``post`` by ``count``.
+
+        These apply to the counters with ``upsert=True``.
+        """
+        return self.counters.get_view_count_update(
+            self._col_name, post[self._seq_id_key], post[self._lang_code_key], count
+        )
+
+    def increase_view_count(self, post: dict[str, Any], count: int = 1):
+        """Increase the view count of ``post`` by ``count``."""
+        self.counters.update_one(*self.get_view_count_update(post, count), upsert=True)
+
+    def flush_view_counts(self, increments: dict[tuple[int, str], int]):
+        """Persist the buffered view count ``increments`` keyed by ``(seq_id, lang_code)`` in a single bulk write."""
+        self.counters.increase_view_counts(self._col_name, increments)
@@ -0,0 +1,21 @@
+"""Watching of the database changes to invalidate the caches of the controllers in each worker process."""
+from .base import CHANGE_WATCH_MODE, CHANGE_WATCH_POLL_SEC, ChangeWatcher
+from .indexes import INDEXED_CONTROLLERS
+
+__all__ = ("CHANGE_WATCHER", "start_change_watcher")
+
+CHANGE_WATCHER = ChangeWatcher(CHANGE_WATCH_MODE, CHANGE_WATCH_POLL_SEC)
+
+
+def start_change_watcher() -> bool:
+    """
+    Start watching the changes of the data cached by the controllers in the current process, if enabled.
+
+    Should be called after the worker process is forked, so each worker invalidates its own caches.
+
+    :return: if the watcher is started by this call
+    """
+    return CHANGE_WATCHER.start(
+        subscription for controller in INDEXED_CONTROLLERS
+        if (subscription := controller.get_change_subscription())
+    )
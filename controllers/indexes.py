@@ -0,0 +1,53 @@
+"""Synchronization of the indexes declared by all controllers."""
+import logging
+import threading
+
+from .base import BaseCollection, IndexSyncReport
+from .post import (
+    PostCounterController, QuestPostController, QuestPostHistoryController, QuestPostListController,
+    UnitAnalysisPostController, UnitAnalysisPostHistoryController, UnitAnalysisPostListController,
+)
+from .user import GoogleUserDataController
+
+__all__ = ("INDEXED_CONTROLLERS", "sync_all_indexes", "sync_all_indexes_in_background")
+
+logger = logging.getLogger(__name__)
+
+INDEXED_CONTROLLERS: tuple[BaseCollection, ...] = (
+    QuestPostController,
+    QuestPostListController,
+    QuestPostHistoryController,
+    UnitAnalysisPostController,
+    UnitAnalysisPostListController,
+    UnitAnalysisPostHistoryController,
+    PostCounterController,
+    GoogleUserDataController,
+)
+
+
+def sync_all_indexes(dry_run: bool = False) -> list[IndexSyncReport]:
+    """
+    Synchronize the indexes declared by each controller in ``INDEXED_CONTROLLERS``.
+
+    Missing indexes will not be created if ``dry_run`` is ``True``.
+    """
+    return [controller.sync_indexes(dry_run=dry_run) for controller in INDEXED_CONTROLLERS]
+
+
+def _sync_all_indexes_logged():
+    try:
+        for report in sync_all_indexes():
+            logger.info("Index sync: %s", report)
+
+            if report.conflicting or report.redundant:
+                logger.warning("Index sync requires attention: %s", report)
+    except Exception:  # pylint: disable=broad-except
+        logger.exception("Failed to synchronize the indexes")
+
+
+def sync_all_indexes_in_background() -> threading.Thread:
+    """Synchronize the indexes of all controllers in a daemon thread so the startup is not blocked."""
+    thread = threading.Thread(target=_sync_all_indexes_logged, name="index-sync", daemon=True)
+    thread.start()
+
+    return thread
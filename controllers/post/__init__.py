@@ -1,3 +1,7 @@
 """Controllers for the post data."""
-from .analysis import UnitAnalysisPostController, UnitAnalysisPostKey, UnitAnalysisPostType
-from .quest import QuestPostController, QuestPostKey
+from .analysis import (
+    UnitAnalysisPostController, UnitAnalysisPostHistoryController, UnitAnalysisPostKey, UnitAnalysisPostListController,
+    UnitAnalysisPostType,
+)
+from .counter import PostCounterController
+from .quest import QuestPostController, QuestPostHistoryController, QuestPostKey, QuestPostListController
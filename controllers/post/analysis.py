@@ -1,12 +1,17 @@
 """Unit analysis post data controllers."""
 from datetime import datetime
 from enum import IntEnum
-from typing import Any, Optional
+from typing import Any, Optional, Sequence
 
-from controllers.base import ModifiableDataKey, MultilingualPostController, MultilingualPostKey
+from controllers.base import (
+    LazyController, ModifiableDataKey, MultilingualPostController, MultilingualPostHistoryController,
+    MultilingualPostKey, MultilingualPostListController, MultilingualPostListResult,
+)
 from controllers.results import UpdateResult
+from .counter import PostCounterController
 
-__all__ = ("UnitAnalysisPostType", "UnitAnalysisPostKey", "UnitAnalysisPostController")
+__all__ = ("UnitAnalysisPostType", "UnitAnalysisPostKey", "UnitAnalysisPostController",
+           "UnitAnalysisPostListController", "UnitAnalysisPostHistoryController")
 
 DB_NAME = "post"
 
@@ -68,40 +73,76 @@ class UnitAnalysisPostKey(ModifiableDataKey, MultilingualPostKey):
         return c_skill_data.keys() == {cls.C_SKILL_NAME, cls.C_SKILL_INFO, cls.C_SKILL_ROTATIONS, cls.C_SKILL_TIPS}
 
 
+class _UnitAnalysisPostListController(MultilingualPostListController):
+    """Unit analysis post list entry controller."""
+
+    database_name = DB_NAME
+    collection_name = "analysis_list"
+
+    def __init__(self):
+        super().__init__(UnitAnalysisPostKey)
+
+
+UnitAnalysisPostListController: _UnitAnalysisPostListController = \
+    LazyController(_UnitAnalysisPostListController)  # type: ignore
+
+
+class _UnitAnalysisPostHistoryController(MultilingualPostHistoryController):
+    """Unit analysis post modification history controller."""
+
+    database_name = DB_NAME
+    collection_name = "analysis_history"
+
+    def __init__(self):
+        super().__init__(UnitAnalysisPostKey)
+
+
+UnitAnalysisPostHistoryController: _UnitAnalysisPostHistoryController = \
+    LazyController(_UnitAnalysisPostHistoryController)  # type: ignore
+
+
 class _UnitAnalysisPostController(MultilingualPostController):
     """Unit analysis post data controller."""
 
     database_name = DB_NAME
     collection_name = "analysis"
 
+    post_list_projection = {
+        UnitAnalysisPostKey.SEQ_ID: 1,
+        UnitAnalysisPostKey.LANG_CODE: 1,
+        UnitAnalysisPostKey.TYPE: 1,
+        UnitAnalysisPostKey.UNIT_NAME: 1,
+        UnitAnalysisPostKey.DT_LAST_MODIFIED: 1,
+        UnitAnalysisPostKey.DT_PUBLISHED: 1
+    }
+
     def __init__(self):
-        super().__init__(UnitAnalysisPostKey)
+        super().__init__(
+            UnitAnalysisPostKey, UnitAnalysisPostListController, UnitAnalysisPostHistoryController,
+            PostCounterController
+        )
 
     def get_posts(
-            self, lang_code: str, /, start: int = 0, limit: int = 0
-    ) -> tuple[list[dict[str, Any]], int]:
+            self, lang_code: Optional[str], /, start: int = 0, limit: int = 0, cursor: Optional[str] = None,
+            with_count: bool = True
+    ) -> MultilingualPostListResult:
         """
-        Get the posts sorted by the last modified date DESC and the total post count.
+        Get the posts sorted by the last modified date DESC, the total post count and the cursor of the next page.
 
         This method only returns key information of posts like sequential id (``s``), title (``t``), last modified
         timestamp (``d_m``) and published timestamp (``d_p``).
 
-        :param lang_code: language code
+        :param lang_code: language code, posts in all languages will be returned if ``None``
         :param start: starting index of the result
         :param limit: maximum count of the results to be returned
-        :return: list of post records
+        :param cursor: cursor returned from the previous page to start right after it, ``start`` is ignored if given
+        :param with_count: if the total post count should be returned
+        :return: post list result
+        :raises ValueError: if `cursor` is malformed
         """
-        projection = {
-            UnitAnalysisPostKey.SEQ_ID: 1,
-            UnitAnalysisPostKey.LANG_CODE: 1,
-            UnitAnalysisPostKey.TYPE: 1,
-            UnitAnalysisPostKey.UNIT_NAME: 1,
-            UnitAnalysisPostKey.DT_LAST_MODIFIED: 1,
-            UnitAnalysisPostKey.DT_PUBLISHED: 1,
-            UnitAnalysisPostKey.VIEW_COUNT: 1
-        }
-
-        return self._get_post_list(lang_code, projection, start=start, limit=limit)
+        return self._get_post_list(
+            lang_code, start=start, limit=limit, cursor=cursor, with_count=with_count
+        )
 
     def publish_chara_post(
             self, unit_name: str, lang_code: str, summary: str, summon_result: str, passives: str,
@@ -130,18 +171,59 @@ class _UnitAnalysisPostController(MultilingualPostController):
         :param keywords: keywords of the character analysis post
         :param seq_id: sequential ID of the post
         :return: sequential ID of the newly published post
+        :raises PostIDUnavailableError: if the post already exists in the language
         :raises ValueError: skill data (`skills`) is incomplete or not using the model key
         """
         # pylint: disable=too-many-arguments, too-many-locals
 
+        new_seq_id = seq_id or self.get_next_seq_id()
+
+        self._insert_post(self._make_chara_post(
+            new_seq_id, datetime.utcnow(), unit_name, lang_code, summary, summon_result, passives, normal_attacks,
+            special_fs, skills, tips_n_builds, videos, story, keywords
+        ))
+
+        return new_seq_id
+
+    def publish_chara_post_bundle(self, variants: Sequence[tuple], /, seq_id: Optional[int] = None) -> int:
+        """
+        Publish a character analysis post in multiple languages at once and get its sequential ID.
+
+        Each of ``variants`` is the arguments of ``publish_chara_post()`` before ``seq_id`` for a language.
+        All variants share the same sequential ID and are inserted in a single write.
+
+        If ``seq_id`` is not specified, a new sequential ID will be used. Otherwise, use the given one.
+
+        :param variants: arguments of the post in each language
+        :param seq_id: sequential ID of the post
+        :return: sequential ID of the newly published post
+        :raises PostIDUnavailableError: if the post already exists in any of the languages
+        :raises ValueError: skill data of any variant is incomplete or not using the model key
+        """
         new_seq_id = seq_id or self.get_next_seq_id()
         now = datetime.utcnow()
 
+        self._insert_posts([self._make_chara_post(new_seq_id, now, *variant) for variant in variants])
+
+        return new_seq_id
+
+    @staticmethod
+    def _make_chara_post(
+            seq_id: int, now: datetime, unit_name: str, lang_code: str, summary: str, summon_result: str,
+            passives: str, normal_attacks: str, special_fs: str, skills: [dict[str, str], dict[str, str]],
+            tips_n_builds: str, videos: str, story: str, keywords: str) -> dict[str, Any]:
+        """
+        Make a new character analysis post published at ``now``.
+
+        :raises ValueError: skill data (`skills`) is incomplete or not using the model key
+        """
+        # pylint: disable=too-many-arguments, too-many-locals
+
         if any(not UnitAnalysisPostKey.is_c_skill_data_completed(skill) for skill in skills):
             raise ValueError("Incomplete skill data")
 
-        self.insert_one({
-            UnitAnalysisPostKey.SEQ_ID: new_seq_id,
+        return {
+            UnitAnalysisPostKey.SEQ_ID: seq_id,
             UnitAnalysisPostKey.LANG_CODE: lang_code,
             UnitAnalysisPostKey.TYPE: UnitAnalysisPostType.CHARACTER,
             UnitAnalysisPostKey.UNIT_NAME: unit_name,
@@ -154,14 +236,11 @@ class _UnitAnalysisPostController(MultilingualPostController):
             UnitAnalysisPostKey.C_TIPS_N_BUILDS: tips_n_builds,
             UnitAnalysisPostKey.VIDEOS: videos,
             UnitAnalysisPostKey.STORY: story,
-            UnitAnalysisPostKey.VIEW_COUNT: 0,
             UnitAnalysisPostKey.KEYWORDS: keywords,
             UnitAnalysisPostKey.MODIFY_NOTES: [],
             UnitAnalysisPostKey.DT_LAST_MODIFIED: now,
             UnitAnalysisPostKey.DT_PUBLISHED: now,
-        })
-
-        return new_seq_id
+        }
 
     def publish_dragon_post(
             self, unit_name: str, lang_code: str, summary: str, summon_result: str, passives: str,
@@ -185,14 +264,50 @@ class _UnitAnalysisPostController(MultilingualPostController):
         :param keywords: keywords of the dragon analysis post
         :param seq_id: sequential ID of the post
         :return: sequential ID of the newly published post
+        :raises PostIDUnavailableError: if the post already exists in the language
         """
         # pylint: disable=too-many-arguments, too-many-locals
 
+        new_seq_id = seq_id or self.get_next_seq_id()
+
+        self._insert_post(self._make_dragon_post(
+            new_seq_id, datetime.utcnow(), unit_name, lang_code, summary, summon_result, passives, normal_attacks,
+            ultimate, notes, suitable_characters, videos, story, keywords
+        ))
+
+        return new_seq_id
+
+    def publish_dragon_post_bundle(self, variants: Sequence[tuple], /, seq_id: Optional[int] = None) -> int:
+        """
+        Publish a dragon analysis post in multiple languages at once and get its sequential ID.
+
+        Each of ``variants`` is the arguments of ``publish_dragon_post()`` before ``seq_id`` for a language.
+        All variants share the same sequential ID and are inserted in a single write.
+
+        If ``seq_id`` is not specified, a new sequential ID will be used. Otherwise, use the given one.
+
+        :param variants: arguments of the post in each language
+        :param seq_id: sequential ID of the post
+        :return: sequential ID of the newly published post
+        :raises PostIDUnavailableError: if the post already exists in any of the languages
+        """
         new_seq_id = seq_id or self.get_next_seq_id()
         now = datetime.utcnow()
 
-        self.insert_one({
-            UnitAnalysisPostKey.SEQ_ID: new_seq_id,
+        self._insert_posts([self._make_dragon_post(new_seq_id, now, *variant) for variant in variants])
+
+        return new_seq_id
+
+    @staticmethod
+    def _make_dragon_post(
+            seq_id: int, now: datetime, unit_name: str, lang_code: str, summary: str, summon_result: str,
+            passives: str, normal_attacks: str, ultimate: str, notes: str, suitable_characters: str,
+            videos: str, story: str, keywords: str) -> dict[str, Any]:
+        """Make a new dragon analysis post published at ``now``."""
+        # pylint: disable=too-many-arguments, too-many-locals
+
+        return {
+            UnitAnalysisPostKey.SEQ_ID: seq_id,
             UnitAnalysisPostKey.LANG_CODE: lang_code,
             UnitAnalysisPostKey.TYPE: UnitAnalysisPostType.DRAGON,
             UnitAnalysisPostKey.UNIT_NAME: unit_name,
@@ -205,14 +320,11 @@ class _UnitAnalysisPostController(MultilingualPostController):
             UnitAnalysisPostKey.D_SUITABLE_CHARACTERS: suitable_characters,
             UnitAnalysisPostKey.VIDEOS: videos,
             UnitAnalysisPostKey.STORY: story,
-            UnitAnalysisPostKey.VIEW_COUNT: 0,
             UnitAnalysisPostKey.KEYWORDS: keywords,
             UnitAnalysisPostKey.MODIFY_NOTES: [],
             UnitAnalysisPostKey.DT_LAST_MODIFIED: now,
             UnitAnalysisPostKey.DT_PUBLISHED: now,
-        })
-
-        return new_seq_id
+        }
 
     def edit_chara_post(
             self, seq_id: int, unit_name: str, lang_code: str, summary: str, summon_result: str, passives: str,
@@ -246,23 +358,55 @@ class _UnitAnalysisPostController(MultilingualPostController):
         return self.update_post(
             seq_id,
             lang_code,
-            {
-                UnitAnalysisPostKey.UNIT_NAME: unit_name,
-                UnitAnalysisPostKey.SUMMARY: summary,
-                UnitAnalysisPostKey.SUMMON_RESULT: summon_result,
-                UnitAnalysisPostKey.PASSIVES: passives,
-                UnitAnalysisPostKey.NORMAL_ATTACKS: normal_attacks,
-                UnitAnalysisPostKey.C_FORCE_STRIKES: special_fs,
-                UnitAnalysisPostKey.C_SKILLS: skills,
-                UnitAnalysisPostKey.C_TIPS_N_BUILDS: tips_n_builds,
-                UnitAnalysisPostKey.VIDEOS: videos,
-                UnitAnalysisPostKey.STORY: story,
-                UnitAnalysisPostKey.KEYWORDS: keywords,
-            },
+            self._make_chara_update(
+                unit_name, summary, summon_result, passives, normal_attacks, special_fs, skills, tips_n_builds,
+                videos, story, keywords
+            ),
             modify_note,
             addl_update_cond={UnitAnalysisPostKey.TYPE: UnitAnalysisPostType.CHARACTER}
         )
 
+    def edit_chara_post_bundle(self, seq_id: int, variants: Sequence[tuple]) -> dict[str, UpdateResult]:
+        """
+        Edit a character analysis post in multiple languages at once.
+
+        Each of ``variants`` is the arguments of ``edit_chara_post()`` after ``seq_id`` for a language.
+        All variants are updated in a single write, each with its own modification note.
+
+        :param seq_id: sequential ID of the post
+        :param variants: arguments of the post in each language
+        :return: result of the update of each language keyed by the language code
+        """
+        return self.update_posts(
+            seq_id,
+            [
+                (lang_code, self._make_chara_update(unit_name, *content), modify_note)
+                for unit_name, lang_code, *content, modify_note in variants
+            ],
+            addl_update_cond={UnitAnalysisPostKey.TYPE: UnitAnalysisPostType.CHARACTER}
+        )
+
+    @staticmethod
+    def _make_chara_update(
+            unit_name: str, summary: str, summon_result: str, passives: str, normal_attacks: str, special_fs: str,
+            skills: [dict[str, str], dict[str, str]], tips_n_builds: str, videos: str, story: str, keywords: str
+    ) -> dict[str, Any]:
+        # pylint: disable=too-many-arguments
+
+        return {
+            UnitAnalysisPostKey.UNIT_NAME: unit_name,
+            UnitAnalysisPostKey.SUMMARY: summary,
+            UnitAnalysisPostKey.SUMMON_RESULT: summon_result,
+            UnitAnalysisPostKey.PASSIVES: passives,
+            UnitAnalysisPostKey.NORMAL_ATTACKS: normal_attacks,
+            UnitAnalysisPostKey.C_FORCE_STRIKES: special_fs,
+            UnitAnalysisPostKey.C_SKILLS: skills,
+            UnitAnalysisPostKey.C_TIPS_N_BUILDS: tips_n_builds,
+            UnitAnalysisPostKey.VIDEOS: videos,
+            UnitAnalysisPostKey.STORY: story,
+            UnitAnalysisPostKey.KEYWORDS: keywords,
+        }
+
     def edit_dragon_post(
             self, seq_id: int, unit_name: str, lang_code: str, summary: str, summon_result: str, passives: str,
             normal_attacks: str, ultimate: str, notes: str, suitable_characters: str,
@@ -291,22 +435,54 @@ class _UnitAnalysisPostController(MultilingualPostController):
         return self.update_post(
             seq_id,
             lang_code,
-            {
-                UnitAnalysisPostKey.UNIT_NAME: unit_name,
-                UnitAnalysisPostKey.SUMMARY: summary,
-                UnitAnalysisPostKey.SUMMON_RESULT: summon_result,
-                UnitAnalysisPostKey.PASSIVES: passives,
-                UnitAnalysisPostKey.NORMAL_ATTACKS: normal_attacks,
-                UnitAnalysisPostKey.D_ULTIMATE: ultimate,
-                UnitAnalysisPostKey.D_NOTES: notes,
-                UnitAnalysisPostKey.D_SUITABLE_CHARACTERS: suitable_characters,
-                UnitAnalysisPostKey.VIDEOS: videos,
-                UnitAnalysisPostKey.STORY: story,
-                UnitAnalysisPostKey.KEYWORDS: keywords,
-            },
+            self._make_dragon_update(
+                unit_name, summary, summon_result, passives, normal_attacks, ultimate, notes, suitable_characters,
+                videos, story, keywords
+            ),
             modify_note,
             addl_update_cond={UnitAnalysisPostKey.TYPE: UnitAnalysisPostType.DRAGON}
         )
 
+    def edit_dragon_post_bundle(self, seq_id: int, variants: Sequence[tuple]) -> dict[str, UpdateResult]:
+        """
+        Edit a dragon analysis post in multiple languages at once.
+
+        Each of ``variants`` is the arguments of ``edit_dragon_post()`` after ``seq_id`` for a language.
+        All variants are updated in a single write, each with its own modification note.
+
+        :param seq_id: sequential ID of the post
+        :param variants: arguments of the post in each language
+        :return: result of the update of each language keyed by the language code
+        """
+        return self.update_posts(
+            seq_id,
+            [
+                (lang_code, self._make_dragon_update(unit_name, *content), modify_note)
+                for unit_name, lang_code, *content, modify_note in variants
+            ],
+            addl_update_cond={UnitAnalysisPostKey.TYPE: UnitAnalysisPostType.DRAGON}
+        )
+
+    @staticmethod
+    def _make_dragon_update(
+            unit_name: str, summary: str, summon_result: str, passives: str, normal_attacks: str, ultimate: str,
+            notes: str, suitable_characters: str, videos: str, story: str, keywords: str
+    ) -> dict[str, Any]:
+        # pylint: disable=too-many-arguments
+
+        return {
+            UnitAnalysisPostKey.UNIT_NAME: unit_name,
+            UnitAnalysisPostKey.SUMMARY: summary,
+            UnitAnalysisPostKey.SUMMON_RESULT: summon_result,
+            UnitAnalysisPostKey.PASSIVES: passives,
+            UnitAnalysisPostKey.NORMAL_ATTACKS: normal_attacks,
+            UnitAnalysisPostKey.D_ULTIMATE: ultimate,
+            UnitAnalysisPostKey.D_NOTES: notes,
+            UnitAnalysisPostKey.D_SUITABLE_CHARACTERS: suitable_characters,
+            UnitAnalysisPostKey.VIDEOS: videos,
+            UnitAnalysisPostKey.STORY: story,
+            UnitAnalysisPostKey.KEYWORDS: keywords,
+        }
+
 
-UnitAnalysisPostController = _UnitAnalysisPostController()
+UnitAnalysisPostController: _UnitAnalysisPostController = LazyController(_UnitAnalysisPostController)  # type: ignore
@@ -0,0 +1,16 @@
+"""Post counter controller."""
+from controllers.base import LazyController, MultilingualPostCounterController
+
+__all__ = ("PostCounterController",)
+
+DB_NAME = "post"
+
+
+class _PostCounterController(MultilingualPostCounterController):
+    """Controller of the counters of the posts in all post collections."""
+
+    database_name = DB_NAME
+    collection_name = "counters"
+
+
+PostCounterController: _PostCounterController = LazyController(_PostCounterController)  # type: ignore
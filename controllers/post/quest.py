@@ -1,11 +1,15 @@
 """Quest post data controllers."""
 from datetime import datetime
-from typing import Any, Optional
+from typing import Any, Optional, Sequence
 
-from controllers.base import ModifiableDataKey, MultilingualPostController, MultilingualPostKey
+from controllers.base import (
+    LazyController, ModifiableDataKey, MultilingualPostController, MultilingualPostHistoryController,
+    MultilingualPostKey, MultilingualPostListController, MultilingualPostListResult,
+)
 from controllers.results import UpdateResult
+from .counter import PostCounterController
 
-__all__ = ("QuestPostKey", "QuestPostController")
+__all__ = ("QuestPostKey", "QuestPostController", "QuestPostListController", "QuestPostHistoryController")
 
 DB_NAME = "post"
 
@@ -34,39 +38,71 @@ class QuestPostKey(ModifiableDataKey, MultilingualPostKey):
         return positional_info_single.keys() == {cls.INFO_POSITION, cls.INFO_BUILDS, cls.INFO_ROTATIONS, cls.INFO_TIPS}
 
 
+class _QuestPostListController(MultilingualPostListController):
+    """Quest post list entry controller."""
+
+    database_name = DB_NAME
+    collection_name = "quest_list"
+
+    def __init__(self):
+        super().__init__(QuestPostKey)
+
+
+QuestPostListController: _QuestPostListController = LazyController(_QuestPostListController)  # type: ignore
+
+
+class _QuestPostHistoryController(MultilingualPostHistoryController):
+    """Quest post modification history controller."""
+
+    database_name = DB_NAME
+    collection_name = "quest_history"
+
+    def __init__(self):
+        super().__init__(QuestPostKey)
+
+
+QuestPostHistoryController: _QuestPostHistoryController = \
+    LazyController(_QuestPostHistoryController)  # type: ignore
+
+
 class _QuestPostController(MultilingualPostController):
     """Quest post data controller."""
 
     database_name = DB_NAME
     collection_name = "quest"
 
+    post_list_projection = {
+        QuestPostKey.SEQ_ID: 1,
+        QuestPostKey.LANG_CODE: 1,
+        QuestPostKey.TITLE: 1,
+        QuestPostKey.DT_LAST_MODIFIED: 1,
+        QuestPostKey.DT_PUBLISHED: 1
+    }
+
     def __init__(self):
-        super().__init__(QuestPostKey)
+        super().__init__(QuestPostKey, QuestPostListController, QuestPostHistoryController, PostCounterController)
 
     def get_posts(
-            self, lang_code: str, /, start: int = 0, limit: int = 0
-    ) -> tuple[list[dict[str, Any]], int]:
+            self, lang_code: Optional[str], /, start: int = 0, limit: int = 0, cursor: Optional[str] = None,
+            with_count: bool = True
+    ) -> MultilingualPostListResult:
         """
-        Get the posts sorted by the last modified date DESC and the total post count.
+        Get the posts sorted by the last modified date DESC, the total post count and the cursor of the next page.
 
         This method only returns key information of posts like sequential id (``s``), title (``t``), last modified
         timestamp (``d_m``) and published timestamp (``d_p``).
 
-        :param lang_code: language code
+        :param lang_code: language code, posts in all languages will be returned if ``None``
         :param start: starting index of the result
         :param limit: maximum count of the results to be returned
-        :return: list of post records
+        :param cursor: cursor returned from the previous page to start right after it, ``start`` is ignored if given
+        :param with_count: if the total post count should be returned
+        :return: post list result
+        :raises ValueError: if `cursor` is malformed
         """
-        projection = {
-            QuestPostKey.SEQ_ID: 1,
-            QuestPostKey.LANG_CODE: 1,
-            QuestPostKey.TITLE: 1,
-            QuestPostKey.DT_LAST_MODIFIED: 1,
-            QuestPostKey.DT_PUBLISHED: 1,
-            QuestPostKey.VIEW_COUNT: 1
-        }
-
-        return self._get_post_list(lang_code, projection, start=start, limit=limit)
+        return self._get_post_list(
+            lang_code, start=start, limit=limit, cursor=cursor, with_count=with_count
+        )
 
     def publish_post(
             self, title: str, lang_code: str, general_info: str, video: str,
@@ -87,16 +123,57 @@ class _QuestPostController(MultilingualPostController):
         :param addendum: addendum of the post
         :param seq_id: sequential ID of the post
         :return: sequential ID lf the newly published post
+        :raises PostIDUnavailableError: if the post already exists in the language
         :raises ValueError: positional info (`position_info`) is incomplete or not using the model key
         """
         new_seq_id = seq_id or self.get_next_seq_id()
+
+        self._insert_post(self._make_post(
+            new_seq_id, datetime.utcnow(), title, lang_code, general_info, video, position_info, addendum
+        ))
+
+        return new_seq_id
+
+    def publish_post_bundle(
+            self, variants: Sequence[tuple[str, str, str, str, list[dict[str, str]], str]], /,
+            seq_id: Optional[int] = None) -> int:
+        """
+        Publish a quest post in multiple languages at once and get its sequential ID.
+
+        Each of ``variants`` is the arguments of ``publish_post()`` before ``seq_id`` for a language.
+        All variants share the same sequential ID and are inserted in a single write.
+
+        If ``seq_id`` is not specified, a new sequential ID will be used. Otherwise, use the given one.
+
+        :param variants: arguments of the post in each language
+        :param seq_id: sequential ID of the post
+        :return: sequential ID of the newly published post
+        :raises PostIDUnavailableError: if the post already exists in any of the languages
+        :raises ValueError: positional info of any variant is incomplete or not using the model key
+        """
+        new_seq_id = seq_id or self.get_next_seq_id()
         now = datetime.utcnow()
 
+        self._insert_posts([self._make_post(new_seq_id, now, *variant) for variant in variants])
+
+        return new_seq_id
+
+    @staticmethod
+    def _make_post(
+            seq_id: int, now: datetime, title: str, lang_code: str, general_info: str, video: str,
+            position_info: list[dict[str, str]], addendum: str) -> dict[str, Any]:
+        """
+        Make a new quest post published at ``now``.
+
+        :raises ValueError: positional info (`position_info`) is incomplete or not using the model key
+        """
+        # pylint: disable=too-many-arguments
+
         if any(not QuestPostKey.is_positional_info_completed(info) for info in position_info):
             raise ValueError("Incomplete positional info")
 
-        self.insert_one({
-            QuestPostKey.SEQ_ID: new_seq_id,
+        return {
+            QuestPostKey.SEQ_ID: seq_id,
             QuestPostKey.TITLE: title,
             QuestPostKey.LANG_CODE: lang_code,
             QuestPostKey.DT_LAST_MODIFIED: now,
@@ -105,11 +182,8 @@ class _QuestPostController(MultilingualPostController):
             QuestPostKey.VIDEO: video,
             QuestPostKey.INFO_PARENT: position_info,
             QuestPostKey.ADDENDUM: addendum,
-            QuestPostKey.MODIFY_NOTES: [],
-            QuestPostKey.VIEW_COUNT: 0
-        })
-
-        return new_seq_id
+            QuestPostKey.MODIFY_NOTES: []
+        }
 
     def edit_post(
             self, seq_id: int, title: str, lang_code: str, general_info: str, video: str,
@@ -135,17 +209,41 @@ class _QuestPostController(MultilingualPostController):
         # pylint: disable=too-many-arguments
 
         return self.update_post(
+            seq_id, lang_code, self._make_update(title, general_info, video, position_info, addendum), modify_note
+        )
+
+    def edit_post_bundle(
+            self, seq_id: int, variants: Sequence[tuple[str, str, str, str, list[dict[str, str]], str, str]]
+    ) -> dict[str, UpdateResult]:
+        """
+        Edit a quest post in multiple languages at once.
+
+        Each of ``variants`` is the arguments of ``edit_post()`` after ``seq_id`` for a language.
+        All variants are updated in a single write, each with its own modification note.
+
+        :param seq_id: sequential ID of the post
+        :param variants: arguments of the post in each language
+        :return: result of the update of each language keyed by the language code
+        """
+        return self.update_posts(
             seq_id,
-            lang_code,
-            {
-                QuestPostKey.TITLE: title,
-                QuestPostKey.GENERAL_INFO: general_info,
-                QuestPostKey.VIDEO: video,
-                QuestPostKey.INFO_PARENT: position_info,
-                QuestPostKey.ADDENDUM: addendum
-            },
-            modify_note
+            [
+                (lang_code, self._make_update(title, general_info, video, position_info, addendum), modify_note)
+                for title, lang_code, general_info, video, position_info, addendum, modify_note in variants
+            ]
         )
 
+    @staticmethod
+    def _make_update(
+            title: str, general_info: str, video: str, position_info: list[dict[str, str]], addendum: str
+    ) -> dict[str, Any]:
+        return {
+            QuestPostKey.TITLE: title,
+            QuestPostKey.GENERAL_INFO: general_info,
+            QuestPostKey.VIDEO: video,
+            QuestPostKey.INFO_PARENT: position_info,
+            QuestPostKey.ADDENDUM: addendum
+        }
+
 
-QuestPostController = _QuestPostController()
+QuestPostController: _QuestPostController = LazyController(_QuestPostController)  # type: ignore
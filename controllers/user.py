@@ -1,11 +1,16 @@
 """Google user data controller."""
+from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
-from typing import Optional
+from typing import Any, Optional
 
-from controllers.base import BaseCollection
+from pymongo import IndexModel
 
-__all__ = ("GoogleLoginType", "GoogleUserDataKeys", "GoogleUserDataController")
+from cache import TTLLRUCache
+from controllers.base import BaseCollection, ChangeEvent, ChangeSubscription, LazyController
+from controllers.base.config import USER_CACHE_SIZE, USER_CACHE_TTL_SEC
+
+__all__ = ("GoogleLoginType", "GoogleUserDataKeys", "GoogleUserDataController", "GoogleUserContext")
 
 
 DB_NAME = "user"
@@ -31,15 +36,58 @@ class GoogleUserDataKeys:
     ADS_DISABLE_EXPIRY = "ad"
 
 
+@dataclass
+class GoogleUserContext:
+    """Context of the user sending the request."""
+
+    data: Optional[dict[str, Any]]  # pylint: disable=unsubscriptable-object
+
+    @property
+    def is_admin(self) -> bool:
+        """If the user is a site admin."""
+        return bool(self.data and self.data.get(GoogleUserDataKeys.IS_SITE_ADMIN))
+
+    @property
+    def show_ads(self) -> bool:
+        """If the ads should be shown to the user. Non-registered users should have ads shown."""
+        return not (self.data and self.data.get(GoogleUserDataKeys.ADS_DISABLE_EXPIRY))
+
+
 class _GoogleUserDataController(BaseCollection):
-    """Google user data controller."""
+    """
+    Google user data controller.
+
+    User data are cached in an LRU cache with TTL, including the results of the users not found.
+    """
 
     database_name = DB_NAME
     collection_name = "google"
 
-    def build_indexes(self):
-        self.create_index(GoogleUserDataKeys.GOOGLE_UID, unique=True)
-        self.create_index(GoogleUserDataKeys.ADS_DISABLE_EXPIRY, unique=True, expireAfterSeconds=1)
+    def __init__(self):
+        super().__init__()
+
+        self.user_cache: TTLLRUCache[Optional[dict[str, Any]]] = TTLLRUCache(USER_CACHE_SIZE, USER_CACHE_TTL_SEC)
+
+    def get_index_models(self) -> list[IndexModel]:
+        return super().get_index_models() + [
+            IndexModel(GoogleUserDataKeys.GOOGLE_UID, unique=True, background=True),
+            # Not unique, otherwise the users without ads disabled will conflict with each other
+            IndexModel(GoogleUserDataKeys.ADS_DISABLE_EXPIRY, expireAfterSeconds=1, background=True),
+        ]
+
+    def get_change_subscription(self) -> Optional[ChangeSubscription]:
+        # User data has no last modified timestamp, so it relies on the TTL of the cache on polling
+        return ChangeSubscription(
+            self, self._on_user_changed, self.user_cache.clear, fields=(GoogleUserDataKeys.GOOGLE_UID,)
+        )
+
+    def _on_user_changed(self, event: ChangeEvent):
+        if not event.document:
+            # Deleted user data (for example, by the TTL index), which UID is unknown
+            self.user_cache.clear()
+            return
+
+        self.user_cache.invalidate(str(event.document[GoogleUserDataKeys.GOOGLE_UID]))
 
     def user_logged_in(self, uid: str, email: str) -> GoogleLoginType:
         """
@@ -66,6 +114,9 @@ class _GoogleUserDataController(BaseCollection):
             upsert=True
         )
 
+        # Invalidated after the write, so the lookups during the write cannot cache the data before it
+        self.user_cache.invalidate(str(uid))
+
         if update_result.modified_count > 0:
             return GoogleLoginType.ALREADY_REGISTERED
 
@@ -74,12 +125,14 @@ class _GoogleUserDataController(BaseCollection):
 
         return GoogleLoginType.UNKNOWN
 
-    def get_user_data(self, uid: Optional[str]) -> Optional[dict[str, str]]:
+    def get_user_data(self, uid: Optional[str]) -> Optional[dict[str, Any]]:
         """
         Get the user data.
 
         Returns ``None`` if the user data does not exist or ``uid`` is ``None``.
 
+        The returned data may be shared with the other callers via the cache and should not be modified.
+
         :param uid: Google UID to get the user data
         :return: user data if found, `None` otherwise
         """
@@ -87,10 +140,37 @@ class _GoogleUserDataController(BaseCollection):
             return None
 
         # Prevent number being accidentally passed in
-        user_data = self.find_one({GoogleUserDataKeys.GOOGLE_UID: str(uid)})
+        uid = str(uid)
+
+        found, user_data = self.user_cache.lookup(uid)
+        if found:
+            return user_data
+
+        user_data = self.find_one({GoogleUserDataKeys.GOOGLE_UID: uid})
+
+        self.cache_user_data(uid, user_data)
 
         return user_data
 
+    def cache_user_data(self, uid: str, user_data: Optional[dict[str, Any]]):
+        """Cache the ``user_data`` fetched from the database of the user ``uid``. ``None`` means not found."""
+        # The user data is removed by the TTL index when the ads disabling expires,
+        # so the cached data must not live longer than that
+        ttl = None
+        if user_data and (ads_disable_expiry := user_data.get(GoogleUserDataKeys.ADS_DISABLE_EXPIRY)):
+            ttl = min(USER_CACHE_TTL_SEC, (ads_disable_expiry - datetime.utcnow()).total_seconds())
+
+        self.user_cache.set(uid, user_data, ttl=ttl)
+
+    def get_user_context(self, uid: Optional[str]) -> GoogleUserContext:
+        """
+        Get the context of the user ``uid``.
+
+        :param uid: Google UID of the user
+        :return: context of the user
+        """
+        return GoogleUserContext(self.get_user_data(uid))
+
     def is_user_admin(self, uid: Optional[str]) -> bool:
         """
         Check if the user is a site admin.
@@ -100,13 +180,7 @@ class _GoogleUserDataController(BaseCollection):
         :param uid: Google UID of the user to check
         :return: if the user is a site admin
         """
-        if not uid:
-            return False
-
-        # Prevent number being accidentally passed in
-        user_data = self.find_one({GoogleUserDataKeys.GOOGLE_UID: str(uid)})
-
-        return user_data and user_data.get(GoogleUserDataKeys.IS_SITE_ADMIN)
+        return self.get_user_context(uid).is_admin
 
     def is_user_show_ads(self, uid: Optional[str]) -> bool:
         """
@@ -117,16 +191,7 @@ class _GoogleUserDataController(BaseCollection):
         :param uid: Google UID of the user to check
         :return: if the ads should be shown to the user
         """
-        if not uid:
-            return True
-
-        # Prevent number being accidentally passed in
-        user_data = self.find_one({GoogleUserDataKeys.GOOGLE_UID: str(uid)})
-
-        print(uid)
-        print(not (user_data and user_data.get(GoogleUserDataKeys.ADS_DISABLE_EXPIRY)))
-
-        return not (user_data and user_data.get(GoogleUserDataKeys.ADS_DISABLE_EXPIRY))
+        return self.get_user_context(uid).show_ads
 
 
-GoogleUserDataController = _GoogleUserDataController()
+GoogleUserDataController: _GoogleUserDataController = LazyController(_GoogleUserDataController)  # type: ignore
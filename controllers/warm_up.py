@@ -0,0 +1,17 @@
+"""Warm-up of the controllers and the database connections of a worker process."""
+from .base import MONGO_WARM_UP_CONNECTIONS, warm_up_mongo_client
+from .indexes import INDEXED_CONTROLLERS
+
+__all__ = ("warm_up_controllers",)
+
+
+def warm_up_controllers(connection_count: int = MONGO_WARM_UP_CONNECTIONS):
+    """
+    Create all controllers and open ``connection_count`` database connections in the current process.
+
+    Should be called after the worker process is forked, so the first requests do not pay for these.
+    """
+    for controller in INDEXED_CONTROLLERS:
+        controller.get_instance()
+
+    warm_up_mongo_client(connection_count)
@@ -1,8 +1,14 @@
 """Endpoint resources of the API."""
+from .metrics import EPMetrics
 from .post_analysis import (
-    EPAnalysisPostGet, EPAnalysisPostIDCheck, EPAnalysisPostList, EPCharaAnalysisPostEdit,
-    EPCharacterAnalysisPostPublish, EPDragonAnalysisPostEdit, EPDragonAnalysisPostPublish,
+    EPAnalysisPostGet, EPAnalysisPostGetMany, EPAnalysisPostHistory, EPAnalysisPostIDCheck, EPAnalysisPostList,
+    EPCharaAnalysisPostEdit, EPCharaAnalysisPostEditBundle, EPCharaAnalysisPostPublishBundle,
+    EPCharacterAnalysisPostPublish, EPDragonAnalysisPostEdit, EPDragonAnalysisPostEditBundle,
+    EPDragonAnalysisPostPublish, EPDragonAnalysisPostPublishBundle,
+)
+from .post_quest import (
+    EPQuestPostEdit, EPQuestPostEditBundle, EPQuestPostGet, EPQuestPostGetMany, EPQuestPostHistory, EPQuestPostIDCheck,
+    EPQuestPostList, EPQuestPostPublish, EPQuestPostPublishBundle,
 )
-from .post_quest import EPQuestPostEdit, EPQuestPostGet, EPQuestPostIDCheck, EPQuestPostList, EPQuestPostPublish
 from .root import EPRootTest
 from .user import EPUserLogin, EPUserLoginParam, EPUserShowAds, EPUserShowAdsParam
@@ -1,8 +1,78 @@
 """Base classes for an endpoint."""
+from datetime import datetime
+from typing import Optional
+
+from flask import Response, g, make_response, request
 from flask_restful import Resource
 from webargs import fields
 
-__all__ = ("EndpointBase", "EPParamBase")
+from controllers import GoogleUserContext, GoogleUserDataController
+from controllers.base import MultilingualPostController
+from .conditional import get_validator_headers, is_not_modified, make_etag
+
+__all__ = ("EndpointBase", "EPParamBase", "get_user_context",
+           "is_request_not_modified", "make_not_modified_response", "get_post_not_modified_response",
+           "get_cache_status_headers")
+
+# Header of the cache status of the data in the response, which is one of `CacheStatus`
+CACHE_STATUS_HEADER = "X-Cache-Status"
+
+
+def get_user_context(uid: Optional[str]) -> GoogleUserContext:
+    """
+    Get the context of the user ``uid``.
+
+    The context is resolved only once per request, so it should be used instead of the user data controller.
+    """
+    if "user_contexts" not in g:
+        g.user_contexts = {}
+
+    if uid not in g.user_contexts:
+        g.user_contexts[uid] = GoogleUserDataController.get_user_context(uid)
+
+    return g.user_contexts[uid]
+
+
+def is_request_not_modified(etag: str, last_modified: Optional[datetime]) -> bool:
+    """Check if the response of the current request is not modified according to its conditional headers."""
+    return is_not_modified(
+        etag, last_modified, request.headers.get("If-None-Match"), request.headers.get("If-Modified-Since")
+    )
+
+
+def make_not_modified_response(etag: str, last_modified: Optional[datetime]) -> Response:
+    """Make the ``304 Not Modified`` response without body."""
+    return make_response("", 304, get_validator_headers(etag, last_modified))
+
+
+def get_post_not_modified_response(
+        controller: MultilingualPostController, seq_id: int, lang_code: str, inc_count: bool,
+        user_context: GoogleUserContext
+) -> Optional[Response]:
+    """
+    Get the ``304 Not Modified`` response if the post to get is not modified. ``None`` if modified.
+
+    The post is not loaded. The view is still counted if ``inc_count`` is ``True``.
+    """
+    if "If-None-Match" not in request.headers and "If-Modified-Since" not in request.headers:
+        return None
+
+    if not (validator := controller.get_post_validator(seq_id, lang_code)):
+        return None
+
+    etag = make_etag(validator, user_context)
+    if not is_request_not_modified(etag, validator.last_modified):
+        return None
+
+    if inc_count:
+        controller.count_post_view(seq_id, validator.lang_code)
+
+    return make_not_modified_response(etag, validator.last_modified)
+
+
+def get_cache_status_headers(cache_status: Optional[str]) -> dict[str, str]:
+    """Get the header of ``cache_status`` of the data in the response. Empty if the data is not cached."""
+    return {CACHE_STATUS_HEADER: cache_status} if cache_status else {}
 
 
 class EPParamBase:
@@ -0,0 +1,58 @@
+"""Helpers of the conditional requests independent of the web framework."""
+import hashlib
+from datetime import datetime, timezone
+from typing import Optional
+
+from werkzeug.http import http_date, parse_date, parse_etags, quote_etag
+
+from controllers import GoogleUserContext, PostValidator
+
+__all__ = ("make_etag", "get_validator_headers", "is_not_modified")
+
+
+def make_etag(validator: PostValidator, user_context: GoogleUserContext) -> str:
+    """
+    Make the entity tag of the response of ``validator`` to the user of ``user_context``.
+
+    The user flags are included as they are in the response body.
+    """
+    return hashlib.blake2b(
+        f"{validator.version}|{user_context.is_admin:d}{user_context.show_ads:d}".encode(),
+        digest_size=8
+    ).hexdigest()
+
+
+def get_validator_headers(etag: str, last_modified: Optional[datetime]) -> dict[str, str]:
+    """
+    Get the validator headers of the response.
+
+    The entity tag is weak because the view counts in the response body are not versioned.
+    Clients are required to revalidate every time, so the views are always counted.
+    """
+    headers = {
+        "ETag": quote_etag(etag, weak=True),
+        "Cache-Control": "no-cache",
+    }
+
+    if last_modified:
+        headers["Last-Modified"] = http_date(last_modified.replace(tzinfo=timezone.utc))
+
+    return headers
+
+
+def is_not_modified(
+        etag: str, last_modified: Optional[datetime], if_none_match: Optional[str], if_modified_since: Optional[str]
+) -> bool:
+    """
+    Check if the response is not modified according to the values of the conditional request headers.
+
+    ``If-Modified-Since`` is ignored if ``If-None-Match`` is given.
+    """
+    if if_none_match:
+        return parse_etags(if_none_match).contains_weak(etag)
+
+    if if_modified_since and last_modified and (since := parse_date(if_modified_since)):
+        # HTTP date has the precision in seconds
+        return last_modified.replace(microsecond=0, tzinfo=timezone.utc) <= since
+
+    return False
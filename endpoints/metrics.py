@@ -0,0 +1,256 @@
+"""
+Metrics of the app in the Prometheus text format.
+
+If ``PROMETHEUS_MULTIPROC_DIR`` is set, the metrics of each worker process are stored in that directory,
+and the metrics returned are aggregated across the processes.
+"""
+import hmac
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from flask import make_response, request
+from prometheus_client import (
+    CONTENT_TYPE_LATEST, REGISTRY, CollectorRegistry, Counter, Gauge, Histogram, generate_latest, multiprocess,
+)
+from werkzeug.exceptions import NotFound
+
+from controllers import (
+    CHANGE_WATCHER, POST_BODY_CACHE, GoogleUserDataController, QuestPostController, UnitAnalysisPostController,
+)
+from controllers.base import POOL_STATS, CommandStats
+from env_var import get_metrics_token
+from responses import Error404Response, Response, ResponseKey
+from .base import EndpointBase
+
+__all__ = ("EPMetrics", "ProcessMetricsState", "RequestMetrics", "get_response_code", "record_request_metrics",
+           "update_process_metrics")
+
+logger = logging.getLogger(__name__)
+
+# Minimum seconds between the updates of the process-wide metrics on request
+PROCESS_METRICS_INTERVAL_SEC = 1
+
+REQUEST_COUNT = Counter(
+    "http_requests", "Count of the requests.", ["endpoint", "method", "status"]
+)
+REQUEST_LATENCY = Histogram(
+    "http_request_duration_seconds", "Seconds spent to handle the requests.", ["endpoint"]
+)
+RESPONSE_SIZE = Histogram(
+    "http_response_size_bytes", "Size of the response bodies.", ["endpoint"],
+    buckets=(256, 1024, 4096, 16384, 65536, 262144, 1048576, float("inf"))
+)
+RESPONSE_CODES = Counter(
+    "response_codes", "Count of the responses by the code in `ResponseCodeCollection`.", ["endpoint", "code"]
+)
+
+MONGO_COMMANDS = Counter(
+    "mongo_commands", "Count of the database commands issued by the requests.", ["endpoint"]
+)
+MONGO_COMMAND_FAILURES = Counter(
+    "mongo_command_failures", "Count of the failed database commands issued by the requests.", ["endpoint"]
+)
+MONGO_COMMAND_DURATION = Counter(
+    "mongo_command_seconds", "Seconds spent on the database commands issued by the requests.", ["endpoint"]
+)
+MONGO_POOL_CONNECTIONS = Gauge(
+    "mongo_pool_connections", "Count of the database connections by state.", ["state"],
+    multiprocess_mode="livesum"
+)
+MONGO_POOL_CHECKOUTS = Counter(
+    "mongo_pool_checkouts", "Count of the database connection check-outs by result.", ["result"]
+)
+MONGO_POOL_CHECKOUT_WAIT = Counter(
+    "mongo_pool_checkout_wait_seconds", "Seconds waited to check out the database connections."
+)
+
+CACHE_LOOKUPS = Counter(
+    "cache_lookups", "Count of the in-process cache lookups by result.", ["cache", "result"]
+)
+
+CHANGE_WATCH_LAG = Gauge(
+    "change_watch_lag_seconds", "Seconds since the change watcher has caught up with the database changes.",
+    multiprocess_mode="livemax"
+)
+
+
+class ProcessMetricsState:
+    """
+    State of the process-wide metrics of the current process.
+
+    The statistics of the process are cumulative totals since the process started,
+    which are exported to the counters by the increases since they were last exported.
+
+    ``lock`` must be held while checking ``updated_at`` and exporting the totals,
+    so the concurrent updates do not export the same increase twice.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.updated_at = 0.0
+        # Counter (with labels) -> total last exported to it
+        self._exported_totals: dict[Any, float] = {}
+
+    def export_total(self, counter: Any, total: float):
+        """Increase ``counter`` (with labels) to the cumulative ``total`` of the current process."""
+        if (increase := total - self._exported_totals.get(counter, 0)) > 0:
+            counter.inc(increase)
+
+        self._exported_totals[counter] = total
+
+
+_PROCESS_METRICS_STATE = ProcessMetricsState()
+
+
+def get_response_code(data: Any) -> Optional[int]:
+    """Get the code in ``ResponseCodeCollection`` of the response body ``data``. ``None`` if not available."""
+    if isinstance(data, Response):
+        return data.code.code
+
+    if isinstance(data, dict):
+        return data.get(ResponseKey.CODE)
+
+    return None
+
+
+@dataclass(frozen=True)
+class RequestMetrics:
+    """Metrics of a request to be recorded by ``record_request_metrics()``."""
+
+    # Name of the endpoint, or an empty string if not matched
+    endpoint: str
+    # HTTP method of the request
+    method: str
+    # HTTP status code of the response
+    status: int
+    # Seconds spent to handle the request
+    duration: float
+    # Size of the response body, if known
+    size: Optional[int] = None  # pylint: disable=unsubscriptable-object
+    # Code in the response body, if any
+    response_code: Optional[int] = None  # pylint: disable=unsubscriptable-object
+    # Statistics of the database commands issued by the request, if recorded
+    command_stats: Optional[CommandStats] = None  # pylint: disable=unsubscriptable-object
+
+
+def record_request_metrics(metrics: RequestMetrics):
+    """Record the ``metrics`` of a request."""
+    endpoint = metrics.endpoint
+
+    REQUEST_COUNT.labels(endpoint, metrics.method, str(metrics.status)).inc()
+    REQUEST_LATENCY.labels(endpoint).observe(metrics.duration)
+
+    if metrics.size is not None:
+        RESPONSE_SIZE.labels(endpoint).observe(metrics.size)
+
+    if metrics.response_code is not None:
+        RESPONSE_CODES.labels(endpoint, str(metrics.response_code)).inc()
+
+    if command_stats := metrics.command_stats:
+        MONGO_COMMANDS.labels(endpoint).inc(command_stats.count)
+        MONGO_COMMAND_FAILURES.labels(endpoint).inc(command_stats.failed_count)
+        MONGO_COMMAND_DURATION.labels(endpoint).inc(command_stats.duration)
+
+    update_process_metrics()
+
+
+def update_process_metrics(force: bool = False):
+    """
+    Update the metrics of the current process, such as the connection pool and the cache statistics.
+
+    The update is skipped if updated within ``PROCESS_METRICS_INTERVAL_SEC``, unless ``force`` is ``True``.
+
+    The statistics of the controllers not created in the current process yet are skipped,
+    so updating the metrics never creates the controllers or connects to the database.
+    Failing to update the metrics is logged without failing the call.
+    """
+    state = _PROCESS_METRICS_STATE
+
+    with state.lock:
+        now = time.monotonic()
+        if not force and now - state.updated_at < PROCESS_METRICS_INTERVAL_SEC:
+            return
+
+        state.updated_at = now
+
+        try:
+            _export_process_metrics(state)
+        except Exception:  # pylint: disable=broad-except
+            logger.exception("Failed to update the process metrics")
+
+
+def _export_process_metrics(state: ProcessMetricsState):
+    """Export the statistics of the current process to the metrics. ``state.lock`` must be held."""
+    MONGO_POOL_CONNECTIONS.labels("open").set(POOL_STATS.open_count)
+    MONGO_POOL_CONNECTIONS.labels("in_use").set(POOL_STATS.in_use_count)
+    state.export_total(MONGO_POOL_CHECKOUTS.labels("succeeded"), POOL_STATS.checkout_count)
+    state.export_total(MONGO_POOL_CHECKOUTS.labels("failed"), POOL_STATS.checkout_failed_count)
+    state.export_total(MONGO_POOL_CHECKOUT_WAIT, POOL_STATS.checkout_wait)
+
+    caches = [("post_body", POST_BODY_CACHE.hits, 0, POST_BODY_CACHE.misses)]
+
+    if (user_controller := GoogleUserDataController.get_created_instance()) is not None:
+        caches.append(("user", user_controller.user_cache.hits, 0, user_controller.user_cache.misses))
+
+    for lazy_controller in (QuestPostController, UnitAnalysisPostController):
+        if (controller := lazy_controller.get_created_instance()) is None:
+            continue
+
+        name = controller.collection_name
+
+        read_stats = controller.reads.cache.stats
+
+        caches.append((f"{name}.count", controller.post_count_cache.hits, 0, controller.post_count_cache.misses))
+        caches.append((f"{name}.read", read_stats.hits, read_stats.stale_hits, read_stats.misses))
+
+    for cache, hits, stale_hits, misses in caches:
+        state.export_total(CACHE_LOOKUPS.labels(cache, "hit"), hits)
+        state.export_total(CACHE_LOOKUPS.labels(cache, "stale_hit"), stale_hits)
+        state.export_total(CACHE_LOOKUPS.labels(cache, "miss"), misses)
+
+    if (lag := CHANGE_WATCHER.lag) is not None:
+        CHANGE_WATCH_LAG.set(lag)
+
+
+def generate_metrics() -> bytes:
+    """Generate the metrics in the Prometheus text format, aggregated across the processes if configured."""
+    if "PROMETHEUS_MULTIPROC_DIR" not in os.environ:
+        return generate_latest(REGISTRY)
+
+    registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(registry)
+
+    return generate_latest(registry)
+
+
+def is_metrics_request_authorized() -> bool:
+    """
+    Check if the current request is authorized to get the metrics.
+
+    The request must have the ``Authorization: Bearer <METRICS_TOKEN>`` header.
+    No request is authorized if ``METRICS_TOKEN`` is not set.
+    """
+    if not (token := get_metrics_token()):
+        return False
+
+    return hmac.compare_digest(request.headers.get("Authorization", "").encode(), f"Bearer {token}".encode())
+
+
+class EPMetrics(EndpointBase):
+    """
+    Endpoint to get the metrics of the app in the Prometheus text format.
+
+    Responds as if the endpoint does not exist, unless the request is authorized by ``METRICS_TOKEN``.
+    """
+
+    def get(self):  # pylint: disable=no-self-use, missing-function-docstring
+        if not is_metrics_request_authorized():
+            return Error404Response(NotFound(), "Resource not found").serialize(), 404
+
+        update_process_metrics(force=True)
+
+        return make_response(generate_metrics(), 200, {"Content-Type": CONTENT_TYPE_LATEST})
@@ -1,24 +1,40 @@
 """Endpoints to get the data related to unit analysis posts."""
 from abc import ABC
+from typing import Any
 
 from webargs import fields
 from webargs.flaskparser import use_args
 
-from controllers import GoogleUserDataController, GoogleUserDataKeys, UnitAnalysisPostController, UnitAnalysisPostKey
+from controllers import PostIDUnavailableError, UnitAnalysisPostController, UnitAnalysisPostKey
+from controllers.base.config import POST_GET_MANY_LIMIT
+from controllers.base.cursor import is_post_list_cursor_valid
 from controllers.results import UpdateResult
 from responses import (
-    AnalysisPostEditFailedResponse, AnalysisPostEditSuccessResponse, AnalysisPostGetFailedResponse,
-    AnalysisPostGetSuccessResponse, AnalysisPostIDCheckResponse, AnalysisPostListResponse,
-    CharaAnalysisPublishFailedResponse, CharaAnalysisPublishSuccessResponse, DragonAnalysisPublishFailedResponse,
-    DragonAnalysisPublishSuccessResponse, ResponseCodeCollection,
+    AnalysisPostEditBundleSuccessResponse, AnalysisPostEditFailedResponse, AnalysisPostEditSuccessResponse,
+    AnalysisPostGetFailedResponse, AnalysisPostGetManyFailedResponse, AnalysisPostGetManyResponse,
+    AnalysisPostGetSuccessResponse, AnalysisPostHistoryResponse, AnalysisPostIDCheckResponse,
+    AnalysisPostListFailedResponse, AnalysisPostListResponse, CharaAnalysisPublishFailedResponse,
+    CharaAnalysisPublishSuccessResponse, DragonAnalysisPublishFailedResponse, DragonAnalysisPublishSuccessResponse,
+    ResponseCodeCollection,
+)
+from .base import (
+    EndpointBase, get_cache_status_headers, get_post_not_modified_response, get_user_context,
+    is_request_not_modified, make_not_modified_response,
+)
+from .conditional import get_validator_headers, make_etag
+from .post_base import (
+    EPPostEditBundleParamBase, EPPostGetManyParamBase, EPPostHistoryParamBase, EPPostListParamBase,
+    EPPostModifyParamBase, EPPostPublishBundleParamBase, EPSinglePostParamBase,
 )
-from .base import EndpointBase
-from .post_base import EPPostListParamBase, EPPostModifyParamBase, EPSinglePostParamBase
 
 __all__ = ("EPCharacterAnalysisPostPublish", "EPDragonAnalysisPostPublish",
+           "EPCharaAnalysisPostPublishBundle", "EPDragonAnalysisPostPublishBundle",
            "EPAnalysisPostList", "EPAnalysisPostListParam",
            "EPAnalysisPostGet", "EPAnalysisPostGetParam",
+           "EPAnalysisPostGetMany", "EPAnalysisPostGetManyParam",
+           "EPAnalysisPostHistory", "EPAnalysisPostHistoryParam",
            "EPCharaAnalysisPostEdit", "EPDragonAnalysisPostEdit",
+           "EPCharaAnalysisPostEditBundle", "EPDragonAnalysisPostEditBundle",
            "EPAnalysisPostIDCheck")
 
 
@@ -42,7 +58,7 @@ class EPAnalysisPostPublishParam(EPSinglePostParamBase, ABC):
     KEYWORDS = "keywords"
 
 
-analysis_pub_args = EPSinglePostParamBase.base_args() | {
+analysis_content_args = {
     EPAnalysisPostPublishParam.UNIT_NAME: fields.Str(),
     EPAnalysisPostPublishParam.SUMMARY: fields.Str(),
     EPAnalysisPostPublishParam.SUMMON_RESULT: fields.Str(),
@@ -95,19 +111,21 @@ class EPCharaAnalysisPostPublishParam(EPAnalysisPostPublishParam):
         return ret
 
 
-chara_analysis_pub_args = analysis_pub_args | {
+chara_analysis_content_args = analysis_content_args | {
     EPCharaAnalysisPostPublishParam.FORCE_STRIKES: fields.Str(),
     EPCharaAnalysisPostPublishParam.SKILLS: fields.List(fields.Dict(keys=fields.Str(), values=fields.Str())),
     EPCharaAnalysisPostPublishParam.TIPS_N_BUILDS: fields.Str(),
 }
 
+chara_analysis_pub_args = EPSinglePostParamBase.base_args() | chara_analysis_content_args
+
 
 class EPCharacterAnalysisPostPublish(EndpointBase):
     """Endpoint resource to publish a character analysis post."""
 
     @use_args(chara_analysis_pub_args)
     def post(self, args):  # pylint: disable=no-self-use, missing-function-docstring, too-many-locals
-        is_user_admin = GoogleUserDataController.is_user_admin(args[EPCharaAnalysisPostPublishParam.GOOGLE_UID])
+        is_user_admin = get_user_context(args[EPCharaAnalysisPostPublishParam.GOOGLE_UID]).is_admin
         if not is_user_admin:
             return CharaAnalysisPublishFailedResponse(ResponseCodeCollection.FAILED_QUEST_NOT_PUBLISHED_NOT_ADMIN), 401
 
@@ -125,10 +143,14 @@ class EPCharacterAnalysisPostPublish(EndpointBase):
         story = args[EPCharaAnalysisPostPublishParam.STORY]
         keywords = args[EPCharaAnalysisPostPublishParam.KEYWORDS]
 
-        new_seq_id = UnitAnalysisPostController.publish_chara_post(
-            unit_name, lang_code, summary, summon_result, passives, normal_attacks, special_fs, skills,
-            tips_n_builds, videos, story, keywords, seq_id=seq_id
-        )
+        try:
+            new_seq_id = UnitAnalysisPostController.publish_chara_post(
+                unit_name, lang_code, summary, summon_result, passives, normal_attacks, special_fs, skills,
+                tips_n_builds, videos, story, keywords, seq_id=seq_id
+            )
+        except PostIDUnavailableError:
+            # The post already exists in the language
+            return CharaAnalysisPublishFailedResponse(ResponseCodeCollection.FAILED_POST_ID_UNAVAILABLE), 400
 
         return CharaAnalysisPublishSuccessResponse(new_seq_id), 200
 
@@ -146,19 +168,21 @@ class EPDragonAnalysisPostPublishParam(EPAnalysisPostPublishParam):
     SUITABLE_CHARACTERS = "suitable_characters"
 
 
-dragon_analysis_pub_args = analysis_pub_args | {
+dragon_analysis_content_args = analysis_content_args | {
     EPDragonAnalysisPostPublishParam.ULTIMATE: fields.Str(),
     EPDragonAnalysisPostPublishParam.NOTES: fields.Str(),
     EPDragonAnalysisPostPublishParam.SUITABLE_CHARACTERS: fields.Str(),
 }
 
+dragon_analysis_pub_args = EPSinglePostParamBase.base_args() | dragon_analysis_content_args
+
 
 class EPDragonAnalysisPostPublish(EndpointBase):
     """Endpoint resource to publish a dragon analysis post."""
 
     @use_args(dragon_analysis_pub_args)
     def post(self, args):  # pylint: disable=no-self-use, missing-function-docstring, too-many-locals
-        is_user_admin = GoogleUserDataController.is_user_admin(args[EPDragonAnalysisPostPublishParam.GOOGLE_UID])
+        is_user_admin = get_user_context(args[EPDragonAnalysisPostPublishParam.GOOGLE_UID]).is_admin
         if not is_user_admin:
             return DragonAnalysisPublishFailedResponse(
                 ResponseCodeCollection.FAILED_QUEST_NOT_PUBLISHED_NOT_ADMIN), 401
@@ -177,11 +201,130 @@ class EPDragonAnalysisPostPublish(EndpointBase):
         story = args[EPDragonAnalysisPostPublishParam.STORY]
         keywords = args[EPDragonAnalysisPostPublishParam.KEYWORDS]
 
-        new_seq_id = UnitAnalysisPostController.publish_dragon_post(
-            unit_name, lang_code, summary, summon_result, passives, normal_attacks, ultimate, notes,
-            suitable_characters, videos, story, keywords, seq_id=seq_id
+        try:
+            new_seq_id = UnitAnalysisPostController.publish_dragon_post(
+                unit_name, lang_code, summary, summon_result, passives, normal_attacks, ultimate, notes,
+                suitable_characters, videos, story, keywords, seq_id=seq_id
+            )
+        except PostIDUnavailableError:
+            # The post already exists in the language
+            return DragonAnalysisPublishFailedResponse(ResponseCodeCollection.FAILED_POST_ID_UNAVAILABLE), 400
+
+        return DragonAnalysisPublishSuccessResponse(new_seq_id), 200
+
+
+# endregion
+
+
+# region Character Analysis Post / Publish Bundle
+
+class EPCharaAnalysisPostPublishBundleParam(EPPostPublishBundleParamBase):
+    """Parameters for the request of publishing a character analysis post in multiple languages at once."""
+
+    @classmethod
+    def to_variant(cls, post: dict[str, Any]) -> tuple:
+        """Get the arguments of ``UnitAnalysisPostController.publish_chara_post()`` of a ``post`` in the bundle."""
+        return (
+            post[EPCharaAnalysisPostPublishParam.UNIT_NAME],
+            post[cls.POST_LANG_CODE],
+            post[EPCharaAnalysisPostPublishParam.SUMMARY],
+            post[EPCharaAnalysisPostPublishParam.SUMMON_RESULT],
+            post[EPCharaAnalysisPostPublishParam.PASSIVES],
+            post[EPCharaAnalysisPostPublishParam.NORMAL_ATTACKS],
+            post[EPCharaAnalysisPostPublishParam.FORCE_STRIKES],
+            EPCharaAnalysisPostPublishParam.skill_to_model_key(post[EPCharaAnalysisPostPublishParam.SKILLS]),
+            post[EPCharaAnalysisPostPublishParam.TIPS_N_BUILDS],
+            post[EPCharaAnalysisPostPublishParam.VIDEOS],
+            post[EPCharaAnalysisPostPublishParam.STORY],
+            post[EPCharaAnalysisPostPublishParam.KEYWORDS]
+        )
+
+
+chara_analysis_pub_bundle_args = EPPostPublishBundleParamBase.bundle_args(chara_analysis_content_args)
+
+
+class EPCharaAnalysisPostPublishBundle(EndpointBase):
+    """Endpoint resource to publish a character analysis post in multiple languages at once."""
+
+    @use_args(chara_analysis_pub_bundle_args)
+    def post(self, args):  # pylint: disable=no-self-use, missing-function-docstring
+        is_user_admin = get_user_context(args[EPCharaAnalysisPostPublishBundleParam.GOOGLE_UID]).is_admin
+        if not is_user_admin:
+            return CharaAnalysisPublishFailedResponse(ResponseCodeCollection.FAILED_QUEST_NOT_PUBLISHED_NOT_ADMIN), 401
+
+        seq_id = args[EPCharaAnalysisPostPublishBundleParam.SEQ_ID]
+        posts = args[EPCharaAnalysisPostPublishBundleParam.POSTS]
+
+        lang_codes = EPCharaAnalysisPostPublishBundleParam.get_lang_codes(posts)
+        if not UnitAnalysisPostController.is_id_langs_available(seq_id, lang_codes):
+            return CharaAnalysisPublishFailedResponse(ResponseCodeCollection.FAILED_POST_ID_UNAVAILABLE), 400
+
+        try:
+            new_seq_id = UnitAnalysisPostController.publish_chara_post_bundle(
+                [EPCharaAnalysisPostPublishBundleParam.to_variant(post) for post in posts], seq_id=seq_id
+            )
+        except PostIDUnavailableError:
+            # Published concurrently after the check above
+            return CharaAnalysisPublishFailedResponse(ResponseCodeCollection.FAILED_POST_ID_UNAVAILABLE), 400
+
+        return CharaAnalysisPublishSuccessResponse(new_seq_id), 200
+
+
+# endregion
+
+
+# region Dragon Analysis Post / Publish Bundle
+
+class EPDragonAnalysisPostPublishBundleParam(EPPostPublishBundleParamBase):
+    """Parameters for the request of publishing a dragon analysis post in multiple languages at once."""
+
+    @classmethod
+    def to_variant(cls, post: dict[str, Any]) -> tuple:
+        """Get the arguments of ``UnitAnalysisPostController.publish_dragon_post()`` of a ``post`` in the bundle."""
+        return (
+            post[EPDragonAnalysisPostPublishParam.UNIT_NAME],
+            post[cls.POST_LANG_CODE],
+            post[EPDragonAnalysisPostPublishParam.SUMMARY],
+            post[EPDragonAnalysisPostPublishParam.SUMMON_RESULT],
+            post[EPDragonAnalysisPostPublishParam.PASSIVES],
+            post[EPDragonAnalysisPostPublishParam.NORMAL_ATTACKS],
+            post[EPDragonAnalysisPostPublishParam.ULTIMATE],
+            post[EPDragonAnalysisPostPublishParam.NOTES],
+            post[EPDragonAnalysisPostPublishParam.SUITABLE_CHARACTERS],
+            post[EPDragonAnalysisPostPublishParam.VIDEOS],
+            post[EPDragonAnalysisPostPublishParam.STORY],
+            post[EPDragonAnalysisPostPublishParam.KEYWORDS]
         )
 
+
+dragon_analysis_pub_bundle_args = EPPostPublishBundleParamBase.bundle_args(dragon_analysis_content_args)
+
+
+class EPDragonAnalysisPostPublishBundle(EndpointBase):
+    """Endpoint resource to publish a dragon analysis post in multiple languages at once."""
+
+    @use_args(dragon_analysis_pub_bundle_args)
+    def post(self, args):  # pylint: disable=no-self-use, missing-function-docstring
+        is_user_admin = get_user_context(args[EPDragonAnalysisPostPublishBundleParam.GOOGLE_UID]).is_admin
+        if not is_user_admin:
+            return DragonAnalysisPublishFailedResponse(
+                ResponseCodeCollection.FAILED_QUEST_NOT_PUBLISHED_NOT_ADMIN), 401
+
+        seq_id = args[EPDragonAnalysisPostPublishBundleParam.SEQ_ID]
+        posts = args[EPDragonAnalysisPostPublishBundleParam.POSTS]
+
+        lang_codes = EPDragonAnalysisPostPublishBundleParam.get_lang_codes(posts)
+        if not UnitAnalysisPostController.is_id_langs_available(seq_id, lang_codes):
+            return DragonAnalysisPublishFailedResponse(ResponseCodeCollection.FAILED_POST_ID_UNAVAILABLE), 400
+
+        try:
+            new_seq_id = UnitAnalysisPostController.publish_dragon_post_bundle(
+                [EPDragonAnalysisPostPublishBundleParam.to_variant(post) for post in posts], seq_id=seq_id
+            )
+        except PostIDUnavailableError:
+            # Published concurrently after the check above
+            return DragonAnalysisPublishFailedResponse(ResponseCodeCollection.FAILED_POST_ID_UNAVAILABLE), 400
+
         return DragonAnalysisPublishSuccessResponse(new_seq_id), 200
 
 
@@ -202,17 +345,31 @@ class EPAnalysisPostList(EndpointBase):
 
     @use_args(analysis_post_list_args, location="query")
     def get(self, args):  # pylint: disable=no-self-use, missing-function-docstring
+        # Rejected before the user lookup, so a malformed cursor is never answered with 304
+        if not is_post_list_cursor_valid(args[EPAnalysisPostListParam.CURSOR]):
+            return AnalysisPostListFailedResponse(ResponseCodeCollection.FAILED_INVALID_CURSOR), 400
+
         start_idx = args[EPAnalysisPostListParam.START]
 
-        user_data = GoogleUserDataController.get_user_data(args[EPAnalysisPostListParam.GOOGLE_UID])
-        is_user_admin = user_data[GoogleUserDataKeys.IS_SITE_ADMIN] if user_data else False
-        show_ads = not (user_data and GoogleUserDataKeys.ADS_DISABLE_EXPIRY in user_data)
+        user_context = get_user_context(args[EPAnalysisPostListParam.GOOGLE_UID])
+        is_user_admin = user_context.is_admin
+        show_ads = user_context.show_ads
         lang_code = args[EPAnalysisPostListParam.LANG_CODE]
-        posts, post_count = UnitAnalysisPostController.get_posts(
-            lang_code, start=start_idx, limit=args[EPAnalysisPostListParam.LIMIT]
+
+        validator = UnitAnalysisPostController.get_post_list_validator(lang_code)
+        etag = make_etag(validator, user_context)
+        if is_request_not_modified(etag, validator.last_modified):
+            return make_not_modified_response(etag, validator.last_modified)
+
+        list_result = UnitAnalysisPostController.get_posts(
+            lang_code, start=start_idx, limit=args[EPAnalysisPostListParam.LIMIT],
+            cursor=args[EPAnalysisPostListParam.CURSOR], with_count=args[EPAnalysisPostListParam.WITH_COUNT]
         )
 
-        return AnalysisPostListResponse(is_user_admin, show_ads, posts, start_idx, post_count), 200
+        return (
+            AnalysisPostListResponse(is_user_admin, show_ads, start_idx, list_result), 200,
+            get_validator_headers(etag, validator.last_modified) | get_cache_status_headers(list_result.cache_status)
+        )
 
 
 # endregion
@@ -236,19 +393,89 @@ class EPAnalysisPostGet(EndpointBase):
 
     @use_args(analysis_post_get_args, location="query")
     def get(self, args):  # pylint: disable=no-self-use, missing-function-docstring
-        user_data = GoogleUserDataController.get_user_data(args[EPAnalysisPostGetParam.GOOGLE_UID])
-        is_user_admin = user_data[GoogleUserDataKeys.IS_SITE_ADMIN] if user_data else False
-        show_ads = not (user_data and GoogleUserDataKeys.ADS_DISABLE_EXPIRY in user_data)
+        user_context = get_user_context(args[EPAnalysisPostGetParam.GOOGLE_UID])
+        is_user_admin = user_context.is_admin
+        show_ads = user_context.show_ads
 
         seq_id = args[EPAnalysisPostGetParam.SEQ_ID]
         lang_code = args[EPAnalysisPostGetParam.LANG_CODE]
         increase_count = args[EPAnalysisPostGetParam.INCREASE_COUNT]
+
+        not_modified = get_post_not_modified_response(
+            UnitAnalysisPostController, seq_id, lang_code, increase_count, user_context
+        )
+        if not_modified is not None:
+            return not_modified
+
         result = UnitAnalysisPostController.get_post(seq_id, lang_code, increase_count)
 
         if not result.data:
             return AnalysisPostGetFailedResponse(ResponseCodeCollection.FAILED_POST_NOT_EXISTS), 404
 
-        return AnalysisPostGetSuccessResponse(is_user_admin, show_ads, result), 200
+        validator = UnitAnalysisPostController.to_post_validator(result)
+
+        return (
+            AnalysisPostGetSuccessResponse(is_user_admin, show_ads, result), 200,
+            get_validator_headers(make_etag(validator, user_context), validator.last_modified)
+            | get_cache_status_headers(result.cache_status)
+        )
+
+
+# endregion
+
+
+# region Analysis Post / Get Many
+
+class EPAnalysisPostGetManyParam(EPPostGetManyParamBase):
+    """Parameters for the request of getting multiple analysis posts."""
+
+
+analysis_post_get_many_args = EPPostGetManyParamBase.base_args()
+
+
+class EPAnalysisPostGetMany(EndpointBase):
+    """Endpoint resource to get multiple analysis posts in the requested order."""
+
+    @use_args(analysis_post_get_many_args)
+    def post(self, args):  # pylint: disable=no-self-use, missing-function-docstring
+        post_ids = EPAnalysisPostGetManyParam.to_post_ids(args[EPAnalysisPostGetManyParam.POSTS])
+        if len(post_ids) > POST_GET_MANY_LIMIT:
+            return AnalysisPostGetManyFailedResponse(ResponseCodeCollection.FAILED_TOO_MANY_POSTS), 400
+
+        user_context = get_user_context(args[EPAnalysisPostGetManyParam.GOOGLE_UID])
+
+        results = UnitAnalysisPostController.get_posts_by_ids(
+            post_ids, args[EPAnalysisPostGetManyParam.INCREASE_COUNT]
+        )
+
+        return AnalysisPostGetManyResponse(user_context.is_admin, user_context.show_ads, results), 200
+
+
+# endregion
+
+
+# region Analysis Post / History
+
+class EPAnalysisPostHistoryParam(EPPostHistoryParamBase):
+    """Parameters for the request of getting the modification history of an analysis post."""
+
+
+analysis_post_history_args = EPPostHistoryParamBase.base_args()
+
+
+class EPAnalysisPostHistory(EndpointBase):
+    """Endpoint resource to get the modification history of an analysis post, latest first."""
+
+    @use_args(analysis_post_history_args, location="query")
+    def get(self, args):  # pylint: disable=no-self-use, missing-function-docstring
+        start_idx = args[EPAnalysisPostHistoryParam.START]
+
+        notes, has_next = UnitAnalysisPostController.get_modify_notes(
+            args[EPAnalysisPostHistoryParam.SEQ_ID], args[EPAnalysisPostHistoryParam.LANG_CODE],
+            start=start_idx, limit=args[EPAnalysisPostHistoryParam.LIMIT]
+        )
+
+        return AnalysisPostHistoryResponse(start_idx, notes, has_next), 200
 
 
 # endregion
@@ -268,7 +495,7 @@ class EPCharaAnalysisPostEdit(EndpointBase):
 
     @use_args(chara_analysis_post_edit_args)
     def post(self, args):  # pylint: disable=no-self-use, missing-function-docstring, too-many-locals, duplicate-code
-        is_user_admin = GoogleUserDataController.is_user_admin(args[EPCharaAnalysisPostEditParam.GOOGLE_UID])
+        is_user_admin = get_user_context(args[EPCharaAnalysisPostEditParam.GOOGLE_UID]).is_admin
         if not is_user_admin:
             return CharaAnalysisPublishFailedResponse(ResponseCodeCollection.FAILED_QUEST_NOT_PUBLISHED_NOT_ADMIN), 401
 
@@ -304,6 +531,48 @@ class EPCharaAnalysisPostEdit(EndpointBase):
 # endregion
 
 
+# region Character Analysis Post / Edit Bundle
+
+class EPCharaAnalysisPostEditBundleParam(EPPostEditBundleParamBase, EPCharaAnalysisPostPublishBundleParam):
+    """Parameters for the request of editing a character analysis post in multiple languages at once."""
+
+    @classmethod
+    def to_variant(cls, post: dict[str, Any]) -> tuple:
+        """Get the arguments of ``UnitAnalysisPostController.edit_chara_post()`` after ``seq_id`` of ``post``."""
+        return super().to_variant(post) + (post[cls.POST_MODIFY_NOTE],)
+
+
+chara_analysis_edit_bundle_args = EPPostEditBundleParamBase.bundle_args(chara_analysis_content_args)
+
+
+class EPCharaAnalysisPostEditBundle(EndpointBase):
+    """Endpoint resource to edit a character analysis post in multiple languages at once."""
+
+    @use_args(chara_analysis_edit_bundle_args)
+    def post(self, args):  # pylint: disable=no-self-use, missing-function-docstring, duplicate-code
+        is_user_admin = get_user_context(args[EPCharaAnalysisPostEditBundleParam.GOOGLE_UID]).is_admin
+        if not is_user_admin:
+            return AnalysisPostEditFailedResponse(ResponseCodeCollection.FAILED_QUEST_NOT_PUBLISHED_NOT_ADMIN), 401
+
+        seq_id = args[EPCharaAnalysisPostEditBundleParam.SEQ_ID]
+        posts = args[EPCharaAnalysisPostEditBundleParam.POSTS]
+
+        if EPCharaAnalysisPostEditBundleParam.has_duplicate_lang_codes(posts):
+            return AnalysisPostEditFailedResponse(ResponseCodeCollection.FAILED_DUPLICATE_LANGS), 400
+
+        edit_outcomes = UnitAnalysisPostController.edit_chara_post_bundle(
+            seq_id, [EPCharaAnalysisPostEditBundleParam.to_variant(post) for post in posts]
+        )
+
+        if all(outcome == UpdateResult.NOT_FOUND for outcome in edit_outcomes.values()):
+            return AnalysisPostEditFailedResponse(ResponseCodeCollection.FAILED_POST_NOT_EXISTS), 404
+
+        return AnalysisPostEditBundleSuccessResponse(seq_id, edit_outcomes), 200
+
+
+# endregion
+
+
 # region Dragon Analysis Post / Edit
 
 class EPDragonAnalysisPostEditParam(EPPostModifyParamBase, EPDragonAnalysisPostPublishParam):
@@ -318,7 +587,7 @@ class EPDragonAnalysisPostEdit(EndpointBase):
 
     @use_args(dragon_analysis_post_edit_args)
     def post(self, args):  # pylint: disable=no-self-use, missing-function-docstring, too-many-locals
-        is_user_admin = GoogleUserDataController.is_user_admin(args[EPDragonAnalysisPostEditParam.GOOGLE_UID])
+        is_user_admin = get_user_context(args[EPDragonAnalysisPostEditParam.GOOGLE_UID]).is_admin
         if not is_user_admin:
             return DragonAnalysisPublishFailedResponse(
                 ResponseCodeCollection.FAILED_QUEST_NOT_PUBLISHED_NOT_ADMIN), 401
@@ -355,6 +624,48 @@ class EPDragonAnalysisPostEdit(EndpointBase):
 # endregion
 
 
+# region Dragon Analysis Post / Edit Bundle
+
+class EPDragonAnalysisPostEditBundleParam(EPPostEditBundleParamBase, EPDragonAnalysisPostPublishBundleParam):
+    """Parameters for the request of editing a dragon analysis post in multiple languages at once."""
+
+    @classmethod
+    def to_variant(cls, post: dict[str, Any]) -> tuple:
+        """Get the arguments of ``UnitAnalysisPostController.edit_dragon_post()`` after ``seq_id`` of ``post``."""
+        return super().to_variant(post) + (post[cls.POST_MODIFY_NOTE],)
+
+
+dragon_analysis_edit_bundle_args = EPPostEditBundleParamBase.bundle_args(dragon_analysis_content_args)
+
+
+class EPDragonAnalysisPostEditBundle(EndpointBase):
+    """Endpoint resource to edit a dragon analysis post in multiple languages at once."""
+
+    @use_args(dragon_analysis_edit_bundle_args)
+    def post(self, args):  # pylint: disable=no-self-use, missing-function-docstring, duplicate-code
+        is_user_admin = get_user_context(args[EPDragonAnalysisPostEditBundleParam.GOOGLE_UID]).is_admin
+        if not is_user_admin:
+            return AnalysisPostEditFailedResponse(ResponseCodeCollection.FAILED_QUEST_NOT_PUBLISHED_NOT_ADMIN), 401
+
+        seq_id = args[EPDragonAnalysisPostEditBundleParam.SEQ_ID]
+        posts = args[EPDragonAnalysisPostEditBundleParam.POSTS]
+
+        if EPDragonAnalysisPostEditBundleParam.has_duplicate_lang_codes(posts):
+            return AnalysisPostEditFailedResponse(ResponseCodeCollection.FAILED_DUPLICATE_LANGS), 400
+
+        edit_outcomes = UnitAnalysisPostController.edit_dragon_post_bundle(
+            seq_id, [EPDragonAnalysisPostEditBundleParam.to_variant(post) for post in posts]
+        )
+
+        if all(outcome == UpdateResult.NOT_FOUND for outcome in edit_outcomes.values()):
+            return AnalysisPostEditFailedResponse(ResponseCodeCollection.FAILED_POST_NOT_EXISTS), 404
+
+        return AnalysisPostEditBundleSuccessResponse(seq_id, edit_outcomes), 200
+
+
+# endregion
+
+
 # region Analysis Post / ID Check
 
 class EPAnalysisPostIDCheckParam(EPSinglePostParamBase):
@@ -369,7 +680,7 @@ class EPAnalysisPostIDCheck(EndpointBase):
 
     @use_args(analysis_post_id_check_args, location="query")
     def get(self, args):  # pylint: disable=no-self-use, missing-function-docstring, duplicate-code
-        is_user_admin = GoogleUserDataController.is_user_admin(args[EPAnalysisPostIDCheckParam.GOOGLE_UID])
+        is_user_admin = get_user_context(args[EPAnalysisPostIDCheckParam.GOOGLE_UID]).is_admin
         if not is_user_admin:
             return AnalysisPostIDCheckResponse(False, False), 200
 
@@ -2,13 +2,15 @@
 from abc import ABC
 from typing import Any
 
-from webargs import fields
+from webargs import fields, validate
 
 from .base import EPParamBase
 
-__all__ = ("EPPostListParamBase", "EPSinglePostParamBase", "EPPostModifyParamBase")
+__all__ = ("EPPostListParamBase", "EPSinglePostParamBase", "EPPostModifyParamBase", "EPPostHistoryParamBase",
+           "EPPostGetManyParamBase", "EPPostPublishBundleParamBase", "EPPostEditBundleParamBase")
 
 DEFAULT_LIST_LIMIT = 25
+DEFAULT_HISTORY_LIMIT = 25
 
 
 class EPSinglePostParamBase(EPParamBase, ABC):
@@ -26,6 +28,55 @@ class EPSinglePostParamBase(EPParamBase, ABC):
         }
 
 
+class EPPostPublishBundleParamBase(EPParamBase, ABC):
+    """Parameter base class for the request of publishing a post in multiple languages at once."""
+
+    SEQ_ID = "seq_id"
+    POSTS = "posts"
+
+    # Subfield of `POSTS`
+
+    POST_LANG_CODE = "lang"
+
+    @classmethod
+    def bundle_args(cls, post_args: dict[str, Any]) -> dict[str, Any]:
+        """Get the arguments to be used for parse, where each post in the bundle is parsed by ``post_args``."""
+        return super().base_args() | {
+            EPPostPublishBundleParamBase.SEQ_ID: fields.Int(missing=None),
+            EPPostPublishBundleParamBase.POSTS: fields.List(
+                fields.Nested({EPPostPublishBundleParamBase.POST_LANG_CODE: fields.Str(required=True)} | post_args),
+                required=True, validate=validate.Length(min=1)
+            )
+        }
+
+    @classmethod
+    def get_lang_codes(cls, posts: list[dict[str, Any]]) -> list[str]:
+        """Get the language codes of the ``posts`` in the bundle."""
+        return [post[cls.POST_LANG_CODE] for post in posts]
+
+    @classmethod
+    def has_duplicate_lang_codes(cls, posts: list[dict[str, Any]]) -> bool:
+        """Check if any of the language codes is given to more than one of the ``posts`` in the bundle."""
+        lang_codes = cls.get_lang_codes(posts)
+
+        return len(set(lang_codes)) < len(lang_codes)
+
+
+class EPPostEditBundleParamBase(EPPostPublishBundleParamBase, ABC):
+    """Parameter base class for the request of editing a post in multiple languages at once."""
+
+    # Subfield of `POSTS`
+
+    POST_MODIFY_NOTE = "modify_note"
+
+    @classmethod
+    def bundle_args(cls, post_args: dict[str, Any]) -> dict[str, Any]:
+        """Get the arguments to be used for parse, where each post in the bundle is parsed by ``post_args``."""
+        return super().bundle_args(
+            {EPPostEditBundleParamBase.POST_MODIFY_NOTE: fields.Str(required=True)} | post_args
+        )
+
+
 class EPPostModifyParamBase(EPSinglePostParamBase, ABC):
     """Parameter base class for the request which modifies a post."""
 
@@ -39,18 +90,65 @@ class EPPostModifyParamBase(EPSinglePostParamBase, ABC):
         }
 
 
+class EPPostHistoryParamBase(EPSinglePostParamBase, ABC):
+    """Parameter base class for the request of the modification history of a post."""
+
+    START = "start"
+    LIMIT = "limit"
+
+    @classmethod
+    def base_args(cls) -> dict[str, Any]:
+        """Get the base arguments to be used for parse."""
+        return super().base_args() | {
+            EPPostHistoryParamBase.START: fields.Int(missing=0, validate=validate.Range(min=0)),
+            EPPostHistoryParamBase.LIMIT: fields.Int(missing=DEFAULT_HISTORY_LIMIT, validate=validate.Range(min=0))
+        }
+
+
+class EPPostGetManyParamBase(EPParamBase, ABC):
+    """Parameter base class for the request of getting multiple posts."""
+
+    POSTS = "posts"
+    INCREASE_COUNT = "inc_count"
+
+    # Subfield of `POSTS`
+
+    POST_SEQ_ID = "seq_id"
+    POST_LANG_CODE = "lang"
+
+    @classmethod
+    def base_args(cls) -> dict[str, Any]:
+        """Get the base arguments to be used for parse."""
+        return super().base_args() | {
+            EPPostGetManyParamBase.POSTS: fields.List(fields.Nested({
+                EPPostGetManyParamBase.POST_SEQ_ID: fields.Int(required=True),
+                EPPostGetManyParamBase.POST_LANG_CODE: fields.Str(required=True)
+            }), required=True),
+            EPPostGetManyParamBase.INCREASE_COUNT: fields.Bool(missing=False)
+        }
+
+    @classmethod
+    def to_post_ids(cls, posts: list[dict[str, Any]]) -> list[tuple[int, str]]:
+        """Get the keys ``(seq_id, lang_code)`` of the requested ``posts``."""
+        return [(post[cls.POST_SEQ_ID], post[cls.POST_LANG_CODE]) for post in posts]
+
+
 class EPPostListParamBase(EPParamBase, ABC):
     """Parameter base class for the request of a list of posts."""
 
     LANG_CODE = "lang_code"
     START = "start"
     LIMIT = "limit"
+    CURSOR = "cursor"
+    WITH_COUNT = "with_count"
 
     @classmethod
     def base_args(cls) -> dict[str, Any]:
         """Get the base arguments to be used for parse."""
         return super().base_args() | {
-            EPPostListParamBase.LANG_CODE: fields.Str(),
-            EPPostListParamBase.START: fields.Int(default=0),
-            EPPostListParamBase.LIMIT: fields.Int(default=DEFAULT_LIST_LIMIT)
+            EPPostListParamBase.LANG_CODE: fields.Str(missing=None),
+            EPPostListParamBase.START: fields.Int(default=0, validate=validate.Range(min=0)),
+            EPPostListParamBase.LIMIT: fields.Int(default=DEFAULT_LIST_LIMIT, validate=validate.Range(min=0)),
+            EPPostListParamBase.CURSOR: fields.Str(missing=None),
+            EPPostListParamBase.WITH_COUNT: fields.Bool(missing=True)
         }
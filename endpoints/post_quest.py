@@ -1,21 +1,35 @@
 """Endpoints to get the data related to quest posts."""
+from typing import Any
+
 from webargs import fields
 from webargs.flaskparser import use_args
 
-from controllers import GoogleUserDataController, GoogleUserDataKeys, QuestPostController, QuestPostKey
+from controllers import PostIDUnavailableError, QuestPostController, QuestPostKey
+from controllers.base.config import POST_GET_MANY_LIMIT
+from controllers.base.cursor import is_post_list_cursor_valid
 from controllers.results import UpdateResult
 from responses import (
-    QuestPostEditFailedResponse, QuestPostEditSuccessResponse, QuestPostGetFailedResponse, QuestPostGetSuccessResponse,
-    QuestPostIDCheckResponse, QuestPostListResponse, QuestPostPublishFailedResponse, QuestPostPublishSuccessResponse,
-    ResponseCodeCollection,
+    QuestPostEditBundleSuccessResponse, QuestPostEditFailedResponse, QuestPostEditSuccessResponse,
+    QuestPostGetFailedResponse, QuestPostGetManyFailedResponse, QuestPostGetManyResponse, QuestPostGetSuccessResponse,
+    QuestPostHistoryResponse, QuestPostIDCheckResponse, QuestPostListFailedResponse, QuestPostListResponse,
+    QuestPostPublishFailedResponse, QuestPostPublishSuccessResponse, ResponseCodeCollection,
+)
+from .base import (
+    EndpointBase, get_cache_status_headers, get_post_not_modified_response, get_user_context,
+    is_request_not_modified, make_not_modified_response,
+)
+from .conditional import get_validator_headers, make_etag
+from .post_base import (
+    EPPostEditBundleParamBase, EPPostGetManyParamBase, EPPostHistoryParamBase, EPPostListParamBase,
+    EPPostModifyParamBase, EPPostPublishBundleParamBase, EPSinglePostParamBase,
 )
-from .base import EndpointBase
-from .post_base import EPPostListParamBase, EPPostModifyParamBase, EPSinglePostParamBase
 
-__all__ = ("EPQuestPostPublish",
+__all__ = ("EPQuestPostPublish", "EPQuestPostPublishBundle",
            "EPQuestPostList", "EPQuestPostListParam",
            "EPQuestPostGet", "EPQuestPostGetParam",
-           "EPQuestPostEdit",
+           "EPQuestPostGetMany", "EPQuestPostGetManyParam",
+           "EPQuestPostHistory", "EPQuestPostHistoryParam",
+           "EPQuestPostEdit", "EPQuestPostEditBundle",
            "EPQuestPostIDCheck")
 
 
@@ -58,7 +72,7 @@ class EPQuestPostPublishParam(EPSinglePostParamBase):
         return ret
 
 
-quest_post_pub_args = EPSinglePostParamBase.base_args() | {
+quest_post_content_args = {
     EPQuestPostPublishParam.TITLE: fields.Str(),
     EPQuestPostPublishParam.GENERAL_INFO: fields.Str(),
     EPQuestPostPublishParam.VIDEO: fields.Str(),
@@ -66,13 +80,15 @@ quest_post_pub_args = EPSinglePostParamBase.base_args() | {
     EPQuestPostPublishParam.ADDENDUM: fields.Str(),
 }
 
+quest_post_pub_args = EPSinglePostParamBase.base_args() | quest_post_content_args
+
 
 class EPQuestPostPublish(EndpointBase):
     """Endpoint resource to publish a quest post."""
 
     @use_args(quest_post_pub_args)
     def post(self, args):  # pylint: disable=no-self-use, missing-function-docstring
-        is_user_admin = GoogleUserDataController.is_user_admin(args[EPQuestPostPublishParam.GOOGLE_UID])
+        is_user_admin = get_user_context(args[EPQuestPostPublishParam.GOOGLE_UID]).is_admin
         if not is_user_admin:
             return QuestPostPublishFailedResponse(ResponseCodeCollection.FAILED_QUEST_NOT_PUBLISHED_NOT_ADMIN), 401
 
@@ -84,10 +100,65 @@ class EPQuestPostPublish(EndpointBase):
         positional_info = EPQuestPostPublishParam.pos_info_to_model_key(args[EPQuestPostPublishParam.POSITION_INFO])
         addendum = args[EPQuestPostPublishParam.ADDENDUM]
 
-        new_seq_id = QuestPostController.publish_post(
-            title, lang_code, general_info, video, positional_info, addendum, seq_id=seq_id
+        try:
+            new_seq_id = QuestPostController.publish_post(
+                title, lang_code, general_info, video, positional_info, addendum, seq_id=seq_id
+            )
+        except PostIDUnavailableError:
+            # The post already exists in the language
+            return QuestPostPublishFailedResponse(ResponseCodeCollection.FAILED_POST_ID_UNAVAILABLE), 400
+
+        return QuestPostPublishSuccessResponse(new_seq_id), 200
+
+
+# endregion
+
+
+# region Quest Post / Publish Bundle
+
+class EPQuestPostPublishBundleParam(EPPostPublishBundleParamBase):
+    """Parameters for the request of publishing a quest post in multiple languages at once."""
+
+    @classmethod
+    def to_variant(cls, post: dict[str, Any]) -> tuple:
+        """Get the arguments of ``QuestPostController.publish_post()`` of a ``post`` in the bundle."""
+        return (
+            post[EPQuestPostPublishParam.TITLE],
+            post[cls.POST_LANG_CODE],
+            post[EPQuestPostPublishParam.GENERAL_INFO],
+            post[EPQuestPostPublishParam.VIDEO],
+            EPQuestPostPublishParam.pos_info_to_model_key(post[EPQuestPostPublishParam.POSITION_INFO]),
+            post[EPQuestPostPublishParam.ADDENDUM]
         )
 
+
+quest_post_pub_bundle_args = EPPostPublishBundleParamBase.bundle_args(quest_post_content_args)
+
+
+class EPQuestPostPublishBundle(EndpointBase):
+    """Endpoint resource to publish a quest post in multiple languages at once."""
+
+    @use_args(quest_post_pub_bundle_args)
+    def post(self, args):  # pylint: disable=no-self-use, missing-function-docstring
+        is_user_admin = get_user_context(args[EPQuestPostPublishBundleParam.GOOGLE_UID]).is_admin
+        if not is_user_admin:
+            return QuestPostPublishFailedResponse(ResponseCodeCollection.FAILED_QUEST_NOT_PUBLISHED_NOT_ADMIN), 401
+
+        seq_id = args[EPQuestPostPublishBundleParam.SEQ_ID]
+        posts = args[EPQuestPostPublishBundleParam.POSTS]
+
+        lang_codes = EPQuestPostPublishBundleParam.get_lang_codes(posts)
+        if not QuestPostController.is_id_langs_available(seq_id, lang_codes):
+            return QuestPostPublishFailedResponse(ResponseCodeCollection.FAILED_POST_ID_UNAVAILABLE), 400
+
+        try:
+            new_seq_id = QuestPostController.publish_post_bundle(
+                [EPQuestPostPublishBundleParam.to_variant(post) for post in posts], seq_id=seq_id
+            )
+        except PostIDUnavailableError:
+            # Published concurrently after the check above
+            return QuestPostPublishFailedResponse(ResponseCodeCollection.FAILED_POST_ID_UNAVAILABLE), 400
+
         return QuestPostPublishSuccessResponse(new_seq_id), 200
 
 
@@ -108,17 +179,31 @@ class EPQuestPostList(EndpointBase):
 
     @use_args(quest_post_list_args, location="query")
     def get(self, args):  # pylint: disable=no-self-use, missing-function-docstring
+        # Rejected before the user lookup, so a malformed cursor is never answered with 304
+        if not is_post_list_cursor_valid(args[EPQuestPostListParam.CURSOR]):
+            return QuestPostListFailedResponse(ResponseCodeCollection.FAILED_INVALID_CURSOR), 400
+
         start_idx = args[EPQuestPostListParam.START]
 
-        user_data = GoogleUserDataController.get_user_data(args[EPQuestPostListParam.GOOGLE_UID])
-        is_user_admin = user_data[GoogleUserDataKeys.IS_SITE_ADMIN] if user_data else False
-        show_ads = not (user_data and GoogleUserDataKeys.ADS_DISABLE_EXPIRY in user_data)
+        user_context = get_user_context(args[EPQuestPostListParam.GOOGLE_UID])
+        is_user_admin = user_context.is_admin
+        show_ads = user_context.show_ads
         lang_code = args[EPQuestPostListParam.LANG_CODE]
-        posts, post_count = QuestPostController.get_posts(
-            lang_code, start=start_idx, limit=args[EPQuestPostListParam.LIMIT]
+
+        validator = QuestPostController.get_post_list_validator(lang_code)
+        etag = make_etag(validator, user_context)
+        if is_request_not_modified(etag, validator.last_modified):
+            return make_not_modified_response(etag, validator.last_modified)
+
+        list_result = QuestPostController.get_posts(
+            lang_code, start=start_idx, limit=args[EPQuestPostListParam.LIMIT],
+            cursor=args[EPQuestPostListParam.CURSOR], with_count=args[EPQuestPostListParam.WITH_COUNT]
         )
 
-        return QuestPostListResponse(is_user_admin, show_ads, posts, start_idx, post_count), 200
+        return (
+            QuestPostListResponse(is_user_admin, show_ads, start_idx, list_result), 200,
+            get_validator_headers(etag, validator.last_modified) | get_cache_status_headers(list_result.cache_status)
+        )
 
 
 # endregion
@@ -142,19 +227,87 @@ class EPQuestPostGet(EndpointBase):
 
     @use_args(quest_post_get_args, location="query")
     def get(self, args):  # pylint: disable=no-self-use, missing-function-docstring
-        user_data = GoogleUserDataController.get_user_data(args[EPQuestPostGetParam.GOOGLE_UID])
-        is_user_admin = user_data[GoogleUserDataKeys.IS_SITE_ADMIN] if user_data else False
-        show_ads = not (user_data and GoogleUserDataKeys.ADS_DISABLE_EXPIRY in user_data)
+        user_context = get_user_context(args[EPQuestPostGetParam.GOOGLE_UID])
+        is_user_admin = user_context.is_admin
+        show_ads = user_context.show_ads
 
         seq_id = args[EPQuestPostGetParam.SEQ_ID]
         lang_code = args[EPQuestPostGetParam.LANG_CODE]
         increase_count = args[EPQuestPostGetParam.INCREASE_COUNT]
+
+        not_modified = get_post_not_modified_response(
+            QuestPostController, seq_id, lang_code, increase_count, user_context
+        )
+        if not_modified is not None:
+            return not_modified
+
         result = QuestPostController.get_post(seq_id, lang_code, increase_count)
 
         if not result.data:
             return QuestPostGetFailedResponse(ResponseCodeCollection.FAILED_POST_NOT_EXISTS), 404
 
-        return QuestPostGetSuccessResponse(is_user_admin, show_ads, result), 200
+        validator = QuestPostController.to_post_validator(result)
+
+        return (
+            QuestPostGetSuccessResponse(is_user_admin, show_ads, result), 200,
+            get_validator_headers(make_etag(validator, user_context), validator.last_modified)
+            | get_cache_status_headers(result.cache_status)
+        )
+
+
+# endregion
+
+
+# region Quest Post / Get Many
+
+class EPQuestPostGetManyParam(EPPostGetManyParamBase):
+    """Parameters for the request of getting multiple quest posts."""
+
+
+quest_post_get_many_args = EPPostGetManyParamBase.base_args()
+
+
+class EPQuestPostGetMany(EndpointBase):
+    """Endpoint resource to get multiple quest posts in the requested order."""
+
+    @use_args(quest_post_get_many_args)
+    def post(self, args):  # pylint: disable=no-self-use, missing-function-docstring
+        post_ids = EPQuestPostGetManyParam.to_post_ids(args[EPQuestPostGetManyParam.POSTS])
+        if len(post_ids) > POST_GET_MANY_LIMIT:
+            return QuestPostGetManyFailedResponse(ResponseCodeCollection.FAILED_TOO_MANY_POSTS), 400
+
+        user_context = get_user_context(args[EPQuestPostGetManyParam.GOOGLE_UID])
+
+        results = QuestPostController.get_posts_by_ids(post_ids, args[EPQuestPostGetManyParam.INCREASE_COUNT])
+
+        return QuestPostGetManyResponse(user_context.is_admin, user_context.show_ads, results), 200
+
+
+# endregion
+
+
+# region Quest Post / History
+
+class EPQuestPostHistoryParam(EPPostHistoryParamBase):
+    """Parameters for the request of getting the modification history of a quest post."""
+
+
+quest_post_history_args = EPPostHistoryParamBase.base_args()
+
+
+class EPQuestPostHistory(EndpointBase):
+    """Endpoint resource to get the modification history of a quest post, latest first."""
+
+    @use_args(quest_post_history_args, location="query")
+    def get(self, args):  # pylint: disable=no-self-use, missing-function-docstring
+        start_idx = args[EPQuestPostHistoryParam.START]
+
+        notes, has_next = QuestPostController.get_modify_notes(
+            args[EPQuestPostHistoryParam.SEQ_ID], args[EPQuestPostHistoryParam.LANG_CODE],
+            start=start_idx, limit=args[EPQuestPostHistoryParam.LIMIT]
+        )
+
+        return QuestPostHistoryResponse(start_idx, notes, has_next), 200
 
 
 # endregion
@@ -174,7 +327,7 @@ class EPQuestPostEdit(EndpointBase):
 
     @use_args(quest_post_edit_args)
     def post(self, args):  # pylint: disable=no-self-use, missing-function-docstring
-        is_user_admin = GoogleUserDataController.is_user_admin(args[EPQuestPostEditParam.GOOGLE_UID])
+        is_user_admin = get_user_context(args[EPQuestPostEditParam.GOOGLE_UID]).is_admin
         if not is_user_admin:
             return QuestPostPublishFailedResponse(ResponseCodeCollection.FAILED_QUEST_NOT_PUBLISHED_NOT_ADMIN), 401
 
@@ -203,6 +356,48 @@ class EPQuestPostEdit(EndpointBase):
 # endregion
 
 
+# region Quest Post / Edit Bundle
+
+class EPQuestPostEditBundleParam(EPPostEditBundleParamBase, EPQuestPostPublishBundleParam):
+    """Parameters for the request of editing a quest post in multiple languages at once."""
+
+    @classmethod
+    def to_variant(cls, post: dict[str, Any]) -> tuple:
+        """Get the arguments of ``QuestPostController.edit_post()`` after ``seq_id`` of a ``post`` in the bundle."""
+        return super().to_variant(post) + (post[cls.POST_MODIFY_NOTE],)
+
+
+quest_post_edit_bundle_args = EPPostEditBundleParamBase.bundle_args(quest_post_content_args)
+
+
+class EPQuestPostEditBundle(EndpointBase):
+    """Endpoint resource to edit a quest post in multiple languages at once."""
+
+    @use_args(quest_post_edit_bundle_args)
+    def post(self, args):  # pylint: disable=no-self-use, missing-function-docstring
+        is_user_admin = get_user_context(args[EPQuestPostEditBundleParam.GOOGLE_UID]).is_admin
+        if not is_user_admin:
+            return QuestPostEditFailedResponse(ResponseCodeCollection.FAILED_QUEST_NOT_PUBLISHED_NOT_ADMIN), 401
+
+        seq_id = args[EPQuestPostEditBundleParam.SEQ_ID]
+        posts = args[EPQuestPostEditBundleParam.POSTS]
+
+        if EPQuestPostEditBundleParam.has_duplicate_lang_codes(posts):
+            return QuestPostEditFailedResponse(ResponseCodeCollection.FAILED_DUPLICATE_LANGS), 400
+
+        edit_outcomes = QuestPostController.edit_post_bundle(
+            seq_id, [EPQuestPostEditBundleParam.to_variant(post) for post in posts]
+        )
+
+        if all(outcome == UpdateResult.NOT_FOUND for outcome in edit_outcomes.values()):
+            return QuestPostEditFailedResponse(ResponseCodeCollection.FAILED_POST_NOT_EXISTS), 404
+
+        return QuestPostEditBundleSuccessResponse(seq_id, edit_outcomes), 200
+
+
+# endregion
+
+
 # region Quest Post / ID Check
 
 class EPQuestPostIDCheckParam(EPSinglePostParamBase):
@@ -217,7 +412,7 @@ class EPQuestPostIDCheck(EndpointBase):
 
     @use_args(quest_post_id_check_args, location="query")
     def get(self, args):  # pylint: disable=no-self-use, missing-function-docstring, duplicate-code
-        is_user_admin = GoogleUserDataController.is_user_admin(args[EPQuestPostIDCheckParam.GOOGLE_UID])
+        is_user_admin = get_user_context(args[EPQuestPostIDCheckParam.GOOGLE_UID]).is_admin
         if not is_user_admin:
             return QuestPostIDCheckResponse(False, False), 200
 
@@ -4,7 +4,7 @@ from webargs.flaskparser import use_args
 
 from controllers import GoogleLoginType, GoogleUserDataController
 from responses import ResponseCodeCollection, UserLoginResponse, UserShowAdsResponse
-from .base import EPParamBase, EndpointBase
+from .base import EPParamBase, EndpointBase, get_user_context
 
 __all__ = ("EPUserLogin", "EPUserLoginParam", "EPUserShowAds", "EPUserShowAdsParam")
 
@@ -53,7 +53,7 @@ class EPUserShowAds(EndpointBase):
 
     @use_args(user_show_ads_args, location="query")
     def get(self, args):  # pylint: disable=no-self-use, missing-function-docstring
-        show_ads = GoogleUserDataController.is_user_show_ads(args[EPUserLoginParam.GOOGLE_UID])
+        show_ads = get_user_context(args[EPUserLoginParam.GOOGLE_UID]).show_ads
 
         return UserShowAdsResponse(show_ads), 200
 # endregion
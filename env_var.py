@@ -1,7 +1,8 @@
 """Convenient functions to extract information from the environment variables."""
 import os
+from typing import Optional
 
-__all__ = ("is_testing",)
+__all__ = ("is_testing", "get_metrics_token")
 
 
 def is_testing() -> bool:
@@ -11,3 +12,12 @@ def is_testing() -> bool:
     :return: if the environment variables indicates it's testing
     """
     return bool(int(os.environ.get("TEST", 0)))
+
+
+def get_metrics_token() -> Optional[str]:
+    """
+    Get the token required to get the metrics from the environment variable ``METRICS_TOKEN``.
+
+    :return: token required to get the metrics, or ``None`` if the metrics are disabled
+    """
+    return os.environ.get("METRICS_TOKEN") or None
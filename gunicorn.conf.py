@@ -0,0 +1,35 @@
+"""Gunicorn configs."""
+import os
+
+from prometheus_client import multiprocess
+
+from controllers import start_change_watcher, warm_up_controllers
+from controllers.base import MONGO_WARM_UP_CONNECTIONS
+
+# Directory to store the metrics of each worker process, so they are aggregated across the processes
+PROMETHEUS_MULTIPROC_DIR = os.environ.get("PROMETHEUS_MULTIPROC_DIR")
+
+
+def on_starting(server):  # pylint: disable=unused-argument
+    """Remove the metrics stored by the previous run."""
+    if not PROMETHEUS_MULTIPROC_DIR:
+        return
+
+    os.makedirs(PROMETHEUS_MULTIPROC_DIR, exist_ok=True)
+
+    for file_name in os.listdir(PROMETHEUS_MULTIPROC_DIR):
+        os.remove(os.path.join(PROMETHEUS_MULTIPROC_DIR, file_name))
+
+
+def post_fork(server, worker):  # pylint: disable=unused-argument
+    """Warm up the database connections of the forked worker and start watching the changes if enabled."""
+    if MONGO_WARM_UP_CONNECTIONS:
+        warm_up_controllers()
+
+    start_change_watcher()
+
+
+def child_exit(server, worker):  # pylint: disable=unused-argument
+    """Drop the live metrics of the exited worker."""
+    if PROMETHEUS_MULTIPROC_DIR:
+        multiprocess.mark_process_dead(worker.pid)
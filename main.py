@@ -2,8 +2,9 @@
 from flask import Flask
 from flask_cors import CORS
 
-from responses import ResponseBodyEncoder
-from api import attach_api
+from api import attach_api, attach_command_stats, attach_metrics, attach_slow_query_log
+from controllers import start_change_watcher, sync_all_indexes_in_background
+from controllers.base import INDEX_SYNC_ON_STARTUP
 from error import setup_error
 
 __all__ = ("app",)
@@ -12,9 +13,8 @@ __all__ = ("app",)
 class AppConfig:
     """Flask app configs."""
 
-    RESTFUL_JSON = {
-        "cls": ResponseBodyEncoder
-    }
+    # Encoder of the response body (`orjson` or `stdlib`). Falls back to `stdlib` if `orjson` is not installed.
+    RESPONSE_BODY_ENCODER = "orjson"
 
 
 # Initialize app
@@ -27,9 +27,22 @@ cors = CORS(app, resources={r"/*": {"origins": "*"}})
 # Setup API resources
 attach_api(app)
 
+# Setup database command recording
+attach_command_stats(app)
+
+# Setup request metrics
+attach_metrics(app)
+
+# Setup slow database command logging
+attach_slow_query_log(app)
+
 # Setup error handlers
 setup_error(app)
 
+# Create the missing indexes
+if INDEX_SYNC_ON_STARTUP:
+    sync_all_indexes_in_background()
+
 # pylint: disable=fixme
 # TODO: Setup sleep preventer
 # TODO: Google Analytics
@@ -37,4 +50,5 @@ setup_error(app)
 # pylint: enable=fixme
 
 if __name__ == "__main__":
+    start_change_watcher()
     app.run(threaded=True)
@@ -1,4 +1,8 @@
 """Request response objects."""
 from .body import *  # noqa
+from .body_cache import EncodedBodyTemplate, encode_with_post_body_cache, make_encoded_body_template
 from .code import ResponseCode, ResponseCodeCollection
-from .serializer import ResponseBodyEncoder
+from .serializer import (
+    ResponseBodyEncodeFunction, ResponseBodyEncoder, encode_response_body_orjson, encode_response_body_stdlib,
+    get_response_body_encoder,
+)
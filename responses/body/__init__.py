@@ -1,17 +1,24 @@
 """Request response body classes."""
 from .basic import Response, ResponseKey
-from .error import Error400Response, Error404Response, Error405Response, Error422Response, Error500Response
+from .error import (
+    Error400Response, Error404Response, Error405Response, Error422Response, Error500Response, Error503Response,
+)
 from .post_analysis import (
-    AnalysisPostEditFailedResponse, AnalysisPostEditSuccessResponse, AnalysisPostEditSuccessResponseKey,
-    AnalysisPostGetFailedResponse, AnalysisPostGetSuccessResponse, AnalysisPostGetSuccessResponseKey,
-    AnalysisPostIDCheckResponse, AnalysisPostIDCheckResponseKey, AnalysisPostListResponse, AnalysisPostListResponseKey,
+    AnalysisPostEditBundleSuccessResponse, AnalysisPostEditBundleSuccessResponseKey, AnalysisPostEditFailedResponse,
+    AnalysisPostEditSuccessResponse, AnalysisPostEditSuccessResponseKey, AnalysisPostGetFailedResponse,
+    AnalysisPostGetManyFailedResponse, AnalysisPostGetManyResponse, AnalysisPostGetManyResponseKey,
+    AnalysisPostGetSuccessResponse, AnalysisPostGetSuccessResponseKey, AnalysisPostHistoryResponse,
+    AnalysisPostHistoryResponseKey, AnalysisPostIDCheckResponse, AnalysisPostIDCheckResponseKey,
+    AnalysisPostListFailedResponse, AnalysisPostListResponse, AnalysisPostListResponseKey,
     CharaAnalysisPublishFailedResponse, CharaAnalysisPublishSuccessResponse, CharaAnalysisPublishSuccessResponseKey,
     DragonAnalysisPublishFailedResponse, DragonAnalysisPublishSuccessResponse, DragonAnalysisPublishSuccessResponseKey,
 )
 from .post_quest import (
-    QuestPostEditFailedResponse, QuestPostEditSuccessResponse, QuestPostGetFailedResponse, QuestPostGetSuccessResponse,
-    QuestPostIDCheckResponse, QuestPostListResponse, QuestPostListResponseKey, QuestPostPublishFailedResponse,
-    QuestPostPublishSuccessResponse,
+    QuestPostEditBundleSuccessResponse, QuestPostEditBundleSuccessResponseKey, QuestPostEditFailedResponse,
+    QuestPostEditSuccessResponse, QuestPostGetFailedResponse, QuestPostGetManyFailedResponse, QuestPostGetManyResponse,
+    QuestPostGetManyResponseKey, QuestPostGetSuccessResponse, QuestPostHistoryResponse, QuestPostHistoryResponseKey,
+    QuestPostIDCheckResponse, QuestPostListFailedResponse, QuestPostListResponse, QuestPostListResponseKey,
+    QuestPostPublishFailedResponse, QuestPostPublishSuccessResponse,
 )
 from .root import RootTestResponse
 from .user import UserLoginResponse, UserShowAdsResponse
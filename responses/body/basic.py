@@ -1,8 +1,11 @@
 """Basic response body class."""
 from abc import ABC
+from typing import Any
 
 from responses.code import ResponseCode
 
+from .fields import ResponseField, ResponseSerializer, compile_serializer
+
 __all__ = ("Response", "ResponseKey")
 
 
@@ -14,15 +17,63 @@ class ResponseKey:
 
 
 class Response(ABC):
-    """The most basic request response body."""
+    """
+    The most basic request response body.
+
+    Each response class declares its own ``fields`` to serialize,
+    which are serialized after the fields declared by its parent classes.
+    The fields of each class are compiled into a single serializer on class creation.
+    """
+
+    fields: tuple[ResponseField, ...] = (
+        ResponseField(ResponseKey.CODE, "_code.code"),
+        ResponseField(ResponseKey.SUCCESS, "_code.success"),
+    )
+
+    # Additional fields to serialize for each variant of the response returned by ``get_variant()``
+    variant_fields: dict[Any, tuple[ResponseField, ...]] = {}
+
+    _serializer: ResponseSerializer
+    _variant_serializers: dict[Any, ResponseSerializer]
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+
+        cls.compile_serializers()
 
     def __init__(self, code: ResponseCode):
         """Create a response body with ``code`` indicating the result."""
         self._code = code
 
+    @property
+    def code(self) -> ResponseCode:
+        """Code indicating the result of the response."""
+        return self._code
+
+    @classmethod
+    def get_fields(cls) -> list[ResponseField]:
+        """Get the fields declared by this class and its parent classes in the order of serialization."""
+        return [field for klass in reversed(cls.__mro__) for field in vars(klass).get("fields", ())]
+
+    @classmethod
+    def compile_serializers(cls):
+        """Compile the serializers of this class, including the ones for each variant."""
+        fields = cls.get_fields()
+
+        # Stored as a static method to not being bound to the instances
+        cls._serializer = staticmethod(compile_serializer(fields))
+        cls._variant_serializers = {
+            variant: compile_serializer(fields + list(variant_fields))
+            for variant, variant_fields in cls.variant_fields.items()
+        }
+
+    def get_variant(self) -> Any:
+        """Get the variant of the response, deciding the additional fields in ``variant_fields`` to serialize."""
+        return None
+
     def serialize(self):
         """Serialize the response and return it."""
-        return {
-            ResponseKey.CODE: self._code.code,
-            ResponseKey.SUCCESS: self._code.success
-        }
+        return self._variant_serializers.get(self.get_variant(), self._serializer)(self)
+
+
+Response.compile_serializers()
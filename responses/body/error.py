@@ -4,8 +4,10 @@ from abc import ABC
 from responses.code import ResponseCodeCollection
 
 from .basic import Response, ResponseKey
+from .fields import ResponseField
 
-__all__ = ("Error400Response", "Error404Response", "Error405Response", "Error422Response", "Error500Response")
+__all__ = ("Error400Response", "Error404Response", "Error405Response", "Error422Response", "Error500Response",
+           "Error503Response")
 
 
 class ServerErrorResponseKey(ResponseKey):
@@ -18,18 +20,19 @@ class ServerErrorResponseKey(ResponseKey):
 class ServerErrorResponse(Response, ABC):
     """Base server error response body."""
 
+    code_on_error = ResponseCodeCollection.FAILED_SERVER_ERROR
+
+    fields = (
+        ResponseField(ServerErrorResponseKey.MESSAGE, "_message"),
+        ResponseField(ServerErrorResponseKey.EXTRA, "_extra"),
+    )
+
     def __init__(self, error, extra: str = ""):
-        super().__init__(ResponseCodeCollection.FAILED_SERVER_ERROR)
+        super().__init__(self.code_on_error)
 
-        self._error = error
+        self._message = str(error)
         self._extra = extra
 
-    def serialize(self):
-        return super().serialize() | {
-            ServerErrorResponseKey.MESSAGE: str(self._error),
-            ServerErrorResponseKey.EXTRA: self._extra
-        }
-
 
 class Error400Response(ServerErrorResponse):
     """Error response body to be used when 400 error occurred."""
@@ -55,3 +58,12 @@ class Error422Response(ServerErrorResponse):
 
 class Error500Response(ServerErrorResponse):
     """Error response body to be used when 500 error occurred."""
+
+
+class Error503Response(ServerErrorResponse):
+    """Error response body to be used when the database is temporarily unavailable."""
+
+    code_on_error = ResponseCodeCollection.FAILED_DB_UNAVAILABLE
+
+    def __init__(self, error):
+        super().__init__(error, "Database unavailable")
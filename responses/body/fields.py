@@ -0,0 +1,88 @@
+"""Field mappings of the response bodies, which are compiled to a flat serializer for each response class."""
+from dataclasses import dataclass
+from operator import attrgetter
+from typing import Any, Callable, Iterable, Optional
+
+__all__ = ("ResponseField", "EntryField", "ResponseSerializer", "compile_serializer")
+
+# Serializes the response passed in as the only argument to a ``dict``
+ResponseSerializer = Callable[[Any], dict[str, Any]]
+
+
+@dataclass(frozen=True)
+class EntryField:
+    """Field of each entry in a list of model documents, mapping ``model_key`` of the entry to ``key``."""
+
+    key: str
+    model_key: str
+
+
+@dataclass(frozen=True)
+class ResponseField:
+    """
+    Field of a response body.
+
+    The value is taken from the attribute ``source`` of the response, which could be a dotted path.
+    If ``model_key`` is given, the value is taken from ``source[model_key]`` instead,
+    which is usually the data of a model document.
+
+    If ``entry_fields`` is given, the value is a list of model documents,
+    and each entry in it is serialized using ``entry_fields``.
+    """
+
+    key: str
+    source: str
+    model_key: Optional[str] = None  # pylint: disable=unsubscriptable-object
+    entry_fields: tuple[EntryField, ...] = ()
+
+    def to_getter(self) -> Callable[[Any], Any]:
+        """
+        Get the function which takes the value of this field from the response passed in as the only argument.
+
+        :raises ValueError: if `source` is not a valid attribute path
+        """
+        if not all(name.isidentifier() for name in self.source.split(".")):
+            raise ValueError(f"Invalid attribute path of the response field `{self.key}`: {self.source}")
+
+        get_source = attrgetter(self.source)
+
+        if self.model_key is None and not self.entry_fields:
+            return get_source
+
+        model_key = self.model_key
+        entry_items = tuple((field.key, field.model_key) for field in self.entry_fields)
+
+        def get_value(response: Any) -> Any:
+            value = get_source(response)
+
+            if model_key is not None:
+                value = value[model_key]
+
+            if entry_items:
+                value = [{key: entry[entry_key] for key, entry_key in entry_items} for entry in value]
+
+            return value
+
+        return get_value
+
+
+def compile_serializer(fields: Iterable[ResponseField]) -> ResponseSerializer:
+    """
+    Compile ``fields`` to a function which serializes the response to a ``dict``.
+
+    The order of the keys is the order of ``fields``.
+    If a key is duplicated, the later field overrides the earlier one but the key stays at its first position,
+    which is the same as merging the ``dict`` of each field in order.
+
+    :raises ValueError: if the attribute path of any field is invalid
+    """
+    field_of_key: dict[str, ResponseField] = {}
+    for field in fields:
+        field_of_key[field.key] = field
+
+    items = tuple((key, field.to_getter()) for key, field in field_of_key.items())
+
+    def serialize(response: Any) -> dict[str, Any]:
+        return {key: get_value(response) for key, get_value in items}
+
+    return serialize
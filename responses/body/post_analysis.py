@@ -1,10 +1,13 @@
 """Response body for getting the data related to unit analysis posts."""
 from typing import Any
 
-from controllers import MultilingualGetOneResult, UnitAnalysisPostKey, UnitAnalysisPostType
+from controllers import MultilingualPostListResult, UnitAnalysisPostKey, UnitAnalysisPostType
+from .fields import EntryField, ResponseField
 from .post_base import (
-    PostEditFailedResponse, PostEditSuccessResponse, PostEditSuccessResponseKey, PostGetFailedResponse,
-    PostGetSuccessResponse, PostGetSuccessResponseKey, PostIDCheckResponse, PostIDCheckResponseKey, PostListResponse,
+    PostEditBundleSuccessResponse, PostEditBundleSuccessResponseKey, PostEditFailedResponse, PostEditSuccessResponse,
+    PostEditSuccessResponseKey, PostGetFailedResponse, PostGetManyFailedResponse, PostGetManyResponse,
+    PostGetManyResponseKey, PostGetSuccessResponse, PostGetSuccessResponseKey, PostHistoryResponse,
+    PostHistoryResponseKey, PostIDCheckResponse, PostIDCheckResponseKey, PostListFailedResponse, PostListResponse,
     PostListResponseKey, PostPublishFailedResponse, PostPublishSuccessResponse, PostPublishSuccessResponseKey,
 )
 
@@ -12,9 +15,12 @@ __all__ = ("CharaAnalysisPublishSuccessResponse", "CharaAnalysisPublishFailedRes
            "CharaAnalysisPublishSuccessResponseKey",
            "DragonAnalysisPublishSuccessResponse", "DragonAnalysisPublishFailedResponse",
            "DragonAnalysisPublishSuccessResponseKey",
-           "AnalysisPostListResponse", "AnalysisPostListResponseKey",
+           "AnalysisPostListResponse", "AnalysisPostListFailedResponse", "AnalysisPostListResponseKey",
            "AnalysisPostGetSuccessResponse", "AnalysisPostGetFailedResponse", "AnalysisPostGetSuccessResponseKey",
+           "AnalysisPostGetManyResponse", "AnalysisPostGetManyFailedResponse", "AnalysisPostGetManyResponseKey",
+           "AnalysisPostHistoryResponse", "AnalysisPostHistoryResponseKey",
            "AnalysisPostEditSuccessResponse", "AnalysisPostEditFailedResponse", "AnalysisPostEditSuccessResponseKey",
+           "AnalysisPostEditBundleSuccessResponse", "AnalysisPostEditBundleSuccessResponseKey",
            "AnalysisPostIDCheckResponseKey", "AnalysisPostIDCheckResponse")
 
 
@@ -71,38 +77,34 @@ class AnalysisPostListResponseKey(PostListResponseKey):
     POSTS_PUBLISHED = "published"
     POSTS_VIEW_COUNT = "viewCount"
 
-    @classmethod
-    def convert_posts_key(cls, posts: list[dict[str, Any]]):
-        """Convert the keys in ``posts`` from model key to be the keys for the response."""
-        ret = []
-
-        for post in posts:
-            ret.append({
-                cls.POSTS_SEQ_ID: post[UnitAnalysisPostKey.SEQ_ID],
-                cls.POSTS_LANG: post[UnitAnalysisPostKey.LANG_CODE],
-                cls.POSTS_TYPE: post[UnitAnalysisPostKey.TYPE],
-                cls.POSTS_UNIT_NAME: post[UnitAnalysisPostKey.UNIT_NAME],
-                cls.POSTS_LAST_MODIFIED: post[UnitAnalysisPostKey.DT_LAST_MODIFIED],
-                cls.POSTS_PUBLISHED: post[UnitAnalysisPostKey.DT_PUBLISHED],
-                cls.POSTS_VIEW_COUNT: post[UnitAnalysisPostKey.VIEW_COUNT],
-            })
-
-        return ret
-
 
 class AnalysisPostListResponse(PostListResponse):
     """Response body of getting a analysis post list."""
 
+    fields = (
+        ResponseField(
+            AnalysisPostListResponseKey.POSTS, "_posts",
+            entry_fields=(
+                EntryField(AnalysisPostListResponseKey.POSTS_SEQ_ID, UnitAnalysisPostKey.SEQ_ID),
+                EntryField(AnalysisPostListResponseKey.POSTS_LANG, UnitAnalysisPostKey.LANG_CODE),
+                EntryField(AnalysisPostListResponseKey.POSTS_TYPE, UnitAnalysisPostKey.TYPE),
+                EntryField(AnalysisPostListResponseKey.POSTS_UNIT_NAME, UnitAnalysisPostKey.UNIT_NAME),
+                EntryField(AnalysisPostListResponseKey.POSTS_LAST_MODIFIED, UnitAnalysisPostKey.DT_LAST_MODIFIED),
+                EntryField(AnalysisPostListResponseKey.POSTS_PUBLISHED, UnitAnalysisPostKey.DT_PUBLISHED),
+                EntryField(AnalysisPostListResponseKey.POSTS_VIEW_COUNT, UnitAnalysisPostKey.VIEW_COUNT),
+            )
+        ),
+    )
+
     # pylint: disable=too-many-arguments
-    def __init__(self, is_admin: bool, show_ads: bool, posts: list[dict[str, Any]], start_idx: int, post_count: int):
-        super().__init__(is_admin, show_ads, start_idx, post_count)
+    def __init__(self, is_admin: bool, show_ads: bool, start_idx: int, list_result: MultilingualPostListResult):
+        super().__init__(is_admin, show_ads, start_idx, list_result.post_count, list_result.next_cursor)
+
+        self._posts = list_result.posts
 
-        self._posts = AnalysisPostListResponseKey.convert_posts_key(posts)
 
-    def serialize(self):
-        return super().serialize() | {
-            AnalysisPostListResponseKey.POSTS: self._posts
-        }
+class AnalysisPostListFailedResponse(PostListFailedResponse):
+    """Response body of failed to get a analysis post list."""
 
 
 # endregion
@@ -156,70 +158,54 @@ class AnalysisPostGetSuccessResponseKey(PostGetSuccessResponseKey):
 
     D_SUITABLE_CHARACTERS = "suitableCharacters"
 
-    @classmethod
-    def convert_skill_key(cls, skills: list[dict[str, Any]]):
-        """Convert the keys in ``skills`` from model key to be the keys for the response."""
-        ret = []
-
-        for skill in skills:
-            ret.append({
-                cls.C_SKILL_NAME: skill[UnitAnalysisPostKey.C_SKILL_NAME],
-                cls.C_SKILL_INFO: skill[UnitAnalysisPostKey.C_SKILL_INFO],
-                cls.C_SKILL_ROTATIONS: skill[UnitAnalysisPostKey.C_SKILL_ROTATIONS],
-                cls.C_SKILL_TIPS: skill[UnitAnalysisPostKey.C_SKILL_TIPS],
-            })
-
-        return ret
-
 
 class AnalysisPostGetSuccessResponse(PostGetSuccessResponse):
-    """Response body of getting a analysis post."""
-
-    # pylint: disable=too-many-instance-attributes
-
-    def __init__(self, is_admin: bool, show_ads: bool, get_result: MultilingualGetOneResult):
-        super().__init__(is_admin, show_ads, get_result)
-
-        post = get_result.data
-
-        self._type = post[UnitAnalysisPostKey.TYPE]
-        self._unit_name = post[UnitAnalysisPostKey.UNIT_NAME]
-        self._summary = post[UnitAnalysisPostKey.SUMMARY]
-        self._summon_result = post[UnitAnalysisPostKey.SUMMON_RESULT]
-        self._passives = post[UnitAnalysisPostKey.PASSIVES]
-        self._normal_attacks = post[UnitAnalysisPostKey.NORMAL_ATTACKS]
-        self._videos = post[UnitAnalysisPostKey.VIDEOS]
-        self._story = post[UnitAnalysisPostKey.STORY]
-        self._keywords = post[UnitAnalysisPostKey.KEYWORDS]
-
-        self._type_specific_serialized = {}
-        if self._type == UnitAnalysisPostType.CHARACTER:
-            self._type_specific_serialized = {
-                AnalysisPostGetSuccessResponseKey.C_FORCE_STRIKES: post[UnitAnalysisPostKey.C_FORCE_STRIKES],
-                AnalysisPostGetSuccessResponseKey.C_SKILLS:
-                    AnalysisPostGetSuccessResponseKey.convert_skill_key(post[UnitAnalysisPostKey.C_SKILLS]),
-                AnalysisPostGetSuccessResponseKey.C_TIPS_N_BUILDS: post[UnitAnalysisPostKey.C_TIPS_N_BUILDS],
-            }
-        elif self._type == UnitAnalysisPostType.DRAGON:
-            self._type_specific_serialized = {
-                AnalysisPostGetSuccessResponseKey.D_ULTIMATE: post[UnitAnalysisPostKey.D_ULTIMATE],
-                AnalysisPostGetSuccessResponseKey.D_NOTES: post[UnitAnalysisPostKey.D_NOTES],
-                AnalysisPostGetSuccessResponseKey.D_SUITABLE_CHARACTERS: post[
-                    UnitAnalysisPostKey.D_SUITABLE_CHARACTERS],
-            }
-
-    def serialize(self):
-        return super().serialize() | {
-            AnalysisPostGetSuccessResponseKey.TYPE: self._type,
-            AnalysisPostGetSuccessResponseKey.UNIT_NAME: self._unit_name,
-            AnalysisPostGetSuccessResponseKey.SUMMARY: self._summary,
-            AnalysisPostGetSuccessResponseKey.SUMMON_RESULT: self._summon_result,
-            AnalysisPostGetSuccessResponseKey.PASSIVES: self._passives,
-            AnalysisPostGetSuccessResponseKey.NORMAL_ATTACKS: self._normal_attacks,
-            AnalysisPostGetSuccessResponseKey.VIDEOS: self._videos,
-            AnalysisPostGetSuccessResponseKey.STORY: self._story,
-            AnalysisPostGetSuccessResponseKey.KEYWORDS: self._keywords,
-        } | self._type_specific_serialized
+    """Response body of getting a analysis post. The additional fields to serialize depend on the unit type."""
+
+    fields = (
+        ResponseField(AnalysisPostGetSuccessResponseKey.TYPE, "_post", UnitAnalysisPostKey.TYPE),
+        ResponseField(AnalysisPostGetSuccessResponseKey.UNIT_NAME, "_post", UnitAnalysisPostKey.UNIT_NAME),
+        ResponseField(AnalysisPostGetSuccessResponseKey.SUMMARY, "_post", UnitAnalysisPostKey.SUMMARY),
+        ResponseField(AnalysisPostGetSuccessResponseKey.SUMMON_RESULT, "_post", UnitAnalysisPostKey.SUMMON_RESULT),
+        ResponseField(AnalysisPostGetSuccessResponseKey.PASSIVES, "_post", UnitAnalysisPostKey.PASSIVES),
+        ResponseField(AnalysisPostGetSuccessResponseKey.NORMAL_ATTACKS, "_post", UnitAnalysisPostKey.NORMAL_ATTACKS),
+        ResponseField(AnalysisPostGetSuccessResponseKey.VIDEOS, "_post", UnitAnalysisPostKey.VIDEOS),
+        ResponseField(AnalysisPostGetSuccessResponseKey.STORY, "_post", UnitAnalysisPostKey.STORY),
+        ResponseField(AnalysisPostGetSuccessResponseKey.KEYWORDS, "_post", UnitAnalysisPostKey.KEYWORDS),
+    )
+
+    variant_fields = {
+        UnitAnalysisPostType.CHARACTER: (
+            ResponseField(
+                AnalysisPostGetSuccessResponseKey.C_FORCE_STRIKES, "_post", UnitAnalysisPostKey.C_FORCE_STRIKES
+            ),
+            ResponseField(
+                AnalysisPostGetSuccessResponseKey.C_SKILLS, "_post", UnitAnalysisPostKey.C_SKILLS,
+                entry_fields=(
+                    EntryField(AnalysisPostGetSuccessResponseKey.C_SKILL_NAME, UnitAnalysisPostKey.C_SKILL_NAME),
+                    EntryField(AnalysisPostGetSuccessResponseKey.C_SKILL_INFO, UnitAnalysisPostKey.C_SKILL_INFO),
+                    EntryField(
+                        AnalysisPostGetSuccessResponseKey.C_SKILL_ROTATIONS, UnitAnalysisPostKey.C_SKILL_ROTATIONS
+                    ),
+                    EntryField(AnalysisPostGetSuccessResponseKey.C_SKILL_TIPS, UnitAnalysisPostKey.C_SKILL_TIPS),
+                )
+            ),
+            ResponseField(
+                AnalysisPostGetSuccessResponseKey.C_TIPS_N_BUILDS, "_post", UnitAnalysisPostKey.C_TIPS_N_BUILDS
+            ),
+        ),
+        UnitAnalysisPostType.DRAGON: (
+            ResponseField(AnalysisPostGetSuccessResponseKey.D_ULTIMATE, "_post", UnitAnalysisPostKey.D_ULTIMATE),
+            ResponseField(AnalysisPostGetSuccessResponseKey.D_NOTES, "_post", UnitAnalysisPostKey.D_NOTES),
+            ResponseField(
+                AnalysisPostGetSuccessResponseKey.D_SUITABLE_CHARACTERS, "_post",
+                UnitAnalysisPostKey.D_SUITABLE_CHARACTERS
+            ),
+        ),
+    }
+
+    def get_variant(self) -> Any:
+        return self._post[UnitAnalysisPostKey.TYPE]
 
 
 class AnalysisPostGetFailedResponse(PostGetFailedResponse):
@@ -229,6 +215,39 @@ class AnalysisPostGetFailedResponse(PostGetFailedResponse):
 # endregion
 
 
+# region Analysis Post / Get Many
+
+class AnalysisPostGetManyResponseKey(PostGetManyResponseKey):
+    """Response keys of getting multiple analysis posts."""
+
+
+class AnalysisPostGetManyResponse(PostGetManyResponse):
+    """Response body of getting multiple analysis posts."""
+
+    get_success_response = AnalysisPostGetSuccessResponse
+    get_failed_response = AnalysisPostGetFailedResponse
+
+
+class AnalysisPostGetManyFailedResponse(PostGetManyFailedResponse):
+    """Response body of failed to get multiple analysis posts."""
+
+
+# endregion
+
+
+# region Analysis Post / History
+
+class AnalysisPostHistoryResponseKey(PostHistoryResponseKey):
+    """Response keys of getting the modification history of an analysis post."""
+
+
+class AnalysisPostHistoryResponse(PostHistoryResponse):
+    """Response body of getting the modification history of an analysis post."""
+
+
+# endregion
+
+
 # region Analysis Post / Edit
 
 class AnalysisPostEditSuccessResponseKey(PostEditSuccessResponseKey):
@@ -246,6 +265,19 @@ class AnalysisPostEditFailedResponse(PostEditFailedResponse):
 # endregion
 
 
+# region Analysis Post / Edit Bundle
+
+class AnalysisPostEditBundleSuccessResponseKey(PostEditBundleSuccessResponseKey):
+    """Response keys of successfully edited an analysis post in multiple languages."""
+
+
+class AnalysisPostEditBundleSuccessResponse(PostEditBundleSuccessResponse):
+    """Response body of successfully edited an analysis post in multiple languages."""
+
+
+# endregion
+
+
 # region Analysis Post / ID Check
 
 class AnalysisPostIDCheckResponseKey(PostIDCheckResponseKey):
@@ -1,15 +1,21 @@
 """Base response class related to post data control."""
 from abc import ABC
-from typing import Any
+from datetime import datetime
+from typing import Any, Hashable, Optional, Type
 
 from controllers import ModifiableDataKey, MultilingualGetOneResult, MultilingualPostKey
+from controllers.results import UpdateResult
 from responses.code import ResponseCodeCollection
 from .basic import Response, ResponseKey
+from .fields import EntryField, ResponseField, ResponseSerializer, compile_serializer
 
 __all__ = ("PostPublishSuccessResponse", "PostPublishFailedResponse", "PostPublishSuccessResponseKey",
-           "PostListResponse", "PostListResponseKey",
+           "PostListResponse", "PostListFailedResponse", "PostListResponseKey",
            "PostGetSuccessResponse", "PostGetFailedResponse", "PostGetSuccessResponseKey",
+           "PostGetManyResponse", "PostGetManyFailedResponse", "PostGetManyResponseKey",
+           "PostHistoryResponse", "PostHistoryResponseKey",
            "PostEditSuccessResponse", "PostEditFailedResponse", "PostEditSuccessResponseKey",
+           "PostEditBundleSuccessResponse", "PostEditBundleSuccessResponseKey",
            "PostIDCheckResponseKey", "PostIDCheckResponse")
 
 
@@ -24,16 +30,15 @@ class PostUpdateSuccessResponseKey(ResponseKey, ABC):
 class PostUpdateSuccessResponse(Response, ABC):
     """Response body of successfully published/edited a post."""
 
+    fields = (
+        ResponseField(PostUpdateSuccessResponseKey.POST_SEQ_ID, "_seq_id"),
+    )
+
     def __init__(self, seq_id: int):
         super().__init__(ResponseCodeCollection.SUCCESS)
 
         self._seq_id = seq_id
 
-    def serialize(self):
-        return super().serialize() | {
-            PostUpdateSuccessResponseKey.POST_SEQ_ID: self._seq_id
-        }
-
 
 class PostUpdateFailedResponse(Response, ABC):
     """Response body of failed to publish/edit a post."""
@@ -74,26 +79,34 @@ class PostListResponseKey(ResponseKey, ABC):
     POSTS = "posts"
     START_IDX = "startIdx"
     POST_COUNT = "postCount"
+    NEXT_CURSOR = "nextCursor"
 
 
 class PostListResponse(Response, ABC):
     """Response body of getting a post list."""
 
-    def __init__(self, is_admin: bool, show_ads: bool, start_idx: int, post_count: int):
+    fields = (
+        ResponseField(PostListResponseKey.START_IDX, "_start_idx"),
+        ResponseField(PostListResponseKey.POST_COUNT, "_post_count"),
+        ResponseField(PostListResponseKey.NEXT_CURSOR, "_next_cursor"),
+        ResponseField(PostListResponseKey.IS_ADMIN, "_is_admin"),
+        ResponseField(PostListResponseKey.SHOW_ADS, "_show_ads"),
+    )
+
+    # pylint: disable=too-many-arguments
+    def __init__(self, is_admin: bool, show_ads: bool, start_idx: int, post_count: Optional[int],
+                 next_cursor: Optional[str]):
         super().__init__(ResponseCodeCollection.SUCCESS)
 
         self._is_admin = is_admin
         self._show_ads = show_ads
         self._start_idx = start_idx
         self._post_count = post_count
+        self._next_cursor = next_cursor
+
 
-    def serialize(self):
-        return super().serialize() | {
-            PostListResponseKey.START_IDX: self._start_idx,
-            PostListResponseKey.POST_COUNT: self._post_count,
-            PostListResponseKey.IS_ADMIN: self._is_admin,
-            PostListResponseKey.SHOW_ADS: self._show_ads
-        }
+class PostListFailedResponse(Response, ABC):
+    """Response body of failed to get a post list."""
 
 
 # endregion
@@ -128,55 +141,73 @@ class PostGetSuccessResponseKey(ResponseKey, ABC):
     IS_ALT_LANG = "isAltLang"
     OTHER_LANGS = "otherLangs"
 
-    @classmethod
-    def convert_modify_notes_key(cls, modify_notes: list[dict[str, Any]]):
-        """Convert the keys in ``modify_notes`` from model key to be the keys for the response."""
-        ret = []
-
-        for mod_note in modify_notes:
-            ret.append({
-                cls.MODIFY_DT: mod_note[ModifiableDataKey.MODIFY_DT],
-                cls.MODIFY_NOTE: mod_note[ModifiableDataKey.MODIFY_NOTE]
-            })
-
-        return ret
-
 
 class PostGetSuccessResponse(Response):
-    """Response body of getting a multilingual modifiable post."""
+    """
+    Response body of getting a multilingual modifiable post.
 
-    # pylint: disable=too-many-instance-attributes
+    The fields of the post are serialized from the post document ``_post`` directly.
+    """
+
+    fields = (
+        ResponseField(PostGetSuccessResponseKey.IS_ADMIN, "_is_admin"),
+        ResponseField(PostGetSuccessResponseKey.SHOW_ADS, "_show_ads"),
+        ResponseField(PostGetSuccessResponseKey.SEQ_ID, "_post", MultilingualPostKey.SEQ_ID),
+        ResponseField(PostGetSuccessResponseKey.LANG_CODE, "_post", MultilingualPostKey.LANG_CODE),
+        ResponseField(PostGetSuccessResponseKey.DT_LAST_MODIFIED, "_post", ModifiableDataKey.DT_LAST_MODIFIED),
+        ResponseField(PostGetSuccessResponseKey.DT_PUBLISHED, "_post", ModifiableDataKey.DT_PUBLISHED),
+        ResponseField(
+            PostGetSuccessResponseKey.MODIFY_NOTES, "_post", ModifiableDataKey.MODIFY_NOTES,
+            entry_fields=(
+                EntryField(PostGetSuccessResponseKey.MODIFY_DT, ModifiableDataKey.MODIFY_DT),
+                EntryField(PostGetSuccessResponseKey.MODIFY_NOTE, ModifiableDataKey.MODIFY_NOTE),
+            )
+        ),
+        ResponseField(PostGetSuccessResponseKey.VIEW_COUNT, "_post", MultilingualPostKey.VIEW_COUNT),
+        ResponseField(PostGetSuccessResponseKey.IS_ALT_LANG, "_get_result.is_alt_lang"),
+        ResponseField(PostGetSuccessResponseKey.OTHER_LANGS, "_get_result.other_langs"),
+    )
+
+    # Keys of the fields varying by request instead of by post, which are excluded from the cached post body
+    request_keys: tuple[str, ...] = (
+        PostGetSuccessResponseKey.IS_ADMIN,
+        PostGetSuccessResponseKey.SHOW_ADS,
+        PostGetSuccessResponseKey.VIEW_COUNT,
+        PostGetSuccessResponseKey.IS_ALT_LANG,
+        PostGetSuccessResponseKey.OTHER_LANGS,
+    )
+
+    _request_serializer: ResponseSerializer
 
     def __init__(self, is_admin: bool, show_ads: bool, get_result: MultilingualGetOneResult):
         super().__init__(ResponseCodeCollection.SUCCESS)
 
-        post = get_result.data
-
         self._is_admin = is_admin
         self._show_ads = show_ads
-        self._seq_id = post[MultilingualPostKey.SEQ_ID]
-        self._lang_code = post[MultilingualPostKey.LANG_CODE]
-        self._modified = post[ModifiableDataKey.DT_LAST_MODIFIED]
-        self._published = post[ModifiableDataKey.DT_PUBLISHED]
-        self._modify_notes = PostGetSuccessResponseKey.convert_modify_notes_key(post[ModifiableDataKey.MODIFY_NOTES])
-        self._view_count = post[MultilingualPostKey.VIEW_COUNT]
-
-        self._is_alt_lang = get_result.is_alt_lang
-        self._other_langs = get_result.other_langs
-
-    def serialize(self):
-        return super().serialize() | {
-            PostGetSuccessResponseKey.IS_ADMIN: self._is_admin,
-            PostGetSuccessResponseKey.SHOW_ADS: self._show_ads,
-            PostGetSuccessResponseKey.SEQ_ID: self._seq_id,
-            PostGetSuccessResponseKey.LANG_CODE: self._lang_code,
-            PostGetSuccessResponseKey.DT_LAST_MODIFIED: self._modified,
-            PostGetSuccessResponseKey.DT_PUBLISHED: self._published,
-            PostGetSuccessResponseKey.MODIFY_NOTES: self._modify_notes,
-            PostGetSuccessResponseKey.VIEW_COUNT: self._view_count,
-            PostGetSuccessResponseKey.IS_ALT_LANG: self._is_alt_lang,
-            PostGetSuccessResponseKey.OTHER_LANGS: self._other_langs
-        }
+        self._get_result = get_result
+        self._post = get_result.data
+
+    @classmethod
+    def compile_serializers(cls):
+        super().compile_serializers()
+
+        cls._request_serializer = staticmethod(
+            compile_serializer(field for field in cls.get_fields() if field.key in cls.request_keys)
+        )
+
+    def serialize_request_fields(self) -> dict[str, Any]:
+        """Serialize the fields in ``request_keys`` only."""
+        return self._request_serializer(self)
+
+    @property
+    def cache_key(self) -> Optional[Hashable]:  # pylint: disable=unsubscriptable-object
+        """Key to cache the encoded body of the post. ``None`` if the post is not cacheable."""
+        return self._get_result.cache_key
+
+    @property
+    def last_modified(self) -> datetime:
+        """Last modified timestamp of the post, which changes on every post change."""
+        return self._post[ModifiableDataKey.DT_LAST_MODIFIED]
 
 
 class PostGetFailedResponse(Response):
@@ -186,6 +217,96 @@ class PostGetFailedResponse(Response):
 # endregion
 
 
+# region Post / Get Many
+
+class PostGetManyResponseKey(ResponseKey, ABC):
+    """
+    Response keys of getting multiple posts.
+
+    Keys must be consistent with the type ``PostGetManyResponse`` at the front side.
+    """
+
+    IS_ADMIN = "isAdmin"
+    SHOW_ADS = "showAds"
+
+    POSTS = "posts"
+
+
+class PostGetManyResponse(Response, ABC):
+    """
+    Response body of getting multiple posts.
+
+    Each entry of the posts is the response body of getting the post in the same order as requested,
+    or the response body of failing to get the post if it does not exist.
+    """
+
+    fields = (
+        ResponseField(PostGetManyResponseKey.IS_ADMIN, "_is_admin"),
+        ResponseField(PostGetManyResponseKey.SHOW_ADS, "_show_ads"),
+        ResponseField(PostGetManyResponseKey.POSTS, "_posts"),
+    )
+
+    get_success_response: Type[PostGetSuccessResponse] = PostGetSuccessResponse
+    get_failed_response: Type[PostGetFailedResponse] = PostGetFailedResponse
+
+    def __init__(self, is_admin: bool, show_ads: bool, get_results: list[MultilingualGetOneResult]):
+        super().__init__(ResponseCodeCollection.SUCCESS)
+
+        self._is_admin = is_admin
+        self._show_ads = show_ads
+        self._posts = [
+            self.get_success_response(is_admin, show_ads, result).serialize() if result.data
+            else self.get_failed_response(ResponseCodeCollection.FAILED_POST_NOT_EXISTS).serialize()
+            for result in get_results
+        ]
+
+
+class PostGetManyFailedResponse(Response, ABC):
+    """Response body of failing to get multiple posts."""
+
+
+# endregion
+
+
+# region Post / History
+
+class PostHistoryResponseKey(ResponseKey, ABC):
+    """Response keys of getting the modification history of a post."""
+
+    START_IDX = "startIdx"
+    HAS_NEXT = "hasNext"
+
+    MODIFY_NOTES = "modifyNotes"
+    MODIFY_DT = "timestamp"
+    MODIFY_NOTE = "note"
+
+
+class PostHistoryResponse(Response, ABC):
+    """Response body of getting the modification history of a post."""
+
+    fields = (
+        ResponseField(PostHistoryResponseKey.START_IDX, "_start_idx"),
+        ResponseField(PostHistoryResponseKey.HAS_NEXT, "_has_next"),
+        ResponseField(
+            PostHistoryResponseKey.MODIFY_NOTES, "_notes",
+            entry_fields=(
+                EntryField(PostHistoryResponseKey.MODIFY_DT, ModifiableDataKey.MODIFY_DT),
+                EntryField(PostHistoryResponseKey.MODIFY_NOTE, ModifiableDataKey.MODIFY_NOTE),
+            )
+        ),
+    )
+
+    def __init__(self, start_idx: int, notes: list[dict[str, Any]], has_next: bool):
+        super().__init__(ResponseCodeCollection.SUCCESS)
+
+        self._start_idx = start_idx
+        self._notes = notes
+        self._has_next = has_next
+
+
+# endregion
+
+
 # region Post / Edit
 
 class PostEditSuccessResponseKey(PostUpdateSuccessResponseKey):
@@ -203,6 +324,34 @@ class PostEditFailedResponse(PostUpdateFailedResponse):
 # endregion
 
 
+# region Post / Edit Bundle
+
+class PostEditBundleSuccessResponseKey(PostEditSuccessResponseKey, ABC):
+    """Response keys of successfully edited a post in multiple languages."""
+
+    RESULTS = "results"
+
+
+class PostEditBundleSuccessResponse(PostEditSuccessResponse, ABC):
+    """
+    Response body of successfully edited a post in multiple languages.
+
+    The results are the names of ``UpdateResult`` of each language keyed by the language code.
+    """
+
+    fields = (
+        ResponseField(PostEditBundleSuccessResponseKey.RESULTS, "_results"),
+    )
+
+    def __init__(self, seq_id: int, results: dict[str, UpdateResult]):
+        super().__init__(seq_id)
+
+        self._results = {lang_code: result.name for lang_code, result in results.items()}
+
+
+# endregion
+
+
 # region Quest Post / ID Check
 
 class PostIDCheckResponseKey(ResponseKey):
@@ -215,16 +364,15 @@ class PostIDCheckResponseKey(ResponseKey):
 class PostIDCheckResponse(Response):
     """Response body of a post ID check request."""
 
+    fields = (
+        ResponseField(PostIDCheckResponseKey.IS_ADMIN, "_is_admin"),
+        ResponseField(PostIDCheckResponseKey.AVAILABLE, "_available"),
+    )
+
     def __init__(self, is_admin: bool, available: bool):
         super().__init__(ResponseCodeCollection.SUCCESS if is_admin else ResponseCodeCollection.FAILED_CHECK_NOT_ADMIN)
 
         self._is_admin = is_admin
         self._available = available
 
-    def serialize(self):
-        return super().serialize() | {
-            PostIDCheckResponseKey.IS_ADMIN: self._is_admin,
-            PostIDCheckResponseKey.AVAILABLE: self._available,
-        }
-
 # endregion
@@ -1,17 +1,21 @@
 """Response body for getting the data related to quest posts."""
-from typing import Any
-
-from controllers import MultilingualGetOneResult, QuestPostKey
+from controllers import MultilingualPostListResult, QuestPostKey
+from .fields import EntryField, ResponseField
 from .post_base import (
-    PostEditFailedResponse, PostEditSuccessResponse, PostEditSuccessResponseKey, PostGetFailedResponse,
-    PostGetSuccessResponse, PostGetSuccessResponseKey, PostIDCheckResponse, PostIDCheckResponseKey, PostListResponse,
+    PostEditBundleSuccessResponse, PostEditBundleSuccessResponseKey, PostEditFailedResponse, PostEditSuccessResponse,
+    PostEditSuccessResponseKey, PostGetFailedResponse, PostGetManyFailedResponse, PostGetManyResponse,
+    PostGetManyResponseKey, PostGetSuccessResponse, PostGetSuccessResponseKey, PostHistoryResponse,
+    PostHistoryResponseKey, PostIDCheckResponse, PostIDCheckResponseKey, PostListFailedResponse, PostListResponse,
     PostListResponseKey, PostPublishFailedResponse, PostPublishSuccessResponse, PostPublishSuccessResponseKey,
 )
 
 __all__ = ("QuestPostPublishSuccessResponse", "QuestPostPublishFailedResponse", "QuestPostPublishSuccessResponseKey",
-           "QuestPostListResponse", "QuestPostListResponseKey",
+           "QuestPostListResponse", "QuestPostListFailedResponse", "QuestPostListResponseKey",
            "QuestPostGetSuccessResponse", "QuestPostGetFailedResponse", "QuestPostGetSuccessResponseKey",
+           "QuestPostGetManyResponse", "QuestPostGetManyFailedResponse", "QuestPostGetManyResponseKey",
+           "QuestPostHistoryResponse", "QuestPostHistoryResponseKey",
            "QuestPostEditSuccessResponse", "QuestPostEditFailedResponse", "QuestPostEditSuccessResponseKey",
+           "QuestPostEditBundleSuccessResponse", "QuestPostEditBundleSuccessResponseKey",
            "QuestPostIDCheckResponseKey", "QuestPostIDCheckResponse")
 
 
@@ -50,37 +54,33 @@ class QuestPostListResponseKey(PostListResponseKey):
     POSTS_LAST_MODIFIED = "modified"
     POSTS_PUBLISHED = "published"
 
-    @classmethod
-    def convert_posts_key(cls, posts: list[dict[str, Any]]):
-        """Convert the keys in ``posts`` from model key to be the keys for the response."""
-        ret = []
-
-        for post in posts:
-            ret.append({
-                cls.POSTS_SEQ_ID: post[QuestPostKey.SEQ_ID],
-                cls.POSTS_LANG: post[QuestPostKey.LANG_CODE],
-                cls.POSTS_TITLE: post[QuestPostKey.TITLE],
-                cls.POSTS_LAST_MODIFIED: post[QuestPostKey.DT_LAST_MODIFIED],
-                cls.POSTS_PUBLISHED: post[QuestPostKey.DT_PUBLISHED],
-                cls.POSTS_VIEW_COUNT: post[QuestPostKey.VIEW_COUNT]
-            })
-
-        return ret
-
 
 class QuestPostListResponse(PostListResponse):
     """Response body of getting a quest post list."""
 
+    fields = (
+        ResponseField(
+            QuestPostListResponseKey.POSTS, "_posts",
+            entry_fields=(
+                EntryField(QuestPostListResponseKey.POSTS_SEQ_ID, QuestPostKey.SEQ_ID),
+                EntryField(QuestPostListResponseKey.POSTS_LANG, QuestPostKey.LANG_CODE),
+                EntryField(QuestPostListResponseKey.POSTS_TITLE, QuestPostKey.TITLE),
+                EntryField(QuestPostListResponseKey.POSTS_LAST_MODIFIED, QuestPostKey.DT_LAST_MODIFIED),
+                EntryField(QuestPostListResponseKey.POSTS_PUBLISHED, QuestPostKey.DT_PUBLISHED),
+                EntryField(QuestPostListResponseKey.POSTS_VIEW_COUNT, QuestPostKey.VIEW_COUNT),
+            )
+        ),
+    )
+
     # pylint: disable=too-many-arguments
-    def __init__(self, is_admin: bool, show_ads: bool, posts: list[dict[str, Any]], start_idx: int, post_count: int):
-        super().__init__(is_admin, show_ads, start_idx, post_count)
+    def __init__(self, is_admin: bool, show_ads: bool, start_idx: int, list_result: MultilingualPostListResult):
+        super().__init__(is_admin, show_ads, start_idx, list_result.post_count, list_result.next_cursor)
 
-        self._posts = QuestPostListResponseKey.convert_posts_key(posts)
+        self._posts = list_result.posts
 
-    def serialize(self):
-        return super().serialize() | {
-            QuestPostListResponseKey.POSTS: self._posts
-        }
+
+class QuestPostListFailedResponse(PostListFailedResponse):
+    """Response body of failed to get a quest post list."""
 
 
 # endregion
@@ -108,50 +108,62 @@ class QuestPostGetSuccessResponseKey(PostGetSuccessResponseKey):
 
     ADDENDUM = "addendum"
 
-    @classmethod
-    def convert_info_key(cls, pos_info: list[dict[str, Any]]):
-        """Convert the keys in ``pos_info`` from model key to be the keys for the response."""
-        ret = []
 
-        for post in pos_info:
-            ret.append({
-                cls.INFO_POSITION: post[QuestPostKey.INFO_POSITION],
-                cls.INFO_BUILDS: post[QuestPostKey.INFO_BUILDS],
-                cls.INFO_ROTATIONS: post[QuestPostKey.INFO_ROTATIONS],
-                cls.INFO_TIPS: post[QuestPostKey.INFO_TIPS]
-            })
+class QuestPostGetSuccessResponse(PostGetSuccessResponse):
+    """Response body of getting a quest post."""
 
-        return ret
+    fields = (
+        ResponseField(QuestPostGetSuccessResponseKey.TITLE, "_post", QuestPostKey.TITLE),
+        ResponseField(QuestPostGetSuccessResponseKey.GENERAL_INFO, "_post", QuestPostKey.GENERAL_INFO),
+        ResponseField(QuestPostGetSuccessResponseKey.VIDEO, "_post", QuestPostKey.VIDEO),
+        ResponseField(
+            QuestPostGetSuccessResponseKey.INFO_PARENT, "_post", QuestPostKey.INFO_PARENT,
+            entry_fields=(
+                EntryField(QuestPostGetSuccessResponseKey.INFO_POSITION, QuestPostKey.INFO_POSITION),
+                EntryField(QuestPostGetSuccessResponseKey.INFO_BUILDS, QuestPostKey.INFO_BUILDS),
+                EntryField(QuestPostGetSuccessResponseKey.INFO_ROTATIONS, QuestPostKey.INFO_ROTATIONS),
+                EntryField(QuestPostGetSuccessResponseKey.INFO_TIPS, QuestPostKey.INFO_TIPS),
+            )
+        ),
+        ResponseField(QuestPostGetSuccessResponseKey.ADDENDUM, "_post", QuestPostKey.ADDENDUM),
+    )
 
 
-class QuestPostGetSuccessResponse(PostGetSuccessResponse):
-    """Response body of getting a quest post."""
+class QuestPostGetFailedResponse(PostGetFailedResponse):
+    """Response body of failed to get a quest post."""
+
 
-    # pylint: disable=too-many-instance-attributes
+# endregion
 
-    def __init__(self, is_admin: bool, show_ads: bool, get_result: MultilingualGetOneResult):
-        super().__init__(is_admin, show_ads, get_result)
 
-        post = get_result.data
+# region Quest Post / Get Many
 
-        self._title = post[QuestPostKey.TITLE]
-        self._general = post[QuestPostKey.GENERAL_INFO]
-        self._video = post[QuestPostKey.VIDEO]
-        self._info = QuestPostGetSuccessResponseKey.convert_info_key(post[QuestPostKey.INFO_PARENT])
-        self._addendum = post[QuestPostKey.ADDENDUM]
+class QuestPostGetManyResponseKey(PostGetManyResponseKey):
+    """Response keys of getting multiple quest posts."""
 
-    def serialize(self):
-        return super().serialize() | {
-            QuestPostGetSuccessResponseKey.TITLE: self._title,
-            QuestPostGetSuccessResponseKey.GENERAL_INFO: self._general,
-            QuestPostGetSuccessResponseKey.VIDEO: self._video,
-            QuestPostGetSuccessResponseKey.INFO_PARENT: self._info,
-            QuestPostGetSuccessResponseKey.ADDENDUM: self._addendum,
-        }
 
+class QuestPostGetManyResponse(PostGetManyResponse):
+    """Response body of getting multiple quest posts."""
+
+    get_success_response = QuestPostGetSuccessResponse
+    get_failed_response = QuestPostGetFailedResponse
 
-class QuestPostGetFailedResponse(PostGetFailedResponse):
-    """Response body of failed to get a quest post."""
+
+class QuestPostGetManyFailedResponse(PostGetManyFailedResponse):
+    """Response body of failed to get multiple quest posts."""
+
+
+# endregion
+
+
+# region Quest Post / History
+
+class QuestPostHistoryResponseKey(PostHistoryResponseKey):
+    """Response keys of getting the modification history of a quest post."""
+
+
+class QuestPostHistoryResponse(PostHistoryResponse):
+    """Response body of getting the modification history of a quest post."""
 
 
 # endregion
@@ -174,6 +186,19 @@ class QuestPostEditFailedResponse(PostEditFailedResponse):
 # endregion
 
 
+# region Quest Post / Edit Bundle
+
+class QuestPostEditBundleSuccessResponseKey(PostEditBundleSuccessResponseKey):
+    """Response keys of successfully edited a quest post in multiple languages."""
+
+
+class QuestPostEditBundleSuccessResponse(PostEditBundleSuccessResponse):
+    """Response body of successfully edited a quest post in multiple languages."""
+
+
+# endregion
+
+
 # region Quest Post / ID Check
 
 class QuestPostIDCheckResponseKey(PostIDCheckResponseKey):
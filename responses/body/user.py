@@ -2,6 +2,7 @@
 from responses.code import ResponseCodeCollection
 
 from .basic import Response, ResponseKey
+from .fields import ResponseField
 
 __all__ = ("UserLoginResponse", "UserShowAdsResponse")
 
@@ -23,12 +24,11 @@ class UserShowAdsResponseKey(ResponseKey):
 class UserShowAdsResponse(Response):
     """Response body of checking the ads availability of an user."""
 
+    fields = (
+        ResponseField(UserShowAdsResponseKey.SHOW_ADS, "_show_ads"),
+    )
+
     def __init__(self, show_ads: bool):
         super().__init__(ResponseCodeCollection.SUCCESS)
 
         self._show_ads = show_ads
-
-    def serialize(self):
-        return super().serialize() | {
-            UserShowAdsResponseKey.SHOW_ADS: self._show_ads,
-        }
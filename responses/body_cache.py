@@ -0,0 +1,114 @@
+"""
+Cache of the encoded post bodies.
+
+The post bodies are encoded once and reused until the post changes.
+The fields varying by request are encoded and spliced into the cached body on each encoding.
+"""
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Collection
+
+from cache import ByteLRUCache
+from .body.post_base import PostGetSuccessResponse
+from .serializer import ResponseBodyEncodeFunction
+
+__all__ = ("EncodedBodyTemplate", "make_encoded_body_template", "encode_with_post_body_cache")
+
+
+@dataclass(frozen=True)
+class EncodedBodyTemplate:
+    """
+    Response body encoded in advance, except the fields of ``keys``.
+
+    The value of each key in ``keys`` goes between the corresponding ``segments``,
+    so there is always 1 more segment than the keys.
+
+    ``last_modified`` is the last modified timestamp of the post encoded.
+    """
+
+    segments: tuple[bytes, ...]
+    keys: tuple[str, ...]
+    last_modified: datetime
+
+    @property
+    def size(self) -> int:
+        """Size of the encoded segments in bytes."""
+        return sum(len(segment) for segment in self.segments)
+
+    def render(self, values: dict[str, Any], encoder: ResponseBodyEncodeFunction) -> bytes:
+        """Encode ``values`` of ``keys`` using ``encoder`` and splice them into the segments."""
+        parts = [self.segments[0]]
+
+        for key, segment in zip(self.keys, self.segments[1:]):
+            parts.append(encoder(values[key], False))
+            parts.append(segment)
+
+        return b"".join(parts)
+
+
+def make_encoded_body_template(
+        body: dict[str, Any], keys: Collection[str], encoder: ResponseBodyEncodeFunction, last_modified: datetime
+) -> EncodedBodyTemplate:
+    """
+    Encode ``body`` except the fields of ``keys`` using ``encoder``.
+
+    The template renders the same bytes as ``encoder`` does for ``body`` without indentation.
+    """
+    segments = []
+    template_keys = []
+
+    segment = b"{"
+    fixed_items: dict[str, Any] = {}
+
+    for key, value in body.items():
+        if key not in keys:
+            fixed_items[key] = value
+            continue
+
+        if fixed_items:
+            # Strip the braces to get the encoded items only
+            segment += encoder(fixed_items, False)[1:-1] + b","
+            fixed_items = {}
+
+        segments.append(segment + encoder(key, False) + b":")
+        template_keys.append(key)
+        segment = b","
+
+    if fixed_items:
+        segment += encoder(fixed_items, False)[1:-1]
+    elif segment == b",":
+        # No items after the last key
+        segment = b""
+
+    segments.append(segment + b"}")
+
+    return EncodedBodyTemplate(tuple(segments), tuple(template_keys), last_modified)
+
+
+def encode_with_post_body_cache(
+        encoder: ResponseBodyEncodeFunction, body_cache: ByteLRUCache
+) -> ResponseBodyEncodeFunction:
+    """
+    Wrap ``encoder`` to reuse the encoded post bodies in ``body_cache`` for the responses of getting a post.
+
+    The cached body is re-encoded if the post has changed since it was cached.
+    Bodies to be indented are not cached.
+
+    Returns ``encoder`` as-is if ``body_cache`` is disabled.
+    """
+    if body_cache.max_bytes <= 0:
+        return encoder
+
+    def encode(data: Any, pretty: bool = False) -> bytes:
+        if pretty or not isinstance(data, PostGetSuccessResponse) or data.cache_key is None:
+            return encoder(data, pretty)
+
+        _, template = body_cache.lookup(data.cache_key)
+
+        if not template or template.last_modified != data.last_modified:
+            template = make_encoded_body_template(data.serialize(), data.request_keys, encoder, data.last_modified)
+            body_cache.set(data.cache_key, template, template.size)
+
+        return template.render(data.serialize_request_fields(), encoder)
+
+    return encode
@@ -33,8 +33,18 @@ class ResponseCodeCollection:
         ResponseCode(202, False, "Post not exists.")
     FAILED_CHECK_NOT_ADMIN = \
         ResponseCode(203, False, "Check failed because the user is not an admin.")
+    FAILED_INVALID_CURSOR = \
+        ResponseCode(204, False, "Pagination cursor is malformed.")
+    FAILED_TOO_MANY_POSTS = \
+        ResponseCode(205, False, "Too many posts are requested at once.")
+    FAILED_POST_ID_UNAVAILABLE = \
+        ResponseCode(206, False, "Post ID is unavailable in some of the languages.")
+    FAILED_DUPLICATE_LANGS = \
+        ResponseCode(207, False, "Some of the languages are given more than once.")
 
     FAILED_SERVER_ERROR = \
         ResponseCode(901, False, "Request failed with server side error.")
+    FAILED_DB_UNAVAILABLE = \
+        ResponseCode(902, False, "Request failed because the database is temporarily unavailable.")
     FAILED_UNKNOWN = \
         ResponseCode(999, False, "Request failed with unknown reason.")
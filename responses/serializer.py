@@ -1,11 +1,54 @@
 """JSON serializer for the response body."""
-from datetime import datetime
+import json
+from datetime import datetime, timezone
 from json import JSONEncoder
+from typing import Any, Callable
 
 from .body import Response
 from .code import ResponseCode
 
-__all__ = ("ResponseBodyEncoder",)
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+__all__ = ("ResponseBodyEncoder", "ResponseBodyEncodeFunction", "get_response_body_encoder",
+           "encode_response_body_stdlib", "encode_response_body_orjson")
+
+# Encodes the response body to JSON bytes. The body will be indented if the 2nd argument (`pretty`) is `True`.
+ResponseBodyEncodeFunction = Callable[[Any, bool], bytes]
+
+
+def _format_datetime(dt: datetime) -> str:
+    """
+    Format ``dt`` in RFC 3339 without the fractional seconds, the same as ``orjson`` does.
+
+    Naive ``dt`` is treated as UTC. UTC is denoted as ``Z``.
+    """
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+
+    formatted = dt.replace(microsecond=0).isoformat()
+    if formatted.endswith("+00:00"):
+        return f"{formatted[:-6]}Z"
+
+    return formatted
+
+
+def _to_serializable(obj: Any) -> Any:
+    """
+    Convert ``obj`` which is not natively JSON serializable.
+
+    :raises TypeError: if `obj` is not serializable
+    """
+    if isinstance(obj, Response):
+        return obj.serialize()
+    if isinstance(obj, ResponseCode):
+        return obj.code
+    if isinstance(obj, datetime):
+        return _format_datetime(obj)
+
+    raise TypeError(f"Object of type {obj.__class__.__name__} is not JSON serializable")
 
 
 class ResponseBodyEncoder(JSONEncoder):
@@ -13,11 +56,57 @@ class ResponseBodyEncoder(JSONEncoder):
 
     def default(self, obj):
         # pylint: disable=arguments-differ
-        if isinstance(obj, Response):
-            return obj.serialize()
-        if isinstance(obj, ResponseCode):
-            return obj.code
-        if isinstance(obj, datetime):
-            return obj.strftime("%Y-%m-%d %H:%M:%S (UTC)")
-
-        return super().default(obj)
+        try:
+            return _to_serializable(obj)
+        except TypeError:
+            return super().default(obj)
+
+
+def encode_response_body_stdlib(data: Any, pretty: bool = False) -> bytes:
+    """Encode ``data`` to compact UTF-8 JSON using the standard library. Indented by 2 spaces if ``pretty``."""
+    if pretty:
+        return json.dumps(data, cls=ResponseBodyEncoder, ensure_ascii=False, indent=2).encode()
+
+    return json.dumps(data, cls=ResponseBodyEncoder, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+def encode_response_body_orjson(data: Any, pretty: bool = False) -> bytes:
+    """
+    Encode ``data`` to the same bytes as ``encode_response_body_stdlib()`` does using ``orjson``, except the floats.
+
+    Floats may be encoded in a different exponent format (for example, ``1e+16`` instead of ``1e16``),
+    and non-finite floats are encoded as ``null`` instead of ``NaN`` or ``Infinity``.
+    The response bodies hold no floats for now.
+
+    Falls back to ``encode_response_body_stdlib()`` for the data ``orjson`` does not support,
+    for example, integers exceeding 64 bits.
+    """
+    # `ResponseCode` is a dataclass, which is natively serialized by `orjson` otherwise
+    option = orjson.OPT_PASSTHROUGH_DATACLASS
+    # Datetimes are encoded natively, in the same format as `_format_datetime()`
+    option |= orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z | orjson.OPT_OMIT_MICROSECONDS
+    if pretty:
+        option |= orjson.OPT_INDENT_2
+
+    try:
+        return orjson.dumps(data, default=_to_serializable, option=option)
+    except orjson.JSONEncodeError:
+        return encode_response_body_stdlib(data, pretty)
+
+
+def get_response_body_encoder(name: str) -> ResponseBodyEncodeFunction:
+    """
+    Get the response body encoder by its ``name``.
+
+    Available encoders are ``orjson`` and ``stdlib``.
+    ``stdlib`` will be returned instead if ``orjson`` is requested but not installed.
+
+    :raises ValueError: if the encoder `name` is unknown
+    """
+    if name == "orjson":
+        return encode_response_body_orjson if orjson else encode_response_body_stdlib
+
+    if name == "stdlib":
+        return encode_response_body_stdlib
+
+    raise ValueError(f"Unknown response body encoder: {name}")
@@ -1,5 +1,5 @@
 """Script to add missing fields."""
-from controllers.base import MONGO_CLIENT
+from controllers.base import get_mongo_client
 
 
 NAME_DB = "post"
@@ -16,7 +16,7 @@ UPDATE_VAL = {
 
 
 def main():
-    col = MONGO_CLIENT.get_database(NAME_DB).get_collection(NAME_COL)
+    col = get_mongo_client().get_database(NAME_DB).get_collection(NAME_COL)
 
     update_result = col.update_many(
         {update_key: {"$exists": False} for update_key in UPDATE_VAL},
@@ -0,0 +1,141 @@
+"""
+Script to benchmark the serialization of the response bodies.
+
+For each response, reports the memory blocks allocated for the serialized body,
+the peak memory allocated to create and serialize it, and the time spent.
+"""
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+from typing import Any, Callable
+
+from controllers import (
+    MultilingualGetOneResult, MultilingualPostListResult, QuestPostKey, UnitAnalysisPostKey, UnitAnalysisPostType,
+)
+from responses import (
+    AnalysisPostGetSuccessResponse, AnalysisPostListResponse, QuestPostGetSuccessResponse, QuestPostListResponse,
+    Response,
+)
+
+REPEAT = 1000
+
+NOW = datetime(2021, 3, 4, 5, 6, 7)
+
+MODIFY_NOTES = [{QuestPostKey.MODIFY_DT: NOW, QuestPostKey.MODIFY_NOTE: f"Note #{idx}"} for idx in range(10)]
+
+
+def make_quest_post(seq_id: int) -> dict[str, Any]:
+    return {
+        QuestPostKey.SEQ_ID: seq_id,
+        QuestPostKey.LANG_CODE: "en",
+        QuestPostKey.TITLE: f"Quest #{seq_id}",
+        QuestPostKey.GENERAL_INFO: "General info",
+        QuestPostKey.VIDEO: "Video",
+        QuestPostKey.INFO_PARENT: [
+            {
+                QuestPostKey.INFO_POSITION: f"Position #{idx}",
+                QuestPostKey.INFO_BUILDS: "Builds",
+                QuestPostKey.INFO_ROTATIONS: "Rotations",
+                QuestPostKey.INFO_TIPS: "Tips"
+            }
+            for idx in range(5)
+        ],
+        QuestPostKey.ADDENDUM: "Addendum",
+        QuestPostKey.DT_LAST_MODIFIED: NOW,
+        QuestPostKey.DT_PUBLISHED: NOW,
+        QuestPostKey.MODIFY_NOTES: MODIFY_NOTES,
+        QuestPostKey.VIEW_COUNT: 777
+    }
+
+
+def make_chara_post(seq_id: int) -> dict[str, Any]:
+    return {
+        UnitAnalysisPostKey.SEQ_ID: seq_id,
+        UnitAnalysisPostKey.LANG_CODE: "en",
+        UnitAnalysisPostKey.TYPE: UnitAnalysisPostType.CHARACTER,
+        UnitAnalysisPostKey.UNIT_NAME: f"Chara #{seq_id}",
+        UnitAnalysisPostKey.SUMMARY: "Summary",
+        UnitAnalysisPostKey.SUMMON_RESULT: "Summon result",
+        UnitAnalysisPostKey.PASSIVES: "Passives",
+        UnitAnalysisPostKey.NORMAL_ATTACKS: "Normal attacks",
+        UnitAnalysisPostKey.VIDEOS: "Videos",
+        UnitAnalysisPostKey.STORY: "Story",
+        UnitAnalysisPostKey.KEYWORDS: "Keywords",
+        UnitAnalysisPostKey.C_FORCE_STRIKES: "Force strikes",
+        UnitAnalysisPostKey.C_SKILLS: [
+            {
+                UnitAnalysisPostKey.C_SKILL_NAME: f"Skill #{idx}",
+                UnitAnalysisPostKey.C_SKILL_INFO: "Info",
+                UnitAnalysisPostKey.C_SKILL_ROTATIONS: "Rotations",
+                UnitAnalysisPostKey.C_SKILL_TIPS: "Tips"
+            }
+            for idx in range(4)
+        ],
+        UnitAnalysisPostKey.C_TIPS_N_BUILDS: "Tips and builds",
+        UnitAnalysisPostKey.DT_LAST_MODIFIED: NOW,
+        UnitAnalysisPostKey.DT_PUBLISHED: NOW,
+        UnitAnalysisPostKey.MODIFY_NOTES: MODIFY_NOTES,
+        UnitAnalysisPostKey.VIEW_COUNT: 777
+    }
+
+
+QUEST_POSTS = [make_quest_post(seq_id) for seq_id in range(25)]
+
+CHARA_POSTS = [make_chara_post(seq_id) for seq_id in range(25)]
+
+# The data is prepared in advance, so only the creation and the serialization of the responses are measured
+BENCHMARKS: dict[str, Callable[[], Response]] = {
+    "Quest post list (25 posts)": lambda: QuestPostListResponse(
+        True, False, 0, MultilingualPostListResult(QUEST_POSTS, len(QUEST_POSTS), "cursor")
+    ),
+    "Quest post get": lambda: QuestPostGetSuccessResponse(
+        True, False, MultilingualGetOneResult(QUEST_POSTS[0], False, ["cht"])
+    ),
+    "Analysis post list (25 posts)": lambda: AnalysisPostListResponse(
+        True, False, 0, MultilingualPostListResult(CHARA_POSTS, len(CHARA_POSTS), "cursor")
+    ),
+    "Character analysis post get": lambda: AnalysisPostGetSuccessResponse(
+        True, False, MultilingualGetOneResult(CHARA_POSTS[0], False, ["cht"])
+    ),
+}
+
+
+def benchmark(name: str, make_response: Callable[[], Response], repeat: int):
+    # Blocks allocated for the serialized bodies, which are kept alive until the 2nd snapshot
+    tracemalloc.start()
+    snapshot_before = tracemalloc.take_snapshot()
+    bodies = [make_response().serialize() for _ in range(repeat)]
+    snapshot_after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    block_count = sum(stat.count_diff for stat in snapshot_after.compare_to(snapshot_before, "filename"))
+    del bodies
+
+    # Peak memory, including the temporary objects dropped during the serialization
+    tracemalloc.start()
+    current, _ = tracemalloc.get_traced_memory()
+    make_response().serialize()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    time_start = time.perf_counter()
+    for _ in range(repeat):
+        make_response().serialize()
+    time_spent = time.perf_counter() - time_start
+
+    print(f"{name}:")
+    print(f"  {block_count / repeat:.1f} blocks allocated per response body")
+    print(f"  {peak - current} bytes of peak memory per response")
+    print(f"  {time_spent / repeat * 1E6:.2f} us per response")
+
+
+def main():
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else REPEAT
+
+    for name, make_response in BENCHMARKS.items():
+        benchmark(name, make_response, repeat)
+
+
+if __name__ == '__main__':
+    main()
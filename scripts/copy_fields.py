@@ -1,5 +1,5 @@
 """Script to copy the fields from one to another with the same value but different key."""
-from controllers.base import MONGO_CLIENT
+from controllers.base import get_mongo_client
 
 NAME_DB = "post"
 NAME_COL = "analysis"
@@ -18,7 +18,7 @@ COPY_KEY: dict[str, str] = {
 
 
 def main():
-    col = MONGO_CLIENT.get_database(NAME_DB).get_collection(NAME_COL)
+    col = get_mongo_client().get_database(NAME_DB).get_collection(NAME_COL)
 
     update_result = col.update_many(
         {},
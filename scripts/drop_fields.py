@@ -1,5 +1,5 @@
 """Script to drop the fields."""
-from controllers.base import MONGO_CLIENT
+from controllers.base import get_mongo_client
 
 NAME_DB = "post"
 NAME_COL = "quest"
@@ -18,7 +18,7 @@ DROP_FIELDS: list[str] = []
 
 
 def main():
-    col = MONGO_CLIENT.get_database(NAME_DB).get_collection(NAME_COL)
+    col = get_mongo_client().get_database(NAME_DB).get_collection(NAME_COL)
 
     update_result = col.update_many(
         {},
@@ -1,8 +1,8 @@
-from controllers.base import MONGO_CLIENT
+from controllers.base import get_mongo_client
 
 
 def main():
-    col = MONGO_CLIENT.get_database("user").get_collection("google")
+    col = get_mongo_client().get_database("user").get_collection("google")
 
     print(f"Emails #: {col.estimated_document_count()}")
 
@@ -0,0 +1,39 @@
+"""
+Script to move the modification notes embedded in the posts to the history collections.
+
+The notes already in the history are skipped, so the script can be run multiple times.
+Only the latest ``POST_MODIFY_NOTES_EMBEDDED`` notes are kept in the posts afterward.
+"""
+from controllers import QuestPostController, QuestPostKey, UnitAnalysisPostController, UnitAnalysisPostKey
+from controllers.base.config import POST_MODIFY_NOTES_EMBEDDED
+
+
+def main():
+    for controller, key_class in ((QuestPostController, QuestPostKey),
+                                  (UnitAnalysisPostController, UnitAnalysisPostKey)):
+        print(f"Moving the modification notes of `{controller.full_name}` to `{controller.history.full_name}`...")
+        print(controller.history.sync_indexes())
+
+        note_count = 0
+        posts = controller.find(
+            {}, projection={key_class.SEQ_ID: 1, key_class.LANG_CODE: 1, key_class.MODIFY_NOTES: 1}
+        )
+        for post in posts:
+            note_count += controller.history.add_embedded_notes(
+                post[key_class.SEQ_ID], post[key_class.LANG_CODE], post.get(key_class.MODIFY_NOTES, [])
+            )
+
+        print(f"{note_count} notes added to the history.")
+
+        update_result = controller.update_many(
+            {f"{key_class.MODIFY_NOTES}.{POST_MODIFY_NOTES_EMBEDDED}": {"$exists": True}},
+            [{"$set": {
+                key_class.MODIFY_NOTES: {"$slice": [f"${key_class.MODIFY_NOTES}", -POST_MODIFY_NOTES_EMBEDDED]}
+            }}]
+        )
+
+        print(f"{update_result.modified_count} posts trimmed to the latest {POST_MODIFY_NOTES_EMBEDDED} notes.")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,71 @@
+"""
+Script to move the view counts stored in the posts and their list entries to the post counters.
+
+The view counts of the posts are added to the counters, then removed from the posts and the list entries.
+
+The script is safe to re-run, including after being interrupted at any step.
+Each counter records the view count moved into it, which is subtracted before moving the view count again,
+so the view counts still in the posts are never added twice.
+The records are removed once the view counts are removed from the posts.
+"""
+from controllers import (
+    PostCounterController, QuestPostController, QuestPostKey, UnitAnalysisPostController, UnitAnalysisPostKey,
+)
+from controllers.base import PostCounterKey
+
+# View count moved into the counter, kept until the view count is removed from the post
+KEY_MOVED_VIEW_COUNT = "_vc_moved"
+
+
+def main():
+    # The unique index of the counters is required by `$merge`
+    print(PostCounterController.sync_indexes())
+
+    # The list entries share the keys of the posts
+    controllers = ((QuestPostController, QuestPostKey), (UnitAnalysisPostController, UnitAnalysisPostKey))
+
+    for controller, post_key in controllers:
+        print(f"Moving the view counts of `{controller.full_name}` to `{PostCounterController.full_name}`...")
+
+        controller.aggregate([
+            {"$match": {post_key.VIEW_COUNT: {"$exists": True}}},
+            {"$project": {
+                "_id": 0,
+                PostCounterKey.COLLECTION: {"$literal": controller.collection_name},
+                PostCounterKey.SEQ_ID: f"${post_key.SEQ_ID}",
+                PostCounterKey.LANG_CODE: f"${post_key.LANG_CODE}",
+                PostCounterKey.VIEW_COUNT: {"$ifNull": [f"${post_key.VIEW_COUNT}", 0]}
+            }},
+            {"$set": {KEY_MOVED_VIEW_COUNT: f"${PostCounterKey.VIEW_COUNT}"}},
+            {"$merge": {
+                "into": {"db": PostCounterController.database.name, "coll": PostCounterController.name},
+                "on": [PostCounterKey.COLLECTION, PostCounterKey.SEQ_ID, PostCounterKey.LANG_CODE],
+                "whenMatched": [{"$set": {
+                    # The view count moved by the interrupted run, if any, is replaced
+                    PostCounterKey.VIEW_COUNT: {"$subtract": [
+                        {"$add": [f"${PostCounterKey.VIEW_COUNT}", f"$$new.{PostCounterKey.VIEW_COUNT}"]},
+                        {"$ifNull": [f"${KEY_MOVED_VIEW_COUNT}", 0]}
+                    ]},
+                    KEY_MOVED_VIEW_COUNT: f"$$new.{KEY_MOVED_VIEW_COUNT}"
+                }}],
+                "whenNotMatched": "insert"
+            }}
+        ])
+
+        for col in (controller, controller.list_entries):
+            update_result = col.update_many(
+                {post_key.VIEW_COUNT: {"$exists": True}}, {"$unset": {post_key.VIEW_COUNT: ""}}
+            )
+
+            print(f"{update_result.modified_count} view counts removed from `{col.full_name}`.")
+
+        update_result = PostCounterController.update_many(
+            {PostCounterKey.COLLECTION: controller.collection_name, KEY_MOVED_VIEW_COUNT: {"$exists": True}},
+            {"$unset": {KEY_MOVED_VIEW_COUNT: ""}}
+        )
+
+        print(f"{update_result.modified_count} moved view counts cleared from `{PostCounterController.full_name}`.")
+
+
+if __name__ == '__main__':
+    main()
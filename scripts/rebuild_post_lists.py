@@ -0,0 +1,16 @@
+"""Script to rebuild the post list entries from the posts, for example, after the posts are modified manually."""
+from controllers import QuestPostController, UnitAnalysisPostController
+
+
+def main():
+    for controller in (QuestPostController, UnitAnalysisPostController):
+        print(f"Rebuilding the post list entries of `{controller.full_name}`...")
+
+        entry_count = controller.rebuild_list_entries()
+
+        print(f"{entry_count} entries rebuilt.")
+        print(controller.list_entries.sync_indexes())
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,18 @@
+"""Script to create the indexes declared by the controllers and report the unused or redundant indexes."""
+import sys
+
+from controllers import sync_all_indexes
+
+
+def main():
+    dry_run = "--dry-run" in sys.argv[1:]
+
+    if dry_run:
+        print("Dry run - the missing indexes will not be created.")
+
+    for report in sync_all_indexes(dry_run=dry_run):
+        print(report)
+
+
+if __name__ == '__main__':
+    main()
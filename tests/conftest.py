@@ -1,5 +1,8 @@
+from contextlib import contextmanager
+
 import pytest
 
+from controllers.base import record_command_stats
 from main import app
 
 
@@ -10,3 +13,16 @@ def client():
 
     with app.test_client() as client, app.app_context():
         yield client
+
+
+@pytest.fixture
+def max_round_trips():
+    @contextmanager
+    def assert_max_round_trips(count: int):
+        """Assert that at most ``count`` database commands are issued within the ``with`` block."""
+        with record_command_stats() as stats:
+            yield stats
+
+        assert stats.count <= count, f"{stats.count} database round trips issued, expected at most {count}"
+
+    return assert_max_round_trips
@@ -0,0 +1,57 @@
+import pytest
+
+from main import app as wsgi_app
+
+starlette_testclient = pytest.importorskip("starlette.testclient")
+asgi = pytest.importorskip("asgi")
+
+
+@pytest.fixture
+def asgi_client():
+    with starlette_testclient.TestClient(asgi.app, raise_server_exceptions=False) as client:
+        yield client
+
+
+@pytest.mark.parametrize(
+    "url",
+    ["/posts/quest?start=0&limit=5&cursor=bad", "/posts/analysis?start=0&limit=5&cursor=bad"]
+)
+def test_post_list_invalid_cursor_same_as_wsgi(asgi_client, url):
+    response = asgi_client.get(url)
+    wsgi_response = wsgi_app.test_client().get(url)
+
+    assert response.status_code == wsgi_response.status_code == 400
+    assert response.content == wsgi_response.get_data()
+
+
+@pytest.mark.parametrize(
+    "url",
+    [
+        "/posts/quest?start=-1&limit=5", "/posts/quest?start=0&limit=-1",
+        "/posts/analysis?start=-1&limit=5", "/posts/analysis?start=0&limit=-1",
+        "/posts/quest?start=bad&limit=5", "/posts/quest/history?seq_id=1&lang=en&start=-1",
+    ]
+)
+def test_invalid_range_same_as_wsgi(asgi_client, url):
+    response = asgi_client.get(url)
+    wsgi_response = wsgi_app.test_client().get(url)
+
+    assert response.status_code == wsgi_response.status_code == 422
+    assert response.content == wsgi_response.get_data()
+
+
+def test_post_get_missing_arg_same_as_wsgi(asgi_client):
+    url = "/posts/quest/get?seq_id=1&lang=en"
+
+    response = asgi_client.get(url)
+    wsgi_response = wsgi_app.test_client().get(url)
+
+    assert response.status_code == wsgi_response.status_code == 500
+    assert response.content == wsgi_response.get_data()
+
+
+def test_wsgi_endpoints_mounted(asgi_client):
+    response = asgi_client.get("/")
+
+    assert response.status_code == 200
+    assert response.content == wsgi_app.test_client().get("/").get_data()
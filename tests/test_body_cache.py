@@ -0,0 +1,86 @@
+from datetime import datetime
+
+import pytest
+
+from cache import ByteLRUCache
+from controllers import MultilingualGetOneResult, QuestPostKey
+from responses import (
+    QuestPostGetSuccessResponse, encode_response_body_orjson, encode_response_body_stdlib,
+    encode_with_post_body_cache, make_encoded_body_template,
+)
+
+now = datetime(2021, 3, 4, 5, 6, 7)
+
+
+def make_quest_post(last_modified: datetime, view_count: int):
+    return {
+        QuestPostKey.SEQ_ID: 7,
+        QuestPostKey.LANG_CODE: "cht",
+        QuestPostKey.TITLE: "頭目攻略 \"quoted\"",
+        QuestPostKey.GENERAL_INFO: "一般資訊\n" * 10,
+        QuestPostKey.VIDEO: "",
+        QuestPostKey.INFO_PARENT: [{
+            QuestPostKey.INFO_POSITION: "Position",
+            QuestPostKey.INFO_BUILDS: "Builds",
+            QuestPostKey.INFO_ROTATIONS: "Rotations",
+            QuestPostKey.INFO_TIPS: "Tips"
+        }],
+        QuestPostKey.ADDENDUM: "",
+        QuestPostKey.DT_LAST_MODIFIED: last_modified,
+        QuestPostKey.DT_PUBLISHED: now,
+        QuestPostKey.MODIFY_NOTES: [{QuestPostKey.MODIFY_DT: now, QuestPostKey.MODIFY_NOTE: "更新"}],
+        QuestPostKey.VIEW_COUNT: view_count
+    }
+
+
+def make_response(is_admin: bool, view_count: int, other_langs: list[str], last_modified: datetime = now):
+    return QuestPostGetSuccessResponse(
+        is_admin, not is_admin,
+        MultilingualGetOneResult(make_quest_post(last_modified, view_count), False, other_langs, ("quest", 7, "cht"))
+    )
+
+
+@pytest.mark.parametrize("encoder", [encode_response_body_stdlib, encode_response_body_orjson])
+@pytest.mark.parametrize("keys", [(), ("code",), ("isAdmin", "viewCount"), ("addendum",), ("code", "addendum")])
+def test_template_same_as_encoder(encoder, keys):
+    response = make_response(True, 3, ["en"])
+    body = response.serialize()
+
+    template = make_encoded_body_template(body, keys, encoder, now)
+
+    assert template.render(body, encoder) == encoder(body, False)
+
+
+@pytest.mark.parametrize("encoder", [encode_response_body_stdlib, encode_response_body_orjson])
+def test_encode_with_cache(encoder):
+    cache = ByteLRUCache(1024 * 1024)
+    encode = encode_with_post_body_cache(encoder, cache)
+
+    for is_admin, view_count, other_langs in [(True, 3, ["en"]), (False, 4, []), (True, 5, ["en", "jp"])]:
+        response = make_response(is_admin, view_count, other_langs)
+
+        assert encode(response, False) == encoder(response, False)
+
+    assert cache.hits == 2
+    assert cache.misses == 1
+    assert len(cache) == 1
+
+
+def test_encode_with_cache_post_changed():
+    cache = ByteLRUCache(1024 * 1024)
+    encode = encode_with_post_body_cache(encode_response_body_stdlib, cache)
+
+    encode(make_response(True, 3, []), False)
+    response = make_response(True, 3, [], last_modified=datetime(2021, 4, 5))
+
+    assert encode(response, False) == encode_response_body_stdlib(response, False)
+    assert cache.lookup(("quest", 7, "cht"))[1].last_modified == datetime(2021, 4, 5)
+
+
+def test_encode_with_cache_pretty_not_cached():
+    cache = ByteLRUCache(1024 * 1024)
+    encode = encode_with_post_body_cache(encode_response_body_stdlib, cache)
+    response = make_response(True, 3, [])
+
+    assert encode(response, True) == encode_response_body_stdlib(response, True)
+    assert len(cache) == 0
@@ -0,0 +1,51 @@
+from cache import ByteLRUCache
+
+
+def test_byte_lru_cached():
+    cache = ByteLRUCache(100)
+
+    cache.set("a", b"a" * 10, 10)
+
+    assert cache.lookup("a") == (True, b"a" * 10)
+    assert cache.lookup("b") == (False, None)
+    assert cache.size == 10
+    assert cache.hits == 1
+    assert cache.misses == 1
+
+
+def test_byte_lru_evict_by_size():
+    cache = ByteLRUCache(100)
+
+    cache.set("a", 1, 40)
+    cache.set("b", 2, 40)
+    cache.lookup("a")
+    cache.set("c", 3, 40)
+
+    assert cache.lookup("a") == (True, 1)
+    assert cache.lookup("b") == (False, None)
+    assert cache.lookup("c") == (True, 3)
+    assert cache.size == 80
+
+
+def test_byte_lru_replace_and_invalidate():
+    cache = ByteLRUCache(100)
+
+    cache.set("a", 1, 40)
+    cache.set("a", 2, 60)
+
+    assert cache.lookup("a") == (True, 2)
+    assert cache.size == 60
+
+    cache.invalidate("a")
+
+    assert cache.lookup("a") == (False, None)
+    assert cache.size == 0
+
+
+def test_byte_lru_too_large():
+    cache = ByteLRUCache(100)
+
+    cache.set("a", 1, 101)
+
+    assert cache.lookup("a") == (False, None)
+    assert cache.size == 0
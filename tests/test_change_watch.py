@@ -0,0 +1,88 @@
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+
+from controllers.base import ChangeEvent, ChangeOperation, ChangeSubscription, ChangeWatcher, ChangeWatchMode
+
+
+def make_subscription(col_name: str, documents=(), modified_key=None):
+    events = []
+    resets = []
+
+    def find(query, projection):
+        since = query[modified_key]["$gt"]
+
+        return [
+            {key: value for key, value in document.items() if key in projection}
+            for document in documents if document[modified_key] > since
+        ]
+
+    collection = SimpleNamespace(name=col_name, database=SimpleNamespace(name="db"), find=find)
+    subscription = ChangeSubscription(
+        collection, events.append, lambda: resets.append(True), fields=("k",), modified_key=modified_key
+    )
+
+    return subscription, events, resets
+
+
+def test_change_watcher_invalid_mode():
+    with pytest.raises(ValueError):
+        ChangeWatcher("unknown", 1)
+
+
+def test_change_watcher_disabled():
+    watcher = ChangeWatcher(ChangeWatchMode.OFF, 1)
+
+    assert not watcher.start([make_subscription("a")[0]])
+    assert watcher.lag is None
+
+
+def test_change_watcher_stream_change():
+    watcher = ChangeWatcher(ChangeWatchMode.STREAM, 1)
+    sub_a, events_a, resets_a = make_subscription("a")
+    sub_b, events_b, _ = make_subscription("b")
+
+    assert watcher.handle_stream_change(
+        {"operationType": "update", "ns": {"db": "db", "coll": "a"}, "fullDocument": {"k": 1}}, [sub_a, sub_b]
+    )
+    assert watcher.handle_stream_change({"operationType": "delete", "ns": {"db": "db", "coll": "a"}}, [sub_a, sub_b])
+    assert watcher.handle_stream_change({"operationType": "drop", "ns": {"db": "db", "coll": "a"}}, [sub_a, sub_b])
+
+    assert events_a == [ChangeEvent(ChangeOperation.UPDATE, {"k": 1}), ChangeEvent(ChangeOperation.DELETE, None)]
+    assert resets_a == [True]
+    assert not events_b
+
+    # Stream invalidated
+    assert not watcher.handle_stream_change({"operationType": "invalidate"}, [sub_a, sub_b])
+    assert resets_a == [True, True]
+    assert watcher.stats.resets == 1
+
+
+def test_change_watcher_stream_pipeline():
+    sub_a, _, _ = make_subscription("a", modified_key="m")
+    sub_b, _, _ = make_subscription("b")
+
+    match, project = ChangeWatcher.get_stream_pipeline([sub_a, sub_b])
+
+    matches = match["$match"]["$or"]
+    assert matches[0]["ns.coll"] == "a"
+    assert {"updateDescription.updatedFields.m": {"$exists": True}} in matches[0]["$or"]
+    assert matches[1] == {"ns.coll": "b"}
+    assert project["$project"]["fullDocument.k"] == 1
+
+
+def test_change_watcher_poll_collection():
+    now = datetime.utcnow()
+    documents = [{"k": 1, "m": now - timedelta(seconds=5)}, {"k": 2, "m": now}, {"k": 3, "m": now}]
+    watcher = ChangeWatcher(ChangeWatchMode.POLL, 1)
+    subscription, events, _ = make_subscription("a", documents, modified_key="m")
+
+    since = watcher.poll_collection(subscription, now - timedelta(seconds=1))
+
+    assert since == now
+    assert [event.document["k"] for event in events] == [2, 3]
+    assert all(event.operation == ChangeOperation.POLLED for event in events)
+
+    assert watcher.poll_collection(subscription, since) == since
+    assert len(events) == 2
@@ -0,0 +1,52 @@
+from types import SimpleNamespace
+
+from controllers.base import CommandStats, record_command_stats
+from controllers.base.command_stats import COMMAND_STATS_LISTENER, EndpointCommandStats
+
+
+def issue_command(duration_micros: int = 1000, failed: bool = False):
+    COMMAND_STATS_LISTENER.started(SimpleNamespace(command={"find": "col"}))
+
+    if failed:
+        COMMAND_STATS_LISTENER.failed(SimpleNamespace(duration_micros=duration_micros))
+    else:
+        COMMAND_STATS_LISTENER.succeeded(SimpleNamespace(reply={"ok": 1}, duration_micros=duration_micros))
+
+
+def test_command_stats_nested():
+    issue_command()  # Not recording
+
+    with record_command_stats() as outer:
+        issue_command()
+
+        with record_command_stats() as inner:
+            issue_command(2000, failed=True)
+
+        issue_command()
+
+    assert outer.count == 3
+    assert outer.failed_count == 1
+    assert outer.duration == 0.004
+    assert outer.request_bytes > 0 and outer.reply_bytes > 0
+
+    assert inner.count == 1
+    assert inner.duration == 0.002
+    assert inner.reply_bytes == 0
+
+
+def test_command_stats_server_timing():
+    stats = CommandStats(count=3, duration=0.0125, request_bytes=100, reply_bytes=200)
+
+    assert stats.to_server_timing() == 'db;dur=12.500;desc="3 commands, 300 bytes"'
+
+
+def test_endpoint_command_stats():
+    endpoint_stats = EndpointCommandStats()
+    endpoint_stats.record("posts.quest.get", CommandStats(count=2, duration=0.5))
+    endpoint_stats.record("posts.quest.get", CommandStats(count=3, duration=0.25))
+
+    snapshot = endpoint_stats.snapshot()
+
+    assert snapshot["posts.quest.get"].request_count == 2
+    assert snapshot["posts.quest.get"].commands.count == 5
+    assert snapshot["posts.quest.get"].commands.duration == 0.75
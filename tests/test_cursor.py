@@ -0,0 +1,37 @@
+from datetime import datetime
+
+import pytest
+
+from controllers.base.cursor import decode_post_list_cursor, encode_post_list_cursor, is_post_list_cursor_valid
+
+
+def test_cursor_round_trip():
+    last_modified = datetime(2021, 3, 4, 5, 6, 7, 891000)
+
+    assert decode_post_list_cursor(encode_post_list_cursor(last_modified, 87)) == (last_modified, 87)
+
+
+@pytest.mark.parametrize("cursor", ["invalid", "", "WzFd", "eyJhIjogMX0="])
+def test_cursor_malformed(cursor):
+    with pytest.raises(ValueError):
+        decode_post_list_cursor(cursor)
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        "Wzk5OTk5OTk5OTk5OTk5OTk5OTk5LCAxXQ==",  # [99999999999999999999, 1]
+        "W3RydWUsIDFd",  # [true, 1]
+        "WzEsIGZhbHNlXQ==",  # [1, false]
+    ]
+)
+def test_cursor_out_of_range_or_bool(cursor):
+    with pytest.raises(ValueError):
+        decode_post_list_cursor(cursor)
+
+
+def test_cursor_valid():
+    assert is_post_list_cursor_valid(encode_post_list_cursor(datetime(2021, 3, 4), 87))
+    assert is_post_list_cursor_valid(None)
+    assert is_post_list_cursor_valid("")
+    assert not is_post_list_cursor_valid("invalid")
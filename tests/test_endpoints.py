@@ -1,8 +1,23 @@
+from datetime import datetime, timedelta
+
+import pytest
 from flask import url_for
 
+import endpoints.post_analysis
+import endpoints.post_quest
+from cache import CircuitOpenError
+from controllers import (
+    GoogleUserContext, GoogleUserDataKeys, PostIDUnavailableError, QuestPostController, UnitAnalysisPostController,
+    UnitAnalysisPostHistoryController,
+)
+
 from endpoints import EPUserLoginParam
-from endpoints.post_quest import EPQuestPostListParam, EPQuestPostGetParam
-from responses import ResponseCodeCollection, QuestPostListResponseKey
+from endpoints.post_analysis import EPAnalysisPostHistoryParam
+from endpoints.post_quest import (
+    EPQuestPostEditBundleParam, EPQuestPostHistoryParam, EPQuestPostListParam, EPQuestPostGetParam,
+    EPQuestPostPublishBundleParam, EPQuestPostPublishParam,
+)
+from responses import ResponseCodeCollection, QuestPostHistoryResponseKey, QuestPostListResponseKey
 
 
 def test_root(client):
@@ -71,3 +86,240 @@ def test_quests_post_get(client):
 
     assert response[QuestPostListResponseKey.CODE] == ResponseCodeCollection.FAILED_POST_NOT_EXISTS.code
     assert not response[QuestPostListResponseKey.SUCCESS]
+
+
+@pytest.mark.parametrize("cursor", ["invalid", "Wzk5OTk5OTk5OTk5OTk5OTk5OTk5LCAxXQ=="])
+def test_quest_posts_list_invalid_cursor(client, cursor):
+    r = client.get(
+        url_for("posts.quest.list"),
+        query_string={
+            EPQuestPostListParam.GOOGLE_UID: "Test",
+            EPQuestPostListParam.LIMIT: 30,
+            EPQuestPostListParam.LANG_CODE: "en",
+            EPQuestPostListParam.CURSOR: cursor
+        }
+    )
+
+    assert r.status_code == 400
+
+    response = r.json
+
+    assert response[QuestPostListResponseKey.CODE] == ResponseCodeCollection.FAILED_INVALID_CURSOR.code
+    assert not response[QuestPostListResponseKey.SUCCESS]
+
+
+@pytest.mark.parametrize("endpoint", ["posts.quest.list", "posts.analysis.list"])
+def test_posts_list_invalid_cursor_before_user_lookup(client, monkeypatch, endpoint):
+    def fail_on_lookup(*_):
+        pytest.fail("User looked up for a malformed cursor")
+
+    for module in (endpoints.post_quest, endpoints.post_analysis):
+        monkeypatch.setattr(module, "get_user_context", fail_on_lookup)
+
+    r = client.get(
+        url_for(endpoint),
+        query_string={EPQuestPostListParam.LANG_CODE: "en", EPQuestPostListParam.CURSOR: "invalid"},
+        headers={"If-None-Match": '"any"'}
+    )
+
+    assert r.status_code == 400
+    assert r.json[QuestPostListResponseKey.CODE] == ResponseCodeCollection.FAILED_INVALID_CURSOR.code
+
+
+def test_quest_post_get_db_unavailable(client, monkeypatch):
+    def raise_circuit_open(*_):
+        raise CircuitOpenError()
+
+    monkeypatch.setattr(endpoints.post_quest, "get_user_context", raise_circuit_open)
+
+    r = client.get(
+        url_for("posts.quest.get"),
+        query_string={
+            EPQuestPostGetParam.GOOGLE_UID: "Test",
+            EPQuestPostGetParam.SEQ_ID: 1,
+            EPQuestPostGetParam.LANG_CODE: "cht"
+        }
+    )
+
+    assert r.status_code == 503
+    assert r.json[QuestPostListResponseKey.CODE] == ResponseCodeCollection.FAILED_DB_UNAVAILABLE.code
+
+
+def test_quest_post_history(client):
+    seq_id = QuestPostController.publish_post("Title", "en", "General", "Video", [], "Addendum")
+    for idx in range(3):
+        QuestPostController.edit_post(seq_id, "Title", "en", "General", "Video", [], "Addendum", f"Note {idx}")
+
+    r = client.get(
+        url_for("posts.quest.history"),
+        query_string={
+            EPQuestPostHistoryParam.SEQ_ID: seq_id,
+            EPQuestPostHistoryParam.LANG_CODE: "en",
+            EPQuestPostHistoryParam.START: 1,
+            EPQuestPostHistoryParam.LIMIT: 1
+        }
+    )
+
+    assert r.status_code == 200
+
+    response = r.json
+
+    assert response[QuestPostHistoryResponseKey.CODE] == ResponseCodeCollection.SUCCESS.code
+    assert response[QuestPostHistoryResponseKey.START_IDX] == 1
+    assert response[QuestPostHistoryResponseKey.HAS_NEXT]
+    notes = response[QuestPostHistoryResponseKey.MODIFY_NOTES]
+
+    assert [note[QuestPostHistoryResponseKey.MODIFY_NOTE] for note in notes] == ["Note 1"]
+
+
+def test_analysis_post_history(client):
+    seq_id = 99999999999998
+    now = datetime.utcnow()
+
+    UnitAnalysisPostHistoryController.add_note(seq_id, "cht", now, "Note 0")
+    UnitAnalysisPostHistoryController.add_note(seq_id, "cht", now + timedelta(seconds=1), "Note 1")
+
+    r = client.get(
+        url_for("posts.analysis.history"),
+        query_string={
+            EPAnalysisPostHistoryParam.SEQ_ID: seq_id,
+            EPAnalysisPostHistoryParam.LANG_CODE: "cht",
+            EPAnalysisPostHistoryParam.LIMIT: 1
+        }
+    )
+
+    assert r.status_code == 200
+
+    response = r.json
+
+    assert response[QuestPostHistoryResponseKey.START_IDX] == 0
+    assert response[QuestPostHistoryResponseKey.HAS_NEXT]
+    notes = response[QuestPostHistoryResponseKey.MODIFY_NOTES]
+
+    assert [note[QuestPostHistoryResponseKey.MODIFY_NOTE] for note in notes] == ["Note 1"]
+
+
+@pytest.mark.parametrize("endpoint", ["posts.quest.history", "posts.analysis.history"])
+@pytest.mark.parametrize("param", [EPQuestPostHistoryParam.START, EPQuestPostHistoryParam.LIMIT])
+def test_post_history_negative_range(client, endpoint, param):
+    r = client.get(
+        url_for(endpoint),
+        query_string={
+            EPQuestPostHistoryParam.SEQ_ID: 1,
+            EPQuestPostHistoryParam.LANG_CODE: "en",
+            param: -1
+        }
+    )
+
+    assert r.status_code == 422
+
+
+def test_quest_post_publish_bundle_published_concurrently(client, monkeypatch):
+    def raise_id_unavailable(*_, **__):
+        raise PostIDUnavailableError()
+
+    monkeypatch.setattr(
+        endpoints.post_quest, "get_user_context", lambda _: GoogleUserContext({GoogleUserDataKeys.IS_SITE_ADMIN: True})
+    )
+    monkeypatch.setattr(QuestPostController.get_instance(), "is_id_langs_available", lambda *_: True)
+    monkeypatch.setattr(QuestPostController.get_instance(), "publish_post_bundle", raise_id_unavailable)
+
+    post = {
+        EPQuestPostPublishParam.TITLE: "Title",
+        EPQuestPostPublishParam.GENERAL_INFO: "General",
+        EPQuestPostPublishParam.VIDEO: "Video",
+        EPQuestPostPublishParam.POSITION_INFO: [],
+        EPQuestPostPublishParam.ADDENDUM: "Addendum"
+    }
+
+    r = client.post(
+        url_for("posts.quest.publish_bundle"),
+        json={
+            EPQuestPostPublishBundleParam.GOOGLE_UID: "Test",
+            EPQuestPostPublishBundleParam.POSTS: [
+                post | {EPQuestPostPublishBundleParam.POST_LANG_CODE: "cht"},
+                post | {EPQuestPostPublishBundleParam.POST_LANG_CODE: "en"}
+            ]
+        }
+    )
+
+    assert r.status_code == 400
+    assert r.json[QuestPostListResponseKey.CODE] == ResponseCodeCollection.FAILED_POST_ID_UNAVAILABLE.code
+
+
+@pytest.mark.parametrize("endpoint", [
+    "posts.quest.edit_bundle", "posts.analysis.edit_bundle.chara", "posts.analysis.edit_bundle.dragon"
+])
+def test_post_edit_bundle_duplicate_langs(client, monkeypatch, endpoint):
+    def fail_on_update(*_, **__):
+        pytest.fail("Posts updated with duplicate languages")
+
+    for module in (endpoints.post_quest, endpoints.post_analysis):
+        monkeypatch.setattr(
+            module, "get_user_context", lambda _: GoogleUserContext({GoogleUserDataKeys.IS_SITE_ADMIN: True})
+        )
+    for controller in (QuestPostController.get_instance(), UnitAnalysisPostController.get_instance()):
+        monkeypatch.setattr(controller, "update_posts", fail_on_update)
+
+    post = {EPQuestPostEditBundleParam.POST_LANG_CODE: "en", EPQuestPostEditBundleParam.POST_MODIFY_NOTE: "Note"}
+
+    r = client.post(
+        url_for(endpoint),
+        json={
+            EPQuestPostEditBundleParam.GOOGLE_UID: "Test",
+            EPQuestPostEditBundleParam.SEQ_ID: 1,
+            EPQuestPostEditBundleParam.POSTS: [post, post]
+        }
+    )
+
+    assert r.status_code == 400
+    assert r.json[QuestPostListResponseKey.CODE] == ResponseCodeCollection.FAILED_DUPLICATE_LANGS.code
+
+
+def test_quest_posts_list_not_modified(client):
+    query_string = {
+        EPQuestPostListParam.GOOGLE_UID: "Test",
+        EPQuestPostListParam.START: 0,
+        EPQuestPostListParam.LIMIT: 30,
+        EPQuestPostListParam.LANG_CODE: "en"
+    }
+
+    r = client.get(url_for("posts.quest.list"), query_string=query_string)
+
+    assert r.status_code == 200
+    assert r.headers["ETag"]
+
+    r = client.get(url_for("posts.quest.list"), query_string=query_string,
+                   headers={"If-None-Match": r.headers["ETag"]})
+
+    assert r.status_code == 304
+    assert not r.data
+
+
+def test_quest_post_get_round_trips(client, max_round_trips):
+    with max_round_trips(4):
+        r = client.get(
+            url_for("posts.quest.get"),
+            query_string={
+                EPQuestPostGetParam.GOOGLE_UID: "Test",
+                EPQuestPostGetParam.SEQ_ID: 99999999999999,
+                EPQuestPostGetParam.LANG_CODE: "cht",
+                EPQuestPostGetParam.INCREASE_COUNT: 1
+            }
+        )
+
+    assert r.status_code == 404
+
+
+def test_quest_posts_list_round_trips(client, max_round_trips):
+    with max_round_trips(4):
+        r = client.get(
+            url_for("posts.quest.list"),
+            query_string={
+                EPQuestPostListParam.GOOGLE_UID: "Test",
+                EPQuestPostListParam.LIMIT: 30,
+                EPQuestPostListParam.LANG_CODE: "en"
+            }
+        )
+
+    assert r.status_code == 200
@@ -0,0 +1,42 @@
+from pymongo import ASCENDING, DESCENDING, IndexModel
+
+from controllers import QuestPostController, QuestPostKey, UnitAnalysisPostController
+from controllers.base import get_mongo_client
+from controllers.base.config import SINGLE_DB_NAME
+from controllers.base.index import sync_collection_indexes
+
+
+def test_sync_indexes_creates_missing_only():
+    col = get_mongo_client().get_database(SINGLE_DB_NAME).get_collection("index_sync_test")
+    col.create_index([("a", ASCENDING)], name="existing_a")
+
+    index_models = [
+        IndexModel([("a", ASCENDING)]),
+        IndexModel([("a", ASCENDING), ("b", DESCENDING)]),
+    ]
+
+    report = sync_collection_indexes(col, index_models)
+
+    assert report.created == ["a_1_b_-1"]
+    assert report.redundant == ["existing_a"]
+    assert "a_1_b_-1" in col.index_information()
+
+    assert not sync_collection_indexes(col, index_models).created
+
+
+def test_sync_indexes_reports_conflicting():
+    col = get_mongo_client().get_database(SINGLE_DB_NAME).get_collection("index_sync_conflict_test")
+    col.create_index([("a", ASCENDING)])
+
+    report = sync_collection_indexes(col, [IndexModel([("a", ASCENDING)], unique=True)], dry_run=True)
+
+    assert report.conflicting == ["a_1"]
+    assert not report.created
+
+
+def test_post_modified_index_declared():
+    # Polling the post changes filters by the last modified timestamp only
+    for controller in (QuestPostController, UnitAnalysisPostController):
+        index_keys = [list(model.document["key"].items()) for model in controller.get_index_models()]
+
+        assert [(QuestPostKey.DT_LAST_MODIFIED, DESCENDING)] in index_keys
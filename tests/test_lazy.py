@@ -0,0 +1,50 @@
+import os
+
+from controllers.base import LazyController
+
+
+class _Counter:
+    created = 0
+
+    def __init__(self):
+        _Counter.created += 1
+        self.pid = os.getpid()
+
+
+def test_lazy_controller_created_on_first_use_only():
+    created = _Counter.created
+    controller = LazyController(_Counter)
+
+    assert _Counter.created == created
+
+    assert controller.pid == os.getpid()
+    assert controller.get_instance() is controller.get_instance()
+    assert _Counter.created == created + 1
+
+
+def test_lazy_controller_created_instance_not_creating():
+    created = _Counter.created
+    controller = LazyController(_Counter)
+
+    assert controller.get_created_instance() is None
+    assert _Counter.created == created
+
+    instance = controller.get_instance()
+
+    assert controller.get_created_instance() is instance
+
+
+def test_lazy_controller_recreated_after_fork():
+    controller = LazyController(_Counter)
+    parent_instance = controller.get_instance()
+
+    read_fd, write_fd = os.pipe()
+    if (pid := os.fork()) == 0:
+        child_instance = controller.get_instance()
+        is_recreated = child_instance is not parent_instance and child_instance.pid == os.getpid()
+        os.write(write_fd, b"1" if is_recreated else b"0")
+        os._exit(0)
+
+    os.waitpid(pid, 0)
+
+    assert os.read(read_fd, 1) == b"1"
@@ -0,0 +1,112 @@
+import threading
+
+import pytest
+from prometheus_client import REGISTRY, CollectorRegistry, Counter
+from prometheus_client.parser import text_string_to_metric_families
+
+from controllers import GoogleUserDataController, QuestPostController
+from controllers.base import POOL_STATS
+from endpoints.metrics import ProcessMetricsState, update_process_metrics
+from responses import ResponseCodeCollection
+
+
+METRICS_TOKEN = "test-metrics-token"
+
+
+@pytest.fixture(autouse=True)
+def metrics_token(monkeypatch):
+    monkeypatch.setenv("METRICS_TOKEN", METRICS_TOKEN)
+
+
+def get_samples(client) -> dict:
+    response = client.get("/metrics", headers={"Authorization": f"Bearer {METRICS_TOKEN}"})
+
+    assert response.status_code == 200
+
+    return {
+        (sample.name, tuple(sorted(sample.labels.items()))): sample.value
+        for family in text_string_to_metric_families(response.get_data(as_text=True))
+        for sample in family.samples
+    }
+
+
+def test_metrics_requests(client):
+    key_count = ("http_requests_total", (("endpoint", "misc.root"), ("method", "GET"), ("status", "200")))
+    key_code = (
+        "response_codes_total", (("code", str(ResponseCodeCollection.SUCCESS.code)), ("endpoint", "misc.root"))
+    )
+
+    before = get_samples(client)
+
+    client.get("/")
+    client.get("/")
+
+    after = get_samples(client)
+
+    assert after[key_count] - before.get(key_count, 0) == 2
+    assert after[key_code] - before.get(key_code, 0) == 2
+    assert after[("http_request_duration_seconds_count", (("endpoint", "misc.root"),))] >= 2
+
+
+def test_metrics_process_stats(client):
+    # Statistics of the controllers not created yet are skipped
+    QuestPostController.get_instance()
+    GoogleUserDataController.get_instance()
+
+    samples = get_samples(client)
+
+    assert ("mongo_pool_connections", (("state", "open"),)) in samples
+    assert ("cache_lookups_total", (("cache", "quest.read"), ("result", "hit"))) in samples
+    assert ("cache_lookups_total", (("cache", "user"), ("result", "miss"))) in samples
+    assert ("mongo_pool_checkouts_total", (("result", "succeeded"),)) in samples
+
+
+def test_process_metrics_state_exports_increases():
+    registry = CollectorRegistry()
+    counter = Counter("test_process_metrics_state", "Test counter.", registry=registry)
+    state = ProcessMetricsState()
+
+    state.export_total(counter, 3)
+    state.export_total(counter, 5)
+    state.export_total(counter, 5)
+
+    assert registry.get_sample_value("test_process_metrics_state_total") == 5
+
+
+def test_process_metrics_concurrent_updates_export_once(monkeypatch):
+    def get_checkouts():
+        return REGISTRY.get_sample_value("mongo_pool_checkouts_total", {"result": "succeeded"})
+
+    update_process_metrics(force=True)
+    before = get_checkouts()
+
+    monkeypatch.setattr(POOL_STATS, "checkout_count", POOL_STATS.checkout_count + 100)
+
+    threads = [threading.Thread(target=update_process_metrics, kwargs={"force": True}) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert get_checkouts() - before == 100
+
+
+def test_process_metrics_failure_not_failing_request(client, monkeypatch, caplog):
+    monkeypatch.setattr("endpoints.metrics.POOL_STATS", None)
+
+    assert client.get("/").status_code == 200
+
+    update_process_metrics(force=True)
+
+    assert "Failed to update the process metrics" in caplog.text
+
+
+def test_metrics_disabled_by_default(client, monkeypatch):
+    monkeypatch.delenv("METRICS_TOKEN")
+
+    assert client.get("/metrics", headers={"Authorization": f"Bearer {METRICS_TOKEN}"}).status_code == 404
+
+
+@pytest.mark.parametrize("headers", [{}, {"Authorization": "Bearer wrong-token"}, {"Authorization": METRICS_TOKEN}])
+def test_metrics_token_required(client, headers):
+    assert client.get("/metrics", headers=headers).status_code == 404
@@ -0,0 +1,92 @@
+import pytest
+from pymongo.errors import BulkWriteError
+
+from controllers import PostIDUnavailableError, QuestPostController, QuestPostKey
+from controllers.results import UpdateResult
+
+
+def test_publish_post_bundle():
+    seq_id = QuestPostController.publish_post_bundle([
+        ("Title", "cht", "General", "Video", [], "Addendum"),
+        ("Title EN", "en", "General", "Video", [], "Addendum")
+    ])
+
+    assert QuestPostController.get_post(seq_id, "cht", False).data[QuestPostKey.TITLE] == "Title"
+    assert QuestPostController.get_post(seq_id, "en", False).data[QuestPostKey.TITLE] == "Title EN"
+
+    assert QuestPostController.is_id_langs_available(seq_id, ["jp"])
+    assert not QuestPostController.is_id_langs_available(seq_id, ["jp", "en"])
+    assert not QuestPostController.is_id_langs_available(None, ["en", "en"])
+
+
+def test_publish_post_bundle_id_unavailable():
+    seq_id = QuestPostController.publish_post_bundle([("Title JP", "jp", "General", "Video", [], "Addendum")])
+    with pytest.raises(PostIDUnavailableError):
+        QuestPostController.publish_post_bundle([
+            ("Title", "cht", "General", "Video", [], "Addendum"),
+            ("Title JP 2", "jp", "General", "Video", [], "Addendum")
+        ], seq_id=seq_id)
+
+    # The post inserted before the existing one is deleted, and its list entry is never written
+    assert QuestPostController.is_id_langs_available(seq_id, ["cht"])
+    assert QuestPostController.list_entries.count_documents({QuestPostKey.SEQ_ID: seq_id}) == 1
+    assert QuestPostController.get_post(seq_id, "jp", False).data[QuestPostKey.TITLE] == "Title JP"
+
+
+def test_edit_post_bundle():
+    seq_id = QuestPostController.publish_post_bundle([
+        ("Title", "cht", "General", "Video", [], "Addendum"),
+        ("Title EN", "en", "General", "Video", [], "Addendum")
+    ])
+
+    results = QuestPostController.edit_post_bundle(seq_id, [
+        ("Edited", "cht", "General", "Video", [], "Addendum", "Note CHT"),
+        ("Edited EN", "en", "General", "Video", [], "Addendum", "Note EN"),
+        ("Edited JP", "jp", "General", "Video", [], "Addendum", "Note JP")
+    ])
+
+    assert results == {"cht": UpdateResult.UPDATED, "en": UpdateResult.UPDATED, "jp": UpdateResult.NOT_FOUND}
+
+    post = QuestPostController.get_post(seq_id, "en", False).data
+
+    assert post[QuestPostKey.TITLE] == "Edited EN"
+    assert [note[QuestPostKey.MODIFY_NOTE] for note in post[QuestPostKey.MODIFY_NOTES]] == ["Note EN"]
+
+    notes, _ = QuestPostController.get_modify_notes(seq_id, "cht")
+
+    assert [note[QuestPostKey.MODIFY_NOTE] for note in notes] == ["Note CHT"]
+
+
+def test_edit_post_bundle_partial_failure(monkeypatch):
+    controller = QuestPostController.get_instance()
+    completed = {}
+
+    def raise_on_second(requests, ordered):
+        assert not ordered
+        raise BulkWriteError({"writeErrors": [{"index": 1, "code": 2, "errmsg": "Failed"}], "nMatched": 2})
+
+    def record_list_update(seq_id, updates, _):
+        completed["entries"] = (seq_id, [lang_code for lang_code, _ in updates])
+
+    monkeypatch.setattr(controller, "bulk_write", raise_on_second)
+    # `jp` does not exist, and `en` failed to be written
+    monkeypatch.setattr(
+        controller, "distinct", lambda key, cond: [lang for lang in cond[key]["$in"] if lang in ("cht", "en")]
+    )
+    monkeypatch.setattr(
+        controller.history, "add_notes", lambda seq_id, now, notes: completed.setdefault("notes", (seq_id, notes))
+    )
+    monkeypatch.setattr(controller.list_entries, "update_entries", record_list_update)
+    monkeypatch.setattr(controller.versions.list_version, "bump", lambda *langs: completed.setdefault("bump", langs))
+    monkeypatch.setattr(controller.reads, "invalidate", lambda seq_id: completed.setdefault("reads", seq_id))
+
+    with pytest.raises(BulkWriteError):
+        controller.edit_post_bundle(7, [
+            ("Edited", "cht", "General", "Video", [], "Addendum", "Note CHT"),
+            ("Edited EN", "en", "General", "Video", [], "Addendum", "Note EN"),
+            ("Edited JP", "jp", "General", "Video", [], "Addendum", "Note JP")
+        ])
+
+    assert completed == {
+        "notes": (7, [("cht", "Note CHT")]), "entries": (7, ["cht"]), "bump": ("cht",), "reads": 7
+    }
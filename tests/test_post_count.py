@@ -0,0 +1,37 @@
+from controllers.base.post_count import PostCountCache
+
+
+def test_post_count_cached():
+    cache = PostCountCache(3600)
+    counted = []
+
+    def counter():
+        counted.append(True)
+        return 5
+
+    assert cache.get("en", counter) == 5
+    assert cache.get("en", counter) == 5
+    assert len(counted) == 1
+    assert cache.hits == 1
+    assert cache.misses == 1
+
+
+def test_post_count_increment():
+    cache = PostCountCache(3600)
+
+    cache.get("en", lambda: 5)
+    cache.get(None, lambda: 12)
+    cache.increment("en")
+    cache.increment("jp")
+
+    assert cache.get("en", lambda: 0) == 6
+    assert cache.get(None, lambda: 0) == 14
+    assert cache.get("jp", lambda: 3) == 3
+
+
+def test_post_count_reconciled():
+    cache = PostCountCache(0)
+
+    assert cache.get("en", lambda: 5) == 5
+    assert cache.get("en", lambda: 7) == 7
+    assert cache.hits == 0
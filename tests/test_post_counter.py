@@ -0,0 +1,29 @@
+from controllers import PostCounterController, QuestPostController, QuestPostKey
+from controllers.base import PostCounterKey
+
+
+def test_view_counts_filter():
+    counter_filter = PostCounterController.get_view_counts_filter("quest", [(1, "cht"), (2, "en")])
+
+    assert counter_filter == {
+        PostCounterKey.COLLECTION: "quest",
+        "$or": [
+            {PostCounterKey.SEQ_ID: 1, PostCounterKey.LANG_CODE: "cht"},
+            {PostCounterKey.SEQ_ID: 2, PostCounterKey.LANG_CODE: "en"}
+        ]
+    }
+
+
+def test_view_counts_attached():
+    posts = [
+        {QuestPostKey.SEQ_ID: 1, QuestPostKey.LANG_CODE: "cht"},
+        {QuestPostKey.SEQ_ID: 2, QuestPostKey.LANG_CODE: "en"}
+    ]
+    view_counts = PostCounterController.to_view_counts([
+        {PostCounterKey.SEQ_ID: 1, PostCounterKey.LANG_CODE: "cht", PostCounterKey.VIEW_COUNT: 7}
+    ])
+
+    QuestPostController.views.attach_view_counts(posts, view_counts)
+
+    assert [post[QuestPostKey.VIEW_COUNT] for post in posts] == [7, 0]
+    assert QuestPostController.views.get_post_ids(posts) == [(1, "cht"), (2, "en")]
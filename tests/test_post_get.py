@@ -0,0 +1,51 @@
+from controllers import QuestPostController, QuestPostKey
+
+
+def publish_post(title: str, lang_code: str, seq_id: int = None) -> int:
+    return QuestPostController.publish_post(title, lang_code, "General", "Video", [], "Addendum", seq_id=seq_id)
+
+
+def test_get_post_exact_lang():
+    seq_id = publish_post("Title EN", "en")
+    publish_post("Title JP", "jp", seq_id)
+
+    result = QuestPostController.get_post(seq_id, "jp", False)
+
+    assert result.data[QuestPostKey.TITLE] == "Title JP"
+    assert not result.is_alt_lang
+    assert result.other_langs == ["en"]
+
+
+def test_get_post_fallback_priority():
+    seq_id = publish_post("Title EN", "en")
+    publish_post("Title JP", "jp", seq_id)
+
+    result = QuestPostController.get_post(seq_id, "cht", False, fallback_langs=["jp", "en"])
+
+    assert result.data[QuestPostKey.TITLE] == "Title JP"
+    assert result.is_alt_lang
+    assert sorted(result.other_langs) == ["en", "jp"]
+
+    result = QuestPostController.get_post(seq_id, "cht", False, fallback_langs=["en", "jp"])
+
+    assert result.data[QuestPostKey.TITLE] == "Title EN"
+
+
+def test_get_post_fallback_any_lang():
+    seq_id = publish_post("Title JP", "jp")
+
+    result = QuestPostController.get_post(seq_id, "cht", False, fallback_langs=["en"])
+
+    assert result.data[QuestPostKey.TITLE] == "Title JP"
+    assert result.is_alt_lang
+    assert result.other_langs == ["jp"]
+
+
+def test_get_post_missing():
+    seq_id = publish_post("Title", "en")
+
+    result = QuestPostController.get_post(seq_id + 1000, "en", False)
+
+    assert result.data is None
+    assert not result.is_alt_lang
+    assert result.other_langs == []
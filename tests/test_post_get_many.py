@@ -0,0 +1,99 @@
+import pytest
+from flask import url_for
+
+from controllers import GoogleUserDataController, MultilingualGetOneResult, QuestPostController, QuestPostKey
+from controllers.base.config import POST_GET_MANY_LIMIT
+from endpoints.post_quest import EPQuestPostGetManyParam
+from responses import QuestPostGetManyResponseKey, ResponseCodeCollection
+from responses.body.post_quest import QuestPostGetSuccessResponseKey
+
+
+def make_post_ids(*post_ids: tuple[int, str]) -> list[dict]:
+    return [
+        {EPQuestPostGetManyParam.POST_SEQ_ID: seq_id, EPQuestPostGetManyParam.POST_LANG_CODE: lang_code}
+        for seq_id, lang_code in post_ids
+    ]
+
+
+def test_get_posts_by_ids():
+    seq_id = QuestPostController.publish_post("Title", "en", "General", "Video", [], "Addendum")
+    QuestPostController.publish_post("Title JP", "jp", "General", "Video", [], "Addendum", seq_id=seq_id)
+
+    results = QuestPostController.get_posts_by_ids([(seq_id, "jp"), (seq_id + 1000, "en"), (seq_id, "cht")], True)
+
+    titles = [result.data[QuestPostKey.TITLE] if result.data else None for result in results]
+
+    assert titles == ["Title JP", None, "Title"]
+    assert [result.is_alt_lang for result in results] == [False, False, True]
+    assert results[0].other_langs == ["en"]
+    assert results[0].data[QuestPostKey.VIEW_COUNT] == 0
+
+    post = QuestPostController.get_post(seq_id, "jp", False).data
+
+    assert post[QuestPostKey.VIEW_COUNT] == 1
+
+
+def test_get_many_request_order(client):
+    seq_id = QuestPostController.publish_post("Title", "en", "General", "Video", [], "Addendum")
+    QuestPostController.publish_post("Title JP", "jp", "General", "Video", [], "Addendum", seq_id=seq_id)
+
+    r = client.post(
+        url_for("posts.quest.get_many"),
+        json={
+            EPQuestPostGetManyParam.GOOGLE_UID: "Test",
+            EPQuestPostGetManyParam.POSTS: make_post_ids((seq_id, "en"), (seq_id + 1000, "en"), (seq_id, "jp"))
+        }
+    )
+
+    assert r.status_code == 200
+
+    posts = r.json[QuestPostGetManyResponseKey.POSTS]
+
+    assert [post.get(QuestPostGetSuccessResponseKey.TITLE) for post in posts] == ["Title", None, "Title JP"]
+    assert posts[1] == {"code": ResponseCodeCollection.FAILED_POST_NOT_EXISTS.code, "success": False}
+
+
+def test_get_many_too_many_posts(client, monkeypatch):
+    def fail_on_get(*_, **__):
+        pytest.fail("Posts fetched exceeding the limit")
+
+    monkeypatch.setattr(QuestPostController.get_instance(), "get_posts_by_ids", fail_on_get)
+
+    post_ids = [(seq_id, "en") for seq_id in range(POST_GET_MANY_LIMIT + 1)]
+
+    r = client.post(
+        url_for("posts.quest.get_many"),
+        json={
+            EPQuestPostGetManyParam.GOOGLE_UID: "Test",
+            EPQuestPostGetManyParam.POSTS: make_post_ids(*post_ids)
+        }
+    )
+
+    assert r.status_code == 400
+    assert r.json[QuestPostGetManyResponseKey.CODE] == ResponseCodeCollection.FAILED_TOO_MANY_POSTS.code
+
+
+def test_get_many_user_looked_up_once(client, monkeypatch):
+    uids = []
+
+    def get_user_data(uid):
+        uids.append(uid)
+        return None
+
+    monkeypatch.setattr(GoogleUserDataController.get_instance(), "get_user_data", get_user_data)
+    monkeypatch.setattr(
+        QuestPostController.get_instance(), "get_posts_by_ids",
+        lambda post_ids, _: [MultilingualGetOneResult(None, False, []) for _ in post_ids]
+    )
+
+    r = client.post(
+        url_for("posts.quest.get_many"),
+        json={
+            EPQuestPostGetManyParam.GOOGLE_UID: "Lookup Once",
+            EPQuestPostGetManyParam.POSTS: make_post_ids((1, "en"), (2, "en"), (3, "jp"))
+        }
+    )
+
+    assert r.status_code == 200
+    assert len(r.json[QuestPostGetManyResponseKey.POSTS]) == 3
+    assert uids == ["Lookup Once"]
@@ -0,0 +1,87 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from controllers import QuestPostController, QuestPostHistoryController, QuestPostKey
+from controllers.base.config import POST_MODIFY_NOTES_EMBEDDED
+
+
+def publish_post() -> int:
+    return QuestPostController.publish_post("Title", "en", "General", "Video", [], "Addendum")
+
+
+def edit_post(seq_id: int, modify_note: str):
+    QuestPostController.edit_post(seq_id, "Title", "en", "General", "Video", [], "Addendum", modify_note)
+
+
+def test_add_note():
+    seq_id = publish_post()
+    now = datetime.utcnow().replace(microsecond=0)
+
+    QuestPostHistoryController.add_note(seq_id, "en", now, "Note")
+
+    notes, has_next = QuestPostHistoryController.get_notes(seq_id, "en")
+
+    assert notes == [{QuestPostKey.MODIFY_DT: now, QuestPostKey.MODIFY_NOTE: "Note"}]
+    assert not has_next
+    assert QuestPostHistoryController.get_notes(seq_id, "jp") == ([], False)
+
+
+def test_add_notes():
+    seq_id = publish_post()
+    now = datetime.utcnow()
+
+    QuestPostHistoryController.add_notes(seq_id, now, [("en", "Note EN"), ("jp", "Note JP")])
+    QuestPostHistoryController.add_notes(seq_id, now, [])
+
+    assert [note[QuestPostKey.MODIFY_NOTE] for note in QuestPostHistoryController.get_notes(seq_id, "en")[0]] \
+           == ["Note EN"]
+    assert [note[QuestPostKey.MODIFY_NOTE] for note in QuestPostHistoryController.get_notes(seq_id, "jp")[0]] \
+           == ["Note JP"]
+
+
+def test_get_notes_paginated():
+    seq_id = publish_post()
+    now = datetime.utcnow()
+
+    for idx in range(5):
+        QuestPostHistoryController.add_note(seq_id, "en", now + timedelta(seconds=idx), f"Note {idx}")
+
+    notes, has_next = QuestPostHistoryController.get_notes(seq_id, "en", start=0, limit=2)
+
+    assert [note[QuestPostKey.MODIFY_NOTE] for note in notes] == ["Note 4", "Note 3"]
+    assert has_next
+
+    notes, has_next = QuestPostHistoryController.get_notes(seq_id, "en", start=2, limit=3)
+
+    assert [note[QuestPostKey.MODIFY_NOTE] for note in notes] == ["Note 2", "Note 1", "Note 0"]
+    assert not has_next
+
+    notes, has_next = QuestPostHistoryController.get_notes(seq_id, "en", start=1)
+
+    assert len(notes) == 4
+    assert not has_next
+
+    with pytest.raises(ValueError):
+        QuestPostHistoryController.get_notes(seq_id, "en", start=-1)
+
+    with pytest.raises(ValueError):
+        QuestPostHistoryController.get_notes(seq_id, "en", limit=-1)
+
+
+def test_embedded_notes_capped():
+    seq_id = publish_post()
+
+    edit_count = POST_MODIFY_NOTES_EMBEDDED + 2
+    for idx in range(edit_count):
+        edit_post(seq_id, f"Note {idx}")
+
+    post = QuestPostController.get_post(seq_id, "en", False).data
+
+    assert [note[QuestPostKey.MODIFY_NOTE] for note in post[QuestPostKey.MODIFY_NOTES]] \
+           == [f"Note {idx}" for idx in range(2, edit_count)]
+
+    notes, has_next = QuestPostController.get_modify_notes(seq_id, "en")
+
+    assert len(notes) == edit_count
+    assert not has_next
@@ -0,0 +1,39 @@
+from controllers import QuestPostController, QuestPostKey
+
+
+def get_list_entry(seq_id: int, lang_code: str):
+    list_entries = QuestPostController.list_entries
+
+    return list_entries.find_one(list_entries.get_entry_filter(seq_id, lang_code), projection={"_id": 0})
+
+
+def test_list_entries_maintained():
+    seq_id = QuestPostController.publish_post("Title", "en", "General", "Video", [], "Addendum")
+
+    entry = get_list_entry(seq_id, "en")
+
+    assert entry.keys() == QuestPostController.post_list_projection.keys()
+    assert entry[QuestPostKey.TITLE] == "Title"
+
+    QuestPostController.edit_post(seq_id, "Edited", "en", "General", "Video", [], "Addendum", "Note")
+    QuestPostController.get_post(seq_id, "en", True)
+
+    entry = get_list_entry(seq_id, "en")
+    post = QuestPostController.get_post(seq_id, "en", False).data
+
+    assert entry[QuestPostKey.TITLE] == "Edited"
+    assert entry[QuestPostKey.DT_LAST_MODIFIED] == post[QuestPostKey.DT_LAST_MODIFIED]
+    view_counts = QuestPostController.counters.get_view_counts(QuestPostController.collection_name, [(seq_id, "en")])
+
+    assert QuestPostKey.VIEW_COUNT not in entry
+    assert post[QuestPostKey.VIEW_COUNT] == view_counts[(seq_id, "en")] == 1
+
+
+def test_list_entries_rebuild():
+    seq_id = QuestPostController.publish_post("Title", "en", "General", "Video", [], "Addendum")
+    QuestPostController.list_entries.delete_many({})
+
+    entry_count = QuestPostController.rebuild_list_entries()
+
+    assert entry_count == QuestPostController.count_documents({})
+    assert get_list_entry(seq_id, "en")[QuestPostKey.TITLE] == "Title"
@@ -0,0 +1,146 @@
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+
+from controllers import MultilingualGetOneResult, UnitAnalysisPostKey, UnitAnalysisPostType
+from controllers.results import UpdateResult
+from responses import (
+    AnalysisPostGetManyResponse, AnalysisPostGetManyResponseKey, AnalysisPostGetSuccessResponse,
+    AnalysisPostGetSuccessResponseKey, QuestPostEditBundleSuccessResponse, QuestPostEditBundleSuccessResponseKey,
+    QuestPostHistoryResponse, QuestPostHistoryResponseKey, ResponseCodeCollection,
+)
+from responses.body.fields import EntryField, ResponseField, compile_serializer
+
+now = datetime(2021, 3, 4, 5, 6, 7)
+
+
+def test_compile_serializer():
+    serializer = compile_serializer([
+        ResponseField("a", "_a"),
+        ResponseField("b", "_doc", "x"),
+        ResponseField("c", "_nested.value"),
+        ResponseField("d", "_doc", "entries", entry_fields=(EntryField("k", "y"),)),
+        ResponseField("a", "_doc", "x"),
+    ])
+
+    response = SimpleNamespace(
+        _a=1, _doc={"x": 2, "entries": [{"y": 3, "z": 4}]}, _nested=SimpleNamespace(value=5)
+    )
+
+    # Overridden key stays at its first position, same as merging the dicts
+    assert list(serializer(response).items()) == [("a", 2), ("b", 2), ("c", 5), ("d", [{"k": 3}])]
+
+
+@pytest.mark.parametrize("source", ["_a; import os", "_a[0]", "", "_a."])
+def test_compile_serializer_invalid_source(source):
+    with pytest.raises(ValueError):
+        compile_serializer([ResponseField("a", source)])
+
+
+def make_analysis_post(unit_type: UnitAnalysisPostType, **kwargs):
+    return {
+        UnitAnalysisPostKey.SEQ_ID: 7,
+        UnitAnalysisPostKey.LANG_CODE: "en",
+        UnitAnalysisPostKey.TYPE: unit_type,
+        UnitAnalysisPostKey.UNIT_NAME: "Name",
+        UnitAnalysisPostKey.SUMMARY: "Summary",
+        UnitAnalysisPostKey.SUMMON_RESULT: "Summon",
+        UnitAnalysisPostKey.PASSIVES: "Passives",
+        UnitAnalysisPostKey.NORMAL_ATTACKS: "Normal",
+        UnitAnalysisPostKey.VIDEOS: "Videos",
+        UnitAnalysisPostKey.STORY: "Story",
+        UnitAnalysisPostKey.KEYWORDS: "Keywords",
+        UnitAnalysisPostKey.DT_LAST_MODIFIED: now,
+        UnitAnalysisPostKey.DT_PUBLISHED: now,
+        UnitAnalysisPostKey.MODIFY_NOTES: [
+            {UnitAnalysisPostKey.MODIFY_DT: now, UnitAnalysisPostKey.MODIFY_NOTE: "Note"}
+        ],
+        UnitAnalysisPostKey.VIEW_COUNT: 3
+    } | kwargs
+
+
+def test_analysis_post_get_variants():
+    chara_post = make_analysis_post(
+        UnitAnalysisPostType.CHARACTER,
+        **{
+            UnitAnalysisPostKey.C_FORCE_STRIKES: "FS",
+            UnitAnalysisPostKey.C_SKILLS: [{
+                UnitAnalysisPostKey.C_SKILL_NAME: "S1",
+                UnitAnalysisPostKey.C_SKILL_INFO: "Info",
+                UnitAnalysisPostKey.C_SKILL_ROTATIONS: "Rotations",
+                UnitAnalysisPostKey.C_SKILL_TIPS: "Tips"
+            }],
+            UnitAnalysisPostKey.C_TIPS_N_BUILDS: "Builds"
+        }
+    )
+    dragon_post = make_analysis_post(
+        UnitAnalysisPostType.DRAGON,
+        **{
+            UnitAnalysisPostKey.D_ULTIMATE: "Ultimate",
+            UnitAnalysisPostKey.D_NOTES: "Notes",
+            UnitAnalysisPostKey.D_SUITABLE_CHARACTERS: "Characters"
+        }
+    )
+
+    chara = AnalysisPostGetSuccessResponse(True, False, MultilingualGetOneResult(chara_post, False, [])).serialize()
+    dragon = AnalysisPostGetSuccessResponse(True, False, MultilingualGetOneResult(dragon_post, True, [])).serialize()
+
+    assert list(chara)[-3:] == [
+        AnalysisPostGetSuccessResponseKey.C_FORCE_STRIKES,
+        AnalysisPostGetSuccessResponseKey.C_SKILLS,
+        AnalysisPostGetSuccessResponseKey.C_TIPS_N_BUILDS
+    ]
+    assert chara[AnalysisPostGetSuccessResponseKey.C_SKILLS] == [
+        {"name": "S1", "info": "Info", "rotations": "Rotations", "tips": "Tips"}
+    ]
+    assert chara[AnalysisPostGetSuccessResponseKey.MODIFY_NOTES] == [{"timestamp": now, "note": "Note"}]
+
+    assert list(dragon)[-3:] == [
+        AnalysisPostGetSuccessResponseKey.D_ULTIMATE,
+        AnalysisPostGetSuccessResponseKey.D_NOTES,
+        AnalysisPostGetSuccessResponseKey.D_SUITABLE_CHARACTERS
+    ]
+    assert AnalysisPostGetSuccessResponseKey.C_SKILLS not in dragon
+
+
+def test_post_history_response():
+    notes = [{UnitAnalysisPostKey.MODIFY_DT: now, UnitAnalysisPostKey.MODIFY_NOTE: "Note"}]
+
+    serialized = QuestPostHistoryResponse(25, notes, True).serialize()
+
+    assert serialized[QuestPostHistoryResponseKey.START_IDX] == 25
+    assert serialized[QuestPostHistoryResponseKey.HAS_NEXT]
+    assert serialized[QuestPostHistoryResponseKey.MODIFY_NOTES] == [{"timestamp": now, "note": "Note"}]
+
+
+def test_post_get_many_response():
+    post = make_analysis_post(
+        UnitAnalysisPostType.DRAGON,
+        **{
+            UnitAnalysisPostKey.D_ULTIMATE: "Ultimate",
+            UnitAnalysisPostKey.D_NOTES: "Notes",
+            UnitAnalysisPostKey.D_SUITABLE_CHARACTERS: "Characters"
+        }
+    )
+    results = [
+        MultilingualGetOneResult(None, False, []),
+        MultilingualGetOneResult(post, True, ["cht"]),
+    ]
+
+    serialized = AnalysisPostGetManyResponse(True, False, results).serialize()
+    not_found, found = serialized[AnalysisPostGetManyResponseKey.POSTS]
+
+    assert serialized[AnalysisPostGetManyResponseKey.IS_ADMIN]
+    assert not_found == {"code": ResponseCodeCollection.FAILED_POST_NOT_EXISTS.code, "success": False}
+    assert found == AnalysisPostGetSuccessResponse(True, False, results[1]).serialize()
+    assert found[AnalysisPostGetSuccessResponseKey.D_ULTIMATE] == "Ultimate"
+
+
+def test_post_edit_bundle_response():
+    results = {"cht": UpdateResult.UPDATED, "en": UpdateResult.NOT_FOUND}
+
+    serialized = QuestPostEditBundleSuccessResponse(7, results).serialize()
+
+    assert serialized[QuestPostEditBundleSuccessResponseKey.POST_SEQ_ID] == 7
+    assert serialized[QuestPostEditBundleSuccessResponseKey.RESULTS] == {"cht": "UPDATED", "en": "NOT_FOUND"}
@@ -0,0 +1,16 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from controllers.base import get_mongo_client
+from controllers.base.config import SINGLE_DB_NAME
+from controllers.base.seq_alloc import SequentialIdAllocator
+
+
+def test_seq_ids_unique_across_allocators():
+    counter = get_mongo_client().get_database(SINGLE_DB_NAME).get_collection("_seq_counter_test")
+    allocators = [SequentialIdAllocator(counter, "test_unique", 5) for _ in range(2)]
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        seq_ids = list(executor.map(lambda idx: allocators[idx % 2].next_id(), range(100)))
+
+    assert len(set(seq_ids)) == 100
+    assert max(allocator.refresh_highest_allocated() for allocator in allocators) >= max(seq_ids)
@@ -0,0 +1,62 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from controllers import MultilingualGetOneResult, QuestPostKey, UnitAnalysisPostType
+from responses import (
+    QuestPostGetSuccessResponse, ResponseCodeCollection, encode_response_body_orjson, encode_response_body_stdlib,
+    get_response_body_encoder,
+)
+
+now = datetime(2021, 3, 4, 5, 6, 7, 890000)
+
+post = {
+    QuestPostKey.SEQ_ID: 7,
+    QuestPostKey.LANG_CODE: "cht",
+    QuestPostKey.TITLE: "頭目攻略 \"quoted\"  ",
+    QuestPostKey.GENERAL_INFO: "一般資訊\n" * 100,
+    QuestPostKey.VIDEO: "",
+    QuestPostKey.INFO_PARENT: [],
+    QuestPostKey.ADDENDUM: "",
+    QuestPostKey.DT_LAST_MODIFIED: now,
+    QuestPostKey.DT_PUBLISHED: now,
+    QuestPostKey.MODIFY_NOTES: [{QuestPostKey.MODIFY_DT: now, QuestPostKey.MODIFY_NOTE: "更新"}],
+    QuestPostKey.VIEW_COUNT: 3
+}
+
+
+@pytest.mark.parametrize("pretty", [False, True])
+def test_encoders_identical(pretty):
+    data = {
+        "response": QuestPostGetSuccessResponse(True, False, MultilingualGetOneResult(post, False, ["en"])),
+        "code": ResponseCodeCollection.SUCCESS,
+        "type": UnitAnalysisPostType.DRAGON,
+        "time": now,
+        "float": 0.1,
+        "none": None
+    }
+
+    assert encode_response_body_orjson(data, pretty) == encode_response_body_stdlib(data, pretty)
+
+
+def test_orjson_fallback_on_unsupported():
+    data = {"big": 2 ** 70}
+
+    assert encode_response_body_orjson(data) == encode_response_body_stdlib(data) == b'{"big":1180591620717411303424}'
+
+
+def test_get_encoder_unknown():
+    with pytest.raises(ValueError):
+        get_response_body_encoder("unknown")
+
+
+@pytest.mark.parametrize(
+    "dt,expected",
+    [
+        (now, b'"2021-03-04T05:06:07Z"'),
+        (now.replace(tzinfo=timezone.utc), b'"2021-03-04T05:06:07Z"'),
+        (now.replace(tzinfo=timezone(timedelta(hours=8))), b'"2021-03-04T05:06:07+08:00"'),
+    ]
+)
+def test_encoders_datetime_format(dt, expected):
+    assert encode_response_body_orjson(dt) == encode_response_body_stdlib(dt) == expected
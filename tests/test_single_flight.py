@@ -0,0 +1,109 @@
+import threading
+import time
+
+import pytest
+
+from cache import SingleFlight
+
+
+def wait_until(condition):
+    while not condition():
+        time.sleep(0.001)
+
+
+def test_single_flight_shares_call():
+    flights = SingleFlight()
+    calls = []
+    release = threading.Event()
+    results = []
+
+    def func():
+        calls.append(True)
+        release.wait()
+        return "value"
+
+    threads = [threading.Thread(target=lambda: results.append(flights.do("key", func))) for _ in range(10)]
+    threads[0].start()
+    wait_until(lambda: len(flights))
+    for thread in threads[1:]:
+        thread.start()
+    wait_until(lambda: flights.shared_calls == 9)
+
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert sorted(results) == [("value", 0)] * 9 + [("value", 10)]
+    assert not len(flights)
+
+
+def test_single_flight_total_weight():
+    flights = SingleFlight()
+    release = threading.Event()
+    total_weights = []
+
+    def func():
+        release.wait()
+        return 1
+
+    def call(weight):
+        total_weights.append(flights.do("key", func, weight=weight)[1])
+
+    leader = threading.Thread(target=call, args=(1,))
+    leader.start()
+    wait_until(lambda: len(flights))
+
+    followers = [threading.Thread(target=call, args=(weight,)) for weight in (0, 1, 1)]
+    for follower in followers:
+        follower.start()
+    wait_until(lambda: flights.shared_calls == 3)
+
+    release.set()
+    for thread in [leader, *followers]:
+        thread.join()
+
+    assert sorted(total_weights) == [0, 0, 0, 3]
+
+
+def test_single_flight_shares_error():
+    flights = SingleFlight()
+    release = threading.Event()
+
+    def func():
+        release.wait()
+        raise ValueError()
+
+    leader = threading.Thread(target=lambda: pytest.raises(ValueError, flights.do, "key", func))
+    leader.start()
+    wait_until(lambda: len(flights))
+
+    follower_errors = []
+    follower = threading.Thread(
+        target=lambda: follower_errors.append(pytest.raises(ValueError, flights.do, "key", func))
+    )
+    follower.start()
+    wait_until(lambda: flights.shared_calls)
+
+    release.set()
+    leader.join()
+    follower.join()
+
+    assert follower_errors
+
+
+def test_single_flight_forget():
+    flights = SingleFlight()
+    release = threading.Event()
+
+    leader = threading.Thread(target=lambda: flights.do("key", lambda: release.wait() and 1))
+    leader.start()
+    wait_until(lambda: len(flights))
+
+    flights.forget_if(lambda key: key == "key")
+
+    # Not shared with the call forgotten
+    assert flights.do("key", lambda: 2) == (2, 1)
+
+    release.set()
+    leader.join()
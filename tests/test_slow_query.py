@@ -0,0 +1,52 @@
+from controllers.base.slow_query import SlowQueryListener, get_query_shape, redact_query, summarize_explain
+
+
+def test_query_shape_ignores_values():
+    assert get_query_shape({"_lang": "en", "_seq": {"$in": [1, 2, 3]}}) == \
+           get_query_shape({"_lang": "cht", "_seq": {"$in": [7]}})
+    assert get_query_shape({"_lang": "en"}) != get_query_shape({"_seq": 1})
+
+
+def test_redact_query_keeps_structure():
+    assert redact_query({"uid": "123", "_seq": {"$in": [1, 2]}}) == {"uid": "?", "_seq": {"$in": ["?", "?"]}}
+    assert redact_query([{"$match": {"uid": "123"}}, {"$limit": 1}]) == [{"$match": {"uid": "?"}}, {"$limit": "?"}]
+
+
+def test_slow_query_log_redacted(caplog):
+    listener = SlowQueryListener(100, 0)
+
+    listener.record_slow("user", "find", {"find": "user", "filter": {"uid": "1234567890"}, "limit": 1}, 150)
+
+    assert "1234567890" not in caplog.text
+    assert "'uid': '?'" in caplog.text
+    assert "'limit': 1" in caplog.text
+    assert listener.stats.slow_count == 1
+
+
+def test_slow_query_explain_rate_limited():
+    listener = SlowQueryListener(100, 60)
+
+    command = {"find": "quest", "filter": {"_lang": "en"}, "sort": {"_dt_mod": -1}}
+
+    assert listener.should_explain("post", "find", command)
+    assert not listener.should_explain("post", "find", command | {"filter": {"_lang": "cht"}})
+    assert listener.should_explain("post", "find", command | {"filter": {"_seq": 1}})
+    assert not listener.should_explain("post", "update", {"update": "quest", "updates": []})
+
+
+def test_summarize_explain_collection_scan():
+    result = {
+        "queryPlanner": {},
+        "executionStats": {
+            "nReturned": 25,
+            "totalDocsExamined": 1000,
+            "totalKeysExamined": 0,
+            "executionTimeMillis": 12,
+            "executionStages": {"stage": "SORT", "inputStage": {"stage": "COLLSCAN"}},
+        },
+    }
+
+    summary = summarize_explain(result)
+
+    assert summary["docsExaminedPerReturned"] == 40
+    assert summary["stages"] == ["SORT", "COLLSCAN"]
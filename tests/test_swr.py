@@ -0,0 +1,104 @@
+import time
+
+import pytest
+
+from cache import CacheStatus, CircuitBreaker, CircuitOpenError, StaleWhileRevalidateCache
+
+
+class LoadError(Exception):
+    pass
+
+
+def wait_for(condition, timeout=2):
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+
+def test_swr_fresh_then_stale():
+    cache = StaleWhileRevalidateCache(10, 0.05, 10, CircuitBreaker(3, 1))
+    loads = []
+
+    def loader():
+        loads.append(True)
+        return len(loads)
+
+    assert cache.get("a", loader) == (1, CacheStatus.REVALIDATED)
+    assert cache.get("a", loader) == (1, CacheStatus.FRESH)
+
+    time.sleep(0.06)
+    assert cache.get("a", loader) == (1, CacheStatus.STALE)
+
+    wait_for(lambda: cache.get("a", loader)[0] == 2)
+    assert cache.get("a", loader) == (2, CacheStatus.FRESH)
+
+
+def test_swr_stale_if_error():
+    cache = StaleWhileRevalidateCache(10, 0.01, 0.2, CircuitBreaker(0, 1), (LoadError,))
+    cache.get("a", lambda: 1)
+
+    def failing_loader():
+        raise LoadError()
+
+    time.sleep(0.02)
+    assert cache.get("a", failing_loader) == (1, CacheStatus.STALE)
+    wait_for(lambda: not cache._revalidating)  # pylint: disable=protected-access
+    assert cache.get("a", failing_loader) == (1, CacheStatus.STALE)
+
+    time.sleep(0.2)
+    with pytest.raises(LoadError):
+        cache.get("a", failing_loader)
+
+
+def test_swr_circuit_open():
+    cache = StaleWhileRevalidateCache(10, 1, 1, CircuitBreaker(2, 0.05), (LoadError,))
+    calls = []
+
+    def failing_loader():
+        calls.append(True)
+        raise LoadError()
+
+    for _ in range(2):
+        with pytest.raises(LoadError):
+            cache.get("a", failing_loader)
+
+    with pytest.raises(CircuitOpenError):
+        cache.get("a", failing_loader)
+    assert len(calls) == 2
+
+    # Trial call after the reset timeout closes the circuit
+    time.sleep(0.06)
+    assert cache.get("a", lambda: 1) == (1, CacheStatus.REVALIDATED)
+    assert cache.get("b", lambda: 2) == (2, CacheStatus.REVALIDATED)
+
+
+def test_swr_other_errors_not_recorded():
+    breaker = CircuitBreaker(1, 10)
+    cache = StaleWhileRevalidateCache(10, 1, 1, breaker, (LoadError,))
+
+    def loader():
+        raise ValueError()
+
+    with pytest.raises(ValueError):
+        cache.get("a", loader)
+
+    assert not breaker.is_open
+
+
+def test_swr_invalidate_if():
+    cache = StaleWhileRevalidateCache(10, 10, 10, CircuitBreaker(3, 1))
+    cache.get(("list", 1), lambda: 1)
+    cache.get(("post", 1), lambda: 1)
+
+    cache.invalidate_if(lambda key: key[0] == "list")
+
+    assert cache.get(("list", 1), lambda: 2) == (2, CacheStatus.REVALIDATED)
+    assert cache.get(("post", 1), lambda: 2) == (1, CacheStatus.FRESH)
+
+
+def test_swr_disabled():
+    cache = StaleWhileRevalidateCache(10, 0, 10, CircuitBreaker(3, 1))
+    cache.get("a", lambda: 1)
+
+    assert cache.get("a", lambda: 2) == (2, CacheStatus.REVALIDATED)
+    assert not len(cache)
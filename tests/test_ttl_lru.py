@@ -0,0 +1,46 @@
+from cache import TTLLRUCache
+
+
+def test_ttl_lru_cached():
+    cache = TTLLRUCache(10, 3600)
+
+    cache.set("a", {"uid": "a"})
+    cache.set("b", None)
+
+    assert cache.lookup("a") == (True, {"uid": "a"})
+    assert cache.lookup("b") == (True, None)
+    assert cache.lookup("c") == (False, None)
+    assert cache.hits == 2
+    assert cache.misses == 1
+
+
+def test_ttl_lru_evict_least_recent():
+    cache = TTLLRUCache(2, 3600)
+
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.lookup("a")
+    cache.set("c", 3)
+
+    assert cache.lookup("a") == (True, 1)
+    assert cache.lookup("b") == (False, None)
+    assert cache.lookup("c") == (True, 3)
+
+
+def test_ttl_lru_expiry():
+    cache = TTLLRUCache(10, 3600)
+
+    cache.set("a", 1, ttl=0)
+    cache.set("b", 2, ttl=-0.5)
+
+    assert cache.lookup("a") == (False, None)
+    assert cache.lookup("b") == (False, None)
+
+
+def test_ttl_lru_invalidate():
+    cache = TTLLRUCache(10, 3600)
+
+    cache.set("a", 1)
+    cache.invalidate("a")
+
+    assert cache.lookup("a") == (False, None)
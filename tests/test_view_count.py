@@ -0,0 +1,48 @@
+from controllers.base.view_count import ViewCountBuffer
+
+
+class FakeController:
+    def __init__(self, full_name: str, fail: bool = False):
+        self.full_name = full_name
+        self.fail = fail
+        self.flushed = []
+
+    def flush_view_counts(self, increments):
+        if self.fail:
+            raise ConnectionError("Database unavailable")
+
+        self.flushed.append(increments)
+
+
+def test_view_count_aggregated():
+    buffer = ViewCountBuffer(3600, 100)
+    controller = FakeController("post.quest")
+
+    buffer.add(controller, 1, "cht")
+    buffer.add(controller, 1, "cht")
+    buffer.add(controller, 1, "en")
+
+    assert buffer.get_pending(controller, 1, "cht") == 2
+    assert buffer.get_pending(controller, 1, "en") == 1
+    assert buffer.get_pending(controller, 2, "cht") == 0
+
+    buffer.flush()
+
+    assert controller.flushed == [{(1, "cht"): 2, (1, "en"): 1}]
+    assert buffer.get_pending(controller, 1, "cht") == 0
+
+
+def test_view_count_kept_on_flush_failure():
+    buffer = ViewCountBuffer(3600, 100)
+    controller = FakeController("post.analysis", fail=True)
+
+    buffer.add(controller, 7, "jp", 3)
+    buffer.flush()
+
+    assert buffer.get_pending(controller, 7, "jp") == 3
+
+    controller.fail = False
+    buffer.flush()
+
+    assert controller.flushed == [{(7, "jp"): 3}]
+    assert buffer.get_pending(controller, 7, "jp") == 0